@@ -14,6 +14,7 @@ from flask import request, g  # flask 2.2.0+
 from .errors import AuthenticationError
 from .config import get_config
 from ...services.auth.jwt import (  # src/backend/services/auth/jwt.py
+    decode_token,
     validate_access_token,
     get_token_from_auth_header,
     blacklist_token,
@@ -23,9 +24,11 @@ from ...services.auth.jwt import (  # src/backend/services/auth/jwt.py
 from ...services.auth.rbac import (  # src/backend/services/auth/rbac.py
     has_role,
     has_permission,
+    check_many,
     can_access_organization,
     can_access_entity
 )
+from ...services.auth.principal import AuthenticatedPrincipal  # src/backend/services/auth/principal.py
 from ...db.models.user import User  # src/backend/db/models/user.py
 from ...db.repositories.user_repository import UserRepository  # src/backend/db/repositories/user_repository.py
 from ...services.auth.mfa import (  # src/backend/services/auth/mfa.py
@@ -36,6 +39,7 @@ from ...services.auth.mfa import (  # src/backend/services/auth/mfa.py
     send_mfa_email
 )
 from ...utils.security import hash_password  # src/backend/utils/security.py
+from ...utils.principal_cache import get_cached_principal, cache_principal, invalidate_principal_token  # src/backend/utils/principal_cache.py
 from ...utils.logging import get_logger  # src/backend/utils/logging.py
 
 
@@ -207,19 +211,26 @@ def logout_user(token: str) -> bool:
     Returns:
         bool: True if logout successful, False otherwise
     """
+    try:
+        payload = decode_token(token)
+    except Exception:
+        payload = {}
+
     success = blacklist_token(token)
     if success:
+        invalidate_principal_token(payload.get('sub'), payload.get('jti'))
         log_security_event('info:logout_success', {'token': token})
     else:
         log_security_event('warning:logout_failed', {'token': token})
     return success
 
 
-def get_current_user() -> User:
+def get_current_user() -> AuthenticatedPrincipal:
     """Get the current authenticated user from the request context
 
     Returns:
-        User: Current authenticated user
+        AuthenticatedPrincipal: Current authenticated user; attributes outside the principal
+        are read from the User, loaded on first access
     """
     if 'user' not in g:
         raise AuthenticationError("User not authenticated")
@@ -250,11 +261,19 @@ def require_auth(f: Callable) -> Callable:
         try:
             payload = validate_access_token(token)
             user_id = payload['user_id']
-            user = user_repository.find_by_id(user_id)
-            if not user or not user.is_active:
-                log_security_event('warning:auth_required', {'endpoint': request.path, 'user_id': str(user_id), 'reason': 'invalid_user'})
-                return {'message': 'Invalid token'}, 401
-            g.user = user
+
+            # Repeat requests with the same token are served from the principal cache
+            principal = get_cached_principal(user_id, payload['jti'])
+            user = None
+            if principal is None:
+                user = user_repository.get_by_id(user_id)
+                if not user or not user.is_active:
+                    log_security_event('warning:auth_required', {'endpoint': request.path, 'user_id': str(user_id), 'reason': 'invalid_user'})
+                    return {'message': 'Invalid token'}, 401
+                principal = AuthenticatedPrincipal.from_user(user)
+                cache_principal(user_id, payload['jti'], principal)
+
+            g.user = principal.bind(user_repository.get_by_id, user)
             return f(*args, **kwargs)
         except Exception as e:
             log_security_event('warning:auth_required', {'endpoint': request.path, 'token': token, 'reason': str(e)})
@@ -304,6 +323,28 @@ def require_permission(permission: str) -> Callable:
     return decorator
 
 
+def require_permissions(*permissions: str) -> Callable:
+    """Decorator to require every one of several permissions for API endpoints
+
+    Args:
+        permissions (str): permissions
+
+    Returns:
+        Callable: Decorator function
+    """
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            user = get_current_user()
+            missing = [permission for permission, granted in check_many(user, permissions).items() if not granted]
+            if missing:
+                log_security_event('warning:authz_failed', {'endpoint': request.path, 'user_id': str(user.id), 'required_permissions': missing})
+                return {'message': 'Forbidden'}, 403
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
 def require_organization_access(org_id_param: str) -> Callable:
     """Decorator to require access to a specific organization
 
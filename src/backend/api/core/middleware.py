@@ -9,7 +9,7 @@ from flask_cors import CORS  # flask_cors 3.0+
 from werkzeug.exceptions import HTTPException  # werkzeug.exceptions 2.3+
 
 from ..core.auth import jwt_required, get_logger, APIError, get_current_user  # src/backend/api/core/auth.py
-from ..core.auth import track_event  # src/backend/api/core/auth.py
+from ...utils.event_tracking import track_api_event  # src/backend/utils/event_tracking.py
 from ..core.config import API_VERSION  # src/backend/api/core/config.py
 
 
@@ -97,12 +97,11 @@ def logging_middleware(app: Flask) -> Flask:
         logger.info(f"Outgoing response: {response.status_code} {request.path}",
                     extra={'additional_data': {'duration': f"{duration:.4f}s", 'size': f"{response_size} bytes"}})
 
-        # Track the API event for analytics
-        track_event(
-            event_type='api_request',
-            data={'status_code': response.status_code, 'duration': duration, 'size': response_size},
+        # Track the API event for analytics; this only queues it, the handlers run in the background
+        track_api_event(
             endpoint=request.path,
-            method=request.method
+            method=request.method,
+            data={'status_code': response.status_code, 'duration': duration, 'size': response_size}
         )
         return response
 
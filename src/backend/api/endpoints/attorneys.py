@@ -8,11 +8,13 @@ from ...db.models.attorney import Attorney
 from ...db.repositories.attorney_repository import AttorneyRepository
 from ...api.schemas.attorneys import AttorneyCreate, AttorneyUpdate, AttorneySearchParams, AttorneyList, AttorneyOut, AttorneyWithRatesOut, UniCourtAttorneyMapping, TimekeeperIdUpdate, StaffClassAssignment, UniCourtSearchParams as AttorneyUniCourtSearchParams
 from ...db.session import get_db, Session
-from ...api.core.auth import require_auth, require_role, require_permission, require_organization_access, require_entity_access
+from ...api.core.auth import require_auth, require_role, require_permission, require_organization_access, require_entity_access, get_current_user
+from ...services.auth.rbac import has_role, SYSTEM_ADMIN_ROLE
 from ...api.core.errors import ResourceNotFoundException, ValidationException, IntegrationException
 from ...services.organizations.firm import FirmService
 from ...integrations.unicourt.client import UniCourtClient
 from ...utils.logging import get_logger
+from ...utils.pagination import get_cursor_pagination_params
 from ...utils.validators import validate_uuid
 
 # Blueprint for organizing attorney-related routes
@@ -62,13 +64,36 @@ def after_request(response):
 @require_auth
 @require_permission('attorneys:read')
 def list_attorneys():
-    """List attorneys with optional filtering"""
+    """List attorneys with optional filtering
+
+    Pages are addressed by opaque keyset cursors (cursor, limit, total=none|approximate|exact)
+    unless the client sends an explicit page number, which keeps the offset-based response.
+    """
     try:
         # Parse query parameters into AttorneySearchParams
         search_params = AttorneySearchParams(**request.args)
 
+        # Restrict the query to attorneys the caller's organization can see, so pages and totals stay exact
+        current_user = get_current_user()
+        visible_to = None if has_role(current_user, SYSTEM_ADMIN_ROLE) else current_user.organization_id
+
+        # Serve keyset pages by default so deep pages cost the same as the first
+        if 'page' not in request.args:
+            cursor_params = get_cursor_pagination_params(request)
+            page = attorney_repository.search_by_cursor(
+                search_params.dict(),
+                cursor=cursor_params['cursor'],
+                limit=cursor_params['limit'],
+                sort_by=request.args.get('sort_by', 'name'),
+                total=cursor_params['total'],
+                visible_to=visible_to
+            )
+            page.items = [AttorneyOut.from_orm(attorney).dict() for attorney in page.items]
+            return jsonify(page.to_dict())
+
         # Call attorney_repository.search with validated parameters
-        attorneys, total = attorney_repository.search(search_params.dict(), page=search_params.page, page_size=search_params.page_size)
+        attorneys, total = attorney_repository.search(search_params.dict(), page=search_params.page,
+                                                      page_size=search_params.page_size, visible_to=visible_to)
 
         # Format AttorneyList response
         attorneys_list = [AttorneyOut.from_orm(attorney).dict() for attorney in attorneys]
@@ -77,6 +102,9 @@ def list_attorneys():
         return jsonify(result.dict())
     except ValidationError as e:
         return handle_validation_error(e)
+    except ValueError as e:
+        # Malformed cursors and unsupported sort columns
+        return jsonify({'message': str(e)}), 400
     except Exception as e:
         logger.exception("Error listing attorneys")
         return jsonify({'message': 'Internal server error'}), 500
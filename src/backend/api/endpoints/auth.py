@@ -52,6 +52,7 @@ from ...services.auth.sso import (
 from ...db.repositories.user_repository import UserRepository
 from ..schemas.users import UserOut
 from ..core.dependencies import get_db
+from ...utils.principal_cache import invalidate_principal
 from ...utils.logging import get_logger
 
 # Initialize logger
@@ -171,6 +172,14 @@ def change_password(request: PasswordChangeRequest, db: Session = Depends(get_db
         )
 
 
+def _get_current_user_record(db: Session):
+    """Load the authenticated user as a User of this request's session, for endpoints that change it"""
+    user = UserRepository(db).get_by_id(get_current_user().id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
+
+
 @router.get("/me", response_model=UserOut, dependencies=[Depends(require_auth)])
 def me(db: Session = Depends(get_db)):
     """Get the current authenticated user's profile"""
@@ -183,7 +192,7 @@ def me(db: Session = Depends(get_db)):
 @router.post("/mfa/setup", dependencies=[Depends(require_auth)])
 def setup_mfa(request: MFASetupRequest, db: Session = Depends(get_db)):
     """Setup Multi-Factor Authentication for a user"""
-    user = get_current_user()
+    user = _get_current_user_record(db)
     try:
         if request.enable is False:
             success = disable_mfa(db, user)
@@ -192,6 +201,7 @@ def setup_mfa(request: MFASetupRequest, db: Session = Depends(get_db)):
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Failed to disable MFA",
                 )
+            invalidate_principal(user.id)
             return {"message": "MFA disabled"}
 
         if request.method == "totp":
@@ -205,6 +215,7 @@ def setup_mfa(request: MFASetupRequest, db: Session = Depends(get_db)):
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to initiate email MFA setup",
                 )
+            invalidate_principal(user.id)
             return {"method": "email", "message": "Verification code sent to email"}
         else:
             raise HTTPException(
@@ -222,11 +233,12 @@ def setup_mfa(request: MFASetupRequest, db: Session = Depends(get_db)):
 @router.post("/mfa/verify", dependencies=[Depends(require_auth)])
 def verify_mfa(request: MFAVerifyRequest, db: Session = Depends(get_db)):
     """Verify MFA setup with verification code"""
-    user = get_current_user()
+    user = _get_current_user_record(db)
     try:
         if user.preferences and 'mfa' in user.preferences and user.preferences['mfa'].get('method') == 'totp':
             if verify_totp_code(user.mfa_secret, request.code):
                 enable_totp_mfa(db, user, user.mfa_secret, request.code)
+                invalidate_principal(user.id)
                 return {"message": "MFA setup verified"}
             else:
                 raise HTTPException(
@@ -235,6 +247,7 @@ def verify_mfa(request: MFAVerifyRequest, db: Session = Depends(get_db)):
                 )
         elif user.preferences and 'mfa' in user.preferences and user.preferences['mfa'].get('method') == 'email':
             if confirm_email_mfa(db, user, request.code):
+                invalidate_principal(user.id)
                 return {"message": "MFA setup verified"}
             else:
                 raise HTTPException(
@@ -8,14 +8,16 @@ from typing import List
 from flask import Blueprint, request, jsonify  # flask 2.2.0+
 from flask_jwt_extended import jwt_required, get_jwt_identity  # flask_jwt_extended
 
-from ..core.auth import require_permission  # src/backend/api/core/auth.py
+from ..core.auth import require_permission, get_current_user  # src/backend/api/core/auth.py
 from ..core.errors import APIError, ResourceNotFoundException, ValidationException  # src/backend/api/core/errors.py
 from ..schemas.messages import MessageCreate, MessageResponse, MessageUpdate, MessageList, MessageThreadResponse, MessageFilterParams  # src/backend/api/schemas/messages.py
 from ...db.repositories.message_repository import MessageRepository  # src/backend/db/repositories/message_repository.py
 from ...services.messaging.thread import ThreadService  # src/backend/services/messaging/thread.py
 from ...services.messaging.in_app import InAppMessageService  # src/backend/services/messaging/in_app.py
 from ...services.messaging.notifications import NotificationManager  # src/backend/services/messaging/notifications.py
+from ...services.auth.rbac import can_access_entities  # src/backend/services/auth/rbac.py
 from ...utils.logging import get_logger  # src/backend/utils/logging.py
+from ...utils.pagination import get_cursor_pagination_params  # src/backend/utils/pagination.py
 
 # Initialize Flask Blueprint for messages
 messages_bp = Blueprint('messages', __name__)
@@ -56,6 +58,23 @@ def get_messages():
         # Validate filter parameters using MessageFilterParams schema
         validated_params = MessageFilterParams(**filter_params)
 
+        # Serve keyset pages unless the client asks for a page number
+        if 'page' not in request.args:
+            cursor_params = get_cursor_pagination_params(request)
+            message_page = message_repository.get_messages_page(
+                user_id=user_id,
+                thread_id=validated_params.thread_id,
+                related_entity_type=validated_params.related_entity_type,
+                related_entity_id=validated_params.related_entity_id,
+                cursor=cursor_params['cursor'],
+                limit=cursor_params['limit'],
+                total=cursor_params['total']
+            )
+            # Authorize the whole page with one ownership lookup instead of one per message
+            access = can_access_entities(get_current_user(), 'message', [message.id for message in message_page.items], 'read')
+            message_page.items = [MessageResponse(**message.to_dict()).dict() for message in message_page.items if access[message.id]]
+            return jsonify({**message_page.to_dict(), 'status': 'success'}), 200
+
         # Query message repository for messages based on filters
         messages, total = message_repository.get_messages(
             user_id=user_id,
@@ -65,10 +84,11 @@ def get_messages():
             page=page,
             per_page=per_page
         )
+        access = can_access_entities(get_current_user(), 'message', [message.id for message in messages], 'read')
 
         # Construct response using MessageList schema
         message_list = MessageList(
-            items=[MessageResponse(**message.to_dict()) for message in messages],
+            items=[MessageResponse(**message.to_dict()) for message in messages if access[message.id]],
             total=total,
             page=page,
             size=per_page,
@@ -78,6 +98,9 @@ def get_messages():
         # Return paginated message list
         return jsonify(message_list.dict()), 200
 
+    except ValueError as e:
+        logger.warning(f"Invalid message list request: {e}")
+        return jsonify({'message': str(e)}), 400
     except Exception as e:
         logger.error(f"Error retrieving messages: {e}")
         return jsonify({'message': 'Failed to retrieve messages'}), 500
@@ -317,6 +340,30 @@ def mark_thread_read(thread_id: str):
         return jsonify({'message': 'Failed to mark thread as read'}), 500
 
 
+@messages_bp.route('/unread', methods=['GET'])
+@jwt_required()
+@require_permission('messages:read')
+def get_unread_counts():
+    """Get the current user's unread message and thread counts"""
+    try:
+        # Extract user ID from JWT token
+        user_id = get_jwt_identity()
+
+        # Served from the user's unread counters, so badge polling does not query messages
+        counts = message_repository.get_unread_counts_by_thread(user_id)
+
+        # Return unread counts
+        return jsonify({
+            'unread_messages': sum(counts.values()),
+            'unread_threads': len(counts),
+            'threads': counts
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error retrieving unread counts: {e}")
+        return jsonify({'message': 'Failed to retrieve unread counts'}), 500
+
+
 @messages_bp.route('/threads', methods=['GET'])
 @jwt_required()
 @require_permission('messages:read')
@@ -424,11 +471,32 @@ def search_messages():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
 
-        # Parse additional filter parameters
-        filters = {}  # TODO: Implement message filtering
+        # Parse additional filter parameters; only messages the user sent or received are searched
+        filters = {
+            'participant_id': user_id,
+            'thread_id': request.args.get('thread_id'),
+            'negotiation_id': request.args.get('negotiation_id'),
+            'related_entity_type': request.args.get('related_entity_type'),
+            'related_entity_id': request.args.get('related_entity_id')
+        }
+
+        # Serve ranked keyset pages unless the client asks for a page number
+        if 'page' not in request.args:
+            cursor_params = get_cursor_pagination_params(request)
+            message_page = message_repository.search_messages_page(
+                search_term,
+                filters=filters,
+                cursor=cursor_params['cursor'],
+                limit=cursor_params['limit'],
+                sort=request.args.get('sort', 'relevance'),
+                total=cursor_params['total']
+            )
+            message_page.items = [MessageResponse(**message.to_dict()).dict() for message in message_page.items]
+            return jsonify({**message_page.to_dict(), 'status': 'success'}), 200
 
         # Search messages using message repository
-        messages, total = message_repository.search_messages(search_term, filters, page, per_page)
+        messages = message_repository.search_messages(search_term, filters, (page - 1) * per_page, per_page)
+        total = message_repository.count_search_messages(search_term, filters)
 
         # Construct response using MessageList schema
         message_list = MessageList(
@@ -442,6 +510,9 @@ def search_messages():
         # Return paginated search results
         return jsonify(message_list.dict()), 200
 
+    except ValueError as e:
+        logger.warning(f"Invalid message search request: {e}")
+        return jsonify({'message': str(e)}), 400
     except Exception as e:
         logger.error(f"Error searching messages: {e}")
         return jsonify({'message': 'Failed to search messages'}), 500
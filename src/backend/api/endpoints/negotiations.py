@@ -11,10 +11,12 @@ from ..schemas.negotiations import (
     NegotiationResponse,
     NegotiationUpdate,
     NegotiationFilter,
+    NegotiationCursorListResponse,
     RateSubmissionRequest,
     RateCounterProposal,
 )
-from ...db.repositories.negotiation_repository import NegotiationRepository
+from ..schemas.rates import CursorParams
+from ...db.repositories.negotiation_repository import NegotiationRepository, get_negotiations_by_cursor
 from ...db.repositories.rate_repository import RateRepository
 from ...services.negotiations.state_machine import NegotiationStateMachine
 from ...services.negotiations.validation import NegotiationValidator
@@ -23,6 +25,7 @@ from ...services.negotiations.approval_workflow import ApprovalWorkflowService
 from ...services.negotiations.audit import NegotiationAudit
 from ...services.ai.recommendations import RateRecommendationService
 from ...services.analytics.impact_analysis import ImpactAnalysisService
+from ...services.auth.rbac import can_access_entities
 from src.backend.db.models.user import User
 
 router = APIRouter(prefix="/negotiations", tags=["negotiations"])
@@ -104,18 +107,43 @@ def get_negotiation(
     raise NotImplementedError
 
 
-@router.get("/", response_model=List[NegotiationResponse])
+@router.get("/", response_model=NegotiationCursorListResponse)
 def list_negotiations(
     filters: NegotiationFilter = Depends(),
+    page: CursorParams = Depends(),
     current_user: User = Depends(get_current_user),
     repo: NegotiationRepository = Depends(get_negotiation_repository),
 ):
-    """List negotiations with optional filtering."""
+    """List negotiations with optional filtering, one keyset page at a time."""
     # Validate current user permissions to list negotiations
     # Apply organization filters based on user role (client/law firm)
-    # Retrieve negotiations from database using repo with filters
-    # Return the list of negotiations
-    raise NotImplementedError
+    # Retrieve the page after the cursor with filters
+    try:
+        negotiation_page = get_negotiations_by_cursor(
+            client_id=filters.client_id,
+            firm_id=filters.firm_id,
+            status=filters.status,
+            approval_status=filters.approval_status,
+            from_date=filters.date_from,
+            to_date=filters.date_to,
+            cursor=page.cursor,
+            limit=page.limit,
+            total=page.total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Authorize the whole page with one ownership lookup instead of one per negotiation
+    access = can_access_entities(current_user, "negotiation", [negotiation.id for negotiation in negotiation_page.items], "read")
+
+    # Return the page of negotiations with the next cursor
+    return NegotiationCursorListResponse(
+        items=[negotiation for negotiation in negotiation_page.items if access[negotiation.id]],
+        limit=negotiation_page.pagination["limit"],
+        next_cursor=negotiation_page.pagination["next_cursor"],
+        total=negotiation_page.pagination.get("total_count"),
+        total_is_approximate=negotiation_page.pagination.get("total_is_approximate", False),
+    )
 
 
 @router.put("/{negotiation_id}/status", response_model=NegotiationResponse)
@@ -6,6 +6,7 @@ from typing import List, Optional, Dict
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from api.schemas.rates import (
     RateCreate,
@@ -13,11 +14,14 @@ from api.schemas.rates import (
     RateResponse,
     RateHistoryResponse,
     RateCounterRequest,
-    RateFilters,
+    RateFilter,
+    CursorParams,
+    RateCursorListResponse,
 )
 from api.core.auth import get_current_user, check_permissions
 from api.core.errors import RequestValidationError, BusinessRuleError
-from db.repositories.rate_repository import RateRepository
+from db.repositories.rate_repository import RateRepository, RATE_EXPORT_FIELDS
+from services.auth.rbac import can_access_entities, has_permission, has_role, SYSTEM_ADMIN_ROLE
 from services.rates.validation import RateValidationService
 from services.rates.calculation import RateCalculationService
 from services.rates.rules import RateRulesService
@@ -25,22 +29,93 @@ from services.rates.history import RateHistoryService
 from services.negotiations.counter_proposal import CounterProposalService
 from services.negotiations.approval_workflow import ApprovalWorkflowService
 from services.ai.recommendations import RateRecommendationService
+from utils.file_handling import stream_tabular_export
+
+# Media types of the formats supported by streaming exports
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
 
 router = APIRouter(prefix="/rates", tags=["rates"])
 
 
-@router.get("/", response_model=List[RateResponse])
+@router.get("/", response_model=RateCursorListResponse)
 def get_rates(
-    filters: RateFilters = Depends(),
+    filters: RateFilter = Depends(),
+    page: CursorParams = Depends(),
+    sort_by: str = "effective_date",
     current_user: dict = Depends(get_current_user),
     rate_repository: RateRepository = Depends(),
 ):
-    """Retrieves a filtered list of rates"""
+    """Retrieves a filtered list of rates one keyset page at a time"""
     # Validate user permissions to read rates
     # Apply organization context based on user role
-    # Call rate_repository.get_rates with filters and organization context
-    # Return list of rates as RateResponse objects
-    pass
+    # Fetch the page after the cursor; deep pages cost the same as the first
+    try:
+        rate_page = rate_repository.get_rates_page(
+            client_id=str(filters.client_id) if filters.client_id else None,
+            firm_id=str(filters.firm_id) if filters.firm_id else None,
+            attorney_id=str(filters.attorney_id) if filters.attorney_id else None,
+            staff_class_id=str(filters.staff_class_id) if filters.staff_class_id else None,
+            status=filters.status,
+            cursor=page.cursor,
+            limit=page.limit,
+            sort_by=sort_by,
+            total=page.total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Authorize the whole page with one ownership lookup instead of one per rate
+    access = can_access_entities(current_user, "rate", [rate.id for rate in rate_page.items], "read")
+
+    # Return the page of rates as RateResponse objects with the next cursor
+    return RateCursorListResponse(
+        items=[RateResponse.from_orm(rate) for rate in rate_page.items if access[rate.id]],
+        limit=rate_page.pagination["limit"],
+        next_cursor=rate_page.pagination["next_cursor"],
+        total=rate_page.pagination.get("total_count"),
+        total_is_approximate=rate_page.pagination.get("total_is_approximate", False),
+    )
+
+
+@router.get("/export")
+def export_rates(
+    file_format: str = "csv",
+    client_id: Optional[UUID] = None,
+    firm_id: Optional[UUID] = None,
+    rate_status: Optional[str] = None,
+    currency: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    rate_repository: RateRepository = Depends(),
+):
+    """Streams matching rates as a CSV, JSON lines or XLSX download in chunks"""
+    media_type = EXPORT_MEDIA_TYPES.get(file_format.lower())
+    if not media_type:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported export format: {file_format}")
+
+    # Validate user permissions to read rates
+    if not has_permission(current_user, "rates:read"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not permitted to read rates")
+
+    # Only rates the user's organization is client or firm of are exported, except for system administrators
+    organization_id = None if has_role(current_user, SYSTEM_ADMIN_ROLE) else str(current_user.organization_id)
+
+    # Rows are fetched, converted and serialized one chunk at a time as the response is sent
+    chunks = rate_repository.iter_export_chunks(
+        client_id=str(client_id) if client_id else None,
+        firm_id=str(firm_id) if firm_id else None,
+        status=rate_status,
+        currency=currency,
+        organization_id=organization_id,
+    )
+    return StreamingResponse(
+        stream_tabular_export(chunks, file_format, RATE_EXPORT_FIELDS),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=rates_export.{file_format.lower()}"},
+    )
 
 
 @router.get("/{rate_id}", response_model=RateResponse)
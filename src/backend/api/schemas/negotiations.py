@@ -240,6 +240,15 @@ class NegotiationListResponse(BaseModel):
     pages: int
 
 
+class NegotiationCursorListResponse(BaseModel):
+    """Schema for a keyset page of negotiations in API responses"""
+    items: List[NegotiationResponse]
+    limit: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_approximate: bool = False
+
+
 class NegotiationAnalytics(BaseModel):
     """Schema for negotiation analytics data"""
     total_impact: float
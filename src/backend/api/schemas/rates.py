@@ -46,6 +46,34 @@ class Page(Generic[T], BaseModel):
     pages: int
 
 
+class CursorParams(BaseModel):
+    """Base Pydantic model for keyset cursor pagination parameters."""
+    cursor: Optional[str] = None
+    limit: int = 20
+    total: str = 'none'
+
+    @validator('limit')
+    def limit_must_be_in_range(cls, v):
+        if v < 1 or v > 100:
+            raise ValueError('Limit must be between 1 and 100')
+        return v
+
+    @validator('total')
+    def total_must_be_known_mode(cls, v):
+        if v not in ('none', 'approximate', 'exact'):
+            raise ValueError('Total must be one of none, approximate, exact')
+        return v
+
+
+class CursorPage(Generic[T], BaseModel):
+    """Generic Pydantic model for keyset-paginated responses."""
+    items: List[T]
+    limit: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_approximate: bool = False
+
+
 class RateBase(BaseModel):
     """Base Pydantic model for rate data with common fields used across rate schemas."""
     attorney_id: Optional[UUID] = None
@@ -127,6 +155,9 @@ class RateResponse(RateBase):
     attorney_name: Optional[str] = None
     staff_class_name: Optional[str] = None
 
+    class Config:
+        orm_mode = True
+
 
 class RateCounterProposal(BaseModel):
     """Schema for counter-proposing a rate during negotiation."""
@@ -179,6 +210,11 @@ class RateListResponse(Page[RateResponse]):
     pass
 
 
+class RateCursorListResponse(CursorPage[RateResponse]):
+    """Schema for a keyset page of rates in API responses."""
+    pass
+
+
 class RateSubmissionRequest(BaseModel):
     """Schema for submitting multiple rates in a single request."""
     client_id: UUID
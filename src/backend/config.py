@@ -126,6 +126,16 @@ class BaseConfig:
         self.LOG_LEVEL = get_env_variable('LOG_LEVEL', 'INFO')
         self.USE_JSON_LOGGING = get_env_variable('USE_JSON_LOGGING', True, bool)
         
+        # Event tracking dispatch (see utils/event_tracking.py)
+        self.EVENT_DISPATCH_ASYNC = get_env_variable('EVENT_DISPATCH_ASYNC', True, bool)
+        self.EVENT_QUEUE_MAX_SIZE = get_env_variable('EVENT_QUEUE_MAX_SIZE', 10000, int)
+        self.EVENT_FLUSH_INTERVAL = get_env_variable('EVENT_FLUSH_INTERVAL', 1.0, float)
+        self.EVENT_FLUSH_BATCH_SIZE = get_env_variable('EVENT_FLUSH_BATCH_SIZE', 500, int)
+        self.EVENT_QUEUE_OVERFLOW_POLICY = get_env_variable('EVENT_QUEUE_OVERFLOW_POLICY', 'drop_newest')
+        
+        # PDF rendering processes per worker process (see services/documents/pdf_rendering.py); 0 renders in the calling process
+        self.PDF_RENDER_WORKERS = get_env_variable('PDF_RENDER_WORKERS', 2, int)
+        
         # CORS Configuration
         self.CORS_ORIGINS = get_env_variable('CORS_ORIGINS', '*', list)
 
@@ -168,6 +178,12 @@ class TestingConfig(BaseConfig):
         
         # Disable JSON logging for readable test outputs
         self.USE_JSON_LOGGING = False
+        
+        # Dispatch events inline so tests see handler effects immediately
+        self.EVENT_DISPATCH_ASYNC = False
+        
+        # Render PDFs in the test process instead of spawning rendering processes
+        self.PDF_RENDER_WORKERS = 0
 
 
 class StagingConfig(BaseConfig):
@@ -30,6 +30,12 @@ from .rate import Rate
 # Import Message model
 from .message import Message
 
+# Import MessageReadState model
+from .message import MessageReadState
+
+# Import UserNotification model
+from .notification import UserNotification
+
 # Import Document model
 from .document import Document
 
@@ -42,6 +48,12 @@ from .ocg import OCG
 # Import ApprovalWorkflow model
 from .approval_workflow import ApprovalWorkflow
 
+# Import ExchangeRate model
+from .exchange_rate import ExchangeRate
+
+# Import BillingAggregate model
+from .billing import BillingAggregate
+
 # Export User model for easy importing
 __all__ = ['User']
 
@@ -66,6 +78,12 @@ __all__.append('Rate')
 # Export Message model for easy importing
 __all__.append('Message')
 
+# Export MessageReadState model for easy importing
+__all__.append('MessageReadState')
+
+# Export UserNotification model for easy importing
+__all__.append('UserNotification')
+
 # Export Document model for easy importing
 __all__.append('Document')
 
@@ -76,4 +94,7 @@ __all__.append('Negotiation')
 __all__.append('OCG')
 
 # Export ApprovalWorkflow model for easy importing
-__all__.append('ApprovalWorkflow')
\ No newline at end of file
+__all__.append('ApprovalWorkflow')
+
+# Export ExchangeRate model for easy importing
+__all__.append('ExchangeRate')
\ No newline at end of file
@@ -6,7 +6,7 @@ import uuid
 from datetime import date, datetime
 from typing import Dict, List, Optional, Any
 
-from sqlalchemy import Column, String, ForeignKey, Date
+from sqlalchemy import Column, String, ForeignKey, Date, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 
@@ -21,6 +21,10 @@ class Attorney(Base, TimestampMixin):
     SQLAlchemy model representing an attorney in the Justice Bid system.
     """
     __tablename__ = 'attorneys'
+    __table_args__ = (
+        # Keyset pagination over (name, id) for attorney listings
+        Index('ix_attorneys_name_id', 'name', 'id'),
+    )
     
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID, ForeignKey('organizations.id'), nullable=False)
@@ -7,11 +7,11 @@ rate impact analysis and historical data analysis.
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Column, ForeignKey, String, Numeric, Date, Boolean, JSONB, relationship
+from sqlalchemy import Column, ForeignKey, String, Numeric, Integer, Date, Boolean, JSONB, UniqueConstraint, relationship
 from sqlalchemy.orm import validates
 
 from ..base import Base, UUID
-from .common import TimestampMixin, BaseModel, OrganizationScopedMixin, SoftDeleteMixin, AuditMixin
+from .common import TimestampMixin, BaseModel, OrganizationScopedMixin, SoftDeleteMixin, AuditMixin, generate_uuid
 from ...utils.validators import validate_currency
 
 
@@ -35,10 +35,13 @@ class BillingHistory(Base, TimestampMixin):
     practice_area = Column(String(100), nullable=True)
     office_id = Column(UUID, ForeignKey('offices.id'), nullable=True)
     office_location = Column(String(100), nullable=True)
+    # Firm and staff class of the attorney when the record was written, set by BillingRepository
+    firm_id = Column(UUID, ForeignKey('organizations.id'), nullable=True)
+    staff_class_id = Column(UUID, ForeignKey('staff_classes.id'), nullable=True)
 
     # Relationships
     attorney = relationship('Attorney', back_populates='billing_history')
-    client = relationship('Organization', back_populates='client_billing_history')
+    client = relationship('Organization', back_populates='client_billing_history', foreign_keys=[client_id])
     matter = relationship('Matter', back_populates='billing_history')
 
     def __init__(self, attorney_id, client_id, hours, fees, billing_date, matter_id=None, 
@@ -161,6 +164,8 @@ class BillingHistory(Base, TimestampMixin):
             'practice_area': self.practice_area,
             'office_id': str(self.office_id) if self.office_id else None,
             'office_location': self.office_location,
+            'firm_id': str(self.firm_id) if self.firm_id else None,
+            'staff_class_id': str(self.staff_class_id) if self.staff_class_id else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -345,4 +350,62 @@ class MatterBillingSummary(Base, TimestampMixin):
         result['effective_rate'] = float(self.get_effective_rate()) if self.total_hours > 0 else None
         result['afa_percentage'] = self.get_afa_percentage()
             
-        return result
\ No newline at end of file
+        return result
+
+
+# Columns identifying one BillingAggregate row; every other column is a running total
+BILLING_AGGREGATE_KEY = (
+    'client_id', 'firm_id', 'attorney_id', 'staff_class_id', 'practice_area',
+    'office_id', 'month', 'currency', 'is_afa',
+)
+
+
+class BillingAggregate(Base, TimestampMixin):
+    """
+    SQLAlchemy model for billing totals by client, firm, attorney, staff class, practice area,
+    office and month, maintained incrementally as billing history is written so that rate
+    impact analysis does not have to scan raw billing records.
+    """
+    __tablename__ = 'billing_aggregates'
+    __table_args__ = (
+        # NULL staff classes, practice areas and offices must still collapse into one row per key
+        UniqueConstraint(*BILLING_AGGREGATE_KEY, name='uq_billing_aggregates_key',
+                         postgresql_nulls_not_distinct=True),
+    )
+
+    id = Column(UUID, primary_key=True, default=generate_uuid)
+    client_id = Column(UUID, ForeignKey('organizations.id'), nullable=False)
+    firm_id = Column(UUID, ForeignKey('organizations.id'), nullable=False)
+    attorney_id = Column(UUID, ForeignKey('attorneys.id'), nullable=False)
+    staff_class_id = Column(UUID, ForeignKey('staff_classes.id'), nullable=True)
+    practice_area = Column(String(100), nullable=True)
+    office_id = Column(UUID, ForeignKey('offices.id'), nullable=True)
+    month = Column(Date, nullable=False)  # First day of the billing month
+    currency = Column(String(3), default='USD', nullable=False)
+    is_afa = Column(Boolean, default=False, nullable=False)
+    hours = Column(Numeric(14, 2), default=0, nullable=False)
+    fees = Column(Numeric(16, 2), default=0, nullable=False)
+    record_count = Column(Integer, default=0, nullable=False)
+
+    def to_dict(self):
+        """
+        Convert the model instance to a dictionary for serialization.
+
+        Returns:
+            dict: Dictionary representation of the billing aggregate
+        """
+        return {
+            'id': str(self.id),
+            'client_id': str(self.client_id),
+            'firm_id': str(self.firm_id),
+            'attorney_id': str(self.attorney_id),
+            'staff_class_id': str(self.staff_class_id) if self.staff_class_id else None,
+            'practice_area': self.practice_area,
+            'office_id': str(self.office_id) if self.office_id else None,
+            'month': self.month.isoformat() if self.month else None,
+            'currency': self.currency,
+            'is_afa': self.is_afa,
+            'hours': float(self.hours) if self.hours else 0,
+            'fees': float(self.fees) if self.fees else 0,
+            'record_count': self.record_count,
+        }
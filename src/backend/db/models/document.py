@@ -35,7 +35,7 @@ class Document(Base):
     document_type = Column(Enum(DocumentType), nullable=False)
     
     # File storage information
-    file_path = Column(String(512))
+    file_path = Column(String(512), index=True)  # Looked up when a cached document is stored again
     mime_type = Column(String(128))
     size_bytes = Column(Integer)
     
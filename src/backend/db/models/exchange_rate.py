@@ -0,0 +1,51 @@
+"""
+SQLAlchemy ORM model for historical exchange rates in the Justice Bid Rate Negotiation System.
+Stores one rate per currency per day against a base currency so that historical conversions
+can be served locally instead of calling the currency API for every date.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Column, String, Numeric, Date, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..base import Base
+from .common import TimestampMixin, generate_uuid
+
+
+class ExchangeRate(Base, TimestampMixin):
+    """
+    SQLAlchemy model for a daily exchange rate, expressed as units of the currency
+    per unit of the base currency.
+    """
+    __tablename__ = 'exchange_rates'
+    __table_args__ = (
+        # Also serves range scans by base currency and date
+        UniqueConstraint('base_currency', 'rate_date', 'currency', name='uq_exchange_rates_base_date_currency'),
+    )
+
+    id = Column(UUID, primary_key=True, default=generate_uuid)
+    base_currency = Column(String(3), nullable=False)
+    currency = Column(String(3), nullable=False)
+    rate_date = Column(Date, nullable=False)
+    rate = Column(Numeric(18, 8), nullable=False)
+    source = Column(String(50), default='api', nullable=False)
+
+    def __init__(self, base_currency: str, currency: str, rate_date: date, rate: Decimal, source: str = 'api'):
+        """
+        Initializes a new ExchangeRate instance.
+
+        Args:
+            base_currency: Currency code the rate is quoted against
+            currency: Currency code of the rate
+            rate_date: Day the rate applies to
+            rate: Units of the currency per unit of the base currency
+            source: Where the rate was obtained from
+        """
+        self.base_currency = base_currency
+        self.currency = currency
+        self.rate_date = rate_date
+        self.rate = rate
+        self.source = source
+
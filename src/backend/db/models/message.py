@@ -10,12 +10,29 @@ import datetime
 import enum
 from typing import List, Dict, Any, Optional
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, func
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Computed, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, Index, func, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 
 from ..base import Base
 
+# Text search configuration of the message full-text index
+MESSAGE_SEARCH_CONFIG = 'english'
+
+
+class PostgresComputed(Computed):
+    """Generated column expression that is only emitted on PostgreSQL; other databases get a plain column."""
+    inherit_cache = True
+
+
+@compiles(PostgresComputed)
+def _compile_postgres_computed(element, compiler, **kw):
+    # SQLite (used by tests) has no to_tsvector, so the column is left NULL there
+    if compiler.dialect.name != 'postgresql':
+        return ''
+    return compiler.visit_computed_column(element, **kw)
+
 
 class RelatedEntityType(enum.Enum):
     """Enumeration of entity types that messages can be related to."""
@@ -31,6 +48,12 @@ class Message(Base):
     to senders, recipients, and related entities.
     """
     __tablename__ = 'messages'
+    __table_args__ = (
+        # Keyset pagination over (created_at, id) for message listings
+        Index('ix_messages_created_at_id', 'created_at', 'id'),
+        # Full-text search over message content
+        Index('ix_messages_search_vector', 'search_vector', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
 
     # Primary key
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
@@ -45,13 +68,18 @@ class Message(Base):
     
     # Content
     content = Column(Text, nullable=False)
+    # Search document of the content, kept up to date by PostgreSQL on every insert and update
+    search_vector = deferred(Column(
+        TSVECTOR().with_variant(Text(), 'sqlite'),
+        PostgresComputed(f"to_tsvector('{MESSAGE_SEARCH_CONFIG}', coalesce(content, ''))", persisted=True)
+    ))
     attachments = Column(JSONB, nullable=True)  # Array of attachment objects
     
     # Related entity (what the message is about)
     related_entity_type = Column(Enum(RelatedEntityType), nullable=True)
     related_entity_id = Column(UUID, nullable=True)
     
-    # Status
+    # Status; per-recipient read state is tracked in MessageReadState
     is_read = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
@@ -180,4 +208,41 @@ class Message(Base):
         return (session.query(Message)
                 .filter(Message.parent_id == self.id)
                 .order_by(Message.created_at)
-                .all())
\ No newline at end of file
+                .all())
+
+
+class MessageReadState(Base):
+    """
+    SQLAlchemy model for a user's read state in a message thread.
+    One row per (recipient, thread) holds a read watermark, before which every message in the
+    thread counts as read, and the number of messages received after it, maintained as messages
+    are created and read so that unread counts never scan the messages table.
+    """
+    __tablename__ = 'message_read_states'
+    __table_args__ = (
+        # Unread counts per user only visit threads with unread messages
+        Index('ix_message_read_states_user_unread', 'user_id', 'thread_id',
+              postgresql_where=text('unread_count > 0')),
+    )
+
+    user_id = Column(UUID, ForeignKey('users.id'), primary_key=True)
+    thread_id = Column(UUID, primary_key=True)
+    last_read_at = Column(DateTime, nullable=True)  # Read watermark, None if never read
+    unread_count = Column(Integer, default=0, nullable=False)  # Messages received after the watermark
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow,
+                        onupdate=datetime.datetime.utcnow, nullable=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the MessageReadState object to a dictionary representation
+
+        Returns:
+            Dictionary containing read state attributes
+        """
+        return {
+            'user_id': str(self.user_id),
+            'thread_id': str(self.thread_id),
+            'last_read_at': self.last_read_at.isoformat() if self.last_read_at else None,
+            'unread_count': self.unread_count,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -11,7 +11,7 @@ from typing import List, Dict, Any, Optional, Union
 from sqlalchemy import Column, String, ForeignKey, Enum, Table, relationship
 from sqlalchemy.types import UUID
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import DateTime, Date
+from sqlalchemy import DateTime, Date, Index
 
 from ..base import Base
 from .common import BaseModel, TimestampMixin, AuditMixin
@@ -33,6 +33,10 @@ class Negotiation(BaseModel, TimestampMixin, AuditMixin):
     Tracks the entire negotiation process from request through submission, approval, and completion.
     """
     __tablename__ = 'negotiations'
+    __table_args__ = (
+        # Keyset pagination over (request_date, id) for negotiation listings
+        Index('ix_negotiations_request_date_id', 'request_date', 'id'),
+    )
     
     # Foreign keys
     client_id = Column(UUID, ForeignKey('organizations.id'), nullable=False)
@@ -0,0 +1,58 @@
+"""
+SQLAlchemy ORM model for in-app notifications in the Justice Bid Rate Negotiation System.
+Notifications are written in bulk when an event fans out to many users, and read back
+per user, newest first.
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import Boolean, Column, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from ..base import Base
+from .common import TimestampMixin, generate_uuid
+
+
+class UserNotification(Base, TimestampMixin):
+    """
+    SQLAlchemy model for an in-app notification delivered to a single user.
+    """
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        # A user's notifications, newest first
+        Index('ix_notifications_user_id_created_at', 'user_id', 'created_at'),
+        # A delivery writes at most one notification per user, so retried deliveries are skipped
+        Index('uq_notifications_user_id_delivery_key', 'user_id', 'delivery_key', unique=True),
+    )
+
+    id = Column(UUID, primary_key=True, default=generate_uuid)
+    user_id = Column(UUID, ForeignKey('users.id'), nullable=False)
+    notification_type = Column(String(50), nullable=False)
+    title = Column(String(255), nullable=False)
+    content = Column(Text, nullable=False)
+    priority = Column(String(20), nullable=False, default='medium')
+    notification_metadata = Column('metadata', JSONB, nullable=True)
+    action_url = Column(String(512), nullable=True)
+    is_read = Column(Boolean, default=False, nullable=False)
+    delivery_key = Column(String(100), nullable=True)  # Idempotency key of the delivery that wrote the notification
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the model instance to a dictionary for serialization.
+
+        Returns:
+            dict: Dictionary representation of the notification
+        """
+        return {
+            'id': str(self.id),
+            'user_id': str(self.user_id),
+            'notification_type': self.notification_type,
+            'title': self.title,
+            'content': self.content,
+            'priority': self.priority,
+            'metadata': self.notification_metadata or {},
+            'action_url': self.action_url,
+            'is_read': self.is_read,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
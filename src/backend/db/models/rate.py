@@ -11,7 +11,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any, Union
 import uuid
 
-from sqlalchemy import Column, ForeignKey, String, Numeric, Date, Enum
+from sqlalchemy import Column, ForeignKey, String, Numeric, Date, Enum, Index
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship, validates
 
@@ -42,6 +42,11 @@ class Rate(Base, TimestampMixin):
         history (JSONB): Historical record of rate changes
     """
     __tablename__ = 'rates'
+    __table_args__ = (
+        # Keyset pagination over (sort column, id) for rate listings
+        Index('ix_rates_effective_date_id', 'effective_date', 'id'),
+        Index('ix_rates_created_at_id', 'created_at', 'id'),
+    )
 
     # Primary key
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
@@ -15,6 +15,9 @@ from .document_repository import DocumentRepository  # v1.0 - Repository for doc
 from .negotiation_repository import NegotiationRepository  # v1.0 - Repository for negotiation database operations
 from .ocg_repository import OCGRepository  # v1.0 - Repository for Outside Counsel Guidelines database operations
 from .approval_workflow_repository import ApprovalWorkflowRepository  # v1.0 - Repository for approval workflow database operations
+from .exchange_rate_repository import ExchangeRateRepository  # v1.0 - Repository for historical exchange rate database operations
+from .ownership_repository import OwnershipRepository  # v1.0 - Repository for entity ownership lookups used by access control
+from .notification_repository import NotificationRepository  # v1.0 - Repository for in-app notification database operations
 
 __all__ = [
     "UserRepository",
@@ -29,4 +32,7 @@ __all__ = [
     "NegotiationRepository",
     "OCGRepository",
     "ApprovalWorkflowRepository",
+    "ExchangeRateRepository",
+    "OwnershipRepository",
+    "NotificationRepository",
 ]
\ No newline at end of file
@@ -15,7 +15,10 @@ from ..models.organization import Organization
 from ..models.staff_class import StaffClass
 from ..models.rate import Rate
 from ..session import Session
+from ...utils.constants import DEFAULT_PAGE_SIZE
 from ...utils.logging import get_logger
+from ...utils.ownership_cache import invalidate_owners
+from ...utils.pagination import CursorPaginatedResponse, paginate_by_cursor
 from ...utils.validators import validate_uuid
 
 # Initialize logger
@@ -210,6 +213,8 @@ class AttorneyRepository:
             
             # Commit changes
             self._session.commit()
+            if 'organization_id' in attorney_data:
+                invalidate_owners('attorney', attorney.id)
             
             self._logger.info(f"Updated attorney: {attorney.name} (ID: {attorney_id})")
             return attorney
@@ -240,6 +245,7 @@ class AttorneyRepository:
             # Delete the attorney
             self._session.delete(attorney)
             self._session.commit()
+            invalidate_owners('attorney', attorney.id)
             
             self._logger.info(f"Deleted attorney: {attorney.name} (ID: {attorney_id})")
             return True
@@ -248,8 +254,73 @@ class AttorneyRepository:
             self._logger.error(f"Error deleting attorney {attorney_id}: {str(e)}")
             return False
     
+    def _search_filters(self, search_params: Dict[str, Any]) -> List[Any]:
+        """
+        Build the filter conditions for an attorney search
+        
+        Args:
+            search_params: Dictionary of search parameters
+            
+        Returns:
+            List of SQLAlchemy filter conditions
+        """
+        filters = []
+        
+        if 'name' in search_params and search_params['name']:
+            filters.append(Attorney.name.ilike(f"%{search_params['name']}%"))
+        
+        if 'organization_id' in search_params and search_params['organization_id']:
+            org_id = search_params['organization_id']
+            if isinstance(org_id, str):
+                org_id = uuid.UUID(org_id)
+            filters.append(Attorney.organization_id == org_id)
+        
+        if 'staff_class_id' in search_params and search_params['staff_class_id']:
+            class_id = search_params['staff_class_id']
+            if isinstance(class_id, str):
+                class_id = uuid.UUID(class_id)
+            filters.append(Attorney.staff_class_id == class_id)
+        
+        if 'bar_date_after' in search_params and search_params['bar_date_after']:
+            filters.append(Attorney.bar_date >= search_params['bar_date_after'])
+        
+        if 'bar_date_before' in search_params and search_params['bar_date_before']:
+            filters.append(Attorney.bar_date <= search_params['bar_date_before'])
+        
+        if 'graduation_date_after' in search_params and search_params['graduation_date_after']:
+            filters.append(Attorney.graduation_date >= search_params['graduation_date_after'])
+        
+        if 'graduation_date_before' in search_params and search_params['graduation_date_before']:
+            filters.append(Attorney.graduation_date <= search_params['graduation_date_before'])
+        
+        if 'has_unicourt_data' in search_params:
+            if search_params['has_unicourt_data']:
+                filters.append(Attorney.unicourt_id.is_not(None))
+            else:
+                filters.append(Attorney.unicourt_id.is_(None))
+        
+        return filters
+    
+    def _visible_to(self, organization_id: uuid.UUID) -> Any:
+        """
+        Build the condition restricting attorneys to those an organization can see
+        
+        Law firms see their own attorneys, clients also see the attorneys of every firm
+        they hold rates with.
+        
+        Args:
+            organization_id: UUID of the organization
+            
+        Returns:
+            SQLAlchemy filter condition
+        """
+        if isinstance(organization_id, str):
+            organization_id = uuid.UUID(organization_id)
+        client_firm_ids = select(Rate.firm_id).where(Rate.client_id == organization_id)
+        return or_(Attorney.organization_id == organization_id, Attorney.organization_id.in_(client_firm_ids))
+    
     def search(self, search_params: Dict[str, Any], page: Optional[int] = None, 
-              page_size: Optional[int] = None) -> Tuple[List[Attorney], int]:
+              page_size: Optional[int] = None, visible_to: Optional[uuid.UUID] = None) -> Tuple[List[Attorney], int]:
         """
         Search for attorneys based on various criteria
         
@@ -257,6 +328,7 @@ class AttorneyRepository:
             search_params: Dictionary of search parameters
             page: Page number for pagination (1-based)
             page_size: Number of records per page
+            visible_to: Optional UUID of the organization whose visible attorneys are searched
             
         Returns:
             Tuple containing list of matching attorneys and total count
@@ -264,41 +336,9 @@ class AttorneyRepository:
         try:
             # Build base query
             query = select(Attorney)
-            filters = []
-            
-            # Apply filters based on search parameters
-            if 'name' in search_params and search_params['name']:
-                filters.append(Attorney.name.ilike(f"%{search_params['name']}%"))
-            
-            if 'organization_id' in search_params and search_params['organization_id']:
-                org_id = search_params['organization_id']
-                if isinstance(org_id, str):
-                    org_id = uuid.UUID(org_id)
-                filters.append(Attorney.organization_id == org_id)
-            
-            if 'staff_class_id' in search_params and search_params['staff_class_id']:
-                class_id = search_params['staff_class_id']
-                if isinstance(class_id, str):
-                    class_id = uuid.UUID(class_id)
-                filters.append(Attorney.staff_class_id == class_id)
-            
-            if 'bar_date_after' in search_params and search_params['bar_date_after']:
-                filters.append(Attorney.bar_date >= search_params['bar_date_after'])
-            
-            if 'bar_date_before' in search_params and search_params['bar_date_before']:
-                filters.append(Attorney.bar_date <= search_params['bar_date_before'])
-            
-            if 'graduation_date_after' in search_params and search_params['graduation_date_after']:
-                filters.append(Attorney.graduation_date >= search_params['graduation_date_after'])
-            
-            if 'graduation_date_before' in search_params and search_params['graduation_date_before']:
-                filters.append(Attorney.graduation_date <= search_params['graduation_date_before'])
-            
-            if 'has_unicourt_data' in search_params:
-                if search_params['has_unicourt_data']:
-                    filters.append(Attorney.unicourt_id.is_not(None))
-                else:
-                    filters.append(Attorney.unicourt_id.is_(None))
+            filters = self._search_filters(search_params)
+            if visible_to:
+                filters.append(self._visible_to(visible_to))
             
             # Apply all filters to query
             if filters:
@@ -321,6 +361,41 @@ class AttorneyRepository:
             self._logger.error(f"Error searching for attorneys: {str(e)}")
             raise
     
+    def search_by_cursor(self, search_params: Dict[str, Any], cursor: Optional[str] = None,
+                         limit: int = DEFAULT_PAGE_SIZE, sort_by: str = 'name',
+                         total: str = 'none', visible_to: Optional[uuid.UUID] = None) -> CursorPaginatedResponse:
+        """
+        Search for attorneys one keyset page at a time
+        
+        Args:
+            search_params: Dictionary of search parameters
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of attorneys per page
+            sort_by: Column to sort by ('name' or 'created_at')
+            total: 'none', 'approximate' or 'exact' total count
+            visible_to: Optional UUID of the organization whose visible attorneys are searched
+            
+        Returns:
+            CursorPaginatedResponse of matching attorneys
+        """
+        if sort_by not in ('name', 'created_at'):
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        
+        try:
+            query = select(Attorney)
+            filters = self._search_filters(search_params)
+            if visible_to:
+                filters.append(self._visible_to(visible_to))
+            if filters:
+                query = query.where(and_(*filters))
+            
+            return paginate_by_cursor(
+                self._session, query, getattr(Attorney, sort_by), Attorney.id, cursor, limit, total=total
+            )
+        except Exception as e:
+            self._logger.error(f"Error searching for attorneys: {str(e)}")
+            raise
+    
     def get_with_rates(self, attorney_id: str, client_id: Optional[str] = None) -> Tuple[Attorney, List[Rate]]:
         """
         Retrieve an attorney with their associated rates
@@ -5,23 +5,73 @@ as well as specialized queries to support rate impact analysis and historical an
 """
 
 import uuid
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple, Union, Any
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 
 import sqlalchemy
-from sqlalchemy import func, and_, or_, desc, asc, text
+from sqlalchemy import func, and_, or_, desc, asc, text, select, update, cast, literal_column, Date
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, aliased
 import pandas as pd
 
-from ..models.billing import BillingHistory, MatterBillingSummary
+from ..models.billing import BillingHistory, MatterBillingSummary, BillingAggregate, BILLING_AGGREGATE_KEY
 from ..session import session_scope, get_db, get_read_db
+from ...utils.datetime_utils import add_months, get_first_day_of_month, get_last_day_of_month
 from ...utils.logging import get_logger
 from ...utils.validators import validate_required, validate_positive_number, validate_currency
 
 # Set up logger
 logger = get_logger(__name__, 'repository')
 
+# Rows per aggregate upsert statement, keeping each statement well under PostgreSQL's bind parameter limit
+AGGREGATE_UPSERT_CHUNK_SIZE = 1000
+
+# Billing fields that decide which aggregate row a record contributes to, or how much
+AGGREGATED_FIELDS = {'attorney_id', 'client_id', 'hours', 'fees', 'billing_date', 'is_afa',
+                     'currency', 'practice_area', 'office_id'}
+
+
+def _as_uuid(value: Any) -> Optional[uuid.UUID]:
+    """Normalizes a UUID given as a string or UUID so aggregate keys compare equal"""
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def _as_date(value: Union[date, datetime, str]) -> date:
+    """Normalizes a billing date given as a date, datetime or ISO string"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _full_month_span(start_date: date, end_date: date) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Find the calendar months lying entirely within a date range
+
+    Args:
+        start_date: First day of the range (inclusive)
+        end_date: Last day of the range (inclusive)
+
+    Returns:
+        First days of the first and last fully covered months, or (None, None) if no month is fully covered
+    """
+    first_month = get_first_day_of_month(start_date)
+    if first_month != start_date:
+        first_month = add_months(first_month, 1)
+
+    last_month = get_first_day_of_month(end_date)
+    if get_last_day_of_month(end_date) != end_date:
+        last_month = add_months(last_month, -1)
+
+    if first_month > last_month:
+        return None, None
+    return first_month, last_month
+
 class BillingRepository:
     """
     Repository class for managing billing history data in the database,
@@ -270,6 +320,7 @@ class BillingRepository:
             )
             
             self._db.add(billing_record)
+            self._apply_to_aggregates([billing_record])
             self._db.commit()
             
             logger.info(f"Created billing record: {billing_record.id} for attorney {attorney_id}, client {client_id}")
@@ -310,11 +361,23 @@ class BillingRepository:
             if 'currency' in update_data:
                 validate_currency(update_data['currency'], "currency")
             
+            # Move the record's contribution out of its old aggregate row and into the new one
+            moves_aggregate = not AGGREGATED_FIELDS.isdisjoint(update_data)
+            if moves_aggregate:
+                self._apply_to_aggregates([billing_record], sign=-1)
+            
             # Update fields
             for key, value in update_data.items():
                 if hasattr(billing_record, key):
                     setattr(billing_record, key, value)
             
+            # A record moved to another attorney takes that attorney's firm and staff class
+            if 'attorney_id' in update_data:
+                billing_record.firm_id = None
+            
+            if moves_aggregate:
+                self._apply_to_aggregates([billing_record])
+            
             self._db.commit()
             logger.info(f"Updated billing record: {billing_id}")
             return billing_record
@@ -340,6 +403,7 @@ class BillingRepository:
                 logger.warning(f"Billing record {billing_id} not found for deletion")
                 return False
             
+            self._apply_to_aggregates([billing_record], sign=-1)
             self._db.delete(billing_record)
             self._db.commit()
             logger.info(f"Deleted billing record: {billing_id}")
@@ -410,6 +474,9 @@ class BillingRepository:
                 self._db.add(billing_record)
                 created_records.append(billing_record)
             
+            # Fold the whole batch into the aggregates in the same transaction
+            self._apply_to_aggregates(created_records)
+            
             # Commit all records
             self._db.commit()
             logger.info(f"Created {len(created_records)} billing records in bulk")
@@ -420,6 +487,247 @@ class BillingRepository:
             logger.error(f"Error creating billing records in bulk: {str(e)}")
             raise
     
+    def _attorney_dimensions(self, attorney_ids: set) -> Dict[uuid.UUID, Tuple[uuid.UUID, Optional[uuid.UUID]]]:
+        """
+        Look up the firm and staff class of several attorneys in one query
+
+        Args:
+            attorney_ids: UUIDs of the attorneys
+
+        Returns:
+            Dictionary mapping attorney_ids to (firm_id, staff_class_id)
+        """
+        Attorney = BillingHistory.attorney.property.entity.class_
+        rows = self._db.query(
+            Attorney.id, Attorney.organization_id, Attorney.staff_class_id
+        ).filter(
+            Attorney.id.in_(list(attorney_ids))
+        ).all()
+        return {row.id: (row.organization_id, row.staff_class_id) for row in rows}
+
+    def _apply_to_aggregates(self, records: List[BillingHistory], sign: int = 1) -> None:
+        """
+        Add billing records to, or remove them from, the billing aggregates without committing
+
+        Records are summed per aggregate key in memory and written with one upsert per
+        AGGREGATE_UPSERT_CHUNK_SIZE keys, so a bulk import costs a handful of statements.
+        Firm and staff class are the ones stored on each record; records without a stored
+        firm are first stamped with their attorney's current firm and staff class.
+
+        Args:
+            records: Billing records to apply
+            sign: 1 to add the records, -1 to remove them
+        """
+        if not records:
+            return
+
+        unstamped = [record for record in records if record.firm_id is None]
+        if unstamped:
+            dimensions = self._attorney_dimensions({_as_uuid(record.attorney_id) for record in unstamped})
+            for record in unstamped:
+                attorney_id = _as_uuid(record.attorney_id)
+                if attorney_id not in dimensions:
+                    raise ValueError(f"Attorney {attorney_id} not found")
+                record.firm_id, record.staff_class_id = dimensions[attorney_id]
+
+        totals = defaultdict(lambda: [Decimal('0'), Decimal('0'), 0])
+        for record in records:
+            key = (
+                _as_uuid(record.client_id),
+                _as_uuid(record.firm_id),
+                _as_uuid(record.attorney_id),
+                _as_uuid(record.staff_class_id),
+                record.practice_area,
+                _as_uuid(record.office_id),
+                get_first_day_of_month(_as_date(record.billing_date)),
+                record.currency or 'USD',
+                bool(record.is_afa),
+            )
+            total = totals[key]
+            total[0] += Decimal(str(record.hours))
+            total[1] += Decimal(str(record.fees))
+            total[2] += 1
+
+        values = [
+            dict(zip(BILLING_AGGREGATE_KEY, key), hours=sign * hours, fees=sign * fees, record_count=sign * count)
+            for key, (hours, fees, count) in totals.items()
+        ]
+        for start in range(0, len(values), AGGREGATE_UPSERT_CHUNK_SIZE):
+            statement = insert(BillingAggregate).values(values[start:start + AGGREGATE_UPSERT_CHUNK_SIZE])
+            statement = statement.on_conflict_do_update(
+                index_elements=list(BILLING_AGGREGATE_KEY),
+                set_={
+                    'hours': BillingAggregate.hours + statement.excluded.hours,
+                    'fees': BillingAggregate.fees + statement.excluded.fees,
+                    'record_count': BillingAggregate.record_count + statement.excluded.record_count,
+                    'updated_at': datetime.utcnow(),
+                },
+            )
+            self._db.execute(statement)
+
+        if sign < 0:
+            # Drop rows whose last record was removed
+            self._db.query(BillingAggregate).filter(
+                BillingAggregate.client_id.in_({key[0] for key in totals}),
+                BillingAggregate.record_count <= 0
+            ).delete(synchronize_session=False)
+
+    def rebuild_aggregates(self, client_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Recompute the billing aggregates from billing history with a single INSERT ... SELECT
+
+        Used to backfill the aggregates. Billing records without a stored firm are first
+        stamped with their attorney's current firm and staff class.
+
+        Args:
+            client_id: Optional UUID of the client to rebuild, rebuilds every client if omitted
+
+        Returns:
+            Number of aggregate rows written
+        """
+        try:
+            Attorney = BillingHistory.attorney.property.entity.class_
+            stamp = update(BillingHistory).where(
+                BillingHistory.attorney_id == Attorney.id,
+                BillingHistory.firm_id.is_(None)
+            ).values(firm_id=Attorney.organization_id, staff_class_id=Attorney.staff_class_id)
+            if client_id:
+                stamp = stamp.where(BillingHistory.client_id == client_id)
+            self._db.execute(stamp)
+
+            # Rendered inline so the SELECT and GROUP BY expressions are identical
+            month = cast(func.date_trunc(literal_column("'month'"), BillingHistory.billing_date), Date)
+
+            source = select(
+                func.gen_random_uuid(),
+                BillingHistory.client_id,
+                BillingHistory.firm_id,
+                BillingHistory.attorney_id,
+                BillingHistory.staff_class_id,
+                BillingHistory.practice_area,
+                BillingHistory.office_id,
+                month,
+                BillingHistory.currency,
+                BillingHistory.is_afa,
+                func.sum(BillingHistory.hours),
+                func.sum(BillingHistory.fees),
+                func.count(BillingHistory.id),
+            ).where(
+                BillingHistory.firm_id.isnot(None)
+            ).group_by(
+                BillingHistory.client_id,
+                BillingHistory.firm_id,
+                BillingHistory.attorney_id,
+                BillingHistory.staff_class_id,
+                BillingHistory.practice_area,
+                BillingHistory.office_id,
+                month,
+                BillingHistory.currency,
+                BillingHistory.is_afa,
+            )
+
+            existing = self._db.query(BillingAggregate)
+            if client_id:
+                source = source.where(BillingHistory.client_id == client_id)
+                existing = existing.filter(BillingAggregate.client_id == client_id)
+            existing.delete(synchronize_session=False)
+
+            result = self._db.execute(
+                insert(BillingAggregate).from_select(
+                    ['id', *BILLING_AGGREGATE_KEY, 'hours', 'fees', 'record_count'], source
+                )
+            )
+            self._db.commit()
+
+            logger.info(f"Rebuilt {result.rowcount} billing aggregate rows" + (f" for client {client_id}" if client_id else ""))
+            return result.rowcount
+
+        except Exception as e:
+            self._db.rollback()
+            logger.error(f"Error rebuilding billing aggregates: {str(e)}")
+            raise
+
+    def _sum_hours_and_fees_by(self, dimensions: List[str],
+                               client_id: uuid.UUID,
+                               firm_id: uuid.UUID,
+                               start_date: date,
+                               end_date: date,
+                               filter_dimension: Optional[str] = None,
+                               filter_ids: Optional[List[uuid.UUID]] = None) -> Dict[tuple, List[Decimal]]:
+        """
+        Sum hours and fees for a client-firm relationship grouped by attorney and/or staff class
+
+        Whole months are read from the billing aggregates; only the partial months at either
+        end of the range, if any, are summed from raw billing history. Both are grouped by the
+        firm and staff class stored with the billing records, so a month is attributed the same
+        way whichever source it is read from.
+
+        Args:
+            dimensions: Grouping dimensions, any of 'attorney_id' and 'staff_class_id'
+            client_id: UUID of the client
+            firm_id: UUID of the law firm
+            start_date: Start date for the analysis period
+            end_date: End date for the analysis period
+            filter_dimension: Optional dimension to restrict to filter_ids
+            filter_ids: Optional list of IDs of filter_dimension to include
+
+        Returns:
+            Dictionary mapping tuples of dimension values to [total_hours, total_fees]
+        """
+        totals = defaultdict(lambda: [Decimal('0'), Decimal('0')])
+        raw_ranges = [(start_date, end_date)]
+
+        first_month, last_month = _full_month_span(start_date, end_date)
+        if first_month:
+            columns = [getattr(BillingAggregate, dimension) for dimension in dimensions]
+            query = self._db.query(
+                *columns,
+                func.sum(BillingAggregate.hours),
+                func.sum(BillingAggregate.fees)
+            ).filter(
+                BillingAggregate.client_id == client_id,
+                BillingAggregate.firm_id == firm_id,
+                BillingAggregate.month >= first_month,
+                BillingAggregate.month <= last_month
+            )
+            if filter_ids:
+                query = query.filter(getattr(BillingAggregate, filter_dimension).in_(filter_ids))
+
+            for row in query.group_by(*columns).all():
+                total = totals[tuple(row[:-2])]
+                total[0] += row[-2] or 0
+                total[1] += row[-1] or 0
+
+            raw_ranges = [
+                (start_date, first_month - timedelta(days=1)),
+                (add_months(last_month, 1), end_date),
+            ]
+
+        columns = [getattr(BillingHistory, dimension) for dimension in dimensions]
+        for range_start, range_end in raw_ranges:
+            if range_start > range_end:
+                continue
+
+            query = self._db.query(
+                *columns,
+                func.sum(BillingHistory.hours),
+                func.sum(BillingHistory.fees)
+            ).filter(
+                BillingHistory.client_id == client_id,
+                BillingHistory.firm_id == firm_id,
+                BillingHistory.billing_date >= range_start,
+                BillingHistory.billing_date <= range_end
+            )
+            if filter_ids:
+                query = query.filter(getattr(BillingHistory, filter_dimension).in_(filter_ids))
+
+            for row in query.group_by(*columns).all():
+                total = totals[tuple(row[:-2])]
+                total[0] += row[-2] or 0
+                total[1] += row[-1] or 0
+
+        return dict(totals)
+
     def get_attorney_hours_for_rate_impact(self, client_id: uuid.UUID, 
                                          firm_id: uuid.UUID, 
                                          start_date: date, 
@@ -439,31 +747,10 @@ class BillingRepository:
             Dictionary mapping attorney_ids to their total hours
         """
         try:
-            # Create join with Attorney model to filter by firm
-            Attorney = aliased(BillingHistory.attorney.property.entity.class_)
-            
-            query = self._db.query(
-                BillingHistory.attorney_id,
-                func.sum(BillingHistory.hours).label('total_hours')
-            ).join(
-                Attorney, BillingHistory.attorney_id == Attorney.id
-            ).filter(
-                BillingHistory.client_id == client_id,
-                Attorney.organization_id == firm_id,
-                BillingHistory.billing_date >= start_date,
-                BillingHistory.billing_date <= end_date
+            totals = self._sum_hours_and_fees_by(
+                ['attorney_id'], client_id, firm_id, start_date, end_date, 'attorney_id', attorney_ids
             )
-            
-            # Filter by specific attorneys if provided
-            if attorney_ids:
-                query = query.filter(BillingHistory.attorney_id.in_(attorney_ids))
-            
-            # Group by attorney
-            query = query.group_by(BillingHistory.attorney_id)
-            
-            # Execute query and convert to dictionary
-            results = query.all()
-            return {row.attorney_id: row.total_hours for row in results}
+            return {key[0]: hours for key, (hours, fees) in totals.items()}
             
         except Exception as e:
             logger.error(f"Error retrieving attorney hours for rate impact analysis: {str(e)}")
@@ -488,36 +775,44 @@ class BillingRepository:
             Dictionary mapping staff_class_ids to their total hours
         """
         try:
-            # Create aliases for the join tables
-            Attorney = aliased(BillingHistory.attorney.property.entity.class_)
-            
-            query = self._db.query(
-                Attorney.staff_class_id,
-                func.sum(BillingHistory.hours).label('total_hours')
-            ).join(
-                Attorney, BillingHistory.attorney_id == Attorney.id
-            ).filter(
-                BillingHistory.client_id == client_id,
-                Attorney.organization_id == firm_id,
-                BillingHistory.billing_date >= start_date,
-                BillingHistory.billing_date <= end_date
+            totals = self._sum_hours_and_fees_by(
+                ['staff_class_id'], client_id, firm_id, start_date, end_date, 'staff_class_id', staff_class_ids
             )
-            
-            # Filter by specific staff classes if provided
-            if staff_class_ids:
-                query = query.filter(Attorney.staff_class_id.in_(staff_class_ids))
-            
-            # Group by staff class
-            query = query.group_by(Attorney.staff_class_id)
-            
-            # Execute query and convert to dictionary
-            results = query.all()
-            return {row.staff_class_id: row.total_hours for row in results}
+            return {key[0]: hours for key, (hours, fees) in totals.items()}
             
         except Exception as e:
             logger.error(f"Error retrieving staff class hours for rate impact analysis: {str(e)}")
             return {}
     
+    def get_rate_impact_hours(self, client_id: uuid.UUID,
+                              firm_id: uuid.UUID,
+                              start_date: date,
+                              end_date: date) -> List[Dict[str, Any]]:
+        """
+        Get billing hours and fees by attorney and staff class for rate impact analysis
+        
+        Args:
+            client_id: UUID of the client
+            firm_id: UUID of the law firm
+            start_date: Start date for the analysis period
+            end_date: End date for the analysis period
+            
+        Returns:
+            List of dictionaries with attorney_id, staff_class_id, hours and fees
+        """
+        try:
+            totals = self._sum_hours_and_fees_by(
+                ['attorney_id', 'staff_class_id'], client_id, firm_id, start_date, end_date
+            )
+            return [
+                {'attorney_id': attorney_id, 'staff_class_id': staff_class_id, 'hours': hours, 'fees': fees}
+                for (attorney_id, staff_class_id), (hours, fees) in totals.items()
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error retrieving billing hours for rate impact analysis: {str(e)}")
+            return []
+    
     def get_total_hours_and_fees(self, client_id: uuid.UUID, 
                                 firm_id: Optional[uuid.UUID] = None,
                                 start_date: date = None, 
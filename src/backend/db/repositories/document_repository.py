@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from ..models.document import Document, DocumentType
 from ...utils.logging import logger
+from ...utils.ownership_cache import invalidate_owners
 
 
 class DocumentRepository:
@@ -110,6 +111,24 @@ class DocumentRepository:
             )
             raise
 
+    def get_document_by_file_path(self, file_path: str) -> Optional[Document]:
+        """Retrieve the document stored at a file path
+        
+        Args:
+            file_path: Full storage path of the document file
+            
+        Returns:
+            The document stored at the path or None if not found
+        """
+        try:
+            return self._session.query(Document).filter(Document.file_path == file_path).first()
+        except Exception as e:
+            logger.error(
+                f"Error retrieving document by file path: {str(e)}",
+                extra={"additional_data": {"file_path": file_path}}
+            )
+            raise
+
     def get_documents_by_organization(
         self,
         organization_id: str,
@@ -238,6 +257,7 @@ class DocumentRepository:
             # Delete the document
             self._session.delete(document)
             self._session.commit()
+            invalidate_owners('document', document_id)
             
             logger.info(
                 f"Deleted document {document_id}",
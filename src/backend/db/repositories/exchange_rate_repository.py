@@ -0,0 +1,138 @@
+"""
+Repository class for handling database operations related to historical exchange rates.
+Provides range reads and bulk upserts so that a full history of daily rates can be loaded
+into memory with a single query.
+"""
+
+from collections import defaultdict
+from typing import Dict, Union
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..models.exchange_rate import ExchangeRate
+from ...utils.logging import get_logger
+
+# Set up logger
+logger = get_logger(__name__, 'repository')
+
+# Rows per INSERT statement, keeping each statement well under PostgreSQL's bind parameter limit
+UPSERT_CHUNK_SIZE = 1000
+
+
+class ExchangeRateRepository:
+    """
+    Repository class for managing persisted daily exchange rates.
+    """
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize a new ExchangeRateRepository instance with a database session
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self._db = db_session
+        logger.debug("ExchangeRateRepository initialized")
+
+    def get_rates_by_date(self, base_currency: str, start_date: date, end_date: date) -> Dict[date, Dict[str, Decimal]]:
+        """
+        Get every persisted rate against a base currency within a date range in one query
+
+        Args:
+            base_currency: Currency code the rates are quoted against
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            Mapping of day to a mapping of currency code to rate
+        """
+        try:
+            rows = self._db.query(
+                ExchangeRate.rate_date, ExchangeRate.currency, ExchangeRate.rate
+            ).filter(
+                ExchangeRate.base_currency == base_currency,
+                ExchangeRate.rate_date >= start_date,
+                ExchangeRate.rate_date <= end_date,
+            ).all()
+
+            rates_by_date = defaultdict(dict)
+            for rate_date, currency, rate in rows:
+                rates_by_date[rate_date][currency] = rate
+            return dict(rates_by_date)
+        except Exception as e:
+            logger.error(f"Error retrieving exchange rates for {base_currency} from {start_date} to {end_date}: {str(e)}")
+            return {}
+
+    def get_latest_rates_before(self, base_currency: str, before_date: date) -> Dict[str, Decimal]:
+        """
+        Get the rates of the last persisted day before a date
+
+        Args:
+            base_currency: Currency code the rates are quoted against
+            before_date: Day the persisted day must precede
+
+        Returns:
+            Mapping of currency code to rate, empty if no earlier day is persisted
+        """
+        try:
+            latest_date = self._db.query(func.max(ExchangeRate.rate_date)).filter(
+                ExchangeRate.base_currency == base_currency,
+                ExchangeRate.rate_date < before_date,
+            ).scalar()
+        except Exception as e:
+            logger.error(f"Error retrieving the last exchange rates for {base_currency} before {before_date}: {str(e)}")
+            return {}
+        if latest_date is None:
+            return {}
+        return self.get_rates_by_date(base_currency, latest_date, latest_date).get(latest_date, {})
+
+    def bulk_upsert(self, base_currency: str, rates_by_date: Dict[Union[date, datetime], Dict[str, Union[Decimal, float]]],
+                    source: str = 'api') -> int:
+        """
+        Insert or update the rates of several days in a single statement
+
+        Args:
+            base_currency: Currency code the rates are quoted against
+            rates_by_date: Mapping of day to a mapping of currency code to rate
+            source: Where the rates were obtained from
+
+        Returns:
+            Number of rates written
+        """
+        values = [
+            {
+                'base_currency': base_currency,
+                'currency': currency,
+                'rate_date': rate_date.date() if isinstance(rate_date, datetime) else rate_date,
+                'rate': Decimal(str(rate)),
+                'source': source,
+            }
+            for rate_date, rates in rates_by_date.items()
+            for currency, rate in rates.items()
+        ]
+        if not values:
+            return 0
+
+        try:
+            for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+                statement = insert(ExchangeRate).values(values[start:start + UPSERT_CHUNK_SIZE])
+                statement = statement.on_conflict_do_update(
+                    constraint='uq_exchange_rates_base_date_currency',
+                    set_={
+                        'rate': statement.excluded.rate,
+                        'source': statement.excluded.source,
+                        'updated_at': datetime.utcnow(),
+                    },
+                )
+                self._db.execute(statement)
+            self._db.commit()
+            logger.info(f"Stored {len(values)} exchange rates against {base_currency}")
+            return len(values)
+        except Exception as e:
+            self._db.rollback()
+            logger.error(f"Error storing exchange rates against {base_currency}: {str(e)}")
+            raise
@@ -3,15 +3,41 @@ Repository class for managing message data with support for hierarchical message
 attachments, and full history tracking.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import namedtuple
+from typing import List, Dict, Any, Optional, Tuple
+import threading
 import uuid
+import weakref
 from datetime import datetime
 
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, and_, or_, func, cast, literal_column
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, UUID, insert
+from sqlalchemy.orm import Session, aliased
 
 from db.session import Session
-from db.models.message import Message, RelatedEntityType
+from db.models.message import Message, MessageReadState, RelatedEntityType, MESSAGE_SEARCH_CONFIG
+from utils.ownership_cache import invalidate_owners
+from utils.pagination import (
+    CursorPaginatedResponse, apply_keyset, count_query, decode_cursor, finish_keyset_page, paginate_by_cursor
+)
+from utils.search_index import InvertedIndex
+from utils.unread_counters import (
+    begin_unread_updates, get_unread_counts, get_unread_seed_version, increment_unread, invalidate_unread_counts,
+    seed_unread_counts, set_thread_unread
+)
+
+# Orders supported by message search: best match first, or newest first
+SEARCH_SORTS = ('relevance', 'recent')
+
+# A thread matched by a search, ranked by its best-matching message
+ThreadMatch = namedtuple('ThreadMatch', ['thread_id', 'search_rank', 'match_count', 'last_match_at'])
+
+# Text search configuration as a constant, so PostgreSQL does not receive it as a bind parameter
+_search_config = literal_column(f"'{MESSAGE_SEARCH_CONFIG}'::regconfig")
+
+# In-memory search indexes of databases without a full-text index, one per engine
+_fallback_indexes = weakref.WeakKeyDictionary()
+_fallback_indexes_lock = threading.Lock()
 
 
 class MessageRepository:
@@ -53,9 +79,19 @@ class MessageRepository:
             related_entity_id=message_data.get('related_entity_id')
         )
         
-        # Add to database and commit
+        # Add to database and count the message as unread for its recipients in the same transaction
         self.db_session.add(message)
-        self.db_session.commit()
+        recipient_ids = self._recipient_ids(message)
+        begin_unread_updates(recipient_ids)
+        try:
+            if recipient_ids:
+                self._count_unread(thread_id, recipient_ids)
+            self.db_session.commit()
+        except Exception:
+            increment_unread(recipient_ids, thread_id, 0)
+            raise
+        self._index_message(message)
+        increment_unread(recipient_ids, thread_id)
         
         return message
 
@@ -95,6 +131,43 @@ class MessageRepository:
         result = self.db_session.execute(stmt).scalars().all()
         return list(result)
 
+    def get_messages_page(self, user_id: uuid.UUID, thread_id: Optional[uuid.UUID] = None,
+                          related_entity_type: Optional[RelatedEntityType] = None,
+                          related_entity_id: Optional[uuid.UUID] = None, cursor: Optional[str] = None,
+                          limit: int = 20, total: str = 'none') -> CursorPaginatedResponse:
+        """
+        Retrieves one keyset page of the messages a user sent or received, newest first.
+        
+        Args:
+            user_id: UUID of the user whose messages to list
+            thread_id: Optional UUID of the thread to filter by
+            related_entity_type: Optional related entity type to filter by
+            related_entity_id: Optional related entity UUID to filter by
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of messages per page
+            total: 'none', 'approximate' or 'exact' total count
+            
+        Returns:
+            CursorPaginatedResponse of messages
+        """
+        stmt = select(Message).where(or_(
+            Message.sender_id == user_id,
+            Message.recipient_ids.contains([str(user_id)])
+        ))
+        
+        if thread_id:
+            stmt = stmt.where(Message.thread_id == thread_id)
+            
+        if related_entity_type:
+            stmt = stmt.where(Message.related_entity_type == related_entity_type)
+            
+        if related_entity_id:
+            stmt = stmt.where(Message.related_entity_id == related_entity_id)
+        
+        return paginate_by_cursor(
+            self.db_session, stmt, Message.created_at, Message.id, cursor, limit, ascending=False, total=total
+        )
+
     def get_thread_count(self, thread_id: uuid.UUID) -> int:
         """
         Retrieves the total count of messages in a thread.
@@ -188,6 +261,8 @@ class MessageRepository:
         """
         Searches messages based on content, sender, or other criteria.
         
+        Content is matched through the full-text index (see search_messages_page for the query syntax).
+        
         Args:
             search_term: Text to search for in message content
             filters: Dictionary of additional filters like sender_id, thread_id, etc.
@@ -197,22 +272,226 @@ class MessageRepository:
         Returns:
             List of messages matching the search criteria
         """
-        filters = filters or {}
-        
         # Start with base query
         stmt = select(Message)
         
         # Add content search
         if search_term:
-            stmt = stmt.where(func.lower(Message.content).contains(func.lower(search_term)))
+            condition, _ = self._search_condition(search_term)
+            stmt = stmt.where(condition)
         
         # Add filters
+        stmt = self._apply_search_filters(stmt, filters or {})
+        
+        # Add sorting, pagination
+        stmt = stmt.order_by(Message.created_at.desc()).offset(skip).limit(limit)
+        
+        # Execute query and return results
+        result = self.db_session.execute(stmt).scalars().all()
+        return list(result)
+
+    def count_search_messages(self, search_term: str, filters: Dict = None) -> int:
+        """
+        Counts the messages search_messages pages through.
+        
+        Args:
+            search_term: Text to search for in message content
+            filters: Dictionary of additional filters like sender_id, thread_id, etc.
+            
+        Returns:
+            Number of messages matching the search criteria
+        """
+        stmt = select(Message)
+        if search_term:
+            condition, _ = self._search_condition(search_term)
+            stmt = stmt.where(condition)
+        return count_query(self.db_session, self._apply_search_filters(stmt, filters or {}))
+
+    def search_messages_page(self, search_term: str, filters: Dict = None, cursor: Optional[str] = None,
+                             limit: int = 20, sort: str = 'relevance', total: str = 'none') -> CursorPaginatedResponse:
+        """
+        Retrieves one keyset page of messages matching a full-text query.
+        
+        The query uses web-search syntax: words must all match, "quoted text" matches a phrase,
+        "or" between two clauses matches either and a leading "-" excludes a clause. On PostgreSQL
+        the GIN index on the search_vector column serves the match; other databases use an
+        in-memory inverted index kept up to date by this repository.
+        
+        Args:
+            search_term: Full-text query
+            filters: Dictionary of additional filters like thread_id, negotiation_id, participant_id, etc.
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of messages per page
+            sort: 'relevance' (best match first, each message carrying its search_rank) or 'recent'
+            total: 'none', 'approximate' or 'exact' total count
+            
+        Returns:
+            CursorPaginatedResponse of messages
+            
+        Raises:
+            ValueError: If the sort is not supported or the cursor is invalid
+        """
+        if sort not in SEARCH_SORTS:
+            raise ValueError(f"Unsupported search sort: {sort}")
+        
+        condition, rank = self._search_condition(search_term)
+        stmt = self._apply_search_filters(select(Message).where(condition), filters or {})
+        
+        if sort == 'recent':
+            return paginate_by_cursor(
+                self.db_session, stmt, Message.created_at, Message.id, cursor, limit, ascending=False, total=total
+            )
+        
+        total_count = None
+        if total in ('approximate', 'exact'):
+            total_count = count_query(self.db_session, stmt, approximate=total == 'approximate')
+        
+        if isinstance(rank, dict):
+            messages = self._rank_in_memory(stmt, rank, cursor, limit)
+        else:
+            search_rank = rank.label('search_rank')
+            page_stmt = apply_keyset(stmt.add_columns(search_rank), search_rank, Message.id, cursor, limit,
+                                     ascending=False, sort_key='rank')
+            messages = []
+            for message, message_rank in self.db_session.execute(page_stmt):
+                message.search_rank = message_rank
+                messages.append(message)
+        
+        items, next_cursor = finish_keyset_page(messages, limit, 'search_rank', 'id', sort_key='rank')
+        return CursorPaginatedResponse(
+            items=items,
+            limit=limit,
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_is_approximate=total == 'approximate'
+        )
+
+    def search_threads_page(self, search_term: str, filters: Dict = None, cursor: Optional[str] = None,
+                            limit: int = 20) -> CursorPaginatedResponse:
+        """
+        Retrieves one keyset page of threads containing messages that match a full-text query.
+        
+        Threads are ranked by their best-matching message.
+        
+        Args:
+            search_term: Full-text query (see search_messages_page for the syntax)
+            filters: Dictionary of message filters like negotiation_id, participant_id, etc.
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of threads per page
+            
+        Returns:
+            CursorPaginatedResponse of ThreadMatch tuples
+        """
+        condition, rank = self._search_condition(search_term)
+        
+        if isinstance(rank, dict):
+            stmt = self._apply_search_filters(select(Message).where(condition), filters or {})
+            threads: Dict[Any, ThreadMatch] = {}
+            for message in self.db_session.execute(stmt).scalars():
+                match = threads.get(message.thread_id)
+                message_rank = rank[message.id]
+                if match is None:
+                    threads[message.thread_id] = ThreadMatch(message.thread_id, message_rank, 1, message.created_at)
+                else:
+                    threads[message.thread_id] = ThreadMatch(
+                        message.thread_id, max(match.search_rank, message_rank), match.match_count + 1,
+                        max(match.last_match_at, message.created_at)
+                    )
+            rows = sorted(threads.values(), key=lambda match: (match.search_rank, match.thread_id), reverse=True)
+            if cursor:
+                position = tuple(decode_cursor(cursor, 'rank'))
+                rows = [match for match in rows if (match.search_rank, match.thread_id) < position]
+            rows = rows[:limit + 1]
+        else:
+            matches = self._apply_search_filters(
+                select(Message.thread_id, rank.label('search_rank'), Message.created_at).where(condition),
+                filters or {}
+            ).subquery()
+            threads_query = (
+                select(
+                    matches.c.thread_id,
+                    func.max(matches.c.search_rank).label('search_rank'),
+                    func.count().label('match_count'),
+                    func.max(matches.c.created_at).label('last_match_at'),
+                )
+                .group_by(matches.c.thread_id)
+                .subquery()
+            )
+            page_stmt = apply_keyset(select(threads_query), threads_query.c.search_rank, threads_query.c.thread_id,
+                                     cursor, limit, ascending=False, sort_key='rank')
+            rows = [ThreadMatch(**row._mapping) for row in self.db_session.execute(page_stmt)]
+        
+        items, next_cursor = finish_keyset_page(rows, limit, 'search_rank', 'thread_id', sort_key='rank')
+        return CursorPaginatedResponse(items=items, limit=limit, next_cursor=next_cursor)
+
+    def _search_condition(self, search_term: str) -> Tuple[Any, Any]:
+        """
+        Builds the predicate matching messages for a full-text query.
+        
+        Args:
+            search_term: Full-text query
+            
+        Returns:
+            Tuple of the predicate and either the rank expression (PostgreSQL) or a dictionary of
+            relevance scores by message ID (in-memory index)
+        """
+        if self._has_full_text_index():
+            query = func.websearch_to_tsquery(_search_config, search_term)
+            # ts_rank_cd returns float4; as float8 the value in a cursor compares equal to the row it came from
+            rank = cast(func.ts_rank_cd(Message.search_vector, query), DOUBLE_PRECISION)
+            return Message.search_vector.op('@@')(query), rank
+        
+        scores = self._fallback_index().search(search_term)
+        return Message.id.in_(list(scores)), scores
+
+    def _rank_in_memory(self, stmt: Any, scores: Dict[Any, float], cursor: Optional[str], limit: int) -> List[Message]:
+        """
+        Orders messages matched through the in-memory index by relevance and applies the keyset.
+        
+        Returns:
+            Messages after the cursor, best match first, plus one look-ahead message
+        """
+        messages = list(self.db_session.execute(stmt).scalars().all())
+        for message in messages:
+            message.search_rank = scores[message.id]
+        messages.sort(key=lambda message: (message.search_rank, message.id), reverse=True)
+        
+        if cursor:
+            position = tuple(decode_cursor(cursor, 'rank'))
+            messages = [message for message in messages if (message.search_rank, message.id) < position]
+        return messages[:limit + 1]
+
+    @staticmethod
+    def _apply_search_filters(stmt: Any, filters: Dict) -> Any:
+        """
+        Applies message search filters to a statement.
+        
+        Args:
+            stmt: select() statement over messages
+            filters: Dictionary with optional sender_id, participant_id, thread_id, negotiation_id,
+                related_entity_type, related_entity_id, start_date and end_date
+            
+        Returns:
+            The filtered statement
+        """
         if filters.get('sender_id'):
             stmt = stmt.where(Message.sender_id == filters['sender_id'])
             
+        if filters.get('participant_id'):
+            stmt = stmt.where(or_(
+                Message.sender_id == filters['participant_id'],
+                Message.recipient_ids.contains([str(filters['participant_id'])])
+            ))
+            
         if filters.get('thread_id'):
             stmt = stmt.where(Message.thread_id == filters['thread_id'])
             
+        if filters.get('negotiation_id'):
+            stmt = stmt.where(and_(
+                Message.related_entity_type == RelatedEntityType.Negotiation,
+                Message.related_entity_id == filters['negotiation_id']
+            ))
+            
         if filters.get('related_entity_type'):
             stmt = stmt.where(Message.related_entity_type == filters['related_entity_type'])
             
@@ -225,12 +504,48 @@ class MessageRepository:
         if filters.get('end_date'):
             stmt = stmt.where(Message.created_at <= filters['end_date'])
         
-        # Add sorting, pagination
-        stmt = stmt.order_by(Message.created_at.desc()).offset(skip).limit(limit)
+        return stmt
+
+    def _has_full_text_index(self) -> bool:
+        """Whether the database maintains and serves the message full-text index itself."""
+        return self.db_session.get_bind().dialect.name == 'postgresql'
+
+    def _fallback_index(self, build: bool = True) -> Optional[InvertedIndex]:
+        """
+        Gets the in-memory search index of the session's database.
         
-        # Execute query and return results
-        result = self.db_session.execute(stmt).scalars().all()
-        return list(result)
+        Args:
+            build: Whether to build the index from the messages table if it does not exist yet
+            
+        Returns:
+            The index, or None if it does not exist and build is False
+        """
+        bind = self.db_session.get_bind()
+        engine = getattr(bind, 'engine', bind)
+        with _fallback_indexes_lock:
+            index = _fallback_indexes.get(engine)
+            if index is None and build:
+                index = InvertedIndex()
+                for message_id, content in self.db_session.execute(select(Message.id, Message.content)):
+                    index.add(message_id, content)
+                _fallback_indexes[engine] = index
+        return index
+
+    def _index_message(self, message: Message) -> None:
+        """Adds a created or edited message to the in-memory search index, if one is in use."""
+        if self._has_full_text_index():
+            return  # PostgreSQL recomputes search_vector on write
+        index = self._fallback_index(build=False)
+        if index is not None:
+            index.add(message.id, message.content)
+
+    def _unindex_message(self, message_id: uuid.UUID) -> None:
+        """Removes a deleted message from the in-memory search index, if one is in use."""
+        if self._has_full_text_index():
+            return
+        index = self._fallback_index(build=False)
+        if index is not None:
+            index.remove(message_id)
 
     def update_message(self, message_id: uuid.UUID, update_data: Dict) -> Optional[Message]:
         """
@@ -256,6 +571,10 @@ class MessageRepository:
         # Update timestamp and save
         message.updated_at = datetime.utcnow()
         self.db_session.commit()
+        if 'content' in update_data:
+            self._index_message(message)
+        if 'sender_id' in update_data or 'recipient_ids' in update_data:
+            invalidate_owners('message', message.id)
         return message
 
     def mark_as_read(self, message_id: uuid.UUID, user_id: uuid.UUID) -> bool:
@@ -279,48 +598,45 @@ class MessageRepository:
         if str_user_id not in recipient_ids:
             return False
             
-        # Use the model's method to mark as read
+        # Use the model's method to mark as read, and move the user's read watermark in the thread past it
         message.mark_as_read()
+        unread_count = self._advance_read_watermark(message.thread_id, user_id, message.created_at)
         self.db_session.commit()
+        if unread_count is not None:
+            set_thread_unread(user_id, message.thread_id, unread_count)
         return True
 
     def mark_thread_as_read(self, thread_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """
         Marks all messages in a thread as read by a specific user.
         
+        Moves the user's read watermark in the thread to now with a single UPDATE of their
+        read state; the messages themselves are not touched.
+        
         Args:
             thread_id: UUID of the thread
             user_id: UUID of the user who read the messages
             
         Returns:
-            True if all messages were marked as read, False otherwise
+            True if the thread had unread messages, False otherwise
         """
-        # Get all unread messages in thread
+        now = datetime.utcnow()
         stmt = (
-            select(Message)
+            update(MessageReadState)
             .where(and_(
-                Message.thread_id == thread_id,
-                Message.is_read == False
+                MessageReadState.user_id == user_id,
+                MessageReadState.thread_id == thread_id,
+                MessageReadState.unread_count > 0
             ))
+            .values(last_read_at=now, unread_count=0, updated_at=now)
         )
-        messages = self.db_session.execute(stmt).scalars().all()
-        
-        # Filter messages where user is a recipient
-        str_user_id = str(user_id)
-        messages_to_update = []
-        for message in messages:
-            recipient_ids = [str(r_id) for r_id in message.recipient_ids]
-            if str_user_id in recipient_ids:
-                messages_to_update.append(message)
+        result = self.db_session.execute(stmt)
+        self.db_session.commit()
         
-        if not messages_to_update:
+        if not result.rowcount:
             return False
             
-        # Mark all matching messages as read
-        for message in messages_to_update:
-            message.mark_as_read()
-            
-        self.db_session.commit()
+        set_thread_unread(user_id, thread_id, 0)
         return True
 
     def delete_message(self, message_id: uuid.UUID) -> bool:
@@ -337,8 +653,20 @@ class MessageRepository:
         if not message:
             return False
             
-        self.db_session.delete(message)
-        self.db_session.commit()
+        # Recipients who had not read the message yet have one unread message less
+        recipient_ids = self._recipient_ids(message)
+        begin_unread_updates(recipient_ids)
+        try:
+            self.db_session.delete(message)
+            unread_by = self._uncount_unread(message, recipient_ids) if recipient_ids else []
+            self.db_session.commit()
+        except Exception:
+            increment_unread(recipient_ids, message.thread_id, 0)
+            raise
+        self._unindex_message(message.id)
+        increment_unread(unread_by, message.thread_id, -1)
+        increment_unread([user_id for user_id in recipient_ids if user_id not in unread_by], message.thread_id, 0)
+        invalidate_owners('message', message.id)
         return True
 
     def get_unread_message_count(self, user_id: uuid.UUID) -> int:
@@ -351,20 +679,179 @@ class MessageRepository:
         Returns:
             Count of unread messages
         """
-        str_user_id = str(user_id)
+        return sum(self.get_unread_counts_by_thread(user_id).values())
+
+    def get_unread_thread_count(self, user_id: uuid.UUID) -> int:
+        """
+        Gets the count of threads with unread messages for a specific user.
         
-        # Query for unread messages
-        stmt = select(Message).where(Message.is_read == False)
-        messages = self.db_session.execute(stmt).scalars().all()
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            Count of threads with unread messages
+        """
+        return len(self.get_unread_counts_by_thread(user_id))
+
+    def get_unread_counts_by_thread(self, user_id: uuid.UUID) -> Dict[str, int]:
+        """
+        Gets a user's unread message counts by thread.
         
-        # Filter where user is in recipient_ids
-        count = 0
-        for message in messages:
-            recipient_ids = [str(r_id) for r_id in message.recipient_ids]
-            if str_user_id in recipient_ids:
-                count += 1
-                
-        return count
+        Counts are served from the user's Redis counters; on a miss they are read from the
+        user's read states, never from the messages table, and used to seed the counters.
+        
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            Dictionary mapping thread IDs with unread messages to their unread message counts
+        """
+        counts = get_unread_counts(user_id)
+        if counts is not None:
+            return counts
+            
+        # The version is read before the snapshot, so a snapshot that races a writer is not stored
+        version = get_unread_seed_version(user_id)
+        stmt = (
+            select(MessageReadState.thread_id, MessageReadState.unread_count)
+            .where(and_(
+                MessageReadState.user_id == user_id,
+                MessageReadState.unread_count > 0
+            ))
+        )
+        counts = {str(thread_id): unread_count for thread_id, unread_count in self.db_session.execute(stmt)}
+        seed_unread_counts(user_id, counts, version)
+        return counts
+
+    def rebuild_read_states(self) -> int:
+        """
+        Recomputes every user's unread counts from the messages with a single INSERT ... SELECT.
+        
+        Read watermarks are kept: where a user has read a thread, the messages created after
+        their watermark are unread; the is_read flag is only used for threads without a
+        watermark, e.g. when backfilling the read states.
+        
+        Returns:
+            Number of read state rows written
+        """
+        # One row per recipient of each message, from the recipient_ids JSONB array
+        receipts = select(
+            Message.thread_id,
+            Message.sender_id,
+            Message.is_read,
+            Message.created_at,
+            cast(func.jsonb_array_elements_text(Message.recipient_ids), UUID(as_uuid=True)).label('user_id')
+        ).subquery()
+        states = aliased(MessageReadState)
+        unread = or_(
+            and_(states.last_read_at.isnot(None), receipts.c.created_at > states.last_read_at),
+            and_(states.last_read_at.is_(None), receipts.c.is_read.is_(False))
+        )
+        source = (
+            select(
+                receipts.c.user_id,
+                receipts.c.thread_id,
+                func.count().filter(unread),
+                func.now()
+            )
+            .select_from(receipts.outerjoin(states, and_(
+                states.user_id == receipts.c.user_id,
+                states.thread_id == receipts.c.thread_id
+            )))
+            .where(receipts.c.user_id != receipts.c.sender_id)
+            .group_by(receipts.c.user_id, receipts.c.thread_id)
+        )
+        
+        # Threads left without messages have nothing unread; every other count is replaced
+        reset = (
+            update(MessageReadState)
+            .where(MessageReadState.unread_count > 0)
+            .values(unread_count=0, updated_at=func.now())
+            .returning(MessageReadState.user_id)
+        )
+        reset_user_ids = self.db_session.execute(reset).scalars().all()
+        stmt = insert(MessageReadState).from_select(['user_id', 'thread_id', 'unread_count', 'updated_at'], source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'thread_id'],
+            set_={'unread_count': stmt.excluded.unread_count, 'updated_at': stmt.excluded.updated_at}
+        ).returning(MessageReadState.user_id)
+        user_ids = self.db_session.execute(stmt).scalars().all()
+        self.db_session.commit()
+        invalidate_unread_counts(*set(user_ids) | set(reset_user_ids))
+        return len(user_ids)
+
+    @staticmethod
+    def _recipient_ids(message: Message) -> List[uuid.UUID]:
+        """Gets the distinct recipients of a message other than its sender."""
+        recipient_ids = dict.fromkeys(uuid.UUID(str(recipient_id)) for recipient_id in message.recipient_ids or ())
+        recipient_ids.pop(uuid.UUID(str(message.sender_id)), None)
+        return list(recipient_ids)
+
+    def _count_unread(self, thread_id: uuid.UUID, recipient_ids: List[uuid.UUID]) -> None:
+        """Counts a new message in a thread as unread for its recipients with a single UPSERT."""
+        now = datetime.utcnow()
+        stmt = insert(MessageReadState).values([
+            {'user_id': recipient_id, 'thread_id': thread_id, 'unread_count': 1, 'updated_at': now}
+            for recipient_id in recipient_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'thread_id'],
+            set_={'unread_count': MessageReadState.unread_count + 1, 'updated_at': now}
+        )
+        self.db_session.execute(stmt)
+
+    def _uncount_unread(self, message: Message, recipient_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+        """
+        Removes a deleted message from the unread counts of the recipients who had not read it.
+        
+        Returns:
+            IDs of the recipients whose unread count was decremented
+        """
+        stmt = (
+            update(MessageReadState)
+            .where(and_(
+                MessageReadState.user_id.in_(recipient_ids),
+                MessageReadState.thread_id == message.thread_id,
+                MessageReadState.unread_count > 0,
+                or_(MessageReadState.last_read_at.is_(None), MessageReadState.last_read_at < message.created_at)
+            ))
+            .values(unread_count=MessageReadState.unread_count - 1, updated_at=datetime.utcnow())
+            .returning(MessageReadState.user_id)
+        )
+        return list(self.db_session.execute(stmt).scalars().all())
+
+    def _advance_read_watermark(self, thread_id: uuid.UUID, user_id: uuid.UUID,
+                                read_at: datetime) -> Optional[int]:
+        """
+        Moves a user's read watermark in a thread forward to read_at and recounts the messages
+        they received after it, with a single UPDATE.
+        
+        Returns:
+            The user's new unread count in the thread, or None if the watermark was already past
+            read_at
+        """
+        unread_after = (
+            select(func.count())
+            .select_from(Message)
+            .where(and_(
+                Message.thread_id == thread_id,
+                Message.created_at > read_at,
+                Message.sender_id != user_id,
+                Message.recipient_ids.contains([str(user_id)])
+            ))
+            .scalar_subquery()
+        )
+        stmt = (
+            update(MessageReadState)
+            .where(and_(
+                MessageReadState.user_id == user_id,
+                MessageReadState.thread_id == thread_id,
+                or_(MessageReadState.last_read_at.is_(None), MessageReadState.last_read_at < read_at)
+            ))
+            .values(last_read_at=read_at, unread_count=unread_after, updated_at=datetime.utcnow())
+            .returning(MessageReadState.unread_count)
+        )
+        return self.db_session.execute(stmt).scalar()
 
     def get_thread_summary(self, thread_id: uuid.UUID) -> Dict:
         """
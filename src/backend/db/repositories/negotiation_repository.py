@@ -14,7 +14,7 @@ from sqlalchemy.orm import joinedload
 from ..session import session_scope, get_db, get_read_db
 from ..models.negotiation import Negotiation
 from ...utils.constants import NegotiationStatus, ApprovalStatus
-from ...utils.pagination import paginate_query, PaginatedResponse
+from ...utils.pagination import paginate_query, paginate_by_cursor, PaginatedResponse, CursorPaginatedResponse
 
 
 def create_negotiation(
@@ -90,37 +90,30 @@ def get_negotiation_by_id(
     return negotiation
 
 
-def get_negotiations(
-    client_id: Optional[uuid.UUID] = None,
-    firm_id: Optional[uuid.UUID] = None,
-    status: Optional[NegotiationStatus] = None,
-    approval_status: Optional[ApprovalStatus] = None,
-    from_date: Optional[date] = None,
-    to_date: Optional[date] = None,
-    page: int = 1,
-    page_size: int = 20
-) -> PaginatedResponse[Negotiation]:
+def _filter_negotiations(
+    query,
+    client_id: Optional[uuid.UUID],
+    firm_id: Optional[uuid.UUID],
+    status: Optional[NegotiationStatus],
+    approval_status: Optional[ApprovalStatus],
+    from_date: Optional[date],
+    to_date: Optional[date]
+):
     """
-    Retrieves a paginated list of negotiations with filtering options.
+    Applies the negotiation list filters to a query.
     
     Args:
+        query: Query over Negotiation
         client_id: Optional client organization UUID to filter by
         firm_id: Optional law firm organization UUID to filter by
         status: Optional negotiation status to filter by
         approval_status: Optional approval status to filter by
         from_date: Optional start date for request_date filtering
         to_date: Optional end date for request_date filtering
-        page: Page number for pagination
-        page_size: Number of items per page
         
     Returns:
-        PaginatedResponse[Negotiation]: Paginated list of negotiations matching criteria
+        Filtered query
     """
-    db = get_read_db()
-    
-    # Start building the query
-    query = db.query(Negotiation)
-    
     # Apply filters based on provided parameters
     if client_id is not None:
         query = query.filter(Negotiation.client_id == client_id)
@@ -144,6 +137,42 @@ def get_negotiations(
     if hasattr(Negotiation, 'is_deleted'):
         query = query.filter(Negotiation.is_deleted.is_(False))
     
+    return query
+
+
+def get_negotiations(
+    client_id: Optional[uuid.UUID] = None,
+    firm_id: Optional[uuid.UUID] = None,
+    status: Optional[NegotiationStatus] = None,
+    approval_status: Optional[ApprovalStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    page: int = 1,
+    page_size: int = 20
+) -> PaginatedResponse[Negotiation]:
+    """
+    Retrieves a paginated list of negotiations with filtering options.
+    
+    Args:
+        client_id: Optional client organization UUID to filter by
+        firm_id: Optional law firm organization UUID to filter by
+        status: Optional negotiation status to filter by
+        approval_status: Optional approval status to filter by
+        from_date: Optional start date for request_date filtering
+        to_date: Optional end date for request_date filtering
+        page: Page number for pagination
+        page_size: Number of items per page
+        
+    Returns:
+        PaginatedResponse[Negotiation]: Paginated list of negotiations matching criteria
+    """
+    db = get_read_db()
+    
+    # Start building the query
+    query = _filter_negotiations(
+        db.query(Negotiation), client_id, firm_id, status, approval_status, from_date, to_date
+    )
+    
     # Apply pagination
     items, pagination_metadata = paginate_query(query, page, page_size)
     
@@ -156,6 +185,45 @@ def get_negotiations(
     )
 
 
+def get_negotiations_by_cursor(
+    client_id: Optional[uuid.UUID] = None,
+    firm_id: Optional[uuid.UUID] = None,
+    status: Optional[NegotiationStatus] = None,
+    approval_status: Optional[ApprovalStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    total: str = 'none'
+) -> CursorPaginatedResponse:
+    """
+    Retrieves one keyset page of negotiations, most recently requested first.
+    
+    Args:
+        client_id: Optional client organization UUID to filter by
+        firm_id: Optional law firm organization UUID to filter by
+        status: Optional negotiation status to filter by
+        approval_status: Optional approval status to filter by
+        from_date: Optional start date for request_date filtering
+        to_date: Optional end date for request_date filtering
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Number of items per page
+        total: 'none', 'approximate' or 'exact' total count
+        
+    Returns:
+        CursorPaginatedResponse: One page of negotiations matching criteria
+    """
+    db = get_read_db()
+    
+    query = _filter_negotiations(
+        db.query(Negotiation), client_id, firm_id, status, approval_status, from_date, to_date
+    )
+    
+    return paginate_by_cursor(
+        db, query, Negotiation.request_date, Negotiation.id, cursor, limit, ascending=False, total=total
+    )
+
+
 def update_negotiation_status(
     negotiation_id: uuid.UUID,
     new_status: NegotiationStatus,
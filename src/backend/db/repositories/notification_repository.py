@@ -0,0 +1,70 @@
+"""
+Repository for in-app notifications, writing the notifications of an event for many users
+with multi-row INSERTs. Rows carrying a delivery key that was already written for the user
+are skipped, so a retried delivery does not notify anyone twice.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..models.notification import UserNotification
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__, 'repository')
+
+# Notifications written per INSERT statement
+NOTIFICATION_INSERT_CHUNK_SIZE = 1000
+
+
+class NotificationRepository:
+    """
+    Repository class for in-app notification database operations.
+    """
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self._db = db_session
+
+    def bulk_create(self, notifications: List[Dict]) -> int:
+        """
+        Insert many notifications in one transaction, NOTIFICATION_INSERT_CHUNK_SIZE rows per statement.
+
+        Notifications whose user already has one with the same delivery_key are skipped.
+
+        Args:
+            notifications: Column values of each notification (id, user_id, notification_type, title,
+                content, priority, notification_metadata, action_url, created_at, updated_at and
+                optionally delivery_key)
+
+        Returns:
+            Number of notifications inserted
+        """
+        if not notifications:
+            return 0
+
+        inserted = 0
+        try:
+            for start in range(0, len(notifications), NOTIFICATION_INSERT_CHUNK_SIZE):
+                result = self._db.execute(
+                    insert(UserNotification)
+                    .values(notifications[start:start + NOTIFICATION_INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=['user_id', 'delivery_key'])
+                )
+                inserted += result.rowcount
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            logger.error(f"Error inserting {len(notifications)} notifications: {str(e)}")
+            raise
+
+        if inserted < len(notifications):
+            logger.info(f"Skipped {len(notifications) - inserted} notifications already delivered")
+        logger.debug(f"Inserted {inserted} notifications")
+        return inserted
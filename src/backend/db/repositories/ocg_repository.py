@@ -19,6 +19,7 @@ from ..models.ocg import (
     OCGStatus, ocg_firm_point_budgets
 )
 from ...utils.logging import get_logger
+from ...utils.ownership_cache import invalidate_owners
 
 # Set up logger
 logger = get_logger(__name__, 'repository')
@@ -241,6 +242,7 @@ class OCGRepository:
             # Delete the OCG
             self._db.delete(ocg)
             self._db.commit()
+            invalidate_owners('ocg', ocg_id)
             
             logger.info(f"Deleted OCG with ID {ocg_id}")
             return True
@@ -963,6 +965,8 @@ class OCGRepository:
                 
             # Commit changes
             self._db.commit()
+            if not existing:
+                invalidate_owners('ocg', ocg_id)  # The firm now shares ownership of the OCG
             
             logger.info(f"Set point budget of {points} for firm {firm_id}, OCG {ocg_id}")
             return True
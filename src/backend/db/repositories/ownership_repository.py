@@ -0,0 +1,166 @@
+"""
+Repository resolving which organizations own entities, used by access control checks.
+
+Each supported entity type is answered for a whole batch of IDs with a single query.
+"""
+
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+from sqlalchemy import cast, func, select, union_all
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from ..models.attorney import Attorney
+from ..models.document import Document
+from ..models.message import Message
+from ..models.negotiation import Negotiation
+from ..models.ocg import OCG, ocg_firm_point_budgets
+from ..models.peer_group import PeerGroup
+from ..models.rate import Rate
+from ..models.user import User
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Entity types whose owners can be resolved
+OWNED_ENTITY_TYPES = ('rate', 'negotiation', 'message', 'document', 'ocg', 'peer_group', 'attorney')
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    """Convert an ID read from the database to a UUID."""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _parse_uuids(entity_ids: List[str]) -> List[uuid.UUID]:
+    """Parse IDs into UUIDs, skipping IDs that are not valid UUIDs and so cannot exist."""
+    ids = []
+    for entity_id in entity_ids:
+        try:
+            ids.append(uuid.UUID(entity_id))
+        except ValueError:
+            logger.debug(f"Skipping invalid entity ID {entity_id!r} in ownership lookup")
+    return ids
+
+
+class OwnershipRepository:
+    """
+    Repository mapping entities to the organizations that own them.
+
+    Rates and negotiations are owned by their client and law firm, messages by the organizations
+    of their sender and recipients, OCGs by their client and the firms they were sent to,
+    attorneys by their firm and the clients holding rates with that firm, and documents and
+    peer groups by their organization.
+    """
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db = db_session
+        self._loaders: Dict[str, Callable[[List[str]], List[tuple]]] = {
+            'rate': self._rate_owners,
+            'negotiation': self._negotiation_owners,
+            'message': self._message_owners,
+            'document': self._document_owners,
+            'ocg': self._ocg_owners,
+            'peer_group': self._peer_group_owners,
+            'attorney': self._attorney_owners,
+        }
+
+    def get_owner_organization_ids(self, entity_type: str,
+                                   entity_ids: Iterable[Any]) -> Dict[str, Set[uuid.UUID]]:
+        """
+        Get the organizations owning a batch of entities of one type with a single query.
+
+        Args:
+            entity_type: Type of the entities, one of OWNED_ENTITY_TYPES
+            entity_ids: IDs of the entities
+
+        Returns:
+            Dictionary mapping the string ID of each entity found to its owning organization IDs
+
+        Raises:
+            ValueError: If the entity type is not supported
+        """
+        loader = self._loaders.get(entity_type)
+        if loader is None:
+            raise ValueError(f"Unsupported entity type for ownership: {entity_type}")
+
+        entity_ids = list({str(entity_id) for entity_id in entity_ids})
+        if not entity_ids:
+            return {}
+
+        owners: Dict[str, Set[uuid.UUID]] = {}
+        for entity_id, organization_id in loader(entity_ids):
+            organization_ids = owners.setdefault(str(entity_id), set())
+            if organization_id is not None:
+                organization_ids.add(_as_uuid(organization_id))
+        return owners
+
+    def _rate_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        stmt = union_all(
+            select(Rate.id, Rate.client_id).where(Rate.id.in_(ids)),
+            select(Rate.id, Rate.firm_id).where(Rate.id.in_(ids)),
+        )
+        return self.db.execute(stmt).all()
+
+    def _negotiation_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        stmt = union_all(
+            select(Negotiation.id, Negotiation.client_id).where(Negotiation.id.in_(ids)),
+            select(Negotiation.id, Negotiation.firm_id).where(Negotiation.id.in_(ids)),
+        )
+        return self.db.execute(stmt).all()
+
+    def _message_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        # One row per participant: the sender plus every element of the recipient_ids JSONB array
+        participants = union_all(
+            select(Message.id.label('message_id'), Message.sender_id.label('user_id'))
+            .where(Message.id.in_(ids)),
+            select(Message.id.label('message_id'),
+                   cast(func.jsonb_array_elements_text(Message.recipient_ids), UUID(as_uuid=True)).label('user_id'))
+            .where(Message.id.in_(ids)),
+        ).subquery()
+        stmt = (
+            select(participants.c.message_id, User.organization_id)
+            .join(User, User.id == participants.c.user_id)
+            .distinct()
+        )
+        return self.db.execute(stmt).all()
+
+    def _document_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        stmt = select(Document.id, Document.organization_id).where(Document.id.in_(ids))
+        return self.db.execute(stmt).all()
+
+    def _ocg_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        # Firms an OCG was sent to hold a point budget for it
+        stmt = union_all(
+            select(OCG.id, OCG.client_id).where(OCG.id.in_(ids)),
+            select(ocg_firm_point_budgets.c.ocg_id, ocg_firm_point_budgets.c.firm_id)
+            .where(ocg_firm_point_budgets.c.ocg_id.in_(ids)),
+        )
+        return self.db.execute(stmt).all()
+
+    def _peer_group_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        stmt = select(PeerGroup.id, PeerGroup.organization_id).where(PeerGroup.id.in_(ids))
+        return self.db.execute(stmt).all()
+
+    def _attorney_owners(self, entity_ids: List[str]) -> List[tuple]:
+        ids = _parse_uuids(entity_ids)
+        # Clients working with an attorney's firm hold rates with it, as in AttorneyRepository searches
+        stmt = union_all(
+            select(Attorney.id, Attorney.organization_id).where(Attorney.id.in_(ids)),
+            select(Attorney.id, Rate.client_id).distinct()
+            .join(Rate, Rate.firm_id == Attorney.organization_id)
+            .where(Attorney.id.in_(ids)),
+        )
+        return self.db.execute(stmt).all()
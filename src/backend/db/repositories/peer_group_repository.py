@@ -9,10 +9,11 @@ import uuid
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 
-from ..models.peer_group import PeerGroup
+from ..models.peer_group import PeerGroup, peer_group_members
 from ..models.organization import Organization
 from ..session import session_scope, get_db
 from ...utils.logging import get_logger
+from ...utils.ownership_cache import invalidate_owners
 from ...utils.validators import validate_required, validate_string, validate_uuid, validate_dict
 from ...utils.constants import OrganizationType
 
@@ -176,6 +177,7 @@ class PeerGroupRepository:
             # Remove the peer group
             self._db.delete(peer_group)
             self._db.commit()
+            invalidate_owners('peer_group', peer_group_id)
             
             logger.info(f"Deleted peer group {peer_group_id}")
             return True
@@ -346,6 +348,25 @@ class PeerGroupRepository:
             logger.error(f"Error getting members of peer group {peer_group_id}: {str(e)}")
             return []
     
+    def get_member_ids(self, peer_group_id: uuid.UUID) -> List[uuid.UUID]:
+        """
+        Get the IDs of all members of a peer group without loading the organizations
+        
+        Args:
+            peer_group_id: UUID of the peer group
+        
+        Returns:
+            List of member organization UUIDs
+        """
+        try:
+            rows = self._db.query(peer_group_members.c.organization_id).filter(
+                peer_group_members.c.peer_group_id == peer_group_id
+            ).all()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting member IDs of peer group {peer_group_id}: {str(e)}")
+            return []
+    
     def is_member(self, peer_group_id: uuid.UUID, organization_id: uuid.UUID) -> bool:
         """
         Check if an organization is a member of a peer group
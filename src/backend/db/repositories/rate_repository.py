@@ -3,19 +3,75 @@ Repository class for handling rate data operations in the database, providing CR
 and specialized queries for rate data in the Justice Bid Rate Negotiation System.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+import csv
+import io
 import uuid
 import json
 from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 
-from sqlalchemy import and_, or_, func, desc, asc
+import pandas
+from sqlalchemy import and_, or_, func, desc, asc, select, insert, update
 from sqlalchemy.orm import Session, Query
 
 from ..models.rate import Rate
+from ..models.staff_class import StaffClass
+from ..models.organization import Office
+from ..models.peer_group import peer_group_members
 from ..session import get_session
+from ...utils.cache import cache_tag, invalidate_tags
 from ...utils.datetime_utils import get_current_date
-from ...utils.currency import convert_currency
+from ...utils.constants import RateStatus, RateType, DEFAULT_PAGE_SIZE
+from ...utils.currency import convert_currency, convert_amounts, SUPPORTED_CURRENCIES
 from ...utils.logging import logger
+from ...utils.ownership_cache import invalidate_owners
+from ...utils.pagination import CursorPaginatedResponse, paginate_by_cursor
+
+# Rows per bulk INSERT/UPDATE statement or COPY batch during imports
+IMPORT_CHUNK_SIZE = 5000
+
+# Fields every imported row must provide
+IMPORT_REQUIRED_FIELDS = ['attorney_id', 'client_id', 'firm_id', 'amount', 'currency', 'effective_date']
+
+# Additional fields new rows must provide because the rates table cannot leave them empty
+IMPORT_INSERT_REQUIRED_FIELDS = ['office_id', 'staff_class_id']
+
+# Identifier columns validated as UUIDs during imports
+IMPORT_UUID_FIELDS = ['attorney_id', 'client_id', 'firm_id', 'office_id', 'staff_class_id']
+
+# Column order used when streaming new rates with COPY
+IMPORT_COPY_COLUMNS = [
+    'id', 'attorney_id', 'client_id', 'firm_id', 'office_id', 'staff_class_id', 'amount', 'currency',
+    'type', 'effective_date', 'expiration_date', 'status', 'history', 'created_at', 'updated_at'
+]
+
+# Columns rate listings can be sorted by; each is non-null and paired with id for keyset pagination
+RATE_SORT_COLUMNS = ['effective_date', 'created_at', 'updated_at', 'amount']
+
+# Rows fetched per server-side cursor batch during exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Columns of exported rates, in file order
+RATE_EXPORT_FIELDS = [
+    'id', 'attorney_id', 'client_id', 'firm_id', 'office_id', 'staff_class_id', 'amount', 'currency',
+    'original_amount', 'original_currency', 'type', 'effective_date', 'expiration_date', 'status',
+    'created_at', 'updated_at'
+]
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Formats a value for a CSV COPY row, leaving None as an empty (NULL) field
+    """
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return '' if value is None else value
 
 
 class RateRepository:
@@ -33,6 +89,73 @@ class RateRepository:
         """
         self.session = session or get_session()
     
+    def _rate_cache_tags(self, rate: Rate) -> List[str]:
+        """
+        Builds the cache dependency tags affected by a write to a rate
+        
+        The rate's client, firm, attorney and staff class are affected, along with every
+        peer group its client or firm belongs to.
+        
+        Args:
+            rate: Rate instance being created, changed or deleted
+            
+        Returns:
+            List of cache tags
+        """
+        try:
+            return self._cache_tags_for_rates(
+                client_ids={rate.client_id},
+                firm_ids={rate.firm_id},
+                attorney_ids={rate.attorney_id},
+                staff_class_ids={rate.staff_class_id} if rate.staff_class_id else set(),
+            )
+        except Exception as e:
+            logger.warning(f"Error building cache tags for rate {rate.id}: {str(e)}")
+            return []
+    
+    def _cache_tags_for_rates(self, client_ids: set, firm_ids: set, attorney_ids: set,
+                              staff_class_ids: set) -> List[str]:
+        """
+        Builds the cache dependency tags affected by writes to a set of rates
+        
+        Peer groups of every client and firm involved are resolved with a single query.
+        
+        Args:
+            client_ids: Client organization IDs of the written rates
+            firm_ids: Firm organization IDs of the written rates
+            attorney_ids: Attorney IDs of the written rates
+            staff_class_ids: Staff class IDs of the written rates
+            
+        Returns:
+            List of cache tags
+        """
+        tags = []
+        for client_id in client_ids:
+            tags.extend([cache_tag('organization', client_id), cache_tag('client', client_id)])
+        for firm_id in firm_ids:
+            tags.extend([cache_tag('organization', firm_id), cache_tag('firm', firm_id)])
+        tags.extend(cache_tag('attorney', attorney_id) for attorney_id in attorney_ids)
+        tags.extend(cache_tag('staff_class', staff_class_id) for staff_class_id in staff_class_ids)
+        
+        peer_group_rows = self.session.query(peer_group_members.c.peer_group_id).filter(
+            peer_group_members.c.organization_id.in_(list(client_ids | firm_ids))
+        ).distinct().all()
+        tags.extend(cache_tag('peer_group', row[0]) for row in peer_group_rows)
+        
+        return list(dict.fromkeys(tags))
+    
+    def _invalidate_rate_caches(self, rate: Rate) -> None:
+        """
+        Invalidates cached analytics that depend on a rate after it is written
+        
+        Args:
+            rate: Rate instance that was created or changed
+        """
+        # Cache invalidation must never fail a committed write; entries still expire by TTL
+        tags = self._rate_cache_tags(rate)
+        if tags:
+            invalidate_tags(*tags)
+    
     def create(self, attorney_id: str, client_id: str, firm_id: str, 
                office_id: Optional[str] = None, staff_class_id: Optional[str] = None,
                amount: float = 0.0, currency: str = "USD", type: str = "STANDARD",
@@ -81,6 +204,7 @@ class RateRepository:
             # Add rate to session
             self.session.add(rate)
             self.session.commit()
+            self._invalidate_rate_caches(rate)
             
             logger.info(f"Created new rate for attorney {attorney_id} with client {client_id}")
             
@@ -107,6 +231,59 @@ class RateRepository:
             logger.error(f"Error retrieving rate with ID {rate_id}: {str(e)}")
             raise
     
+    def get_rates_page(self, client_id: Optional[str] = None, firm_id: Optional[str] = None,
+                       attorney_id: Optional[str] = None, staff_class_id: Optional[str] = None,
+                       status: Optional[str] = None, cursor: Optional[str] = None,
+                       limit: int = DEFAULT_PAGE_SIZE, sort_by: str = 'effective_date',
+                       descending: bool = True, total: str = 'none') -> CursorPaginatedResponse:
+        """
+        Retrieves one keyset page of rates matching the filters
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            attorney_id: Optional UUID of the attorney to filter by
+            staff_class_id: Optional UUID of the staff class to filter by
+            status: Optional status to filter by
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of rates per page
+            sort_by: Column to sort by, one of RATE_SORT_COLUMNS
+            descending: Whether to sort from newest/highest first
+            total: 'none', 'approximate' or 'exact' total count
+            
+        Returns:
+            CursorPaginatedResponse of Rate instances
+        """
+        if sort_by not in RATE_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        
+        try:
+            query = self.session.query(Rate)
+            
+            if client_id:
+                query = query.filter(Rate.client_id == uuid.UUID(client_id))
+            
+            if firm_id:
+                query = query.filter(Rate.firm_id == uuid.UUID(firm_id))
+            
+            if attorney_id:
+                query = query.filter(Rate.attorney_id == uuid.UUID(attorney_id))
+            
+            if staff_class_id:
+                query = query.filter(Rate.staff_class_id == uuid.UUID(staff_class_id))
+            
+            if status:
+                query = query.filter(Rate.status == status)
+            
+            return paginate_by_cursor(
+                self.session, query, getattr(Rate, sort_by), Rate.id, cursor, limit,
+                ascending=not descending, total=total
+            )
+            
+        except Exception as e:
+            logger.error(f"Error retrieving page of rates: {str(e)}")
+            raise
+    
     def update(self, rate_id: str, data: Dict[str, Any]) -> Optional[Rate]:
         """
         Updates an existing rate record
@@ -151,6 +328,9 @@ class RateRepository:
                 )
             
             self.session.commit()
+            self._invalidate_rate_caches(rate)
+            if 'client_id' in data or 'firm_id' in data:
+                invalidate_owners('rate', rate.id)
             logger.info(f"Updated rate with ID {rate_id}")
             
             return rate
@@ -178,9 +358,15 @@ class RateRepository:
                 logger.warning(f"Attempted to delete non-existent rate with ID {rate_id}")
                 return False
             
+            # Capture cache dependencies before the row disappears
+            cache_tags = self._rate_cache_tags(rate)
+            
             # Delete the rate
             self.session.delete(rate)
             self.session.commit()
+            if cache_tags:
+                invalidate_tags(*cache_tags)
+            invalidate_owners('rate', rate.id)
             
             logger.info(f"Deleted rate with ID {rate_id}")
             return True
@@ -318,7 +504,144 @@ class RateRepository:
         except Exception as e:
             logger.error(f"Error retrieving rates for firm {firm_id}: {str(e)}")
             raise
-    
+
+    def get_comparison_rows(self, firm_ids: List[str], client_id: Optional[str] = None,
+                            as_of_date: Optional[date] = None,
+                            status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves the columns needed for peer benchmarking for several firms in a single query
+
+        Rates are joined to their staff class and office so that the staff class name, practice
+        area and geography come back with each row, and only scalar columns are selected so the
+        history JSONB column is never loaded.
+
+        Args:
+            firm_ids: UUIDs of the law firms to load rates for
+            client_id: Optional UUID of the client to filter by
+            as_of_date: Optional date to get rates effective on that date
+            status: Optional status to filter by
+
+        Returns:
+            List of dictionaries with firm_id, staff_class, practice_area, geography, type,
+            amount and currency keys
+        """
+        try:
+            if not firm_ids:
+                return []
+
+            # Select only the columns used by the comparison, resolving dimension labels via joins
+            query = self.session.query(
+                Rate.firm_id.label('firm_id'),
+                StaffClass.name.label('staff_class'),
+                StaffClass.practice_area.label('practice_area'),
+                func.coalesce(Office.region, Office.country).label('geography'),
+                Rate.type.label('type'),
+                Rate.amount.label('amount'),
+                Rate.currency.label('currency')
+            ).outerjoin(
+                StaffClass, Rate.staff_class_id == StaffClass.id
+            ).outerjoin(
+                Office, Rate.office_id == Office.id
+            ).filter(
+                Rate.firm_id.in_([uuid.UUID(str(firm_id)) for firm_id in firm_ids])
+            )
+
+            # Add client filter if provided
+            if client_id:
+                query = query.filter(Rate.client_id == uuid.UUID(client_id))
+
+            # Add date filter if provided
+            if as_of_date:
+                query = query.filter(
+                    Rate.effective_date <= as_of_date,
+                    or_(
+                        Rate.expiration_date >= as_of_date,
+                        Rate.expiration_date == None
+                    )
+                )
+
+            # Add status filter if provided
+            if status:
+                query = query.filter(Rate.status == status)
+
+            # Execute query and return plain rows
+            return [row._asdict() for row in query.all()]
+
+        except Exception as e:
+            logger.error(f"Error retrieving comparison rates for {len(firm_ids)} firms: {str(e)}")
+            raise
+
+    def get_trend_rows(self, attorney_id: Optional[str] = None, client_id: Optional[str] = None,
+                       firm_id: Optional[str] = None, start_date: Optional[date] = None,
+                       end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves the columns needed for rate trend analysis in a single query
+
+        Rates are joined to their staff class and office so that the staff class name, practice
+        area and office name come back with each row, and only scalar columns are selected so the
+        history JSONB column is never loaded. At least one of attorney_id, client_id and firm_id
+        must be given.
+
+        Args:
+            attorney_id: Optional UUID of the attorney to filter by
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            start_date: Optional earliest effective date
+            end_date: Optional latest effective date
+
+        Returns:
+            List of dictionaries with attorney_id, client_id, firm_id, staff_class_id, staff_class,
+            practice_area, office_id, office, effective_date, amount and currency keys, ordered by
+            attorney, client and effective date
+        """
+        if not (attorney_id or client_id or firm_id):
+            raise ValueError("An attorney, client or firm is required to load rate trends")
+
+        try:
+            # Select only the columns used by the trend analysis, resolving dimension labels via joins
+            query = self.session.query(
+                Rate.attorney_id.label('attorney_id'),
+                Rate.client_id.label('client_id'),
+                Rate.firm_id.label('firm_id'),
+                Rate.staff_class_id.label('staff_class_id'),
+                StaffClass.name.label('staff_class'),
+                StaffClass.practice_area.label('practice_area'),
+                Rate.office_id.label('office_id'),
+                Office.name.label('office'),
+                Rate.effective_date.label('effective_date'),
+                Rate.amount.label('amount'),
+                Rate.currency.label('currency')
+            ).outerjoin(
+                StaffClass, Rate.staff_class_id == StaffClass.id
+            ).outerjoin(
+                Office, Rate.office_id == Office.id
+            )
+
+            # Add entity filters
+            if attorney_id:
+                query = query.filter(Rate.attorney_id == uuid.UUID(attorney_id))
+            if client_id:
+                query = query.filter(Rate.client_id == uuid.UUID(client_id))
+            if firm_id:
+                query = query.filter(Rate.firm_id == uuid.UUID(firm_id))
+
+            # Add date filters if provided
+            if start_date:
+                query = query.filter(Rate.effective_date >= start_date)
+            if end_date:
+                query = query.filter(Rate.effective_date <= end_date)
+
+            # Order each attorney's rates for a client chronologically
+            query = query.order_by(Rate.attorney_id, Rate.client_id, Rate.effective_date)
+
+            # Execute query and return plain rows
+            return [row._asdict() for row in query.all()]
+
+        except Exception as e:
+            logger.error(f"Error retrieving trend rates for attorney {attorney_id}, client {client_id}, "
+                         f"firm {firm_id}: {str(e)}")
+            raise
+
     def get_by_negotiation(self, negotiation_id: str) -> List[Rate]:
         """
         Retrieves rates associated with a specific negotiation
@@ -523,6 +846,7 @@ class RateRepository:
                 )
             
             self.session.commit()
+            self._invalidate_rate_caches(rate)
             logger.info(f"Updated status of rate {rate_id} to {status}")
             
             return rate
@@ -589,6 +913,7 @@ class RateRepository:
             rate.history.append(counter_entry)
             
             self.session.commit()
+            self._invalidate_rate_caches(rate)
             logger.info(f"Added counter-proposal of {counter_amount} for rate {rate_id}")
             
             return rate
@@ -661,6 +986,7 @@ class RateRepository:
             )
             
             self.session.commit()
+            self._invalidate_rate_caches(rate)
             logger.info(f"Accepted counter-proposal for rate {rate_id}, new amount: {counter_amount}")
             
             return rate
@@ -672,7 +998,7 @@ class RateRepository:
     
     def get_rate_analytics(self, client_id: Optional[str] = None, firm_id: Optional[str] = None,
                           start_date: Optional[date] = None, end_date: Optional[date] = None,
-                          currency: Optional[str] = None) -> Dict[str, Any]:
+                          currency: Optional[str] = None, aggregate_in_db: bool = True) -> Dict[str, Any]:
         """
         Retrieves rate data for analytics purposes
         
@@ -682,118 +1008,221 @@ class RateRepository:
             start_date: Optional start date for filtering
             end_date: Optional end date for filtering
             currency: Optional currency to convert all amounts to
+            aggregate_in_db: Whether to compute the aggregates with a GROUP BY in the database
+                instead of loading every matching rate
             
         Returns:
             Dictionary containing analytics data
         """
         try:
-            # Build base query
-            query = self.session.query(Rate)
+            if aggregate_in_db:
+                analytics = self._aggregate_rate_analytics(client_id, firm_id, start_date, end_date)
+            else:
+                analytics = self._collect_rate_analytics(client_id, firm_id, start_date, end_date)
             
-            # Add filters if provided
-            if client_id:
-                query = query.filter(Rate.client_id == uuid.UUID(client_id))
+            # Convert analytics to target currency if specified
+            if currency:
+                analytics = self._convert_rate_analytics(analytics, currency)
             
-            if firm_id:
-                query = query.filter(Rate.firm_id == uuid.UUID(firm_id))
+            return analytics
             
-            if start_date:
-                query = query.filter(Rate.effective_date >= start_date)
+        except Exception as e:
+            logger.error(f"Error generating rate analytics: {str(e)}")
+            raise
+    
+    def _filter_rate_analytics(self, query: Query, client_id: Optional[str], firm_id: Optional[str],
+                               start_date: Optional[date], end_date: Optional[date]) -> Query:
+        """
+        Applies the rate analytics filters to a query
+        
+        Args:
+            query: Query over the rates table
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            start_date: Optional start date for filtering
+            end_date: Optional end date for filtering
             
-            if end_date:
-                query = query.filter(
-                    or_(
-                        Rate.effective_date <= end_date,
-                        and_(
-                            Rate.expiration_date != None,
-                            Rate.expiration_date <= end_date
-                        )
+        Returns:
+            Filtered query
+        """
+        if client_id:
+            query = query.filter(Rate.client_id == uuid.UUID(client_id))
+        
+        if firm_id:
+            query = query.filter(Rate.firm_id == uuid.UUID(firm_id))
+        
+        if start_date:
+            query = query.filter(Rate.effective_date >= start_date)
+        
+        if end_date:
+            query = query.filter(
+                or_(
+                    Rate.effective_date <= end_date,
+                    and_(
+                        Rate.expiration_date != None,
+                        Rate.expiration_date <= end_date
                     )
                 )
+            )
+        
+        return query
+    
+    def _empty_rate_analytics(self) -> Dict[str, Any]:
+        """
+        Creates the rate analytics result structure
+        
+        Returns:
+            Dictionary with empty analytics sections
+        """
+        return {
+            'total_rates': 0,
+            'currency_breakdown': {},
+            'average_rates': {},
+            'rate_increases': {},
+            'staff_class_breakdown': {},
+            'office_breakdown': {}
+        }
+    
+    def _aggregate_rate_analytics(self, client_id: Optional[str], firm_id: Optional[str],
+                                  start_date: Optional[date], end_date: Optional[date]) -> Dict[str, Any]:
+        """
+        Computes rate analytics from per currency and staff class aggregate rows
+        
+        Only one row per currency and staff class leaves the database, so no Rate objects
+        (or their history column) are loaded. Sums are exact numerics, so the averages match
+        the row-by-row calculation.
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            start_date: Optional start date for filtering
+            end_date: Optional end date for filtering
             
-            # Execute query
-            rates = query.all()
-            
-            # Process rates for analytics
-            analytics = {
-                'total_rates': len(rates),
-                'currency_breakdown': {},
-                'average_rates': {},
-                'rate_increases': {},
-                'staff_class_breakdown': {},
-                'office_breakdown': {}
-            }
-            
-            # Group by currency for aggregation
-            rates_by_currency = {}
-            for rate in rates:
-                if rate.currency not in rates_by_currency:
-                    rates_by_currency[rate.currency] = []
-                rates_by_currency[rate.currency].append(rate)
-            
-            # Process rates in each currency
-            for curr, curr_rates in rates_by_currency.items():
-                # Count rates in this currency
-                analytics['currency_breakdown'][curr] = len(curr_rates)
-                
-                # Calculate average rate
-                total_amount = sum(r.amount for r in curr_rates)
-                average_rate = total_amount / len(curr_rates) if curr_rates else 0
-                analytics['average_rates'][curr] = average_rate
-                
-                # Calculate rates by staff class
-                staff_class_rates = {}
-                for rate in curr_rates:
-                    staff_class_id = str(rate.staff_class_id)
-                    if staff_class_id not in staff_class_rates:
-                        staff_class_rates[staff_class_id] = []
-                    staff_class_rates[staff_class_id].append(rate.amount)
-                
-                for staff_class_id, amounts in staff_class_rates.items():
-                    avg = sum(amounts) / len(amounts) if amounts else 0
-                    if 'staff_class' not in analytics['average_rates']:
-                        analytics['average_rates']['staff_class'] = {}
-                    if curr not in analytics['average_rates']['staff_class']:
-                        analytics['average_rates']['staff_class'][curr] = {}
-                    analytics['average_rates']['staff_class'][curr][staff_class_id] = avg
+        Returns:
+            Dictionary containing analytics data
+        """
+        query = self.session.query(
+            Rate.currency,
+            Rate.staff_class_id,
+            func.count(Rate.id).label('rate_count'),
+            func.sum(Rate.amount).label('total_amount')
+        )
+        query = self._filter_rate_analytics(query, client_id, firm_id, start_date, end_date)
+        rows = query.group_by(Rate.currency, Rate.staff_class_id).order_by(
+            Rate.currency, Rate.staff_class_id
+        ).all()
+        
+        analytics = self._empty_rate_analytics()
+        totals_by_currency = {}
+        
+        # Roll the staff class groups up into per-currency totals
+        for row in rows:
+            count, total = totals_by_currency.get(row.currency, (0, 0))
+            totals_by_currency[row.currency] = (count + row.rate_count, total + row.total_amount)
             
-            # Convert analytics to target currency if specified
-            if currency:
-                converted_analytics = {
-                    'total_rates': analytics['total_rates'],
-                    'currency_breakdown': analytics['currency_breakdown'],
-                    'average_rates': {},
-                    'rate_increases': {},
-                    'staff_class_breakdown': {},
-                    'office_breakdown': {}
-                }
-                
-                # Convert average rates
-                for curr, avg in analytics['average_rates'].items():
-                    if isinstance(avg, dict):
-                        # Handle nested dictionaries like staff_class breakdown
-                        converted_analytics['average_rates'][curr] = {}
-                        for key, value in avg.items():
-                            if isinstance(value, dict):
-                                converted_analytics['average_rates'][curr][key] = {}
-                                for subkey, subvalue in value.items():
-                                    converted_amount = convert_currency(subvalue, curr, currency)
-                                    converted_analytics['average_rates'][curr][key][subkey] = converted_amount
-                            else:
-                                converted_amount = convert_currency(value, curr, currency)
-                                converted_analytics['average_rates'][curr][key] = converted_amount
-                    else:
-                        # Handle direct currency values
-                        converted_amount = convert_currency(avg, curr, currency)
-                        converted_analytics['average_rates'][curr] = converted_amount
-                
-                analytics = converted_analytics
+            staff_class_averages = analytics['average_rates'].setdefault('staff_class', {}).setdefault(row.currency, {})
+            staff_class_averages[str(row.staff_class_id)] = row.total_amount / row.rate_count
+        
+        for curr, (count, total) in totals_by_currency.items():
+            analytics['total_rates'] += count
+            analytics['currency_breakdown'][curr] = count
+            analytics['average_rates'][curr] = total / count
+        
+        return analytics
+    
+    def _collect_rate_analytics(self, client_id: Optional[str], firm_id: Optional[str],
+                                start_date: Optional[date], end_date: Optional[date]) -> Dict[str, Any]:
+        """
+        Computes rate analytics by loading every matching rate
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            start_date: Optional start date for filtering
+            end_date: Optional end date for filtering
             
-            return analytics
+        Returns:
+            Dictionary containing analytics data
+        """
+        query = self._filter_rate_analytics(self.session.query(Rate), client_id, firm_id, start_date, end_date)
+        
+        # Execute query
+        rates = query.all()
+        
+        # Process rates for analytics
+        analytics = self._empty_rate_analytics()
+        analytics['total_rates'] = len(rates)
+        
+        # Group by currency for aggregation
+        rates_by_currency = {}
+        for rate in rates:
+            if rate.currency not in rates_by_currency:
+                rates_by_currency[rate.currency] = []
+            rates_by_currency[rate.currency].append(rate)
+        
+        # Process rates in each currency
+        for curr, curr_rates in rates_by_currency.items():
+            # Count rates in this currency
+            analytics['currency_breakdown'][curr] = len(curr_rates)
+            
+            # Calculate average rate
+            total_amount = sum(r.amount for r in curr_rates)
+            average_rate = total_amount / len(curr_rates) if curr_rates else 0
+            analytics['average_rates'][curr] = average_rate
+            
+            # Calculate rates by staff class
+            staff_class_rates = {}
+            for rate in curr_rates:
+                staff_class_id = str(rate.staff_class_id)
+                if staff_class_id not in staff_class_rates:
+                    staff_class_rates[staff_class_id] = []
+                staff_class_rates[staff_class_id].append(rate.amount)
+            
+            for staff_class_id, amounts in staff_class_rates.items():
+                avg = sum(amounts) / len(amounts) if amounts else 0
+                if 'staff_class' not in analytics['average_rates']:
+                    analytics['average_rates']['staff_class'] = {}
+                if curr not in analytics['average_rates']['staff_class']:
+                    analytics['average_rates']['staff_class'][curr] = {}
+                analytics['average_rates']['staff_class'][curr][staff_class_id] = avg
+        
+        return analytics
+    
+    def _convert_rate_analytics(self, analytics: Dict[str, Any], currency: str) -> Dict[str, Any]:
+        """
+        Converts the averages of a rate analytics result to a target currency
+        
+        Args:
+            analytics: Rate analytics with averages in their original currencies
+            currency: Currency to convert all amounts to
             
-        except Exception as e:
-            logger.error(f"Error generating rate analytics: {str(e)}")
-            raise
+        Returns:
+            Rate analytics with converted averages
+        """
+        converted_analytics = self._empty_rate_analytics()
+        converted_analytics['total_rates'] = analytics['total_rates']
+        converted_analytics['currency_breakdown'] = analytics['currency_breakdown']
+        
+        # Convert average rates
+        for curr, avg in analytics['average_rates'].items():
+            if isinstance(avg, dict):
+                # Handle nested dictionaries like staff_class breakdown, keyed by source currency
+                converted_analytics['average_rates'][curr] = {}
+                for key, value in avg.items():
+                    if isinstance(value, dict):
+                        converted_analytics['average_rates'][curr][key] = {}
+                        for subkey, subvalue in value.items():
+                            converted_amount = convert_currency(subvalue, key, currency)
+                            converted_analytics['average_rates'][curr][key][subkey] = converted_amount
+                    else:
+                        converted_amount = convert_currency(value, key, currency)
+                        converted_analytics['average_rates'][curr][key] = converted_amount
+            else:
+                # Handle direct currency values
+                converted_amount = convert_currency(avg, curr, currency)
+                converted_analytics['average_rates'][curr] = converted_amount
+        
+        return converted_analytics
     
     def bulk_update_status(self, rate_ids: List[str], status: str, 
                           user_id: Optional[str] = None, message: Optional[str] = None) -> int:
@@ -827,14 +1256,20 @@ class RateRepository:
             raise
     
     def import_rates(self, rate_data: List[Dict[str, Any]], import_type: str,
-                    user_id: Optional[str] = None) -> Dict[str, Any]:
+                    user_id: Optional[str] = None, chunk_size: int = IMPORT_CHUNK_SIZE) -> Dict[str, Any]:
         """
         Imports multiple rate records from structured data
         
+        Rows are validated in one vectorized pass, rows to update are resolved with one keyed
+        query per chunk, and writes go out in chunks (COPY on PostgreSQL, multi-row INSERT and
+        bulk UPDATE by primary key otherwise). A chunk that fails is retried row by row so that
+        errors are still reported against the rows that caused them.
+        
         Args:
             rate_data: List of dictionaries containing rate information
             import_type: Type of import (e.g., 'NEW', 'UPDATE')
             user_id: Optional UUID of the user performing the import
+            chunk_size: Number of rows written per statement
             
         Returns:
             Import results summary
@@ -846,66 +1281,45 @@ class RateRepository:
                 'failed': 0,
                 'errors': []
             }
+            if not rate_data:
+                return results
+            
+            # 1. Validate and normalize every row in one vectorized pass
+            frame = pandas.DataFrame(rate_data)
+            is_update = pandas.Series(import_type == 'UPDATE', index=frame.index)
+            if 'id' in frame.columns:
+                is_update &= frame['id'].notna()
+            else:
+                is_update &= False
+            errors = self._validate_import_frame(frame, is_update)
+            
+            # 2. Resolve rows to update with one keyed query per chunk and apply them in bulk
+            update_index = frame.index[is_update & errors.isna()]
+            written = self._bulk_update_imported_rates(rate_data, frame, update_index, errors, chunk_size)
+            
+            # 3. Insert new rows in chunks
+            insert_index = frame.index[~is_update & errors.isna()]
+            written.extend(self._bulk_insert_imported_rates(frame, insert_index, errors, chunk_size))
+            
+            # 4. Invalidate dependent caches once for everything written
+            if written:
+                tags = self._cache_tags_for_rates(
+                    client_ids={row['client_id'] for row in written},
+                    firm_ids={row['firm_id'] for row in written},
+                    attorney_ids={row['attorney_id'] for row in written},
+                    staff_class_ids={row['staff_class_id'] for row in written if row['staff_class_id']},
+                )
+                if tags:
+                    invalidate_tags(*tags)
+            
+            failed = errors.dropna()
+            results['failed'] = len(failed)
+            results['successful'] = results['total'] - results['failed']
+            results['errors'] = [
+                {'index': int(index), 'error': error, 'data': rate_data[index]}
+                for index, error in failed.items()
+            ]
             
-            # Process each rate record
-            for index, data in enumerate(rate_data):
-                try:
-                    # Check for required fields
-                    required_fields = ['attorney_id', 'client_id', 'firm_id', 'amount', 'currency', 'effective_date']
-                    missing_fields = [field for field in required_fields if field not in data]
-                    
-                    if missing_fields:
-                        error_msg = f"Missing required fields: {', '.join(missing_fields)}"
-                        results['errors'].append({
-                            'index': index,
-                            'error': error_msg,
-                            'data': data
-                        })
-                        results['failed'] += 1
-                        continue
-                    
-                    # Check if this is an update or new record
-                    if import_type == 'UPDATE' and 'id' in data:
-                        # Update existing rate
-                        rate = self.update(data['id'], data)
-                        if rate:
-                            results['successful'] += 1
-                        else:
-                            results['errors'].append({
-                                'index': index,
-                                'error': f"Rate with ID {data['id']} not found",
-                                'data': data
-                            })
-                            results['failed'] += 1
-                    else:
-                        # Create new rate
-                        rate = self.create(
-                            attorney_id=data['attorney_id'],
-                            client_id=data['client_id'],
-                            firm_id=data['firm_id'],
-                            office_id=data.get('office_id'),
-                            staff_class_id=data.get('staff_class_id'),
-                            amount=data['amount'],
-                            currency=data.get('currency', 'USD'),
-                            type=data.get('type', 'STANDARD'),
-                            effective_date=data['effective_date'],
-                            expiration_date=data.get('expiration_date'),
-                            status=data.get('status', 'DRAFT')
-                        )
-                        results['successful'] += 1
-                
-                except Exception as e:
-                    # Log the error and continue with next record
-                    error_msg = str(e)
-                    results['errors'].append({
-                        'index': index,
-                        'error': error_msg,
-                        'data': data
-                    })
-                    results['failed'] += 1
-            
-            # Commit all successful changes
-            self.session.commit()
             logger.info(f"Imported {results['successful']} rates, {results['failed']} failed")
             
             return results
@@ -915,42 +1329,340 @@ class RateRepository:
             logger.error(f"Error importing rates: {str(e)}")
             raise
     
-    def export_rates(self, client_id: Optional[str] = None, firm_id: Optional[str] = None,
-                    status: Optional[str] = None, export_format: Optional[str] = None,
-                    currency: Optional[str] = None) -> Dict[str, Any]:
+    def _validate_import_frame(self, frame: pandas.DataFrame, is_update: pandas.Series) -> pandas.Series:
         """
-        Exports rate data based on filters
+        Validates and normalizes imported rate rows in place with vectorized checks
+        
+        Only the first error found for a row is reported, following the order of the
+        checks below. Valid values are normalized to what the rates table stores.
         
         Args:
-            client_id: Optional UUID of the client to filter by
-            firm_id: Optional UUID of the law firm to filter by
-            status: Optional status to filter by
-            export_format: Optional format for the export (e.g., 'JSON', 'CSV')
-            currency: Optional currency to convert all amounts to
+            frame: DataFrame of imported rows, one row per input record
+            is_update: Boolean mask of rows that update an existing rate
             
         Returns:
-            Exported rate data
+            Series of error messages indexed like the frame, None for valid rows
         """
-        try:
-            # Build query based on filters
-            query = self.session.query(Rate)
+        errors = pandas.Series(None, index=frame.index, dtype=object)
+        
+        def flag(mask: pandas.Series, message: Any) -> None:
+            mask = mask & errors.isna()
+            if mask.any():
+                errors[mask] = message[mask] if isinstance(message, pandas.Series) else message
+        
+        # 1. Required fields; new rows also need the columns the rates table cannot leave empty
+        fields = IMPORT_REQUIRED_FIELDS + IMPORT_INSERT_REQUIRED_FIELDS
+        missing = pandas.DataFrame({
+            field: frame[field].isna() if field in frame.columns else True for field in fields
+        }, index=frame.index)
+        missing.loc[is_update, IMPORT_INSERT_REQUIRED_FIELDS] = False
+        has_missing = missing.any(axis=1)
+        if has_missing.any():
+            names = missing[has_missing].dot(pandas.Index(fields) + ', ').str[:-2]
+            flag(has_missing, 'Missing required fields: ' + names.reindex(frame.index, fill_value=''))
+        
+        # 2. Identifiers must be UUIDs
+        for column in ['id'] + IMPORT_UUID_FIELDS:
+            if column not in frame.columns:
+                continue
+            present = frame[column].notna()
+            text = frame[column].astype(str).str.strip('{}').str.replace('-', '', regex=False)
+            valid = text.str.fullmatch(r'[0-9a-fA-F]{32}').fillna(False).astype(bool)
+            flag(present & ~valid, f"Invalid {column}: badly formed hexadecimal UUID string")
+            frame[column] = text.where(present & valid).map(
+                lambda value: uuid.UUID(value) if isinstance(value, str) else None
+            )
+        
+        # 3. Amounts must be positive numbers
+        if 'amount' in frame.columns:
+            present = frame['amount'].notna()
+            amounts = pandas.to_numeric(frame['amount'], errors='coerce')
+            flag(present & amounts.isna(), "Rate amount must be a number")
+            flag(present & (amounts <= 0), "Rate amount must be greater than zero")
+        
+        # 4. Currencies must be supported
+        if 'currency' in frame.columns:
+            present = frame['currency'].notna()
+            frame['currency'] = frame['currency'].astype(str).str.upper().where(present)
+            flag(present & ~frame['currency'].isin(SUPPORTED_CURRENCIES),
+                 'Unsupported currency code: ' + frame['currency'].fillna(''))
+        
+        # 5. Dates must parse and expiration must follow the effective date
+        for column in ['effective_date', 'expiration_date']:
+            if column in frame.columns:
+                present = frame[column].notna()
+                parsed = pandas.to_datetime(frame[column], errors='coerce')
+                flag(present & parsed.isna(), f"Invalid {column}")
+                frame[column] = parsed.dt.date.where(parsed.notna(), None)
+        if 'effective_date' in frame.columns and 'expiration_date' in frame.columns:
+            both = frame['effective_date'].notna() & frame['expiration_date'].notna()
+            flag(both & (frame['expiration_date'].where(both) <= frame['effective_date'].where(both)).fillna(False).astype(bool),
+                 "Expiration date must be after effective date")
+        
+        # 6. Type and status accept enum names or values in any case
+        for column, enum_class in [('type', RateType), ('status', RateStatus)]:
+            if column not in frame.columns:
+                continue
+            present = frame[column].notna()
+            lookup = {member.value.lower(): member for member in enum_class}
+            lookup.update({member.name.lower(): member for member in enum_class})
+            members = frame[column].map(lambda value: value if isinstance(value, enum_class) else lookup.get(str(value).lower()))
+            flag(present & members.isna(), "'" + frame[column].astype(str) + f"' is not a valid {enum_class.__name__}")
+            frame[column] = members
+        
+        return errors
+    
+    def _bulk_update_imported_rates(self, rate_data: List[Dict[str, Any]], frame: pandas.DataFrame,
+                                    update_index: pandas.Index, errors: pandas.Series,
+                                    chunk_size: int) -> List[Dict[str, Any]]:
+        """
+        Applies imported updates to existing rates with one keyed lookup and one bulk UPDATE per chunk
+        
+        Args:
+            rate_data: Original imported records, used to decide which fields each row updates
+            frame: Validated and normalized import frame
+            update_index: Frame index of valid rows that update an existing rate
+            errors: Error series to record rows that cannot be updated
+            chunk_size: Number of rows per lookup and statement
             
-            if client_id:
-                query = query.filter(Rate.client_id == uuid.UUID(client_id))
+        Returns:
+            Identifying columns of the updated rates, for cache invalidation
+        """
+        written = []
+        updatable = set(Rate.__table__.columns.keys()) - {'id', 'history', 'created_at', 'updated_at'}
+        
+        for start in range(0, len(update_index), chunk_size):
+            chunk = update_index[start:start + chunk_size]
+            
+            # Resolve the existing rows of the whole chunk with one query
+            existing = {
+                row.id: row for row in self.session.execute(
+                    select(Rate.id, Rate.attorney_id, Rate.client_id, Rate.firm_id, Rate.staff_class_id,
+                           Rate.amount, Rate.status, Rate.type, Rate.history)
+                    .where(Rate.id.in_(list(frame.loc[chunk, 'id'])))
+                ).all()
+            }
             
-            if firm_id:
-                query = query.filter(Rate.firm_id == uuid.UUID(firm_id))
+            values = []
+            for index in chunk:
+                rate_id = frame.at[index, 'id']
+                current = existing.get(rate_id)
+                if current is None:
+                    errors[index] = f"Rate with ID {rate_data[index]['id']} not found"
+                    continue
+                
+                data = rate_data[index]
+                row = {'id': rate_id, 'updated_at': datetime.utcnow()}
+                row.update({key: frame.at[index, key] for key in data if key in updatable})
+                if 'amount' in row:
+                    row['amount'] = Decimal(str(row['amount']))
+                
+                # Record history the same way as update() when a user and message are given
+                if 'user_id' in data and 'message' in data:
+                    new_status = row.get('status', current.status)
+                    new_type = row.get('type', current.type)
+                    row['history'] = list(current.history or []) + [{
+                        'timestamp': datetime.utcnow().isoformat(),
+                        'user_id': str(uuid.UUID(str(data['user_id']))),
+                        'previous_amount': str(current.amount),
+                        'new_amount': str(row.get('amount', current.amount)),
+                        'previous_status': current.status.value,
+                        'new_status': new_status.value,
+                        'previous_type': current.type.value,
+                        'new_type': new_type.value,
+                        'message': data['message'],
+                    }]
+                
+                values.append((index, row))
+                written.append({
+                    'client_id': row.get('client_id', current.client_id),
+                    'firm_id': row.get('firm_id', current.firm_id),
+                    'attorney_id': row.get('attorney_id', current.attorney_id),
+                    'staff_class_id': row.get('staff_class_id', current.staff_class_id),
+                })
+            
+            failed = self._write_import_chunk(values, lambda rows: self.session.execute(update(Rate), rows))
+            for index, error in failed.items():
+                errors[index] = error
+        
+        return written
+    
+    def _bulk_insert_imported_rates(self, frame: pandas.DataFrame, insert_index: pandas.Index,
+                                    errors: pandas.Series, chunk_size: int) -> List[Dict[str, Any]]:
+        """
+        Inserts imported rates in chunks, using COPY when the database driver supports it
+        
+        Args:
+            frame: Validated and normalized import frame
+            insert_index: Frame index of valid rows to insert
+            errors: Error series to record rows the database rejects
+            chunk_size: Number of rows per statement or COPY batch
             
-            if status:
-                query = query.filter(Rate.status == status)
+        Returns:
+            Identifying columns of the inserted rates, for cache invalidation
+        """
+        if not len(insert_index):
+            return []
+        
+        # Build every row to insert from the normalized columns in one pass
+        now = datetime.utcnow()
+        rows = frame.loc[insert_index, IMPORT_REQUIRED_FIELDS + IMPORT_INSERT_REQUIRED_FIELDS].copy()
+        rows['amount'] = rows['amount'].map(lambda value: Decimal(str(value)))
+        rows['type'] = frame.loc[insert_index, 'type'] if 'type' in frame.columns else RateType.STANDARD
+        rows['type'] = rows['type'].where(rows['type'].notna(), RateType.STANDARD)
+        rows['status'] = frame.loc[insert_index, 'status'] if 'status' in frame.columns else RateStatus.DRAFT
+        rows['status'] = rows['status'].where(rows['status'].notna(), RateStatus.DRAFT)
+        rows['expiration_date'] = frame.loc[insert_index, 'expiration_date'] if 'expiration_date' in frame.columns else None
+        rows['id'] = [uuid.uuid4() for _ in range(len(rows))]
+        rows['history'] = [[] for _ in range(len(rows))]
+        rows['created_at'] = now
+        rows['updated_at'] = now
+        records = rows.astype(object).where(rows.notna(), None).to_dict('records')
+        
+        use_copy = self._supports_copy()
+        written = []
+        for start in range(0, len(records), chunk_size):
+            values = list(zip(insert_index[start:start + chunk_size], records[start:start + chunk_size]))
+            write = self._copy_rates if use_copy else (lambda chunk: self.session.execute(insert(Rate), chunk))
+            failed = self._write_import_chunk(values, write)
+            for index, error in failed.items():
+                errors[index] = error
+            written.extend(record for index, record in values if index not in failed)
+        
+        return written
+    
+    def _write_import_chunk(self, values: List[Tuple[Any, Dict[str, Any]]], write) -> Dict[Any, str]:
+        """
+        Writes one chunk of imported rows and commits it, falling back to row-by-row writes on failure
+        
+        Args:
+            values: Pairs of (frame index, row values) to write
+            write: Callable that writes a list of row values in one operation
+            
+        Returns:
+            Mapping of frame index to error message for rows the database rejected
+        """
+        if not values:
+            return {}
+        
+        try:
+            write([row for _, row in values])
+            self.session.commit()
+            return {}
+        except Exception as e:
+            self.session.rollback()
+            logger.warning(f"Bulk write of {len(values)} imported rates failed, retrying row by row: {str(getattr(e, 'orig', None) or e)}")
+        
+        # Isolate the offending rows with a savepoint per row
+        failed = {}
+        for index, row in values:
+            try:
+                with self.session.begin_nested():
+                    write([row])
+            except Exception as e:
+                failed[index] = str(getattr(e, 'orig', None) or e)
+        self.session.commit()
+        return failed
+    
+    def _supports_copy(self) -> bool:
+        """
+        Checks whether the session's database connection supports COPY FROM STDIN
+        
+        Returns:
+            True for PostgreSQL through psycopg2, False otherwise
+        """
+        try:
+            dialect = self.session.get_bind().dialect
+            return dialect.name == 'postgresql' and dialect.driver == 'psycopg2'
+        except Exception:
+            return False
+    
+    def _copy_rates(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Streams rate rows into the rates table with a single COPY statement
+        
+        Args:
+            records: Complete rate rows keyed by column name
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in records:
+            writer.writerow([_copy_value(record[column]) for column in IMPORT_COPY_COLUMNS])
+        buffer.seek(0)
+        
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Rate.__tablename__} ({', '.join(IMPORT_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+    
+    def _export_statement(self, client_id: Optional[str], firm_id: Optional[str], status: Optional[str],
+                          organization_id: Optional[str] = None):
+        """
+        Builds the column-only select for rate exports, so rows stream without ORM instances
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            status: Optional status to filter by
+            organization_id: Optional UUID of an organization the rates must belong to, as client or firm
             
-            # Execute query
-            rates = query.all()
+        Returns:
+            SQLAlchemy select statement
+        """
+        statement = select(
+            Rate.id, Rate.attorney_id, Rate.client_id, Rate.firm_id, Rate.office_id, Rate.staff_class_id,
+            Rate.amount, Rate.currency, Rate.type, Rate.effective_date, Rate.expiration_date, Rate.status,
+            Rate.created_at, Rate.updated_at
+        )
+        
+        if client_id:
+            statement = statement.where(Rate.client_id == uuid.UUID(client_id))
+        
+        if firm_id:
+            statement = statement.where(Rate.firm_id == uuid.UUID(firm_id))
+        
+        if status:
+            statement = statement.where(Rate.status == status)
+        
+        if organization_id:
+            organization_uuid = uuid.UUID(organization_id)
+            statement = statement.where(or_(Rate.client_id == organization_uuid, Rate.firm_id == organization_uuid))
+        
+        return statement.order_by(Rate.id)
+    
+    def iter_export_chunks(self, client_id: Optional[str] = None, firm_id: Optional[str] = None,
+                           status: Optional[str] = None, currency: Optional[str] = None,
+                           chunk_size: int = EXPORT_CHUNK_SIZE,
+                           organization_id: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Streams rates matching the filters as chunks of export rows
+        
+        Rows are fetched through a server-side cursor and each chunk is converted to the
+        target currency in one vectorized pass, so memory stays flat regardless of row count.
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            status: Optional status to filter by
+            currency: Optional currency to convert all amounts to
+            chunk_size: Number of rows fetched and yielded at a time
+            organization_id: Optional UUID of an organization the rates must belong to, as client or firm
             
-            # Format rates for export
-            export_data = []
-            for rate in rates:
-                rate_dict = {
+        Returns:
+            Iterator over lists of export rows with the RATE_EXPORT_FIELDS keys
+        """
+        result = self.session.execute(
+            self._export_statement(client_id, firm_id, status, organization_id),
+            execution_options={'yield_per': chunk_size}
+        )
+        
+        for partition in result.partitions():
+            rows = [
+                {
                     'id': str(rate.id),
                     'attorney_id': str(rate.attorney_id),
                     'client_id': str(rate.client_id),
@@ -966,15 +1678,47 @@ class RateRepository:
                     'created_at': rate.created_at.isoformat(),
                     'updated_at': rate.updated_at.isoformat()
                 }
-                
-                # Convert amount to target currency if specified
-                if currency and rate.currency != currency:
-                    rate_dict['original_amount'] = rate_dict['amount']
-                    rate_dict['original_currency'] = rate_dict['currency']
-                    rate_dict['amount'] = float(convert_currency(rate.amount, rate.currency, currency))
-                    rate_dict['currency'] = currency
-                
-                export_data.append(rate_dict)
+                for rate in partition
+            ]
+            
+            # Convert amounts of the whole chunk to the target currency in one call
+            if currency:
+                foreign = [row for row in rows if row['currency'] != currency]
+                if foreign:
+                    converted = convert_amounts(
+                        [row['amount'] for row in foreign], [row['currency'] for row in foreign], currency
+                    )
+                    for row, amount in zip(foreign, converted):
+                        row['original_amount'] = row['amount']
+                        row['original_currency'] = row['currency']
+                        row['amount'] = round(float(amount), 2)
+                        row['currency'] = currency
+            
+            yield rows
+    
+    def export_rates(self, client_id: Optional[str] = None, firm_id: Optional[str] = None,
+                    status: Optional[str] = None, export_format: Optional[str] = None,
+                    currency: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Exports rate data based on filters
+        
+        Returns every matching rate in memory; large exports should stream
+        iter_export_chunks instead.
+        
+        Args:
+            client_id: Optional UUID of the client to filter by
+            firm_id: Optional UUID of the law firm to filter by
+            status: Optional status to filter by
+            export_format: Optional format for the export (e.g., 'JSON', 'CSV')
+            currency: Optional currency to convert all amounts to
+            
+        Returns:
+            Exported rate data
+        """
+        try:
+            export_data = []
+            for rows in self.iter_export_chunks(client_id, firm_id, status, currency):
+                export_data.extend(rows)
             
             # Create result object
             result = {
@@ -992,9 +1736,11 @@ class RateRepository:
             
             # Format based on export_format if needed
             if export_format == 'CSV':
-                # In a real implementation, we would convert to CSV format here
-                # but for this example we'll just note it in the result
-                result['format_note'] = 'CSV conversion would be implemented here'
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=RATE_EXPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(export_data)
+                result['content'] = buffer.getvalue()
             
             logger.info(f"Exported {len(export_data)} rates")
             return result
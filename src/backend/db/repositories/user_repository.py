@@ -14,6 +14,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from ..models.user import User, UserRole
 from ..session import session_scope, get_db
 from ...utils.logging import get_logger
+from ...utils.principal_cache import invalidate_principal
 from ...utils.validators import (
     validate_required, validate_email, validate_string, 
     validate_password, validate_enum_value
@@ -232,6 +233,7 @@ class UserRepository:
             
             # Commit changes
             self._db.commit()
+            invalidate_principal(user_id)
             
             logger.info(f"Updated user {user_id}")
             return user
@@ -263,6 +265,7 @@ class UserRepository:
             
             user.delete(deleted_by_id)
             self._db.commit()
+            invalidate_principal(user_id)
             
             logger.info(f"Deleted user {user_id}" + 
                       (f" by {deleted_by_id}" if deleted_by_id else ""))
@@ -291,6 +294,7 @@ class UserRepository:
             
             user.restore()
             self._db.commit()
+            invalidate_principal(user_id)
             
             logger.info(f"Restored user {user_id}")
             return True
@@ -437,6 +441,7 @@ class UserRepository:
             # Update role
             user.role = new_role
             self._db.commit()
+            invalidate_principal(user_id)
             
             logger.info(f"Updated role to {new_role} for user {user_id}")
             return user
@@ -471,6 +476,7 @@ class UserRepository:
             
             if result:
                 self._db.commit()
+                invalidate_principal(user_id)
                 logger.info(f"Added permission '{permission}' to user {user_id}")
             else:
                 logger.info(f"Permission '{permission}' already exists for user {user_id}")
@@ -503,6 +509,7 @@ class UserRepository:
             
             if result:
                 self._db.commit()
+                invalidate_principal(user_id)
                 logger.info(f"Removed permission '{permission}' from user {user_id}")
             else:
                 logger.info(f"Permission '{permission}' not found for user {user_id}")
@@ -566,6 +573,7 @@ class UserRepository:
                 logger.info(f"Disabled MFA for user {user_id}")
             
             self._db.commit()
+            invalidate_principal(user_id)
             return True
             
         except ValueError as e:
@@ -601,6 +609,7 @@ class UserRepository:
                 logger.info(f"Deactivated user {user_id}")
             
             self._db.commit()
+            invalidate_principal(user_id)
             return True
             
         except SQLAlchemyError as e:
@@ -678,6 +687,81 @@ class UserRepository:
             logger.error(f"Error getting users by role {role}: {str(e)}")
             return []
     
+    def get_by_ids(self, user_ids: List[uuid.UUID]) -> List[User]:
+        """
+        Get several users by their IDs with a single query.
+        
+        Args:
+            user_ids (List[uuid.UUID]): IDs of the users to retrieve
+            
+        Returns:
+            List[User]: Users found, in no particular order
+        """
+        if not user_ids:
+            return []
+        
+        try:
+            return self._db.query(User).filter(
+                User.id.in_(list(user_ids)),
+                User.is_deleted == False
+            ).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving {len(user_ids)} users by ID: {str(e)}")
+            return []
+    
+    def get_notification_recipients(self, user_ids: List[uuid.UUID]) -> List[Any]:
+        """
+        Get the delivery details of the active users among notification recipients with a single query.
+        
+        Only the ID, email address and preferences are loaded, so that fanning a notification
+        out to thousands of users does not hydrate full User objects.
+        
+        Args:
+            user_ids (List[uuid.UUID]): IDs of the recipients
+            
+        Returns:
+            List[Any]: Rows with id, email and preferences of each active recipient
+        """
+        if not user_ids:
+            return []
+        
+        try:
+            return self._db.query(User.id, User.email, User.preferences).filter(
+                User.id.in_(list(user_ids)),
+                User.is_active == True,
+                User.is_deleted == False
+            ).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving {len(user_ids)} notification recipients: {str(e)}")
+            raise
+    
+    def get_user_ids_by_organization(self, organization_id: uuid.UUID,
+                                     roles: Optional[List[UserRole]] = None) -> List[uuid.UUID]:
+        """
+        Get the IDs of the active users of an organization, optionally limited to some roles.
+        
+        Args:
+            organization_id (uuid.UUID): The ID of the organization
+            roles (Optional[List[UserRole]]): Roles to filter by, every role if omitted
+            
+        Returns:
+            List[uuid.UUID]: IDs of the matching users
+        """
+        try:
+            query = self._db.query(User.id).filter(
+                User.organization_id == organization_id,
+                User.is_active == True,
+                User.is_deleted == False
+            )
+            
+            if roles:
+                query = query.filter(User.role.in_(list(roles)))
+            
+            return [user_id for user_id, in query.all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving user IDs for organization {organization_id}: {str(e)}")
+            raise
+    
     def count_by_organization(self, organization_id: uuid.UUID, active_only: bool = True) -> int:
         """
         Count the number of users in an organization.
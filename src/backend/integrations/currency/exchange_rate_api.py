@@ -4,7 +4,7 @@ Integration module for interacting with an external currency exchange rate API t
 
 import requests  #  Making HTTP requests to the currency API
 import json  # Processing JSON responses from the API
-from datetime import datetime  # Handling date objects for historical exchange rates
+from datetime import date, datetime  # Handling date objects for historical exchange rates
 from typing import List, Dict, Optional, Any  # Type annotations
 
 from ..common.adapter import BaseAdapter  # Base class for integration adapters
@@ -14,6 +14,7 @@ from ...utils.logging import logger  # Logging utility
 
 DEFAULT_BASE_CURRENCY = "USD"
 CACHE_DURATION = 86400  # 24 hours
+TIMESERIES_MAX_DAYS = 365  # Longest date range the API serves in one timeseries request
 
 
 class ExchangeRateClient(BaseClient):
@@ -55,6 +56,52 @@ class ExchangeRateClient(BaseClient):
         data = self._make_request(date_str, params)
         return data['rates']
 
+    def get_timeseries_rates(self, start_date: date, end_date: date, base_currency: str,
+                             symbols: Optional[List[str]] = None) -> Dict[date, Dict[str, float]]:
+        """Get daily exchange rates for every day of a date range in one request"""
+        params = {
+            'base': base_currency,
+            'start_date': start_date.strftime('%Y-%m-%d'),
+            'end_date': end_date.strftime('%Y-%m-%d'),
+        }
+        if symbols:
+            params['symbols'] = ','.join(symbols)
+        data = self._make_request('timeseries', params)
+        return {date.fromisoformat(day): rates for day, rates in data['rates'].items()}
+
+    def get_historical_rates_for_dates(self, dates: List[date], base_currency: str,
+                                       symbols: Optional[List[str]] = None) -> Dict[date, Dict[str, float]]:
+        """
+        Get historical exchange rates for several dates, skipping dates the API cannot serve
+
+        Dates are fetched with one timeseries request per TIMESERIES_MAX_DAYS window, falling
+        back to one request per date when the API cannot serve a timeseries.
+        """
+        days = sorted(set(dates))
+        rates_by_date = {}
+        while days:
+            window = [day for day in days if (day - days[0]).days < TIMESERIES_MAX_DAYS]
+            days = days[len(window):]
+            try:
+                series = self.get_timeseries_rates(window[0], window[-1], base_currency, symbols)
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                logger.warning(f"Timeseries request for {base_currency} from {window[0]} to {window[-1]} failed, "
+                               f"fetching each date instead: {str(e)}")
+                series = self._get_daily_historical_rates(window, base_currency, symbols)
+            rates_by_date.update({day: series[day] for day in window if day in series})
+        return rates_by_date
+
+    def _get_daily_historical_rates(self, dates: List[date], base_currency: str,
+                                    symbols: Optional[List[str]] = None) -> Dict[date, Dict[str, float]]:
+        """Get historical exchange rates with one request per date"""
+        rates_by_date = {}
+        for rate_date in dates:
+            try:
+                rates_by_date[rate_date] = self.get_historical_rates(rate_date, base_currency, symbols)
+            except (requests.exceptions.RequestException, KeyError) as e:
+                logger.error(f"Failed to fetch historical rates for {base_currency} on {rate_date}: {str(e)}")
+        return rates_by_date
+
     def convert(self, amount: float, from_currency: str, to_currency: str, date: Optional[datetime] = None) -> float:
         """Convert amount between currencies"""
         if from_currency == to_currency:
@@ -4,9 +4,19 @@ Processes CSV files for import and export operations, handling parsing, validati
 
 import csv  # built-in
 import io  # built-in
+import os  # built-in
 import typing  # built-in
+import contextlib  # built-in
+from collections import defaultdict  # built-in
 import pandas  # package version: ^1.5.0
 
+try:
+    import pyarrow  # optional, faster chunked parsing
+    import pyarrow.csv as pyarrow_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pyarrow = None
+    pyarrow_csv = None
+
 from .validators import validate_csv_structure, validate_csv_data  # internal
 from ...utils.file_handling import read_file, save_file  # internal
 from ..common.adapter import FileProcessor  # internal
@@ -15,6 +25,24 @@ from ...utils.logging import get_logger  # internal
 # Initialize logger
 logger = get_logger(__name__)
 
+# Characters read from the start of a file to detect its delimiter
+CSV_SNIFF_SIZE = int(os.getenv('CSV_SNIFF_SIZE', str(64 * 1024)))
+
+# Rows parsed, typed, validated and written together by the streaming import
+CSV_CHUNK_SIZE = int(os.getenv('CSV_CHUNK_SIZE', '20000'))
+
+# Parser of the streaming import: 'c' (pandas) or 'pyarrow' when it is installed
+CSV_STREAM_ENGINE = os.getenv('CSV_STREAM_ENGINE', 'c')
+
+# Rows sampled per column to infer column types
+TYPE_INFERENCE_SAMPLE_SIZE = 100
+
+# Row errors kept in a streaming import result; the invalid count still covers every row
+CSV_MAX_REPORTED_ERRORS = 1000
+
+# Delimiters considered when detecting the dialect of a file
+CSV_DELIMITERS = ',;\t|'
+
 
 def detect_delimiter(file_content: str) -> str:
     """
@@ -27,8 +55,8 @@ def detect_delimiter(file_content: str) -> str:
         The detected delimiter character (comma, semicolon, tab, etc.).
         Defaults to comma if no clear delimiter is detected.
     """
-    # Analyze the first few lines of the file content
-    lines = file_content.splitlines()
+    # Analyze the first few lines of the file content, without splitting the rest of it
+    lines = file_content[:CSV_SNIFF_SIZE].splitlines()
     sample_lines = lines[:5]  # Use the first 5 lines as a sample
 
     # Count occurrences of common delimiters (comma, semicolon, tab)
@@ -69,6 +97,27 @@ def normalize_headers(headers: list) -> list:
     return normalized_headers
 
 
+def sniff_delimiter(sample: str) -> str:
+    """
+    Detects the delimiter of a CSV file from a prefix of its content.
+
+    Args:
+        sample: The first characters of the file, see CSV_SNIFF_SIZE.
+
+    Returns:
+        The delimiter found by csv.Sniffer, or the one found by detect_delimiter
+        when the sample is too irregular to sniff.
+    """
+    # Drop the last line, which is usually cut off at the end of the sample
+    lines = sample.splitlines()
+    if len(lines) > 2 and len(sample) >= CSV_SNIFF_SIZE:
+        sample = '\n'.join(lines[:-1])
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return detect_delimiter(sample)
+
+
 def infer_column_types(data: list, headers: list) -> dict:
     """
     Analyzes the data to infer the data type of each column.
@@ -80,44 +129,160 @@ def infer_column_types(data: list, headers: list) -> dict:
     Returns:
         A dictionary mapping column names to their inferred types (e.g., 'int', 'float', 'str', 'date').
     """
+    sample = pandas.DataFrame(data[:TYPE_INFERENCE_SAMPLE_SIZE], columns=headers)
+    return infer_frame_column_types(sample)
+
+
+def _non_empty_text(values: pandas.Series) -> pandas.Series:
+    # Values as stripped strings, without missing and empty values
+    return values[values.notna() & (values.astype(str) != '')].astype(str).str.strip()
+
+
+def _has_leading_zeros(values: pandas.Series) -> bool:
+    # Codes such as '0042' are identifiers, converting them to numbers would drop the zeros
+    return bool(values.str.fullmatch(r'[+-]?0\d+(\.\d*)?').any())
+
+
+def infer_frame_column_types(frame: pandas.DataFrame) -> dict:
+    """
+    Infers the data type of each column from the first rows of a frame of CSV values.
+
+    Numeric columns holding values with leading zeros are typed 'str', and numeric columns
+    holding any fractional value are typed 'float'.
+
+    Args:
+        frame: A DataFrame of values as read from the file (strings).
+
+    Returns:
+        A dictionary mapping column names to their inferred types ('int', 'float', 'date' or 'str').
+    """
     column_types = {}
-    for header in headers:
-        # Initialize an empty list to store values for type inference
-        values = []
-        # Collect a sample of values from the data
-        for row in data[:min(100, len(data))]:  # Analyze up to 100 rows
-            value = row.get(header)
-            if value:
-                values.append(value)
+    for column in frame.columns:
+        values = _non_empty_text(frame[column].head(TYPE_INFERENCE_SAMPLE_SIZE))
 
         # If no values are found, default to string
-        if not values:
-            column_types[header] = 'str'
+        if values.empty:
+            column_types[column] = 'str'
             continue
 
-        # Attempt to parse values as different types (int, float, date, etc.)
-        inferred_type = 'str'  # Default type
-        try:
-            # Check if all values can be converted to integers
-            all(isinstance(int(float(v)), int) for v in values)
-            inferred_type = 'int'
-        except ValueError:
-            try:
-                # Check if all values can be converted to floats
-                all(isinstance(float(v), float) for v in values)
-                inferred_type = 'float'
-            except ValueError:
-                try:
-                    # Check if all values can be converted to dates
-                    all(pandas.to_datetime(v) for v in values)
-                    inferred_type = 'date'
-                except ValueError:
-                    pass  # Keep default 'str' type
-
-        column_types[header] = inferred_type
+        numbers = pandas.to_numeric(values, errors='coerce')
+        if numbers.notna().all():
+            if _has_leading_zeros(values):
+                column_types[column] = 'str'
+            else:
+                column_types[column] = 'int' if values.str.fullmatch(r'[+-]?\d+').all() else 'float'
+        elif pandas.to_datetime(values, errors='coerce', format='mixed').notna().all():
+            column_types[column] = 'date'
+        else:
+            column_types[column] = 'str'
     return column_types
 
 
+def widen_column_types(frame: pandas.DataFrame, column_types: dict) -> dict:
+    """
+    Widens inferred column types so that every value of a later frame converts without loss.
+
+    Types are inferred from the first rows only; an 'int' column becomes 'float' when a
+    later value has a fractional part, and a numeric column becomes 'str' when a later
+    value has leading zeros.
+
+    Args:
+        frame: A DataFrame of values as read from the file (strings).
+        column_types: Column types as returned by infer_frame_column_types.
+
+    Returns:
+        A new dictionary of column types that fits both the earlier rows and the frame.
+    """
+    widened = dict(column_types)
+    for column in frame.columns:
+        if widened.get(column) not in ('int', 'float'):
+            continue
+        values = _non_empty_text(frame[column])
+        if _has_leading_zeros(values):
+            widened[column] = 'str'
+        elif widened[column] == 'int':
+            numbers = pandas.to_numeric(values, errors='coerce')
+            if not values[numbers.notna()].str.fullmatch(r'[+-]?\d+').all():
+                widened[column] = 'float'
+        if widened[column] != column_types[column]:
+            logger.info(f"Widened CSV column {column} from {column_types[column]} to {widened[column]}")
+    return widened
+
+
+def clean_frame(frame: pandas.DataFrame, column_types: dict) -> pandas.DataFrame:
+    """
+    Converts the columns of a frame of CSV values to their inferred types.
+
+    Empty values, and values that cannot be converted, become None; conversion_errors reports
+    the values that could not be converted. Numbers are never truncated: an 'int' column holding a fractional value keeps its values as floats.
+
+    Args:
+        frame: A DataFrame of values as read from the file (strings).
+        column_types: Column types as returned by infer_frame_column_types.
+
+    Returns:
+        A new DataFrame of object columns holding int, float, date, str or None values.
+    """
+    cleaned = {}
+    for column in frame.columns:
+        values = frame[column]
+        empty = values.isna() | (values.astype(str) == '')
+        inferred_type = column_types.get(column)
+
+        if inferred_type in ('int', 'float'):
+            converted = pandas.to_numeric(values.where(~empty), errors='coerce')
+            if inferred_type == 'int' and (converted.dropna() % 1 == 0).all():
+                converted = converted.astype('Int64')
+        elif inferred_type == 'date':
+            converted = pandas.to_datetime(values.where(~empty), errors='coerce', format='mixed').dt.date
+        else:
+            converted = values.where(~empty).astype(object)
+
+        converted = converted.astype(object)
+        cleaned[column] = converted.where(converted.notna(), None)
+    return pandas.DataFrame(cleaned, index=frame.index, columns=frame.columns)
+
+
+def conversion_errors(frame: pandas.DataFrame, cleaned: pandas.DataFrame, column_types: dict) -> pandas.Series:
+    """
+    Finds the non-empty values that clean_frame could not convert to their column type.
+
+    Args:
+        frame: A DataFrame of values as read from the file (strings).
+        cleaned: The frame as returned by clean_frame.
+        column_types: Column types as returned by infer_frame_column_types.
+
+    Returns:
+        A Series indexed like the frame with an error message for each row holding values
+        that could not be converted, None for the other rows.
+    """
+    messages = defaultdict(list)
+    for column in frame.columns:
+        inferred_type = column_types.get(column)
+        if inferred_type not in ('int', 'float', 'date'):
+            continue
+        values = frame[column]
+        empty = values.isna() | (values.astype(str) == '')
+        failed = ~empty & cleaned[column].isna()
+        for index in failed[failed].index:
+            messages[index].append(f"Invalid {inferred_type} value for {column}: {values[index]}")
+    return pandas.Series({index: '; '.join(row_messages) for index, row_messages in messages.items()},
+                         index=frame.index, dtype=object)
+
+
+def frame_to_records(frame: pandas.DataFrame) -> list:
+    """
+    Converts a cleaned frame to a list of row dictionaries for repository writers.
+
+    Args:
+        frame: A DataFrame as returned by clean_frame.
+
+    Returns:
+        A list of dictionaries, one per row, with None for missing values.
+    """
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
 class CSVProcessor(FileProcessor):
     """
     Processes CSV files for import and export operations, handling parsing, validation, mapping, and transformation.
@@ -156,8 +321,8 @@ class CSVProcessor(FileProcessor):
                 # Use the provided content directly
                 file_content = file_path_or_content
 
-            # Detect the delimiter if not specified
-            self.delimiter = detect_delimiter(file_content)
+            # Detect the delimiter from the start of the content
+            self.delimiter = sniff_delimiter(file_content[:CSV_SNIFF_SIZE])
 
             # Use csv.reader or pandas to parse the CSV content
             data = []
@@ -185,6 +350,82 @@ class CSVProcessor(FileProcessor):
             logger.error(f"Error reading CSV file/content: {str(e)}")
             raise
 
+    @contextlib.contextmanager
+    def _open_text(self, file_path_or_content: str, is_content: bool) -> typing.Iterator[typing.TextIO]:
+        # Files are read incrementally; a leading byte order mark is dropped
+        if is_content:
+            yield io.StringIO(file_path_or_content)
+        else:
+            with open(file_path_or_content, 'r', encoding='utf-8-sig', newline='') as handle:
+                yield handle
+
+    def iter_csv_chunks(self, file_path_or_content: str, is_content: bool = False, has_headers: bool = True,
+                        chunk_size: int = CSV_CHUNK_SIZE,
+                        engine: str = CSV_STREAM_ENGINE) -> typing.Iterator[pandas.DataFrame]:
+        """
+        Reads a CSV file in chunks of rows without loading the whole file.
+
+        The delimiter is detected from the first CSV_SNIFF_SIZE characters. Values are kept as
+        strings, with empty strings for empty fields, as read_csv returns them.
+
+        Args:
+            file_path_or_content: The path to the CSV file or the CSV content itself.
+            is_content: A boolean indicating whether the input is a file path or content.
+            has_headers: A boolean indicating whether the CSV file has a header row.
+            chunk_size: Number of rows per chunk.
+            engine: 'c' to parse with pandas, 'pyarrow' to parse with pyarrow when it is installed.
+
+        Returns:
+            An iterator of DataFrames whose index numbers the data rows across the whole file.
+        """
+        with self._open_text(file_path_or_content, is_content) as handle:
+            sample = handle.read(CSV_SNIFF_SIZE)
+            handle.seek(0)
+            self.delimiter = sniff_delimiter(sample)
+
+            first_row = next(csv.reader(io.StringIO(sample), delimiter=self.delimiter), [])
+            if has_headers:
+                headers = first_row
+            else:
+                headers = [f'column_{i+1}' for i in range(len(first_row))]
+
+            if engine == 'pyarrow' and pyarrow_csv is None:
+                logger.warning("pyarrow is not installed, parsing CSV with pandas")
+                engine = 'c'
+
+            if engine == 'pyarrow':
+                # pyarrow reads in blocks of bytes; size them from the sample to hold about chunk_size rows
+                row_bytes = len(sample.encode('utf-8')) / max(1, sample.count('\n'))
+                block_size = max(CSV_SNIFF_SIZE, int(chunk_size * row_bytes))
+                chunks = self._iter_pyarrow_chunks(file_path_or_content, is_content, headers, has_headers, block_size)
+            else:
+                chunks = pandas.read_csv(
+                    handle, sep=self.delimiter, header=0 if has_headers else None, names=headers,
+                    dtype=str, keep_default_na=False, na_filter=False, chunksize=chunk_size
+                )
+
+            row_offset = 0
+            for chunk in chunks:
+                chunk.index = pandas.RangeIndex(row_offset, row_offset + len(chunk))
+                row_offset += len(chunk)
+                yield chunk
+
+    def _iter_pyarrow_chunks(self, file_path_or_content: str, is_content: bool, headers: list, has_headers: bool,
+                             block_size: int) -> typing.Iterator[pandas.DataFrame]:
+        source = io.BytesIO(file_path_or_content.encode('utf-8')) if is_content else file_path_or_content
+        reader = pyarrow_csv.open_csv(
+            source,
+            read_options=pyarrow_csv.ReadOptions(
+                column_names=headers, skip_rows=1 if has_headers else 0, block_size=block_size
+            ),
+            parse_options=pyarrow_csv.ParseOptions(delimiter=self.delimiter),
+            convert_options=pyarrow_csv.ConvertOptions(
+                column_types={header: pyarrow.string() for header in headers}, strings_can_be_null=False
+            )
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+
     def set_field_mapping(self, mapping: dict) -> None:
         """
         Sets the mapping between CSV columns and system fields.
@@ -230,6 +471,22 @@ class CSVProcessor(FileProcessor):
         # Return the transformed data list
         return transformed_data
 
+    def apply_field_mapping_frame(self, frame: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Applies the field mapping to a chunk of CSV rows.
+
+        Args:
+            frame: A DataFrame of CSV rows with the file's column headers.
+
+        Returns:
+            A DataFrame with the mapped columns renamed to system field names, or the frame
+            unchanged when no mapping is set.
+        """
+        if not self.field_mapping:
+            return frame
+        mapped = [header for header in frame.columns if self.field_mapping.get(header)]
+        return frame[mapped].rename(columns=self.field_mapping)
+
     def validate_csv_file(self, file_path_or_content: str, is_content: bool, validation_schema: dict) -> bool:
         """
         Validates a CSV file against defined rules and schema.
@@ -296,6 +553,97 @@ class CSVProcessor(FileProcessor):
         except Exception as e:
             return {"success": False, "errors": [str(e)]}
 
+    def process_import_stream(self, file_path_or_content: str, is_content: bool = False, field_mapping: dict = None,
+                              validator: typing.Callable[[pandas.DataFrame], pandas.Series] = None,
+                              writer: typing.Callable[[list], typing.Union[int, dict]] = None, has_headers: bool = True,
+                              chunk_size: int = CSV_CHUNK_SIZE, engine: str = CSV_STREAM_ENGINE) -> dict:
+        """
+        Imports a CSV file chunk by chunk, so memory stays bounded by the chunk size.
+
+        Each chunk is mapped to system fields, converted to the column types inferred from the
+        first chunk (widened when a later chunk would not convert without loss), validated,
+        and its valid rows are handed to the writer before the next chunk is read. Rows holding
+        values that cannot be converted to their column type are invalid.
+
+        Args:
+            file_path_or_content: The path to the CSV file or the CSV content itself.
+            is_content: A boolean indicating whether the input is a file path or content.
+            field_mapping: A dictionary defining the mapping between CSV columns and system fields.
+            validator: Called with each cleaned chunk, returns a Series aligned with the chunk
+                holding an error message for invalid rows and None for valid rows.
+            writer: Called with the valid rows of each chunk as a list of dictionaries, returns
+                the number of rows written, or a dictionary with 'successful' and 'errors' (each
+                with the 'index' of its row in the list) as RateRepository.import_rates does.
+            has_headers: A boolean indicating whether the CSV file has a header row.
+            chunk_size: Number of rows per chunk.
+            engine: 'c' to parse with pandas, 'pyarrow' to parse with pyarrow when it is installed.
+
+        Returns:
+            A dictionary with success, row, valid, invalid, written and chunk counts, the column
+            types, and up to CSV_MAX_REPORTED_ERRORS errors with their file row numbers.
+        """
+        result = {
+            "success": True, "rows": 0, "valid": 0, "invalid": 0, "written": 0, "chunks": 0,
+            "column_types": {}, "errors": []
+        }
+        # File row number of the first data row, counting from 1
+        first_row_number = 2 if has_headers else 1
+        try:
+            if field_mapping:
+                self.set_field_mapping(field_mapping)
+            self.column_types = {}
+
+            for chunk in self.iter_csv_chunks(file_path_or_content, is_content, has_headers, chunk_size, engine):
+                frame = self.apply_field_mapping_frame(chunk)
+                if not self.column_types:
+                    self.column_types = infer_frame_column_types(frame)
+                else:
+                    self.column_types = widen_column_types(frame, self.column_types)
+                cleaned = clean_frame(frame, self.column_types)
+
+                # Unconvertible values are reported rather than imported as nulls
+                errors = conversion_errors(frame, cleaned, self.column_types)
+                frame = cleaned
+                if validator is not None:
+                    errors = errors.where(errors.notna(), validator(frame))
+                invalid = errors.notna()
+                room = CSV_MAX_REPORTED_ERRORS - len(result["errors"])
+                for index, message in errors[invalid].head(max(0, room)).items():
+                    result["errors"].append({"row": index + first_row_number, "error": message})
+
+                valid = frame[~invalid]
+                if writer is not None and not valid.empty:
+                    written = writer(frame_to_records(valid))
+                    if isinstance(written, dict):
+                        # Rows the writer rejected count as invalid and are reported with their file rows
+                        write_errors = written.get("errors", [])
+                        room = CSV_MAX_REPORTED_ERRORS - len(result["errors"])
+                        for error in write_errors[:max(0, room)]:
+                            row = valid.index[error["index"]] + first_row_number
+                            result["errors"].append({"row": row, "error": error["error"]})
+                        invalid.loc[valid.index[[error["index"] for error in write_errors]]] = True
+                        valid = frame[~invalid]
+                        written = written.get("successful", 0)
+                    result["written"] += written or 0
+
+                result["chunks"] += 1
+                result["rows"] += len(frame)
+                result["valid"] += len(valid)
+                result["invalid"] += int(invalid.sum())
+                logger.debug(f"Imported CSV chunk {result['chunks']}: {len(frame)} rows, {len(valid)} valid")
+
+            result["column_types"] = self.column_types
+            self.validation_errors = [
+                f"Row {error['row']}: {error['error']}" for error in result["errors"]
+            ]
+            return result
+        except Exception as e:
+            logger.error(f"Error importing CSV file/content: {str(e)}")
+            result["success"] = False
+            result["errors"].append({"row": None, "error": str(e)})
+            self.validation_errors = [str(e)]
+            return result
+
     def process_export(self, data: list, field_mapping: dict, delimiter: str = ',') -> str:
         """
         Processes data for export to CSV format.
@@ -376,33 +724,9 @@ class CSVProcessor(FileProcessor):
             # Infer column types using infer_column_types function
             column_types = infer_column_types(data, headers)
 
-            # Initialize a new list for cleaned data
-            cleaned_data = []
-
-            # For each row in the data, attempt to convert values to their inferred types
-            for row in data:
-                cleaned_row = {}
-                for header in headers:
-                    value = row.get(header)
-                    inferred_type = column_types.get(header)
-
-                    try:
-                        if inferred_type == 'int':
-                            cleaned_value = int(float(value)) if value else None
-                        elif inferred_type == 'float':
-                            cleaned_value = float(value) if value else None
-                        elif inferred_type == 'date':
-                            cleaned_value = pandas.to_datetime(value).date() if value else None
-                        else:
-                            cleaned_value = str(value) if value else None
-                    except ValueError:
-                        cleaned_value = None  # Handle conversion errors gracefully
-
-                    cleaned_row[header] = cleaned_value
-                cleaned_data.append(cleaned_row)
-
-            # Return the cleaned data list
-            return cleaned_data
+            # Convert every column in one pass and return one dictionary per row
+            frame = pandas.DataFrame(data, columns=headers)
+            return frame_to_records(clean_frame(frame, column_types))
         except Exception as e:
             logger.error(f"Error inferring and cleaning data: {str(e)}")
-            raise
\ No newline at end of file
+            raise
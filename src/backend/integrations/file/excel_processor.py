@@ -6,17 +6,20 @@ Justice Bid Rate Negotiation System.
 
 import os  # standard library
 import io  # standard library
-from typing import Dict, List, Union  # standard library
+import time  # standard library
+import multiprocessing  # standard library
+from concurrent.futures import ProcessPoolExecutor  # standard library
+from typing import Dict, Iterator, List, Optional, Tuple, Union  # standard library
 
 import pandas as pd  # version 2.0.0
 import numpy  # version 1.24.0
 from openpyxl import load_workbook  # version 3.1.0
 from openpyxl.styles import Font, PatternFill  # version 3.1.0
 
-from .validators import validate_excel_file, validate_dataframe_structure, validate_rate_import_data, \
+from .validators import validate_excel_file, validate_file_basics, validate_dataframe_structure, validate_rate_import_data, \
     validate_attorney_import_data, validate_billing_import_data, RATE_IMPORT_REQUIRED_FIELDS, \
     RATE_IMPORT_OPTIONAL_FIELDS, ATTORNEY_IMPORT_REQUIRED_FIELDS, ATTORNEY_IMPORT_OPTIONAL_FIELDS, \
-    BILLING_IMPORT_REQUIRED_FIELDS, BILLING_IMPORT_OPTIONAL_FIELDS  # Internal import
+    BILLING_IMPORT_REQUIRED_FIELDS, BILLING_IMPORT_OPTIONAL_FIELDS, FILE_SIZE_LIMIT_MB  # Internal import
 from ..common.adapter import FileProcessor  # Internal import
 from ...utils.file_handling import read_excel_file, write_excel_file, get_file_extension  # Internal import
 from ...utils.logging import get_logger  # Internal import
@@ -30,6 +33,166 @@ EXCEL_EXTENSIONS = {'xlsx', 'xls'}
 # Define default sheet name
 DEFAULT_SHEET_NAME = "Sheet1"
 
+# Validator of each import type and the columns it checks
+IMPORT_VALIDATORS = {
+    'rate': (validate_rate_import_data, RATE_IMPORT_REQUIRED_FIELDS + RATE_IMPORT_OPTIONAL_FIELDS),
+    'attorney': (validate_attorney_import_data, ATTORNEY_IMPORT_REQUIRED_FIELDS + ATTORNEY_IMPORT_OPTIONAL_FIELDS),
+    'billing': (validate_billing_import_data, BILLING_IMPORT_REQUIRED_FIELDS + BILLING_IMPORT_OPTIONAL_FIELDS),
+}
+
+# Rows collected into each DataFrame while iterating a sheet
+EXCEL_CHUNK_SIZE = int(os.getenv('EXCEL_CHUNK_SIZE', '20000'))
+
+# Processes reading independent sheets of one workbook; 1 reads them in the calling process
+EXCEL_SHEET_WORKERS = int(os.getenv('EXCEL_SHEET_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# Sheet reading processes are spawned for the same reason as PDF render processes: the calling
+# web or Celery worker runs background threads whose locks a forked child could inherit held
+EXCEL_SHEET_START_METHOD = os.getenv('EXCEL_SHEET_START_METHOD', 'spawn')
+
+
+def is_legacy_excel(file_path_or_buffer: Union[str, io.BytesIO]) -> bool:
+    """
+    Checks whether a file is a legacy .xls workbook, which openpyxl cannot open
+
+    Args:
+        file_path_or_buffer: Path to the Excel file or content buffer
+
+    Returns:
+        bool: True for a path with an .xls extension
+    """
+    return isinstance(file_path_or_buffer, (str, os.PathLike)) and get_file_extension(file_path_or_buffer) == 'xls'
+
+
+def open_workbook(file_path_or_buffer: Union[str, io.BytesIO]):
+    """
+    Opens an .xlsx workbook in read-only streaming mode
+
+    Rows are parsed from the sheet XML as they are iterated instead of being loaded into
+    memory when the workbook is opened. Cells hold their last calculated values.
+
+    Args:
+        file_path_or_buffer: Path to the Excel file or content buffer
+
+    Returns:
+        Workbook: Read-only openpyxl workbook; close it when done
+    """
+    if isinstance(file_path_or_buffer, io.BytesIO):
+        file_path_or_buffer.seek(0)
+    return load_workbook(file_path_or_buffer, read_only=True, data_only=True)
+
+
+def sheet_headers(header_row: tuple) -> list:
+    """
+    Builds column names from the header row of a sheet the way pandas.read_excel names them
+
+    Args:
+        header_row: Cell values of the header row
+
+    Returns:
+        list: Column names, 'Unnamed: <index>' for empty cells and '<name>.<n>' for repeated names
+    """
+    headers = []
+    seen = {}
+    for index, value in enumerate(header_row):
+        header = f"Unnamed: {index}" if value is None else str(value)
+        if header in seen:
+            seen[header] += 1
+            header = f"{header}.{seen[header]}"
+        else:
+            seen[header] = 0
+        headers.append(header)
+    return headers
+
+
+def iter_sheet_chunks(worksheet, columns: Optional[List[str]] = None, chunk_size: int = EXCEL_CHUNK_SIZE,
+                      ignore_missing_columns: bool = False, infer_types: bool = True) -> Iterator[pd.DataFrame]:
+    """
+    Iterates the rows of a worksheet lazily, collecting them into DataFrames of chunk_size rows
+
+    The first row is the header row. Rows whose selected cells are all empty are skipped, and
+    every row is labelled with its sheet row number minus 2, as pd.read_excel labels the rows of
+    a sheet without blank rows, so that validators reporting index + 2 give the row in the sheet.
+
+    Args:
+        worksheet: Worksheet of a workbook opened with open_workbook
+        columns: Column names to read, all columns by default; cells of other columns are not kept
+        chunk_size: Number of rows per DataFrame
+        ignore_missing_columns: Skip columns the sheet does not have instead of raising ValueError
+        infer_types: Infer the dtypes of each chunk; otherwise columns are left as object
+
+    Returns:
+        Iterator[DataFrame]: DataFrames with the selected columns, in the order of the sheet
+    """
+    headers = sheet_headers(next(worksheet.iter_rows(max_row=1, values_only=True), ()))
+
+    if columns is None:
+        indexes = list(range(len(headers)))
+    else:
+        missing = [column for column in columns if column not in headers]
+        if missing and not ignore_missing_columns:
+            raise ValueError(f"Columns not found in sheet '{worksheet.title}': {missing}")
+        indexes = [headers.index(column) for column in columns if column in headers]
+    selected = [headers[index] for index in indexes]
+
+    # Cells right of the last selected column are not turned into values
+    rows = worksheet.iter_rows(min_row=2, max_col=max(indexes) + 1 if indexes else 1, values_only=True)
+
+    chunk, labels = [], []
+    yielded = False
+    for row_number, row in enumerate(rows, start=2):
+        values = tuple(row[index] if index < len(row) else None for index in indexes)
+        if all(value is None for value in values):
+            continue
+        chunk.append(values)
+        labels.append(row_number - 2)
+        if len(chunk) >= chunk_size:
+            yield _chunk_frame(chunk, selected, labels, infer_types)
+            chunk, labels = [], []
+            yielded = True
+    if chunk or not yielded:
+        yield _chunk_frame(chunk, selected, labels, infer_types)
+
+
+def _chunk_frame(rows: List[tuple], columns: List[str], labels: List[int], infer_types: bool) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    if infer_types:
+        df = df.infer_objects()
+    df.index = pd.Index(labels, dtype='int64')
+    return df
+
+
+def read_sheet_frame(worksheet, columns: Optional[List[str]] = None, chunk_size: int = EXCEL_CHUNK_SIZE,
+                     ignore_missing_columns: bool = False) -> pd.DataFrame:
+    """
+    Reads the selected columns of a worksheet into one DataFrame
+
+    Args:
+        worksheet: Worksheet of a workbook opened with open_workbook
+        columns: Column names to read, all columns by default
+        chunk_size: Number of rows parsed per chunk
+        ignore_missing_columns: Skip columns the sheet does not have instead of raising ValueError
+
+    Returns:
+        DataFrame: Sheet data without empty rows, labelled as by iter_sheet_chunks
+    """
+    # Dtypes are inferred once over the whole sheet, so a column empty in one chunk keeps its type
+    chunks = list(iter_sheet_chunks(worksheet, columns, chunk_size, ignore_missing_columns, infer_types=False))
+    df = chunks[0] if len(chunks) == 1 else pd.concat(chunks)
+    return df.infer_objects()
+
+
+def _read_sheet_job(file_path: str, sheet_name: str, columns: Optional[List[str]],
+                    chunk_size: int) -> Tuple[pd.DataFrame, float]:
+    # Runs in a sheet reading process, which opens its own read-only handle on the workbook
+    start = time.perf_counter()
+    workbook = open_workbook(file_path)
+    try:
+        df = read_sheet_frame(workbook[sheet_name], columns, chunk_size)
+    finally:
+        workbook.close()
+    return df, time.perf_counter() - start
+
 
 def detect_sheet_names(file_path_or_buffer: str) -> list:
     """
@@ -42,12 +205,16 @@ def detect_sheet_names(file_path_or_buffer: str) -> list:
         list: List of sheet names in the Excel file
     """
     try:
-        # LD1: Use pandas ExcelFile to open the file
-        excel_file = pd.ExcelFile(file_path_or_buffer)
-        # LD1: Get sheet names from the ExcelFile object
-        sheet_names = excel_file.sheet_names
-        # LD1: Return list of sheet names
-        return sheet_names
+        if is_legacy_excel(file_path_or_buffer):
+            # LD1: Use pandas ExcelFile to open legacy .xls files
+            return pd.ExcelFile(file_path_or_buffer).sheet_names
+        # LD1: Open the workbook read-only; only the workbook index is parsed
+        workbook = open_workbook(file_path_or_buffer)
+        try:
+            # LD1: Return list of sheet names
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
     except Exception as e:
         # LD1: Handle exceptions and log errors
         logger.error(f"Error detecting sheet names in Excel file: {str(e)}")
@@ -163,6 +330,8 @@ class ExcelProcessor(FileProcessor):
         self.current_sheet = None
         # LD1: Initialize logger
         self.logger = logger
+        # LD1: Initialize per-sheet timings of the last read_sheets call
+        self.sheet_timings = {}
 
     def read_excel(self, file_path_or_buffer: Union[str, io.BytesIO], sheet_name: str = None, options: Dict = None) -> pd.DataFrame:
         """
@@ -180,32 +349,29 @@ class ExcelProcessor(FileProcessor):
             options = {}
 
         try:
-            # LD1: If no sheet_name provided, use DEFAULT_SHEET_NAME or the first sheet
-            if sheet_name is None:
-                sheet_name = options.get('default_sheet_name', DEFAULT_SHEET_NAME)
-                if sheet_name == DEFAULT_SHEET_NAME:
-                    try:
-                        all_sheets = detect_sheet_names(file_path_or_buffer)
-                        if all_sheets:
-                            sheet_name = all_sheets[0]
-                    except Exception as e:
-                        logger.warning(f"Could not detect sheet names, using default. Error: {e}")
-
-            # LD1: Use pandas.read_excel to read the Excel file or buffer
-            df = pd.read_excel(file_path_or_buffer, sheet_name=sheet_name)
-
-            # LD1: Convert all column names to string type
-            df.columns = df.columns.astype(str)
-
-            # LD1: Check if headers need to be normalized based on options
-            if options.get('normalize_headers', False):
-                df.columns = normalize_excel_headers(df.columns)
+            # LD1: Read only the columns listed in options, e.g. the mapped source columns
+            columns = options.get('columns')
+            ignore_missing_columns = options.get('ignore_missing_columns', False)
+
+            if is_legacy_excel(file_path_or_buffer):
+                # LD1: If no sheet_name provided, use DEFAULT_SHEET_NAME or the first sheet
+                with pd.ExcelFile(file_path_or_buffer) as excel_file:
+                    sheet_name = self._resolve_sheet_name(excel_file.sheet_names, sheet_name, options)
+                    usecols = columns
+                    if columns is not None and ignore_missing_columns:
+                        usecols = lambda column: column in columns
+                    df = excel_file.parse(sheet_name, usecols=usecols)
+            else:
+                # LD1: Open the workbook once, read-only, and iterate the sheet rows lazily
+                workbook = open_workbook(file_path_or_buffer)
+                try:
+                    sheet_name = self._resolve_sheet_name(workbook.sheetnames, sheet_name, options)
+                    df = read_sheet_frame(workbook[sheet_name], columns, options.get('chunk_size', EXCEL_CHUNK_SIZE),
+                                          ignore_missing_columns)
+                finally:
+                    workbook.close()
 
-            # LD1: Drop empty rows and columns if specified in options
-            if options.get('drop_empty_rows', True):
-                df.dropna(axis=0, how='all', inplace=True)
-            if options.get('drop_empty_columns', True):
-                df.dropna(axis=1, how='all', inplace=True)
+            df = self._prepare_frame(df, options)
 
             # LD1: Store the column types using infer_column_types
             self.column_types = infer_column_types(df)
@@ -219,6 +385,126 @@ class ExcelProcessor(FileProcessor):
             logger.error(f"Error reading Excel file: {str(e)}")
             raise
 
+    def _resolve_sheet_name(self, sheet_names: List[str], sheet_name: Optional[str], options: Dict) -> str:
+        # The first sheet is read unless a sheet or another default sheet name is given
+        if sheet_name is None:
+            sheet_name = options.get('default_sheet_name', DEFAULT_SHEET_NAME)
+            if sheet_name == DEFAULT_SHEET_NAME and sheet_names:
+                sheet_name = sheet_names[0]
+        return sheet_name
+
+    def _prepare_frame(self, df: pd.DataFrame, options: Dict) -> pd.DataFrame:
+        # LD1: Convert all column names to string type
+        df.columns = df.columns.astype(str)
+
+        # LD1: Check if headers need to be normalized based on options
+        if options.get('normalize_headers', False):
+            df.columns = normalize_excel_headers(df.columns)
+
+        # LD1: Drop empty rows and columns if specified in options
+        if options.get('drop_empty_rows', True):
+            df.dropna(axis=0, how='all', inplace=True)
+        if options.get('drop_empty_columns', True):
+            df.dropna(axis=1, how='all', inplace=True)
+        return df
+
+    def iter_excel_chunks(self, file_path_or_buffer: Union[str, io.BytesIO], sheet_name: str = None,
+                          columns: List[str] = None, chunk_size: int = EXCEL_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Reads a sheet in chunks of rows without loading the whole sheet
+
+        Args:
+            file_path_or_buffer: Path to the Excel file or content buffer
+            sheet_name: Name of the sheet to read (default: first sheet)
+            columns: Column names to read (default: all columns)
+            chunk_size: Number of rows per chunk
+
+        Returns:
+            Iterator[DataFrame]: DataFrames of up to chunk_size rows, without empty rows
+        """
+        if is_legacy_excel(file_path_or_buffer):
+            # LD1: Legacy .xls files cannot be streamed and are read whole
+            yield self.read_excel(file_path_or_buffer, sheet_name, {'columns': columns, 'drop_empty_columns': False})
+            return
+
+        workbook = open_workbook(file_path_or_buffer)
+        try:
+            self.current_sheet = self._resolve_sheet_name(workbook.sheetnames, sheet_name, {})
+            for chunk in iter_sheet_chunks(workbook[self.current_sheet], columns, chunk_size):
+                chunk.columns = chunk.columns.astype(str)
+                yield chunk
+        finally:
+            workbook.close()
+
+    def read_sheets(self, file_path: str, sheet_names: List[str] = None, columns: List[str] = None,
+                    options: Dict = None, max_workers: int = EXCEL_SHEET_WORKERS) -> Dict[str, pd.DataFrame]:
+        """
+        Reads several sheets of a workbook, in a pool of processes when there is more than one
+        and the calling process may start processes
+
+        Each sheet is read from its own read-only handle on the workbook, and the read time of
+        every sheet is kept in sheet_timings.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_names: Names of the sheets to read (default: all sheets)
+            columns: Column names to read from every sheet (default: all columns)
+            options: Dictionary of options for reading the Excel file, as for read_excel
+            max_workers: Number of sheet reading processes, 1 to read in this process
+
+        Returns:
+            Dict[str, DataFrame]: DataFrame of each sheet, in the order of sheet_names
+        """
+        if options is None:
+            options = {}
+        chunk_size = options.get('chunk_size', EXCEL_CHUNK_SIZE)
+        results = {}
+
+        if is_legacy_excel(file_path):
+            # LD1: Legacy .xls files are parsed through one pandas ExcelFile
+            with pd.ExcelFile(file_path) as excel_file:
+                for sheet_name in sheet_names or excel_file.sheet_names:
+                    start = time.perf_counter()
+                    results[sheet_name] = (excel_file.parse(sheet_name, usecols=columns), time.perf_counter() - start)
+        else:
+            workbook = open_workbook(file_path)
+            try:
+                sheet_names = list(sheet_names or workbook.sheetnames)
+                missing = [sheet_name for sheet_name in sheet_names if sheet_name not in workbook.sheetnames]
+                if missing:
+                    raise ValueError(f"Sheets not found in Excel file: {missing}")
+
+                workers = min(max_workers, len(sheet_names))
+                # Daemonic processes, such as Celery prefork pool children, are not allowed to have children
+                if multiprocessing.current_process().daemon:
+                    workers = 1
+                if workers > 1 and isinstance(file_path, (str, os.PathLike)):
+                    # LD1: Independent sheets are parsed in parallel, each process opening the file itself
+                    with ProcessPoolExecutor(max_workers=workers,
+                                             mp_context=multiprocessing.get_context(EXCEL_SHEET_START_METHOD)) as executor:
+                        futures = {
+                            sheet_name: executor.submit(_read_sheet_job, file_path, sheet_name, columns, chunk_size)
+                            for sheet_name in sheet_names
+                        }
+                        results = {sheet_name: future.result() for sheet_name, future in futures.items()}
+                else:
+                    for sheet_name in sheet_names:
+                        start = time.perf_counter()
+                        df = read_sheet_frame(workbook[sheet_name], columns, chunk_size)
+                        results[sheet_name] = (df, time.perf_counter() - start)
+            finally:
+                workbook.close()
+
+        self.sheet_timings = {}
+        frames = {}
+        for sheet_name, (df, seconds) in results.items():
+            frames[sheet_name] = self._prepare_frame(df, options)
+            self.sheet_timings[sheet_name] = {
+                'rows': len(df), 'columns': len(df.columns), 'seconds': round(seconds, 4)
+            }
+            logger.info(f"Read sheet '{sheet_name}': {len(df)} rows, {len(df.columns)} columns in {seconds:.2f}s")
+        return frames
+
     def set_field_mapping(self, mapping: Dict):
         """
         Sets the mapping between Excel columns and system fields
@@ -286,21 +572,16 @@ class ExcelProcessor(FileProcessor):
         except Exception as e:
             return {"valid": False, "errors": [str(e)], "warnings": []}
 
+        # LD1: Validate the data with the rules of the import type
+        return self._validate_import_frame(df, import_type, validation_rules)
+
+    def _validate_import_frame(self, df: pd.DataFrame, import_type: Optional[str],
+                               validation_rules: Optional[Dict]) -> dict:
         # LD1: Determine which validation function to use based on import_type
-        if import_type == 'rate':
-            validation_function = validate_rate_import_data
-        elif import_type == 'attorney':
-            validation_function = validate_attorney_import_data
-        elif import_type == 'billing':
-            validation_function = validate_billing_import_data
-        else:
+        if import_type not in IMPORT_VALIDATORS:
             return {"valid": True, "errors": [], "warnings": []}
-
-        # LD1: Call appropriate validation function (validate_rate_import_data, etc.)
-        # LD1: Store validation errors if any
-        validation_results = validation_function(df, validation_rules)
-        # LD1: Return validation results
-        return validation_results
+        validation_function, _ = IMPORT_VALIDATORS[import_type]
+        return validation_function(df, validation_rules)
 
     def get_validation_errors(self) -> list:
         """
@@ -330,19 +611,29 @@ class ExcelProcessor(FileProcessor):
         if field_mapping:
             self.set_field_mapping(field_mapping)
 
-        # LD1: Validate the Excel file using validate_excel_file
-        validation_results = self.validate_excel_file(file_path_or_buffer, sheet_name, import_type, validation_rules)
-
-        # LD1: If validation fails, return a result with success=False and errors
-        if not validation_results["valid"]:
-            return {"success": False, "errors": validation_results["errors"]}
-
-        # LD1: Read the Excel file using read_excel
+        # LD1: Check the file itself without parsing it, then read the sheet once
         try:
-            df = self.read_excel(file_path_or_buffer, sheet_name=sheet_name)
+            if isinstance(file_path_or_buffer, (str, os.PathLike)):
+                validate_file_basics(file_path_or_buffer, EXCEL_EXTENSIONS, FILE_SIZE_LIMIT_MB)
+            options = None
+            if self.field_mapping:
+                # LD1: Keep the mapped source columns and the columns the import validator checks
+                columns = list(self.field_mapping.values())
+                if import_type in IMPORT_VALIDATORS:
+                    columns += IMPORT_VALIDATORS[import_type][1]
+                options = {'columns': list(dict.fromkeys(columns)), 'ignore_missing_columns': True}
+            df = self.read_excel(file_path_or_buffer, sheet_name=sheet_name, options=options)
         except Exception as e:
             return {"success": False, "errors": [str(e)]}
 
+        if df.empty:
+            return {"success": False, "errors": [f"Excel sheet '{self.current_sheet}' is empty"]}
+
+        # LD1: Validate the frame that was read; if validation fails, return success=False and errors
+        validation_results = self._validate_import_frame(df, import_type, validation_rules)
+        if not validation_results["valid"]:
+            return {"success": False, "errors": validation_results["errors"]}
+
         # LD1: Apply field mapping using apply_field_mapping
         transformed_data = self.apply_field_mapping(df)
 
@@ -467,23 +758,33 @@ class ExcelProcessor(FileProcessor):
             dict: Dictionary with sheet names and information (row count, column names)
         """
         try:
-            # LD1: Get sheet names using detect_sheet_names
-            sheet_names = detect_sheet_names(file_path)
+            if is_legacy_excel(file_path):
+                return {
+                    sheet_name: {'row_count': len(df), 'column_names': list(df.columns)}
+                    for sheet_name, df in self.read_sheets(file_path, max_workers=1).items()
+                }
+
+            # LD1: Open the workbook once and count rows lazily, without building DataFrames
+            workbook = open_workbook(file_path)
             sheets_info = {}
-            # LD1: For each sheet, read a sample to get column names and row count
-            for sheet_name in sheet_names:
-                try:
-                    df = self.read_excel(file_path, sheet_name=sheet_name)
-                    sheets_info[sheet_name] = {
-                        'row_count': len(df),
-                        'column_names': list(df.columns)
-                    }
-                except Exception as e:
-                    logger.warning(f"Could not read sheet '{sheet_name}': {str(e)}")
-                    sheets_info[sheet_name] = {
-                        'row_count': 0,
-                        'column_names': []
-                    }
+            try:
+                for sheet_name in workbook.sheetnames:
+                    try:
+                        rows = workbook[sheet_name].iter_rows(values_only=True)
+                        column_names = sheet_headers(next(rows, ()))
+                        row_count = sum(1 for row in rows if any(value is not None for value in row))
+                        sheets_info[sheet_name] = {
+                            'row_count': row_count,
+                            'column_names': column_names
+                        }
+                    except Exception as e:
+                        logger.warning(f"Could not read sheet '{sheet_name}': {str(e)}")
+                        sheets_info[sheet_name] = {
+                            'row_count': 0,
+                            'column_names': []
+                        }
+            finally:
+                workbook.close()
             # LD1: Return dictionary with sheet details
             return sheets_info
         except Exception as e:
@@ -503,14 +804,12 @@ class ExcelProcessor(FileProcessor):
         Returns:
             DataFrame: Merged DataFrame from multiple sheets
         """
-        dataframes = {}
-        # LD1: For each sheet in sheet_names, read the data
-        for sheet_name in sheet_names:
-            try:
-                dataframes[sheet_name] = self.read_excel(file_path, sheet_name=sheet_name)
-            except Exception as e:
-                logger.error(f"Could not read sheet '{sheet_name}': {str(e)}")
-                return None
+        # LD1: Read the sheets in parallel from read-only handles on the workbook
+        try:
+            dataframes = self.read_sheets(file_path, sheet_names)
+        except Exception as e:
+            logger.error(f"Could not read sheets {sheet_names}: {str(e)}")
+            return None
 
         merged_df = None
         # LD1: Validate that key_column exists in all sheets
@@ -0,0 +1,268 @@
+"""
+Vectorized validation engine for file imports in the Justice Bid Rate Negotiation System.
+
+Import rules are expressed as column operations over a whole DataFrame. Every rule yields a
+boolean mask of the rows it rejects; the masks are packed into one integer error code per row,
+and messages are only rendered for the rows whose code is not zero.
+"""
+
+import decimal
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Rules of one rule set are packed into the bits of a 64-bit code per row
+MAX_RULES = 64
+
+
+class RuleFrame:
+    """
+    DataFrame under validation, with the parsed forms of its columns computed once and shared by rules.
+
+    Attributes:
+        df: DataFrame being validated
+        options: Validation rules of the import type, e.g. min_rate or historical_rates
+        today: Date that future and age checks are made against
+    """
+
+    def __init__(self, df: pd.DataFrame, options: Dict = None):
+        self.df = df
+        self.options = options or {}
+        self.today = pd.Timestamp(date.today())
+        self._cache = {}
+
+    def _cached(self, kind: str, column: str, compute: Callable[[], pd.Series]) -> pd.Series:
+        key = (kind, column)
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def has(self, column: str) -> bool:
+        """Returns True if the DataFrame has the column."""
+        return column in self.df.columns
+
+    def empty(self) -> pd.Series:
+        """Returns an all-False mask indexed like the DataFrame."""
+        return pd.Series(False, index=self.df.index)
+
+    def present(self, column: str) -> pd.Series:
+        """Returns a mask of rows with a value in the column, all False when the column is missing."""
+        if not self.has(column):
+            return self.empty()
+        return self._cached('present', column, lambda: self.df[column].notna())
+
+    def text(self, column: str) -> pd.Series:
+        """Returns the column as stripped strings, NaN where it has no value."""
+        return self._cached(
+            'text', column, lambda: self.df[column].astype(str).str.strip().where(self.present(column))
+        )
+
+    def numeric(self, column: str) -> pd.Series:
+        """
+        Returns the column as floats, NaN where the value is missing or is not a number.
+
+        Values are accepted as numbers exactly when Decimal(str(value)) accepts them, so booleans
+        and strings such as '1,000' are not numbers.
+        """
+        def compute():
+            values = self.df[column]
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                return values.astype(float)
+            return pd.to_numeric(self.text(column), errors='coerce')
+        return self._cached('numeric', column, compute)
+
+    def decimal_places(self, column: str) -> pd.Series:
+        """Returns the number of decimal places Decimal(str(value)) reports for each value of the column."""
+        def compute():
+            text = self.text(column)
+            places = text.str.extract(r'^[+-]?\d*\.(\d+)$')[0].str.len().fillna(0)
+            # Exponent notation such as '1e-05' is rare, so those values are parsed one by one
+            scientific = text.str.contains('[eE]', regex=True).fillna(False).astype(bool)
+            if scientific.any():
+                places[scientific] = text[scientific].map(_decimal_places)
+            return places.astype(int)
+        return self._cached('decimal_places', column, compute)
+
+    def dates(self, column: str) -> pd.Series:
+        """Returns the column as dates at midnight, NaT where the value is missing or not a date."""
+        def compute():
+            values = self.df[column].where(self.present(column))
+            try:
+                # Each value is parsed on its own format, as pd.to_datetime(value) does per cell
+                parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+            except (TypeError, ValueError):
+                # Mixed time zones cannot share a column; fall back to parsing cell by cell
+                parsed = pd.to_datetime(values.map(_parse_date), errors='coerce')
+            if getattr(parsed.dt, 'tz', None) is not None:
+                parsed = parsed.dt.tz_localize(None)
+            return parsed.dt.normalize()
+        return self._cached('dates', column, compute)
+
+    def value(self, column: str, label: Any) -> Any:
+        """Returns the original value of a column at a row label, for rendering messages."""
+        return self.df.at[label, column]
+
+
+@dataclass
+class ColumnRule:
+    """
+    One validation rule applied to all rows at once.
+
+    Attributes:
+        code: Short error code, e.g. 'rate_negative'
+        check: Function of a RuleFrame returning a boolean mask of the rows that fail the rule
+        message: Message without the row prefix; a str.format template filled with the frame
+            options, or a function of the RuleFrame and row label returning the message
+        severity: 'error' or 'warning'
+    """
+    code: str
+    check: Callable[[RuleFrame], pd.Series]
+    message: Union[str, Callable[[RuleFrame, Any], str]]
+    severity: str = 'error'
+
+    def render(self, frame: RuleFrame, label: Any) -> str:
+        if callable(self.message):
+            return self.message(frame, label)
+        return self.message.format(**frame.options)
+
+
+@dataclass
+class RuleResult:
+    """
+    Outcome of a rule set over a DataFrame.
+
+    Attributes:
+        frame: RuleFrame the rules were evaluated on
+        rules: Rules of the rule set, in order; bit i of a code stands for rules[i]
+        codes: Error code of every row, 0 for rows that pass every rule
+    """
+    frame: RuleFrame
+    rules: List[ColumnRule]
+    codes: np.ndarray
+
+    def failing(self, severity: str) -> np.ndarray:
+        """Returns the positions of rows failing at least one rule of a severity."""
+        mask = np.uint64(0)
+        for bit, rule in enumerate(self.rules):
+            if rule.severity == severity:
+                mask |= np.uint64(1) << np.uint64(bit)
+        return np.flatnonzero(self.codes & mask)
+
+    def row_codes(self, position: int) -> List[str]:
+        """Returns the codes of the rules a row fails, in rule order."""
+        code = int(self.codes[position])
+        return [rule.code for bit, rule in enumerate(self.rules) if code >> bit & 1]
+
+    def messages(self, severity: str, row_offset: int = 2) -> List[str]:
+        """
+        Renders the messages of a severity for the failing rows only, ordered by row then rule.
+
+        Args:
+            severity: 'error' or 'warning'
+            row_offset: Added to the row label to give the row number in the file (header row and 1-based)
+
+        Returns:
+            List of messages prefixed with 'Row <n>: '
+        """
+        messages = []
+        labels = self.frame.df.index
+        for position in self.failing(severity):
+            code = int(self.codes[position])
+            label = labels[position]
+            for bit, rule in enumerate(self.rules):
+                if rule.severity == severity and code >> bit & 1:
+                    messages.append(f"Row {label + row_offset}: {rule.render(self.frame, label)}")
+        return messages
+
+    def row_messages(self, severity: str = 'error', separator: str = '; ') -> pd.Series:
+        """
+        Renders the messages of a severity as one message per failing row.
+
+        Args:
+            severity: 'error' or 'warning'
+            separator: Placed between the messages of a row, in rule order
+
+        Returns:
+            Series indexed like the DataFrame, None for rows that pass every rule of the severity
+        """
+        labels = self.frame.df.index
+        messages = pd.Series(None, index=labels, dtype=object)
+        for position in self.failing(severity):
+            code = int(self.codes[position])
+            label = labels[position]
+            messages.iat[position] = separator.join(
+                rule.render(self.frame, label) for bit, rule in enumerate(self.rules)
+                if rule.severity == severity and code >> bit & 1
+            )
+        return messages
+
+
+class RuleSet:
+    """
+    Ordered validation rules of one import type.
+    """
+
+    def __init__(self, rules: List[ColumnRule]):
+        """
+        Initialize the rule set.
+
+        Args:
+            rules: Rules in the order their messages are reported within a row
+        """
+        if len(rules) > MAX_RULES:
+            raise ValueError(f"A rule set holds at most {MAX_RULES} rules, got {len(rules)}")
+        self.rules = list(rules)
+
+    def evaluate(self, df: pd.DataFrame, options: Dict = None) -> RuleResult:
+        """
+        Applies every rule to the whole DataFrame and packs the failures into a code per row.
+
+        Args:
+            df: DataFrame to validate
+            options: Validation rules of the import type
+
+        Returns:
+            RuleResult with the error code of every row
+        """
+        frame = RuleFrame(df, options)
+        codes = np.zeros(len(df), dtype=np.uint64)
+        for bit, rule in enumerate(self.rules):
+            mask = rule.check(frame)
+            mask = np.asarray(pd.Series(mask, index=df.index).fillna(False), dtype=bool)
+            codes |= mask.astype(np.uint64) << np.uint64(bit)
+        return RuleResult(frame, self.rules, codes)
+
+    def validate(self, df: pd.DataFrame, options: Dict = None) -> Dict:
+        """
+        Validates a DataFrame and renders the messages of its failing rows.
+
+        Args:
+            df: DataFrame to validate
+            options: Validation rules of the import type
+
+        Returns:
+            Dictionary with validation results including warnings and errors
+        """
+        result = self.evaluate(df, options)
+        errors = result.messages('error')
+        return {"valid": not errors, "errors": errors, "warnings": result.messages('warning')}
+
+
+def _decimal_places(value: str) -> int:
+    try:
+        exponent = Decimal(value).as_tuple().exponent
+    except (ValueError, TypeError, decimal.InvalidOperation):
+        return 0
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def _parse_date(value: Any) -> Optional[pd.Timestamp]:
+    try:
+        parsed = pd.to_datetime(value)
+    except Exception:
+        return None
+    return parsed.tz_localize(None) if parsed.tzinfo is not None else parsed
@@ -10,13 +10,15 @@ import numpy as np
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 from decimal import Decimal
 import decimal
-from datetime import date, datetime
+from datetime import datetime
 
 from ...utils.logging import get_logger
 from ...utils.file_handling import get_file_extension, validate_file_size
-from ...utils.validators import validate_decimal, validate_string, validate_date, validate_currency_code
+from ...utils.validators import validate_decimal, validate_string, validate_date
+from ...utils.currency import SUPPORTED_CURRENCIES
 from ...api.core.errors import ValidationError
 from ...utils.constants import DEFAULT_CURRENCY, RATE_DECIMALS
+from .validation_engine import ColumnRule, RuleFrame, RuleSet
 
 # Set up logger
 logger = get_logger(__name__)
@@ -33,9 +35,18 @@ BILLING_IMPORT_REQUIRED_FIELDS = ['Firm Name', 'Attorney Name', 'Hours', 'Fees',
 
 # Optional fields for various import types
 RATE_IMPORT_OPTIONAL_FIELDS = ['Currency', 'Expiration Date', 'Timekeeper ID', 'Office', 'Practice Area', 'Staff Class']
+
+# Import columns checked by the rate rules, keyed by the rate fields they are mapped to
+RATE_IMPORT_FIELD_COLUMNS = {
+    'amount': 'Rate Amount', 'currency': 'Currency', 'effective_date': 'Effective Date',
+    'expiration_date': 'Expiration Date'
+}
 ATTORNEY_IMPORT_OPTIONAL_FIELDS = ['Graduation Date', 'Timekeeper ID', 'Practice Area', 'Staff Class']
 BILLING_IMPORT_OPTIONAL_FIELDS = ['Matter ID', 'Practice Area', 'Office', 'Currency', 'AFA Flag']
 
+# Values accepted for the AFA flag when it is given as text
+AFA_FLAG_VALUES = ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']
+
 
 def validate_file_basics(file_path: str, allowed_extensions: set, max_size_mb: int) -> bool:
     """
@@ -193,112 +204,182 @@ def validate_dataframe_structure(df: pd.DataFrame, required_columns: List, optio
     return True
 
 
-def validate_rate_import_data(df: pd.DataFrame, validation_rules: Dict = None) -> Dict:
+def _invalid_numbers(column: str) -> Callable[[RuleFrame], pd.Series]:
+    return lambda frame: frame.present(column) & frame.numeric(column).isna()
+
+
+def _invalid_dates(column: str) -> Callable[[RuleFrame], pd.Series]:
+    return lambda frame: frame.present(column) & frame.dates(column).isna() if frame.has(column) else frame.empty()
+
+
+def _future_dates(column: str) -> Callable[[RuleFrame], pd.Series]:
+    return lambda frame: frame.dates(column) > frame.today if frame.has(column) else frame.empty()
+
+
+def _invalid_currencies(frame: RuleFrame) -> pd.Series:
+    if not frame.has('Currency'):
+        return frame.empty()
+    return frame.present('Currency') & ~frame.text('Currency').str.upper().isin(SUPPORTED_CURRENCIES)
+
+
+def _currency_message(frame: RuleFrame, label: Any) -> str:
+    return f"Invalid currency code: {str(frame.value('Currency', label)).strip().upper()}"
+
+
+def _rate_increases(frame: RuleFrame) -> pd.Series:
+    historical_rates = frame.options.get('historical_rates')
+    if not historical_rates or not frame.has('Attorney Name'):
+        return frame.empty()
+    names = frame.df['Attorney Name'].astype(str).str.strip()
+    old_rates = pd.to_numeric(names.map(lambda name: historical_rates.get(name)), errors='coerce')
+    new_rates = frame.numeric('Rate Amount')
+    max_increase = float(frame.options['max_increase_percent'])
+    known = old_rates.notna() & (old_rates != 0) & new_rates.notna()
+    return known & ((new_rates - old_rates) / old_rates.where(known) * 100 > max_increase)
+
+
+def _rate_increase_message(frame: RuleFrame, label: Any) -> str:
+    # Rendered with Decimal arithmetic, as only the flagged rows reach this point
+    attorney_name = str(frame.value('Attorney Name', label)).strip()
+    old_rate = Decimal(str(frame.options['historical_rates'][attorney_name]))
+    new_rate = Decimal(str(frame.value('Rate Amount', label)))
+    max_increase = frame.options['max_increase_percent']
+    increase_percent = ((new_rate - old_rate) / old_rate) * Decimal('100')
+    return (
+        f"Rate increase of {increase_percent:.2f}% for {attorney_name} "
+        f"exceeds recommended maximum of {max_increase}%"
+    )
+
+
+def _invalid_afa_flags(frame: RuleFrame) -> pd.Series:
+    if not frame.has('AFA Flag'):
+        return frame.empty()
+    values = frame.df['AFA Flag']
+    present = frame.present('AFA Flag')
+    if pd.api.types.is_bool_dtype(values):
+        return frame.empty()
+    if pd.api.types.is_numeric_dtype(values):
+        # Numbers are accepted when int(value) is 0 or 1
+        return present & ~np.trunc(values).isin([0, 1])
+    kinds = values.map(type)
+    is_bool = kinds.isin([bool, np.bool_])
+    is_text = kinds.eq(str)
+    invalid_text = is_text & ~values.where(is_text).str.lower().isin(AFA_FLAG_VALUES)
+    is_number = present & ~is_text & ~is_bool
+    numbers = pd.to_numeric(values.where(is_number), errors='coerce')
+    return invalid_text | (is_number & ~np.trunc(numbers).isin([0, 1]))
+
+
+def _duplicate_attorney_warnings(df: pd.DataFrame) -> List[str]:
+    # Check for potential duplicate attorneys
+    duplicate_check = df.duplicated(subset=['Firm Name', 'Attorney Name'], keep=False)
+    if not duplicate_check.any():
+        return []
+    duplicate_rows = df[duplicate_check].index.tolist()
+    duplicate_rows = [r + 2 for r in duplicate_rows]  # +2 for 0-based index and header
+    return [f"Potential duplicate attorneys found in rows: {duplicate_rows}"]
+
+
+def _expiration_not_after_effective(frame: RuleFrame) -> pd.Series:
+    if not frame.has('Expiration Date'):
+        return frame.empty()
+    return frame.dates('Expiration Date') <= frame.dates('Effective Date')
+
+
+def _graduation_after_bar(frame: RuleFrame) -> pd.Series:
+    if not frame.has('Graduation Date'):
+        return frame.empty()
+    return frame.dates('Graduation Date') > frame.dates('Bar Date')
+
+
+# Rules for each import type, in the order their messages are reported within a row
+RATE_IMPORT_RULES = RuleSet([
+    ColumnRule('rate_invalid', _invalid_numbers('Rate Amount'), "Invalid rate amount format"),
+    ColumnRule('rate_negative', lambda frame: frame.numeric('Rate Amount') < 0,
+               "Rate amount cannot be negative"),
+    ColumnRule('rate_below_minimum', lambda frame: frame.numeric('Rate Amount') < float(frame.options['min_rate']),
+               "Rate amount must be at least {min_rate}"),
+    ColumnRule('rate_decimal_places',
+               lambda frame: frame.numeric('Rate Amount').notna()
+               & (frame.decimal_places('Rate Amount') > frame.options['max_decimals']),
+               "Rate amount has too many decimal places (max {max_decimals})"),
+    ColumnRule('currency_invalid', _invalid_currencies, _currency_message),
+    ColumnRule('effective_date_invalid', _invalid_dates('Effective Date'), "Invalid effective date format"),
+    ColumnRule('expiration_date_invalid', _invalid_dates('Expiration Date'), "Invalid expiration date format"),
+    ColumnRule('expiration_not_after_effective', _expiration_not_after_effective,
+               "Expiration date must be after effective date"),
+    ColumnRule('rate_increase_high', _rate_increases, _rate_increase_message, severity='warning'),
+])
+
+ATTORNEY_IMPORT_RULES = RuleSet([
+    ColumnRule('attorney_name_short',
+               lambda frame: frame.present('Attorney Name') & (frame.text('Attorney Name').str.len() < 2),
+               "Invalid attorney name: too short"),
+    ColumnRule('bar_date_invalid', _invalid_dates('Bar Date'), "Invalid bar date format"),
+    ColumnRule('bar_date_future', _future_dates('Bar Date'), "Bar date cannot be in the future"),
+    ColumnRule('graduation_date_invalid', _invalid_dates('Graduation Date'), "Invalid graduation date format"),
+    ColumnRule('graduation_date_future', _future_dates('Graduation Date'), "Graduation date cannot be in the future"),
+    ColumnRule('graduation_after_bar', _graduation_after_bar, "Graduation date should be before bar date"),
+    ColumnRule('office_missing', lambda frame: ~frame.present('Office'), "Office is required"),
+])
+
+BILLING_IMPORT_RULES = RuleSet([
+    ColumnRule('hours_invalid', _invalid_numbers('Hours'), "Invalid hours format"),
+    ColumnRule('hours_negative', lambda frame: frame.numeric('Hours') < 0, "Hours cannot be negative"),
+    ColumnRule('hours_high', lambda frame: frame.numeric('Hours') > 24,
+               lambda frame, label: f"Hours value {Decimal(str(frame.value('Hours', label)))} seems unusually high",
+               severity='warning'),
+    ColumnRule('fees_invalid', _invalid_numbers('Fees'), "Invalid fees format"),
+    ColumnRule('fees_negative', lambda frame: frame.numeric('Fees') < 0, "Fees cannot be negative"),
+    ColumnRule('date_invalid', _invalid_dates('Date'), "Invalid date format"),
+    ColumnRule('date_future', _future_dates('Date'), "Billing date cannot be in the future"),
+    ColumnRule('date_old', lambda frame: frame.dates('Date') < frame.today - pd.DateOffset(years=10),
+               "Billing date is more than 10 years old", severity='warning'),
+    ColumnRule('afa_flag_invalid', _invalid_afa_flags,
+               lambda frame, label: f"Invalid AFA Flag value: {frame.value('AFA Flag', label)}"),
+    ColumnRule('currency_invalid', _invalid_currencies, _currency_message),
+])
+
+
+def apply_import_rules(df: pd.DataFrame, rule_set: RuleSet, required_columns: List, optional_columns: List,
+                       options: Dict, include_error_codes: bool = False,
+                       frame_warnings: Callable[[pd.DataFrame], List[str]] = None) -> Dict:
     """
-    Validates that rate import data meets business rules and data type requirements.
+    Validates the structure of import data and applies a rule set to all of its rows at once.
     
     Args:
-        df: DataFrame containing rate data
-        validation_rules: Dictionary of validation rules to apply
+        df: DataFrame containing the import data
+        rule_set: Rules of the import type
+        required_columns: List of columns that must be present
+        optional_columns: List of columns that may be present
+        options: Validation rules with their defaults filled in
+        include_error_codes: Whether to add the rule codes of each failing row to the results
+        frame_warnings: Function returning warnings about the data as a whole, reported before row warnings
         
     Returns:
         Dictionary with validation results including warnings and errors
     """
-    if validation_rules is None:
-        validation_rules = {}
-    
     validation_results = {"valid": True, "errors": [], "warnings": []}
     
     try:
         # Validate dataframe structure first
-        validate_dataframe_structure(df, RATE_IMPORT_REQUIRED_FIELDS, RATE_IMPORT_OPTIONAL_FIELDS)
-        
-        # Validate data types and business rules
-        errors = []
-        warnings = []
+        validate_dataframe_structure(df, required_columns, optional_columns)
         
-        # Process each row
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # +2 because idx is 0-based and we have a header row
-            
-            try:
-                # Validate rate amount
-                try:
-                    rate_amount = Decimal(str(row['Rate Amount']))
-                    max_decimals = validation_rules.get('max_decimals', RATE_DECIMALS)
-                    min_rate = validation_rules.get('min_rate', Decimal('0'))
-                    
-                    # Check for negative rates
-                    if rate_amount < 0:
-                        errors.append(f"Row {row_num}: Rate amount cannot be negative")
-                    
-                    # Check minimum rate if specified
-                    if rate_amount < min_rate:
-                        errors.append(f"Row {row_num}: Rate amount must be at least {min_rate}")
-                    
-                    # Check decimal places
-                    decimal_tuple = rate_amount.as_tuple()
-                    if decimal_tuple.exponent < 0 and abs(decimal_tuple.exponent) > max_decimals:
-                        errors.append(f"Row {row_num}: Rate amount has too many decimal places (max {max_decimals})")
-                    
-                except (ValueError, TypeError, decimal.InvalidOperation):
-                    errors.append(f"Row {row_num}: Invalid rate amount format")
-                
-                # Validate currency if present
-                if 'Currency' in row and not pd.isna(row['Currency']):
-                    try:
-                        currency = str(row['Currency']).strip().upper()
-                        if not validate_currency_code(currency, f"Row {row_num}: Currency"):
-                            errors.append(f"Row {row_num}: Invalid currency code: {currency}")
-                    except Exception as e:
-                        errors.append(f"Row {row_num}: {str(e)}")
-                
-                # Validate effective date
-                try:
-                    effective_date = pd.to_datetime(row['Effective Date']).date()
-                except Exception:
-                    errors.append(f"Row {row_num}: Invalid effective date format")
-                
-                # Validate expiration date if present
-                if 'Expiration Date' in row and not pd.isna(row['Expiration Date']):
-                    try:
-                        expiration_date = pd.to_datetime(row['Expiration Date']).date()
-                        
-                        # Check that expiration date is after effective date
-                        if 'Effective Date' in row and not pd.isna(row['Effective Date']):
-                            effective_date = pd.to_datetime(row['Effective Date']).date()
-                            if expiration_date <= effective_date:
-                                errors.append(f"Row {row_num}: Expiration date must be after effective date")
-                    except Exception:
-                        errors.append(f"Row {row_num}: Invalid expiration date format")
-                
-                # Check rate increase against historical rate if provided in validation rules
-                if validation_rules.get('historical_rates') and 'Attorney Name' in row:
-                    attorney_name = str(row['Attorney Name']).strip()
-                    historical_rates = validation_rules.get('historical_rates', {})
-                    
-                    if attorney_name in historical_rates:
-                        old_rate = Decimal(str(historical_rates[attorney_name]))
-                        new_rate = Decimal(str(row['Rate Amount']))
-                        max_increase = validation_rules.get('max_increase_percent', Decimal('10'))
-                        
-                        increase_percent = ((new_rate - old_rate) / old_rate) * Decimal('100')
-                        
-                        if increase_percent > max_increase:
-                            warnings.append(
-                                f"Row {row_num}: Rate increase of {increase_percent:.2f}% for {attorney_name} "
-                                f"exceeds recommended maximum of {max_increase}%"
-                            )
-            
-            except Exception as e:
-                errors.append(f"Row {row_num}: Validation error: {str(e)}")
+        # Evaluate every rule as a column operation, then render messages for failing rows only
+        result = rule_set.evaluate(df, options)
+        errors = result.messages('error')
         
-        # Update validation results
         if errors:
             validation_results["valid"] = False
             validation_results["errors"] = errors
         
-        validation_results["warnings"] = warnings
+        warnings = frame_warnings(df) if frame_warnings else []
+        validation_results["warnings"] = warnings + result.messages('warning')
+        
+        if include_error_codes:
+            validation_results["error_codes"] = {
+                int(df.index[position]) + 2: result.row_codes(position) for position in np.flatnonzero(result.codes)
+            }
     
     except ValidationError as e:
         validation_results["valid"] = False
@@ -307,211 +388,80 @@ def validate_rate_import_data(df: pd.DataFrame, validation_rules: Dict = None) -
     return validation_results
 
 
-def validate_attorney_import_data(df: pd.DataFrame, validation_rules: Dict = None) -> Dict:
+def validate_rate_import_data(df: pd.DataFrame, validation_rules: Dict = None, include_error_codes: bool = False) -> Dict:
     """
-    Validates that attorney import data meets business rules and data type requirements.
+    Validates that rate import data meets business rules and data type requirements.
     
     Args:
-        df: DataFrame containing attorney data
+        df: DataFrame containing rate data
         validation_rules: Dictionary of validation rules to apply
+        include_error_codes: Whether to add the rule codes of each failing row to the results
         
     Returns:
         Dictionary with validation results including warnings and errors
     """
-    if validation_rules is None:
-        validation_rules = {}
+    return apply_import_rules(df, RATE_IMPORT_RULES, RATE_IMPORT_REQUIRED_FIELDS, RATE_IMPORT_OPTIONAL_FIELDS,
+                              _rate_import_options(validation_rules), include_error_codes)
+
+
+def _rate_import_options(validation_rules: Dict = None) -> Dict:
+    options = {'max_decimals': RATE_DECIMALS, 'min_rate': Decimal('0'), 'max_increase_percent': Decimal('10')}
+    options.update(validation_rules or {})
+    return options
+
+
+def validate_rate_import_rows(df: pd.DataFrame, validation_rules: Dict = None) -> pd.Series:
+    """
+    Validates rows already mapped to rate fields with the rate import rules.
     
-    validation_results = {"valid": True, "errors": [], "warnings": []}
+    Used as the per-chunk validator of streamed imports; columns missing from the rows are
+    left to the repository, which reports missing required fields.
     
-    try:
-        # Validate dataframe structure first
-        validate_dataframe_structure(df, ATTORNEY_IMPORT_REQUIRED_FIELDS, ATTORNEY_IMPORT_OPTIONAL_FIELDS)
-        
-        # Validate data types and business rules
-        errors = []
-        warnings = []
-        
-        # Check for potential duplicate attorneys
-        if 'Attorney Name' in df.columns and 'Firm Name' in df.columns:
-            duplicate_check = df.duplicated(subset=['Firm Name', 'Attorney Name'], keep=False)
-            if duplicate_check.any():
-                duplicate_rows = df[duplicate_check].index.tolist()
-                duplicate_rows = [r + 2 for r in duplicate_rows]  # +2 for 0-based index and header
-                warnings.append(f"Potential duplicate attorneys found in rows: {duplicate_rows}")
-        
-        # Process each row
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # +2 because idx is 0-based and we have a header row
-            
-            try:
-                # Validate attorney name format
-                if not pd.isna(row['Attorney Name']):
-                    attorney_name = str(row['Attorney Name']).strip()
-                    if not attorney_name or len(attorney_name) < 2:
-                        errors.append(f"Row {row_num}: Invalid attorney name: too short")
-                
-                # Validate bar date
-                try:
-                    bar_date = pd.to_datetime(row['Bar Date']).date()
-                    
-                    # Check if bar date is in the future
-                    if bar_date > date.today():
-                        errors.append(f"Row {row_num}: Bar date cannot be in the future")
-                    
-                except Exception:
-                    errors.append(f"Row {row_num}: Invalid bar date format")
-                
-                # Validate graduation date if present
-                if 'Graduation Date' in row and not pd.isna(row['Graduation Date']):
-                    try:
-                        graduation_date = pd.to_datetime(row['Graduation Date']).date()
-                        
-                        # Check if graduation date is in the future
-                        if graduation_date > date.today():
-                            errors.append(f"Row {row_num}: Graduation date cannot be in the future")
-                        
-                        # Check that graduation date is before bar date
-                        if 'Bar Date' in row and not pd.isna(row['Bar Date']):
-                            bar_date = pd.to_datetime(row['Bar Date']).date()
-                            if graduation_date > bar_date:
-                                errors.append(f"Row {row_num}: Graduation date should be before bar date")
-                    except Exception:
-                        errors.append(f"Row {row_num}: Invalid graduation date format")
-                
-                # Validate office
-                if pd.isna(row['Office']):
-                    errors.append(f"Row {row_num}: Office is required")
-            
-            except Exception as e:
-                errors.append(f"Row {row_num}: Validation error: {str(e)}")
-        
-        # Update validation results
-        if errors:
-            validation_results["valid"] = False
-            validation_results["errors"] = errors
+    Args:
+        df: DataFrame of rows keyed by rate fields (amount, currency, effective_date, ...)
+        validation_rules: Dictionary of validation rules to apply
         
-        validation_results["warnings"] = warnings
-    
-    except ValidationError as e:
-        validation_results["valid"] = False
-        validation_results["errors"] = [str(e)]
+    Returns:
+        Series indexed like the DataFrame with the error messages of each invalid row, None for valid rows
+    """
+    columns = df.rename(columns=RATE_IMPORT_FIELD_COLUMNS)
+    columns = columns.reindex(columns=list(columns.columns) + [
+        column for column in RATE_IMPORT_FIELD_COLUMNS.values() if column not in columns.columns
+    ])
+    return RATE_IMPORT_RULES.evaluate(columns, _rate_import_options(validation_rules)).row_messages('error')
+
+
+def validate_attorney_import_data(df: pd.DataFrame, validation_rules: Dict = None, include_error_codes: bool = False) -> Dict:
+    """
+    Validates that attorney import data meets business rules and data type requirements.
     
-    return validation_results
+    Args:
+        df: DataFrame containing attorney data
+        validation_rules: Dictionary of validation rules to apply
+        include_error_codes: Whether to add the rule codes of each failing row to the results
+        
+    Returns:
+        Dictionary with validation results including warnings and errors
+    """
+    return apply_import_rules(df, ATTORNEY_IMPORT_RULES, ATTORNEY_IMPORT_REQUIRED_FIELDS,
+                              ATTORNEY_IMPORT_OPTIONAL_FIELDS, dict(validation_rules or {}), include_error_codes,
+                              frame_warnings=_duplicate_attorney_warnings)
 
 
-def validate_billing_import_data(df: pd.DataFrame, validation_rules: Dict = None) -> Dict:
+def validate_billing_import_data(df: pd.DataFrame, validation_rules: Dict = None, include_error_codes: bool = False) -> Dict:
     """
     Validates that billing import data meets business rules and data type requirements.
     
     Args:
         df: DataFrame containing billing data
         validation_rules: Dictionary of validation rules to apply
+        include_error_codes: Whether to add the rule codes of each failing row to the results
         
     Returns:
         Dictionary with validation results including warnings and errors
     """
-    if validation_rules is None:
-        validation_rules = {}
-    
-    validation_results = {"valid": True, "errors": [], "warnings": []}
-    
-    try:
-        # Validate dataframe structure first
-        validate_dataframe_structure(df, BILLING_IMPORT_REQUIRED_FIELDS, BILLING_IMPORT_OPTIONAL_FIELDS)
-        
-        # Validate data types and business rules
-        errors = []
-        warnings = []
-        
-        # Process each row
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # +2 because idx is 0-based and we have a header row
-            
-            try:
-                # Validate hours
-                try:
-                    hours = Decimal(str(row['Hours']))
-                    
-                    # Check for negative hours
-                    if hours < 0:
-                        errors.append(f"Row {row_num}: Hours cannot be negative")
-                    
-                    # Check for unusually high hours
-                    if hours > 24:
-                        warnings.append(f"Row {row_num}: Hours value {hours} seems unusually high")
-                
-                except (ValueError, TypeError, decimal.InvalidOperation):
-                    errors.append(f"Row {row_num}: Invalid hours format")
-                
-                # Validate fees
-                try:
-                    fees = Decimal(str(row['Fees']))
-                    
-                    # Check for negative fees
-                    if fees < 0:
-                        errors.append(f"Row {row_num}: Fees cannot be negative")
-                
-                except (ValueError, TypeError, decimal.InvalidOperation):
-                    errors.append(f"Row {row_num}: Invalid fees format")
-                
-                # Validate date
-                try:
-                    billing_date = pd.to_datetime(row['Date']).date()
-                    
-                    # Check if date is in the future
-                    if billing_date > date.today():
-                        errors.append(f"Row {row_num}: Billing date cannot be in the future")
-                    
-                    # Check if date is too old (over 10 years)
-                    if billing_date < (date.today() - pd.DateOffset(years=10)).date():
-                        warnings.append(f"Row {row_num}: Billing date is more than 10 years old")
-                
-                except Exception:
-                    errors.append(f"Row {row_num}: Invalid date format")
-                
-                # Validate AFA flag if present
-                if 'AFA Flag' in row and not pd.isna(row['AFA Flag']):
-                    afa_flag = row['AFA Flag']
-                    
-                    # Convert to boolean if possible
-                    if isinstance(afa_flag, bool):
-                        pass  # Already a boolean
-                    elif isinstance(afa_flag, str):
-                        if afa_flag.lower() not in ('true', 'false', 'yes', 'no', '1', '0', 'y', 'n'):
-                            errors.append(f"Row {row_num}: Invalid AFA Flag value: {afa_flag}")
-                    else:
-                        try:
-                            # Try to convert to int and then check if 0 or 1
-                            afa_int = int(afa_flag)
-                            if afa_int not in (0, 1):
-                                errors.append(f"Row {row_num}: Invalid AFA Flag value: {afa_flag}")
-                        except (ValueError, TypeError):
-                            errors.append(f"Row {row_num}: Invalid AFA Flag value: {afa_flag}")
-                
-                # Validate currency if present
-                if 'Currency' in row and not pd.isna(row['Currency']):
-                    try:
-                        currency = str(row['Currency']).strip().upper()
-                        if not validate_currency_code(currency, f"Row {row_num}: Currency"):
-                            errors.append(f"Row {row_num}: Invalid currency code: {currency}")
-                    except Exception as e:
-                        errors.append(f"Row {row_num}: {str(e)}")
-            
-            except Exception as e:
-                errors.append(f"Row {row_num}: Validation error: {str(e)}")
-        
-        # Update validation results
-        if errors:
-            validation_results["valid"] = False
-            validation_results["errors"] = errors
-        
-        validation_results["warnings"] = warnings
-    
-    except ValidationError as e:
-        validation_results["valid"] = False
-        validation_results["errors"] = [str(e)]
-    
-    return validation_results
+    return apply_import_rules(df, BILLING_IMPORT_RULES, BILLING_IMPORT_REQUIRED_FIELDS,
+                              BILLING_IMPORT_OPTIONAL_FIELDS, dict(validation_rules or {}), include_error_codes)
 
 
 def create_validation_error_report(validation_results: Dict, file_path: str) -> Dict:
@@ -1042,7 +992,8 @@ class FileValidator:
         Args:
             df: DataFrame to validate
             import_type: Type of import ('rate', 'attorney', 'billing')
-            options: Dictionary of validation options
+            options: Dictionary of validation options; include_error_codes adds the rule codes
+                of each failing row, keyed by row number
             
         Returns:
             Dictionary with validation results
@@ -1054,15 +1005,22 @@ class FileValidator:
             raise ValidationError(f"Unknown import type: {import_type}")
         
         try:
+            # Rules are evaluated as column operations over the whole DataFrame
             if import_type == 'rate':
-                validation_results = validate_rate_import_data(df, self._validation_rules.get('rate', {}))
+                validator_func = validate_rate_import_data
             elif import_type == 'attorney':
-                validation_results = validate_attorney_import_data(df, self._validation_rules.get('attorney', {}))
+                validator_func = validate_attorney_import_data
             elif import_type == 'billing':
-                validation_results = validate_billing_import_data(df, self._validation_rules.get('billing', {}))
+                validator_func = validate_billing_import_data
             else:
                 raise ValidationError(f"Unsupported import type: {import_type}")
             
+            validation_results = validator_func(
+                df,
+                self._validation_rules.get(import_type, {}),
+                include_error_codes=options.get('include_error_codes', False)
+            )
+            
             return validation_results
             
         except ValidationError as e:
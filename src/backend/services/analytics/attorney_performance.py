@@ -19,6 +19,7 @@ from src.backend.integrations.unicourt import mapper as unicourt_mapper  # Purpo
 from src.backend.utils import datetime_utils  # Purpose: Date handling utilities for performance period calculations
 from src.backend.utils import cache  # Purpose: Caching performance metrics for improved performance
 from src.backend.utils import validators  # Purpose: Input validation for performance analysis parameters
+from src.backend.db.session import session_scope  # Purpose: Database sessions for the module-level helpers
 
 # Initialize logger
 logger = logging.getLogger(__name__)
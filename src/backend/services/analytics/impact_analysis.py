@@ -12,79 +12,87 @@ import uuid
 from ...db.repositories.rate_repository import RateRepository  # src/backend/db/repositories/rate_repository.py
 from ...db.repositories.billing_repository import BillingRepository  # src/backend/db/repositories/billing_repository.py
 from ...db.repositories.organization_repository import OrganizationRepository  # src/backend/db/repositories/organization_repository.py
+from ...db.session import get_db  # src/backend/db/session.py
 from ...utils.currency import convert_currency, format_currency  # src/backend/utils/currency.py
 from ...utils.formatting import format_currency  # src/backend/utils/formatting.py
 from ...utils.datetime_utils import get_year_range  # src/backend/utils/datetime_utils.py
+from ...utils.constants import RateStatus  # src/backend/utils/constants.py
 
 
-def calculate_rate_impact(client_id: str, firm_id: str, proposed_rates: list, reference_period: tuple, currency: str) -> dict:
+def calculate_rate_impact(client_id: str, firm_id: str, proposed_rates: list, reference_period: tuple, currency: str,
+                          billing_repository: Optional[BillingRepository] = None,
+                          rate_repository: Optional[RateRepository] = None) -> dict:
     """
     Calculates the financial impact of proposed rates based on historical billing data.
 
+    Historical hours come from the maintained billing aggregates, so the cost of the calculation
+    depends on the number of attorneys rather than the number of billing records in the period.
+
     Args:
         client_id: UUID of the client organization.
         firm_id: UUID of the law firm organization.
         proposed_rates: List of proposed rate dictionaries.
         reference_period: Tuple containing start and end dates for historical data.
         currency: Currency code for the calculation.
+        billing_repository: Optional repository for billing data access.
+        rate_repository: Optional repository for rate data access.
 
     Returns:
         Impact calculation results including total impact, percentage change, and breakdown by attorney/staff class.
     """
-    # 1. Retrieve historical billing data for the reference period
-    billing_repository = BillingRepository()
-    billing_data = billing_repository.get_billing_history(
-        client_id=uuid.UUID(client_id),
-        start_date=reference_period[0],
-        end_date=reference_period[1]
+    # 1. Retrieve historical hours by attorney and staff class for the reference period
+    billing_repository = billing_repository or BillingRepository(get_db())
+    hours = pandas.DataFrame(
+        billing_repository.get_rate_impact_hours(
+            client_id=uuid.UUID(client_id),
+            firm_id=uuid.UUID(firm_id),
+            start_date=reference_period[0],
+            end_date=reference_period[1]
+        ),
+        columns=['attorney_id', 'staff_class_id', 'hours', 'fees']
     )
 
     # 2. Retrieve current approved rates for comparison
-    rate_repository = RateRepository()
-    current_rates = rate_repository.get_rates_by_firm(
-        firm_id=firm_id,
+    rate_repository = rate_repository or RateRepository(get_db())
+    current_rates = rate_repository.get_current_rates(
         client_id=client_id,
-        status='APPROVED'
+        firm_id=firm_id,
+        status=RateStatus.APPROVED
     )
 
-    # 3. Calculate total hours by attorney/staff class from billing data
-    attorney_hours = {}
-    staff_class_hours = {}
-    for record in billing_data:
-        attorney_id = str(record.attorney_id)
-        staff_class_id = str(record.staff_class_id)
-
-        if attorney_id not in attorney_hours:
-            attorney_hours[attorney_id] = 0
-        attorney_hours[attorney_id] += record.hours
-
-        if staff_class_id not in staff_class_hours:
-            staff_class_hours[staff_class_id] = 0
-        staff_class_hours[staff_class_id] += record.hours
-
-    # 4. Calculate current total cost based on approved rates and historical hours
-    current_total_cost = 0
-    for attorney_id, hours in attorney_hours.items():
-        rate = next((r for r in current_rates if str(r.attorney_id) == attorney_id), None)
-        if rate:
-            current_total_cost += rate.amount * hours
-
-    # 5. Calculate proposed total cost based on proposed rates and historical hours
-    proposed_total_cost = 0
-    for attorney_id, hours in attorney_hours.items():
-        rate = next((r for r in proposed_rates if str(r['attorney_id']) == attorney_id), None)
-        if rate:
-            proposed_total_cost += rate['amount'] * hours
-
-    # 6. Determine absolute difference and percentage change
+    # 3. Look up each attorney's current and proposed rate, keeping the first rate per attorney
+    current_amounts = {}
+    for rate in current_rates:
+        current_amounts.setdefault(str(rate.attorney_id), float(rate.amount))
+    proposed_amounts = {}
+    for rate in proposed_rates:
+        proposed_amounts.setdefault(str(rate['attorney_id']), float(rate['amount']))
+
+    hours['attorney_id'] = hours['attorney_id'].astype(str)
+    hours['staff_class_id'] = hours['staff_class_id'].map(lambda value: str(value) if value is not None else 'unassigned')
+    hours['hours'] = hours['hours'].astype(float)
+
+    # 4. Calculate current and proposed cost of the historical hours in one vectorized step
+    hours['current'] = hours['attorney_id'].map(current_amounts).fillna(0.0) * hours['hours']
+    hours['proposed'] = hours['attorney_id'].map(proposed_amounts).fillna(0.0) * hours['hours']
+
+    current_total_cost = float(hours['current'].sum())
+    proposed_total_cost = float(hours['proposed'].sum())
+
+    # 5. Determine absolute difference and percentage change
     absolute_difference = proposed_total_cost - current_total_cost
     percentage_change = (absolute_difference / current_total_cost) * 100 if current_total_cost else 0
 
-    # 7. Organize results by attorney and staff class for detailed breakdown
-    attorney_impact = {}
-    staff_class_impact = {}
+    # 6. Organize results by attorney and staff class for detailed breakdown
+    def breakdown(dimension: str) -> dict:
+        grouped = hours.groupby(dimension)[['hours', 'current', 'proposed']].sum()
+        grouped['difference'] = grouped['proposed'] - grouped['current']
+        return grouped.to_dict(orient='index')
+
+    attorney_impact = breakdown('attorney_id')
+    staff_class_impact = breakdown('staff_class_id')
 
-    # 8. Return comprehensive impact analysis dictionary
+    # 7. Return comprehensive impact analysis dictionary
     return {
         'total_impact': absolute_difference,
         'percentage_change': percentage_change,
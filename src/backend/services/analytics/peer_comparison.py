@@ -6,6 +6,7 @@ import pandas  # version: 2.0+
 import numpy  # version: 1.24+
 from typing import List, Dict, Any, Optional
 import datetime
+import uuid
 import logging  # standard library
 from src.backend.db.models.peer_group import PeerGroup  # Access to peer group data model
 from src.backend.db.models.organization import Organization  # Access to organization data model
@@ -15,10 +16,29 @@ from src.backend.db.models.staff_class import StaffClass  # Access to staff clas
 from src.backend.db.repositories.peer_group_repository import PeerGroupRepository  # Repository for peer group data access
 from src.backend.db.repositories.rate_repository import RateRepository  # Repository for rate data access
 from src.backend.db.repositories.organization_repository import OrganizationRepository  # Repository for organization data access
-from src.backend.utils.currency import convert_currency  # Currency conversion for comparing rates in different currencies
+from src.backend.db.session import get_db  # Database session factory
+from src.backend.utils.currency import get_exchange_rate_table  # Exchange rates for comparing rates in different currencies
+from src.backend.services.rates.currency import load_historical_exchange_rates  # Historical exchange rates for as-of comparisons
 
 logger = logging.getLogger(__name__)
 
+# Dimensions the comparison engine can group by, each a column of the peer rates frame
+COMPARISON_DIMENSIONS = ["staff_class", "practice_area", "geography"]
+
+# Columns of the peer rates frame returned by RateRepository.get_comparison_rows
+RATE_FRAME_COLUMNS = ["firm_id", "staff_class", "practice_area", "geography", "type", "amount", "currency"]
+
+# Label used for rates whose staff class, practice area or geography is not recorded
+UNSPECIFIED_GROUP = "Unspecified"
+
+# Percentiles reported in rate statistics, keyed by their output names
+STATISTIC_PERCENTILES = {
+    "10th_percentile": 0.10,
+    "25th_percentile": 0.25,
+    "75th_percentile": 0.75,
+    "90th_percentile": 0.90,
+}
+
 
 class PeerComparisonService:
     """
@@ -113,7 +133,14 @@ class PeerComparisonService:
         )
         # Call compare_rates_by_staff_class with parameters
         comparison_results = compare_rates_by_staff_class(
-            organization_id, peer_group_id, filters, target_currency, as_of_date
+            organization_id,
+            peer_group_id,
+            filters,
+            target_currency,
+            as_of_date,
+            peer_group_repository=self._peer_group_repository,
+            rate_repository=self._rate_repository,
+            organization_repository=self._organization_repository,
         )
 
         # Return the comparison results
@@ -145,7 +172,14 @@ class PeerComparisonService:
         )
         # Call compare_rates_by_practice_area with parameters
         comparison_results = compare_rates_by_practice_area(
-            organization_id, peer_group_id, filters, target_currency, as_of_date
+            organization_id,
+            peer_group_id,
+            filters,
+            target_currency,
+            as_of_date,
+            peer_group_repository=self._peer_group_repository,
+            rate_repository=self._rate_repository,
+            organization_repository=self._organization_repository,
         )
 
         # Return the comparison results
@@ -177,12 +211,57 @@ class PeerComparisonService:
         )
         # Call compare_rates_by_geography with parameters
         comparison_results = compare_rates_by_geography(
-            organization_id, peer_group_id, filters, target_currency, as_of_date
+            organization_id,
+            peer_group_id,
+            filters,
+            target_currency,
+            as_of_date,
+            peer_group_repository=self._peer_group_repository,
+            rate_repository=self._rate_repository,
+            organization_repository=self._organization_repository,
         )
 
         # Return the comparison results
         return comparison_results
 
+    def get_dimension_comparison(
+        self,
+        organization_id: str,
+        peer_group_id: str,
+        filters: Dict,
+        target_currency: str,
+        as_of_date: datetime.date,
+        dimensions: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        Generates staff class, practice area and geography comparisons from a single pass over the peer rates
+
+        Args:
+            organization_id: ID of the organization to compare
+            peer_group_id: ID of the peer group to compare against
+            filters: Filters to apply to the rate data
+            target_currency: Currency to convert all rates to
+            as_of_date: Date to retrieve rates as of
+            dimensions: Dimensions to compare by, defaults to all COMPARISON_DIMENSIONS
+
+        Returns:
+            Comparison analytics keyed by dimension
+        """
+        logger.info(
+            f"Generating dimension comparison for organization {organization_id}, peer group {peer_group_id}"
+        )
+        return compare_rates_by_dimensions(
+            organization_id,
+            peer_group_id,
+            filters,
+            target_currency,
+            as_of_date,
+            dimensions=dimensions,
+            peer_group_repository=self._peer_group_repository,
+            rate_repository=self._rate_repository,
+            organization_repository=self._organization_repository,
+        )
+
 
 def get_peer_comparison(
     organization_id: str,
@@ -230,37 +309,22 @@ def get_peer_comparison(
         )
         return {}
 
-    # 3. Get rates for the specified organization
-    org_rates = rate_repository.get_by_firm(
-        firm_id=organization_id, as_of_date=as_of_date
+    # 3. Get rates for the organization and every peer in one query
+    rates_df = load_peer_rates_frame(
+        peer_group_repository, rate_repository, organization_id, peer_group_id, as_of_date
     )
-    org_rates_df = pandas.DataFrame([rate.__dict__ for rate in org_rates])
-
-    # 4. Get rates for all organizations in the peer group
-    peer_orgs = get_peer_group_organizations(peer_group_id, organization_id)
-    peer_rates_df = pandas.DataFrame()
-    for peer_org in peer_orgs:
-        peer_rates = rate_repository.get_by_firm(
-            firm_id=str(peer_org.id), as_of_date=as_of_date
-        )
-        peer_rates_df = pandas.concat(
-            [peer_rates_df, pandas.DataFrame([rate.__dict__ for rate in peer_rates])],
-            ignore_index=True,
-        )
 
-    # 5. Apply filters (staff class, practice area, etc.)
-    org_rates_df = apply_filters(org_rates_df, filters)
-    peer_rates_df = apply_filters(peer_rates_df, filters)
+    # 4. Apply filters (staff class, practice area, etc.)
+    rates_df = apply_filters(rates_df, filters)
 
-    # 6. Normalize currencies to target currency
-    org_rates_df = normalize_currencies(org_rates_df, target_currency, as_of_date)
-    peer_rates_df = normalize_currencies(peer_rates_df, target_currency, as_of_date)
+    # 5. Normalize currencies to target currency
+    rates_df = normalize_currencies(rates_df, target_currency, as_of_date)
 
-    # 7. Calculate statistics (mean, median, range, percentiles)
-    org_stats = calculate_rate_statistics(org_rates_df)
-    peer_stats = calculate_rate_statistics(peer_rates_df)
+    # 6. Calculate statistics (mean, median, range, percentiles)
+    org_stats = calculate_rate_statistics(rates_df[rates_df["is_target"]])
+    peer_stats = calculate_rate_statistics(rates_df[~rates_df["is_target"]])
 
-    # 8. Structure and return the comparison data
+    # 7. Structure and return the comparison data
     comparison_data = {
         "organization": {"id": organization_id, "name": organization.name, "stats": org_stats},
         "peer_group": {"id": peer_group_id, "name": peer_group.name, "stats": peer_stats},
@@ -275,95 +339,143 @@ def get_peer_comparison(
     return comparison_data
 
 
-def compare_rates_by_staff_class(
+def compare_rates_by_dimensions(
     organization_id: str,
     peer_group_id: str,
     filters: Dict,
     target_currency: str,
     as_of_date: datetime.date,
+    dimensions: Optional[List[str]] = None,
+    peer_group_repository: Optional[PeerGroupRepository] = None,
+    rate_repository: Optional[RateRepository] = None,
+    organization_repository: Optional[OrganizationRepository] = None,
 ) -> Dict:
     """
-    Compares rates across organizations within a peer group, grouped by staff class
+    Compares rates across organizations within a peer group for several dimensions in one pass
+
+    All rates for the organization and its peers are loaded with a single query, converted to
+    the target currency in one vectorized step, and summarized with a groupby per dimension.
+    Groups are the values present in the organization's own rates.
 
     Args:
         organization_id: ID of the organization to compare
         peer_group_id: ID of the peer group to compare against
-        filters: Filters to apply (practice area, etc.)
+        filters: Filters to apply (rate type, etc.)
         target_currency: Currency to convert all rates to
         as_of_date: Date to retrieve rates as of
+        dimensions: Dimensions to group by, defaults to all COMPARISON_DIMENSIONS
+        peer_group_repository: Optional repository for peer group data access
+        rate_repository: Optional repository for rate data access
+        organization_repository: Optional repository for organization data access
 
     Returns:
-        Staff class comparison data with organization vs peer metrics
+        Comparison data keyed by dimension, then by group, with organization vs peer metrics
     """
+    dimensions = dimensions or COMPARISON_DIMENSIONS
+    invalid_dimensions = [dimension for dimension in dimensions if dimension not in COMPARISON_DIMENSIONS]
+    if invalid_dimensions:
+        raise ValueError(f"Unsupported comparison dimensions: {', '.join(invalid_dimensions)}")
+
     logger.info(
-        f"Starting staff class comparison for organization {organization_id}, peer group {peer_group_id}"
+        f"Starting {', '.join(dimensions)} comparison for organization {organization_id}, peer group {peer_group_id}"
     )
 
-    # 1. Get staff classes for the organization
-    organization_repository = OrganizationRepository(get_db())
+    # 1. Validate the organization exists
+    organization_repository = organization_repository or OrganizationRepository(get_db())
     organization = organization_repository.get_by_id(uuid.UUID(organization_id))
     if not organization:
         logger.warning(f"Organization with ID {organization_id} not found")
         return {}
 
-    staff_classes = organization.staff_classes
-    comparison_data = {}
+    # 2. Load the organization's and all peers' rates into one frame
+    rates_df = load_peer_rates_frame(
+        peer_group_repository or PeerGroupRepository(get_db()),
+        rate_repository or RateRepository(get_db()),
+        organization_id,
+        peer_group_id,
+        as_of_date,
+    )
 
-    # 2. For each staff class, retrieve rates from the organization
-    rate_repository = RateRepository(get_db())
-    for staff_class in staff_classes:
-        org_rates = rate_repository.get_by_firm(
-            firm_id=organization_id,
-            staff_class_id=str(staff_class.id),
-            as_of_date=as_of_date,
-        )
-        org_rates_df = pandas.DataFrame([rate.__dict__ for rate in org_rates])
-
-        # 3. For each staff class, retrieve rates from peer organizations
-        peer_group_repository = PeerGroupRepository(get_db())
-        peer_orgs = get_peer_group_organizations(peer_group_id, organization_id)
-        peer_rates_df = pandas.DataFrame()
-        for peer_org in peer_orgs:
-            peer_rates = rate_repository.get_by_firm(
-                firm_id=str(peer_org.id),
-                staff_class_id=str(staff_class.id),
-                as_of_date=as_of_date,
-            )
-            peer_rates_df = pandas.concat(
-                [peer_rates_df, pandas.DataFrame([rate.__dict__ for rate in peer_rates])],
-                ignore_index=True,
-            )
-
-        # 4. Apply filters
-        org_rates_df = apply_filters(org_rates_df, filters)
-        peer_rates_df = apply_filters(peer_rates_df, filters)
-
-        # 5. Normalize all rates to target currency
-        org_rates_df = normalize_currencies(org_rates_df, target_currency, as_of_date)
-        peer_rates_df = normalize_currencies(peer_rates_df, target_currency, as_of_date)
-
-        # 6. Calculate statistics for each staff class
-        org_stats = calculate_rate_statistics(org_rates_df)
-        peer_stats = calculate_rate_statistics(peer_rates_df)
-
-        # 7. Structure and return the comparison data by staff class
-        comparison_data[staff_class.name] = {
-            "organization": {"id": organization_id, "name": organization.name, "stats": org_stats},
-            "peer_group": {"id": peer_group_id, "name": f"Peer Group - {staff_class.name}", "stats": peer_stats},
+    # 3. Apply filters and normalize all rates to target currency
+    rates_df = apply_filters(rates_df, filters)
+    rates_df = normalize_currencies(rates_df, target_currency, as_of_date)
+
+    org_rates_df = rates_df[rates_df["is_target"]]
+    peer_rates_df = rates_df[~rates_df["is_target"]]
+
+    # 4. Calculate grouped statistics for every requested dimension
+    comparison_data = {}
+    for dimension in dimensions:
+        org_stats = calculate_grouped_rate_statistics(org_rates_df, dimension)
+        peer_stats = calculate_grouped_rate_statistics(peer_rates_df, dimension)
+
+        comparison_data[dimension] = {
+            group: {
+                "organization": {"id": organization_id, "name": organization.name, "stats": stats},
+                "peer_group": {
+                    "id": peer_group_id,
+                    "name": f"Peer Group - {group}",
+                    "stats": peer_stats.get(group, calculate_rate_statistics(pandas.DataFrame())),
+                },
+            }
+            for group, stats in org_stats.items()
         }
 
     logger.info(
-        f"Staff class comparison completed for organization {organization_id}, peer group {peer_group_id}"
+        f"{', '.join(dimensions)} comparison completed for organization {organization_id}, peer group {peer_group_id}"
     )
     return comparison_data
 
 
+def compare_rates_by_staff_class(
+    organization_id: str,
+    peer_group_id: str,
+    filters: Dict,
+    target_currency: str,
+    as_of_date: datetime.date,
+    peer_group_repository: Optional[PeerGroupRepository] = None,
+    rate_repository: Optional[RateRepository] = None,
+    organization_repository: Optional[OrganizationRepository] = None,
+) -> Dict:
+    """
+    Compares rates across organizations within a peer group, grouped by staff class
+
+    Args:
+        organization_id: ID of the organization to compare
+        peer_group_id: ID of the peer group to compare against
+        filters: Filters to apply (practice area, etc.)
+        target_currency: Currency to convert all rates to
+        as_of_date: Date to retrieve rates as of
+        peer_group_repository: Optional repository for peer group data access
+        rate_repository: Optional repository for rate data access
+        organization_repository: Optional repository for organization data access
+
+    Returns:
+        Staff class comparison data with organization vs peer metrics
+    """
+    comparison_data = compare_rates_by_dimensions(
+        organization_id,
+        peer_group_id,
+        filters,
+        target_currency,
+        as_of_date,
+        dimensions=["staff_class"],
+        peer_group_repository=peer_group_repository,
+        rate_repository=rate_repository,
+        organization_repository=organization_repository,
+    )
+    return comparison_data.get("staff_class", {})
+
+
 def compare_rates_by_practice_area(
     organization_id: str,
     peer_group_id: str,
     filters: Dict,
     target_currency: str,
     as_of_date: datetime.date,
+    peer_group_repository: Optional[PeerGroupRepository] = None,
+    rate_repository: Optional[RateRepository] = None,
+    organization_repository: Optional[OrganizationRepository] = None,
 ) -> Dict:
     """
     Compares rates across organizations within a peer group, grouped by practice area
@@ -374,12 +486,25 @@ def compare_rates_by_practice_area(
         filters: Filters to apply (staff class, etc.)
         target_currency: Currency to convert all rates to
         as_of_date: Date to retrieve rates as of
+        peer_group_repository: Optional repository for peer group data access
+        rate_repository: Optional repository for rate data access
+        organization_repository: Optional repository for organization data access
 
     Returns:
         Practice area comparison data with organization vs peer metrics
     """
-    logger.warning("compare_rates_by_practice_area is not yet implemented")
-    return {}
+    comparison_data = compare_rates_by_dimensions(
+        organization_id,
+        peer_group_id,
+        filters,
+        target_currency,
+        as_of_date,
+        dimensions=["practice_area"],
+        peer_group_repository=peer_group_repository,
+        rate_repository=rate_repository,
+        organization_repository=organization_repository,
+    )
+    return comparison_data.get("practice_area", {})
 
 
 def compare_rates_by_geography(
@@ -388,6 +513,9 @@ def compare_rates_by_geography(
     filters: Dict,
     target_currency: str,
     as_of_date: datetime.date,
+    peer_group_repository: Optional[PeerGroupRepository] = None,
+    rate_repository: Optional[RateRepository] = None,
+    organization_repository: Optional[OrganizationRepository] = None,
 ) -> Dict:
     """
     Compares rates across organizations within a peer group, grouped by geographic region
@@ -398,12 +526,69 @@ def compare_rates_by_geography(
         filters: Filters to apply (staff class, etc.)
         target_currency: Currency to convert all rates to
         as_of_date: Date to retrieve rates as of
+        peer_group_repository: Optional repository for peer group data access
+        rate_repository: Optional repository for rate data access
+        organization_repository: Optional repository for organization data access
 
     Returns:
         Geographic comparison data with organization vs peer metrics
     """
-    logger.warning("compare_rates_by_geography is not yet implemented")
-    return {}
+    comparison_data = compare_rates_by_dimensions(
+        organization_id,
+        peer_group_id,
+        filters,
+        target_currency,
+        as_of_date,
+        dimensions=["geography"],
+        peer_group_repository=peer_group_repository,
+        rate_repository=rate_repository,
+        organization_repository=organization_repository,
+    )
+    return comparison_data.get("geography", {})
+
+
+def load_peer_rates_frame(
+    peer_group_repository: PeerGroupRepository,
+    rate_repository: RateRepository,
+    organization_id: str,
+    peer_group_id: str,
+    as_of_date: datetime.date,
+) -> pandas.DataFrame:
+    """
+    Loads the rates of an organization and all of its peers into a single columnar frame
+
+    Args:
+        peer_group_repository: Repository for peer group data access
+        rate_repository: Repository for rate data access
+        organization_id: ID of the organization being compared
+        peer_group_id: ID of the peer group to compare against
+        as_of_date: Date to retrieve rates as of
+
+    Returns:
+        DataFrame with one row per rate and an is_target column marking the organization's own rates
+    """
+    target_id = str(uuid.UUID(organization_id))
+
+    # 1. Resolve peer member IDs without loading the organizations
+    peer_ids = [
+        str(member_id)
+        for member_id in peer_group_repository.get_member_ids(uuid.UUID(peer_group_id))
+        if str(member_id) != target_id
+    ]
+
+    # 2. Load every rate for the organization and its peers in one query
+    rows = rate_repository.get_comparison_rows([target_id] + peer_ids, as_of_date=as_of_date)
+    rates_df = pandas.DataFrame.from_records(rows, columns=RATE_FRAME_COLUMNS)
+
+    # 3. Coerce columns into comparable, vectorizable types
+    rates_df["firm_id"] = rates_df["firm_id"].astype(str)
+    rates_df["amount"] = rates_df["amount"].astype(float)
+    rates_df["type"] = rates_df["type"].map(lambda rate_type: getattr(rate_type, "value", rate_type))
+    rates_df[COMPARISON_DIMENSIONS] = rates_df[COMPARISON_DIMENSIONS].fillna(UNSPECIFIED_GROUP)
+    rates_df["is_target"] = rates_df["firm_id"] == target_id
+
+    logger.debug(f"Loaded {len(rates_df)} rates for {len(peer_ids) + 1} organizations")
+    return rates_df
 
 
 def calculate_rate_statistics(rates_df: pandas.DataFrame) -> Dict:
@@ -459,6 +644,47 @@ def calculate_rate_statistics(rates_df: pandas.DataFrame) -> Dict:
     }
 
 
+def calculate_grouped_rate_statistics(rates_df: pandas.DataFrame, group_column: str) -> Dict[str, Dict]:
+    """
+    Calculates the calculate_rate_statistics metrics for every group of a column in one groupby
+
+    Args:
+        rates_df: DataFrame containing rate data
+        group_column: Column to group the rates by
+
+    Returns:
+        Statistics keyed by group value, in the same shape as calculate_rate_statistics
+    """
+    if rates_df.empty:
+        return {}
+
+    grouped = rates_df.groupby(group_column, sort=True)["amount"]
+
+    # Aggregate all groups at once; population std matches numpy.std and linear quantiles match numpy.percentile
+    summary = grouped.agg(["mean", "median", "min", "max"])
+    summary["standard_deviation"] = grouped.std(ddof=0)
+    quantiles = grouped.quantile(list(STATISTIC_PERCENTILES.values())).unstack()
+    for name, quantile in STATISTIC_PERCENTILES.items():
+        summary[name] = quantiles[quantile]
+
+    summary = summary.astype(float).round(2)
+
+    return {
+        str(group): {
+            "mean": row["mean"],
+            "median": row["median"],
+            "min": row["min"],
+            "max": row["max"],
+            "10th_percentile": row["10th_percentile"],
+            "25th_percentile": row["25th_percentile"],
+            "75th_percentile": row["75th_percentile"],
+            "90th_percentile": row["90th_percentile"],
+            "standard_deviation": row["standard_deviation"],
+        }
+        for group, row in summary.to_dict("index").items()
+    }
+
+
 def normalize_currencies(
     rates_df: pandas.DataFrame, target_currency: str, conversion_date: datetime.date
 ) -> pandas.DataFrame:
@@ -476,30 +702,9 @@ def normalize_currencies(
     if rates_df.empty:
         return rates_df
 
-    # 1. Create a copy of the input DataFrame
-    rates_df = rates_df.copy()
-
-    # 2. Identify unique source currencies in the data
-    unique_currencies = rates_df["currency"].unique()
-
-    # 3. For each source currency, apply conversion to target currency
-    for from_currency in unique_currencies:
-        if from_currency == target_currency:
-            continue  # Skip if already in target currency
-
-        # Get exchange rate
-        exchange_rate = convert_currency(1, from_currency, target_currency)
-
-        # Apply conversion to the 'amount' column
-        rates_df.loc[rates_df["currency"] == from_currency, "amount"] = (
-            rates_df["amount"][rates_df["currency"] == from_currency] * exchange_rate
-        )
-
-    # 4. Update the currency column to reflect the target currency
-    rates_df["currency"] = target_currency
-
-    # 5. Return the normalized DataFrame
-    return rates_df
+    # Convert every amount as of the conversion date in one vectorized lookup
+    load_historical_exchange_rates(conversion_date, conversion_date)
+    return get_exchange_rate_table().convert_frame(rates_df, target_currency, rate_date=conversion_date)
 
 
 def apply_filters(rates_df: pandas.DataFrame, filters: Dict) -> pandas.DataFrame:
@@ -528,8 +733,8 @@ def apply_filters(rates_df: pandas.DataFrame, filters: Dict) -> pandas.DataFrame
     if "geography" in filters and filters["geography"]:
         rates_df = rates_df[rates_df["geography"] == filters["geography"]]
 
-    # 4. Check for attorney experience filter and apply if present
-    if "attorney_experience" in filters and filters["attorney_experience"]:
+    # 4. Check for attorney experience filter and apply if present (not carried by comparison frames)
+    if "attorney_experience" in filters and filters["attorney_experience"] and "attorney_experience" in rates_df.columns:
         rates_df = rates_df[
             rates_df["attorney_experience"] == filters["attorney_experience"]
         ]
@@ -0,0 +1,335 @@
+"""
+Batch rate forecasting for the Justice Bid Rate Negotiation System, projecting the rates of every
+attorney and staff class series of a client or firm at once.
+
+Annual rates are laid out as a padded matrix with one row per series and one column per year, and
+linear, log-linear (exponential) and damped CAGR models are fitted to all rows with vectorized least
+squares. Fitted parameters are cached per scope together with a watermark of each series' data, so
+a forecast only refits the series whose rates were added, edited or removed since the last fit.
+"""
+
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+import numpy  # version: ^1.24.0
+import pandas  # version: ^2.0.0
+
+from src.backend.utils.cache import get_cache, set_cache
+from src.backend.utils.logging import logger
+
+# Models the forecaster can fit
+FORECAST_MODELS = ("linear", "exponential", "damped")
+
+# Columns identifying one forecast series: an attorney's rates for a client in one staff class
+FORECAST_SERIES_COLUMNS = ["attorney_id", "client_id", "staff_class"]
+
+# Confidence level of forecast intervals
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+# Share of the previous year's growth kept each forecast year by the damped CAGR model
+CAGR_DAMPING_FACTOR = 0.8
+
+# Year subtracted from calendar years before fitting, so cached parameters share one time origin
+FORECAST_BASE_YEAR = 2000
+
+# Fitted parameters kept per series, in column order of the parameter matrix
+FORECAST_PARAMETERS = ("intercept", "slope", "sigma", "count", "t_mean", "t_ss", "last_t", "last_value", "growth")
+
+# Cache key prefix and lifetime of fitted parameters; watermarks decide when series are refitted
+FORECAST_CACHE_PREFIX = "rate_forecast_params"
+FORECAST_CACHE_TTL = 7 * 86400
+
+
+@dataclass
+class SeriesMatrix:
+    """
+    Annual rates of many series padded to a common range of years.
+
+    Attributes:
+        keys: Series keys, one tuple of FORECAST_SERIES_COLUMNS values per row
+        years: Calendar year of each column
+        values: Rate of each series (row) and year (column), NaN where a series has no rate
+        watermarks: Latest effective date, rate count and checksum of the dates and amounts of each
+            series, changing whenever one of its rates is added, edited or removed
+    """
+    keys: List[Tuple]
+    years: numpy.ndarray
+    values: numpy.ndarray
+    watermarks: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def build_series_matrix(frame: pandas.DataFrame) -> SeriesMatrix:
+    """
+    Lays out the last rate of each series and year of a rate trend frame as a padded matrix
+
+    Args:
+        frame: Rate trend frame from rate_trends.load_rate_trend_frame
+
+    Returns:
+        SeriesMatrix with one row per attorney, client and staff class
+    """
+    if frame.empty:
+        return SeriesMatrix([], numpy.empty(0, dtype=int), numpy.empty((0, 0)), numpy.empty(0, dtype=object))
+
+    ordered = frame.sort_values("effective_date", kind="mergesort")
+    series = ordered.groupby(FORECAST_SERIES_COLUMNS, sort=True)
+    codes = series.ngroup().to_numpy()
+    summary = series.agg(last_date=("effective_date", "max"), count=("amount", "size"))
+
+    # Order-independent checksum of each series' rates, so edited amounts change the watermark too
+    row_hashes = pandas.util.hash_pandas_object(ordered[["effective_date", "amount"]], index=False).to_numpy()
+    checksums = numpy.zeros(len(summary), dtype=numpy.uint64)
+    numpy.add.at(checksums, codes, row_hashes)
+
+    first_year = int(ordered["year"].min())
+    years = numpy.arange(first_year, int(ordered["year"].max()) + 1)
+    values = numpy.full((len(summary), len(years)), numpy.nan)
+    # Rows are in date order, so the last assignment to a cell is the last rate of that year
+    values[codes, ordered["year"].to_numpy() - first_year] = ordered["amount"].to_numpy(dtype=float)
+
+    watermarks = (summary["last_date"].dt.strftime("%Y-%m-%d") + ":" + summary["count"].astype(str) + ":"
+                  + pandas.Series(checksums, index=summary.index).map("{:016x}".format)).to_numpy()
+    return SeriesMatrix(list(summary.index), years, values, watermarks)
+
+
+def fit_forecast_models(values: numpy.ndarray, years: numpy.ndarray, model: str) -> numpy.ndarray:
+    """
+    Fits a forecast model to every row of a padded rate matrix at once
+
+    Linear and exponential models are ordinary least squares fits of the rate (or its logarithm)
+    against the year, computed from per-row sums so missing years are simply left out. The damped
+    model keeps the series' CAGR between its first and last rate and the spread of its annual log
+    changes. Series with a single rate are forecast flat.
+
+    Args:
+        values: Rates of each series (row) and year (column), NaN where missing
+        years: Calendar year of each column
+        model: One of FORECAST_MODELS
+
+    Returns:
+        Parameter matrix with one row per series and the FORECAST_PARAMETERS columns
+    """
+    if model not in FORECAST_MODELS:
+        raise ValueError(f"Invalid model_type. Must be one of {', '.join(FORECAST_MODELS)}")
+
+    t = (numpy.asarray(years) - FORECAST_BASE_YEAR).astype(float)
+    mask = ~numpy.isnan(values) & (values > 0)
+    y = numpy.log(numpy.where(mask, values, 1.0)) if model in ("exponential", "damped") else values
+    y = numpy.where(mask, y, 0.0)
+    tt = numpy.where(mask, t, 0.0)
+
+    count = mask.sum(axis=1).astype(float)
+    safe_count = numpy.maximum(count, 1.0)
+    t_mean = tt.sum(axis=1) / safe_count
+    y_mean = y.sum(axis=1) / safe_count
+    t_centered = numpy.where(mask, t - t_mean[:, None], 0.0)
+    t_ss = (t_centered ** 2).sum(axis=1)
+    slope = numpy.divide((t_centered * y).sum(axis=1), t_ss, out=numpy.zeros_like(t_ss), where=t_ss > 0)
+    intercept = y_mean - slope * t_mean
+
+    # Position of each series' first and last rate
+    last_index = values.shape[1] - 1 - numpy.argmax(mask[:, ::-1], axis=1)
+    first_index = numpy.argmax(mask, axis=1)
+    rows = numpy.arange(values.shape[0])
+    last_t = t[last_index] if values.shape[1] else numpy.zeros(0)
+    last_value = values[rows, last_index] if values.shape[1] else numpy.zeros(0)
+
+    growth = numpy.zeros_like(count)
+    if model == "damped":
+        # CAGR between the first and last rate, and the spread of the annualized log changes between rates
+        span = last_t - t[first_index]
+        log_growth = numpy.divide(y[rows, last_index] - y[rows, first_index], span,
+                                  out=numpy.zeros_like(span), where=span > 0)
+        growth = numpy.expm1(log_growth)
+        log_changes = _annualized_log_changes(y, mask, t)
+        change_count = (~numpy.isnan(log_changes)).sum(axis=1)
+        sigma = numpy.full_like(count, numpy.nan)
+        has_spread = change_count > 1
+        sigma[has_spread] = numpy.nanstd(log_changes[has_spread], axis=1, ddof=1)
+        slope = log_growth
+    else:
+        residuals = numpy.where(mask, y - (intercept[:, None] + slope[:, None] * t), 0.0)
+        dof = count - 2
+        sigma = numpy.sqrt(numpy.divide((residuals ** 2).sum(axis=1), dof,
+                                        out=numpy.full_like(dof, numpy.nan), where=dof > 0))
+
+    # A single rate (or none) has no trend; it is forecast flat
+    flat = t_ss <= 0
+    intercept = numpy.where(flat, y_mean, intercept)
+
+    return numpy.column_stack([intercept, slope, sigma, count, t_mean, t_ss, last_t, last_value, growth])
+
+
+def _annualized_log_changes(y: numpy.ndarray, mask: numpy.ndarray, t: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the log change between consecutive rates of each series per year elapsed, NaN elsewhere
+    """
+    columns = numpy.arange(y.shape[1])
+    # Column of the most recent earlier rate for every cell, -1 where there is none
+    previous = numpy.maximum.accumulate(numpy.where(mask, columns, -1), axis=1)
+    previous = numpy.concatenate([numpy.full((y.shape[0], 1), -1), previous[:, :-1]], axis=1)
+    rows = numpy.arange(y.shape[0])[:, None]
+    valid = mask & (previous >= 0)
+    safe_previous = numpy.maximum(previous, 0)
+    elapsed = t[None, :] - t[safe_previous]
+    changes = numpy.divide(y - y[rows, safe_previous], elapsed, out=numpy.full(y.shape, numpy.nan),
+                           where=valid & (elapsed > 0))
+    return changes
+
+
+def predict_from_parameters(params: numpy.ndarray, target_years: numpy.ndarray, model: str,
+                            confidence_level: float = DEFAULT_CONFIDENCE_LEVEL) -> Dict[str, numpy.ndarray]:
+    """
+    Computes point forecasts and confidence intervals of every series for several years at once
+
+    Args:
+        params: Parameter matrix from fit_forecast_models
+        target_years: Calendar years to forecast
+        model: Model the parameters were fitted with
+        confidence_level: Confidence level of the intervals
+
+    Returns:
+        Dictionary of 'rate', 'lower' and 'upper' arrays with one row per series and one column per
+        target year; intervals are NaN where a series has too few rates to estimate them
+    """
+    p = {name: params[:, index][:, None] for index, name in enumerate(FORECAST_PARAMETERS)}
+    t0 = (numpy.asarray(target_years, dtype=float) - FORECAST_BASE_YEAR)[None, :]
+    z = NormalDist().inv_cdf(0.5 + confidence_level / 2)
+
+    if model == "damped":
+        # Growth decays by CAGR_DAMPING_FACTOR each year after the last rate
+        horizon = numpy.maximum(t0 - p["last_t"], 0.0)
+        steps = numpy.arange(1, int(horizon.max(initial=0)) + 1)
+        factors = 1 + p["growth"] * CAGR_DAMPING_FACTOR ** steps[None, :]
+        cumulative = numpy.concatenate([numpy.ones((len(params), 1)), numpy.cumprod(factors, axis=1)], axis=1)
+        rate = p["last_value"] * numpy.take_along_axis(cumulative, horizon.astype(int), axis=1)
+        spread = z * p["sigma"] * numpy.sqrt(horizon)
+        return {"rate": rate, "lower": rate * numpy.exp(-spread), "upper": rate * numpy.exp(spread)}
+
+    estimate = p["intercept"] + p["slope"] * t0
+    # Prediction standard error of a new observation at t0
+    leverage = numpy.divide((t0 - p["t_mean"]) ** 2, p["t_ss"], out=numpy.zeros(estimate.shape),
+                            where=p["t_ss"] > 0)
+    spread = z * p["sigma"] * numpy.sqrt(1 + 1 / numpy.maximum(p["count"], 1) + leverage)
+    if model == "exponential":
+        return {"rate": numpy.exp(estimate), "lower": numpy.exp(estimate - spread), "upper": numpy.exp(estimate + spread)}
+    return {"rate": estimate, "lower": estimate - spread, "upper": estimate + spread}
+
+
+def fit_with_cache(matrix: SeriesMatrix, model: str, cache_key: Optional[str] = None) -> Tuple[numpy.ndarray, int]:
+    """
+    Returns fitted parameters for every series, refitting only series whose watermark changed
+
+    Args:
+        matrix: Series to fit
+        model: One of FORECAST_MODELS
+        cache_key: Key of the cached parameters of this scope, or None to always fit
+
+    Returns:
+        Tuple of the parameter matrix, aligned with matrix.keys, and the number of series refitted
+    """
+    cached = get_cache(cache_key) if cache_key else None
+    params = numpy.full((len(matrix), len(FORECAST_PARAMETERS)), numpy.nan)
+    stale = numpy.ones(len(matrix), dtype=bool)
+
+    if cached:
+        cached_rows = {key: row for row, key in enumerate(cached["keys"])}
+        positions = numpy.array([cached_rows.get(key, -1) for key in matrix.keys], dtype=int)
+        found = positions >= 0
+        current = numpy.zeros(len(matrix), dtype=bool)
+        current[found] = cached["watermarks"][positions[found]] == matrix.watermarks[found]
+        params[current] = cached["params"][positions[current]]
+        stale = ~current
+
+    refit = int(stale.sum())
+    if refit:
+        params[stale] = fit_forecast_models(matrix.values[stale], matrix.years, model)
+        if cache_key:
+            set_cache(cache_key, {"keys": matrix.keys, "watermarks": matrix.watermarks, "params": params},
+                      ttl=FORECAST_CACHE_TTL)
+
+    logger.debug(f"Forecast parameters for {len(matrix)} series, {refit} refitted")
+    return params, refit
+
+
+def forecast_rates(frame: pandas.DataFrame, model: str, years_ahead: int, cache_key: Optional[str] = None,
+                   confidence_level: float = DEFAULT_CONFIDENCE_LEVEL) -> dict:
+    """
+    Forecasts the rates of every attorney and staff class series of a rate trend frame
+
+    Args:
+        frame: Rate trend frame from rate_trends.load_rate_trend_frame
+        model: One of FORECAST_MODELS
+        years_ahead: Number of calendar years after the latest rate year to forecast
+        cache_key: Key of the cached parameters of this scope, or None to always fit
+        confidence_level: Confidence level of the intervals
+
+    Returns:
+        Forecast years, per-series forecasts with intervals, the average forecast rate per year and
+        the number of series refitted
+    """
+    if model not in FORECAST_MODELS:
+        raise ValueError(f"Invalid model_type. Must be one of {', '.join(FORECAST_MODELS)}")
+
+    matrix = build_series_matrix(frame)
+    if not len(matrix):
+        return {"forecast_years": [], "series": [], "summary": {}, "series_count": 0, "refitted": 0}
+
+    params, refit = fit_with_cache(matrix, model, cache_key)
+    target_years = numpy.arange(matrix.years[-1] + 1, matrix.years[-1] + 1 + max(1, years_ahead))
+    prediction = predict_from_parameters(params, target_years, model, confidence_level)
+
+    rate, lower, upper = (numpy.round(prediction[name], 2) for name in ("rate", "lower", "upper"))
+    last_years = (params[:, FORECAST_PARAMETERS.index("last_t")] + FORECAST_BASE_YEAR).astype(int)
+    last_values = numpy.round(params[:, FORECAST_PARAMETERS.index("last_value")], 2)
+    year_list = [int(year) for year in target_years]
+
+    series = []
+    for row, key in enumerate(matrix.keys):
+        series.append({
+            **dict(zip(FORECAST_SERIES_COLUMNS, key)),
+            "last_year": int(last_years[row]),
+            "last_rate": float(last_values[row]),
+            "forecasts": [
+                {
+                    "year": year,
+                    "rate": float(rate[row, column]),
+                    "lower": None if numpy.isnan(lower[row, column]) else float(lower[row, column]),
+                    "upper": None if numpy.isnan(upper[row, column]) else float(upper[row, column]),
+                }
+                for column, year in enumerate(year_list)
+            ],
+        })
+
+    return {
+        "forecast_years": year_list,
+        "series": series,
+        "summary": {
+            year: {"average_rate": round(float(numpy.mean(prediction["rate"][:, column])), 2)}
+            for column, year in enumerate(year_list)
+        },
+        "series_count": len(matrix),
+        "refitted": refit,
+    }
+
+
+def forecast_cache_key(entity_type: str, entity_id: str, related_id: Optional[str], model: str,
+                       currency: str) -> str:
+    """
+    Builds the cache key of the fitted forecast parameters of one scope
+
+    Args:
+        entity_type: Type of entity ('attorney', 'client', 'firm')
+        entity_id: UUID of the entity
+        related_id: Optional UUID of the related entity scoping the rates
+        model: One of FORECAST_MODELS
+        currency: Currency the rates were converted to
+
+    Returns:
+        The cache key
+    """
+    return f"{FORECAST_CACHE_PREFIX}:{entity_type}:{entity_id}:{related_id or 'all'}:{model}:{currency}"
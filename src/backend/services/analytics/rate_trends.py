@@ -13,7 +13,11 @@ from decimal import Decimal
 from src.backend.db.models.rate import Rate
 from src.backend.db.repositories.rate_repository import RateRepository
 from src.backend.db.repositories.billing_repository import BillingRepository
-from src.backend.utils.currency import convert_currency
+from src.backend.services.rates.currency import load_historical_exchange_rates
+from src.backend.utils.currency import get_exchange_rate_table
+from src.backend.services.analytics.rate_forecasting import (
+    DEFAULT_CONFIDENCE_LEVEL, forecast_rates, forecast_cache_key
+)
 from src.backend.utils.datetime_utils import get_current_date, add_years, get_fiscal_year_start, get_fiscal_year_end, date_diff_years, get_month_range
 from src.backend.utils.logging import logger
 
@@ -21,6 +25,44 @@ DEFAULT_TREND_YEARS = 5
 DEFAULT_CURRENCY = "USD"
 CPI_DATA = {2018: 2.4, 2019: 1.8, 2020: 1.2, 2021: 4.7, 2022: 8.0, 2023: 3.4}
 
+# Columns of the rate trend frame returned by RateRepository.get_trend_rows
+TREND_FRAME_COLUMNS = ["attorney_id", "client_id", "firm_id", "staff_class_id", "staff_class", "practice_area",
+                       "office_id", "office", "effective_date", "amount", "currency"]
+
+# Identifier columns of the rate trend frame, compared as strings
+TREND_ID_COLUMNS = ["attorney_id", "client_id", "firm_id", "staff_class_id", "office_id"]
+
+# Label columns of the rate trend frame
+TREND_LABEL_COLUMNS = ["staff_class", "practice_area", "office"]
+
+# Columns identifying one rate series: an attorney's rates for a client
+RATE_SERIES_COLUMNS = ["attorney_id", "client_id"]
+
+# Dimensions time series and trend breakdowns can be grouped by, mapped to their trend frame column
+TREND_GROUP_COLUMNS = {
+    "attorney": "attorney_id",
+    "client": "client_id",
+    "firm": "firm_id",
+    "staff_class": "staff_class",
+    "practice_area": "practice_area",
+    "office": "office",
+}
+
+# Label used for rates whose staff class, practice area or office is not recorded
+UNSPECIFIED_GROUP = "Unspecified"
+
+# Percentiles reported in rate change distributions, keyed by their output names
+DISTRIBUTION_PERCENTILES = {
+    "10th_percentile": 10,
+    "25th_percentile": 25,
+    "50th_percentile": 50,
+    "75th_percentile": 75,
+    "90th_percentile": 90,
+}
+
+# Number of histogram bins of rate change distributions
+DISTRIBUTION_HISTOGRAM_BINS = 10
+
 
 class RateTrendsAnalyzer:
     """
@@ -37,7 +79,8 @@ class RateTrendsAnalyzer:
         """
         self.rate_repository = rate_repository
         self.billing_repository = billing_repository
-        # Initialize any required instance variables
+        # Rate trend frames loaded by this analyzer, so trends and time series of the same scope share one query
+        self._frames: Dict[tuple, pandas.DataFrame] = {}
         logger.debug("RateTrendsAnalyzer initialized")
 
     def get_rate_trends_by_attorney(self, attorney_id: str, client_id: Optional[str] = None,
@@ -49,7 +92,7 @@ class RateTrendsAnalyzer:
         Args:
             attorney_id: UUID of the attorney
             client_id: Optional UUID of the client to filter by
-            start_date: Optional start date for the analysis period
+            start_date: Optional start date for the analysis period (default: start of the year DEFAULT_TREND_YEARS ago)
             end_date: Optional end date for the analysis period
             currency: Optional currency to convert all amounts to
             years: Optional number of years to analyze (default: DEFAULT_TREND_YEARS)
@@ -62,33 +105,15 @@ class RateTrendsAnalyzer:
             currency = DEFAULT_CURRENCY
         if years is None:
             years = DEFAULT_TREND_YEARS
+        start_date = self._window_start(start_date, years)
 
-        # Retrieve rate history data for the attorney from rate_repository
-        rate_history = self.rate_repository.get_rate_history(attorney_id, client_id, start_date, end_date)
-
-        # Convert all rates to the specified currency for consistent analysis
-        converted_rates = []
-        for rate in rate_history:
-            converted_rate = convert_currency(rate.amount, rate.currency, currency)
-            converted_rates.append({"effective_date": rate.effective_date, "amount": converted_rate})
-
-        # Calculate year-over-year rate changes
-        rate_changes = []
-        for i in range(1, len(converted_rates)):
-            rate_changes.append({
-                "year": converted_rates[i]["effective_date"].year,
-                "change": (converted_rates[i]["amount"] - converted_rates[i - 1]["amount"]) / converted_rates[i - 1]["amount"] if converted_rates[i - 1]["amount"] else 0
-            })
-
-        # Calculate Compound Annual Growth Rate (CAGR) over the specified period
-        start_value = converted_rates[0]["amount"] if converted_rates else 0
-        end_value = converted_rates[-1]["amount"] if converted_rates else 0
-        cagr = self.calculate_cagr(start_value, end_value, years)
+        # Load and convert the attorney's rate history in one query
+        frame = self._load_frame(currency, attorney_id=attorney_id, client_id=client_id,
+                                 start_date=start_date, end_date=end_date)
+        trends = self._summarize_frame(frame, {})
 
         # Compare rate increases against inflation (CPI) for the same period
-        start_year = get_current_date().year - years
-        end_year = get_current_date().year
-        inflation_data = self.get_inflation_for_period(start_year, end_year)
+        inflation_data = self.get_inflation_for_period(get_current_date().year - years, get_current_date().year)
 
         # Format and return the analysis results
         analysis_results = {
@@ -97,9 +122,10 @@ class RateTrendsAnalyzer:
             "currency": currency,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
-            "historical_rates": [{"year": r["effective_date"].year, "amount": float(r["amount"])} for r in converted_rates],
-            "rate_changes": rate_changes,
-            "cagr": cagr,
+            "historical_rates": trends["historical_rates"],
+            "rate_changes": trends["rate_changes"],
+            "rate_change_distribution": trends["rate_change_distribution"],
+            "cagr": trends["cagr"],
             "inflation": inflation_data
         }
         logger.info(f"Analyzed rate trends for attorney {attorney_id}")
@@ -114,62 +140,31 @@ class RateTrendsAnalyzer:
         Args:
             client_id: UUID of the client
             firm_id: Optional UUID of the law firm to filter by
-            start_date: Optional start date for the analysis period
+            start_date: Optional start date for the analysis period (default: start of the year DEFAULT_TREND_YEARS ago)
             end_date: Optional end date for the analysis period
             currency: Optional currency to convert all amounts to
             years: Optional number of years to analyze (default: DEFAULT_TREND_YEARS)
         
         Returns:
-            Client rate trend analysis with aggregate statistics and breakdowns
+            Client rate trend analysis with aggregate statistics and breakdowns by staff class and practice area
         """
         # Set default values for optional parameters if not provided
         if currency is None:
             currency = DEFAULT_CURRENCY
         if years is None:
             years = DEFAULT_TREND_YEARS
+        start_date = self._window_start(start_date, years)
+
+        # Load and convert the rates of all the client's attorneys in one query, then analyze them in one pass
+        frame = self._load_frame(currency, client_id=client_id, firm_id=firm_id,
+                                 start_date=start_date, end_date=end_date)
+        trends = self._summarize_frame(frame, {
+            "staff_class_trends": TREND_GROUP_COLUMNS["staff_class"],
+            "practice_area_trends": TREND_GROUP_COLUMNS["practice_area"],
+        })
 
-        # Retrieve rate data for all attorneys associated with the client
-        rates = self.rate_repository.get_by_client(client_id, firm_id, start_date, end_date)
-
-        # Optionally filter by firm_id if provided
-        if firm_id:
-            rates = [rate for rate in rates if str(rate.firm_id) == firm_id]
-
-        # Convert all rates to the specified currency for consistent analysis
-        converted_rates = []
-        for rate in rates:
-            converted_rate = convert_currency(rate.amount, rate.currency, currency)
-            converted_rates.append({"effective_date": rate.effective_date, "amount": converted_rate, "staff_class_id": rate.staff_class_id, "practice_area": rate.practice_area})
-
-        # Calculate aggregate rate trends across all attorneys
-        total_rate_changes = []
-        for i in range(1, len(converted_rates)):
-            total_rate_changes.append((converted_rates[i]["amount"] - converted_rates[i - 1]["amount"]) / converted_rates[i - 1]["amount"] if converted_rates[i - 1]["amount"] else 0)
-
-        # Calculate trends by staff class for the client
-        staff_class_trends = {}
-        for rate in converted_rates:
-            staff_class_id = str(rate["staff_class_id"])
-            if staff_class_id not in staff_class_trends:
-                staff_class_trends[staff_class_id] = []
-            staff_class_trends[staff_class_id].append(rate["amount"])
-
-        # Calculate trends by practice area for the client
-        practice_area_trends = {}
-        for rate in converted_rates:
-            practice_area = rate["practice_area"]
-            if practice_area not in practice_area_trends:
-                practice_area_trends[practice_area] = []
-            practice_area_trends[practice_area].append(rate["amount"])
-
-        # Calculate CAGR and compare against inflation
-        start_value = converted_rates[0]["amount"] if converted_rates else 0
-        end_value = converted_rates[-1]["amount"] if converted_rates else 0
-        cagr = self.calculate_cagr(start_value, end_value, years)
-
-        start_year = get_current_date().year - years
-        end_year = get_current_date().year
-        inflation_data = self.get_inflation_for_period(start_year, end_year)
+        # Compare against inflation
+        inflation_data = self.get_inflation_for_period(get_current_date().year - years, get_current_date().year)
 
         # Format and return the analysis results
         analysis_results = {
@@ -178,11 +173,7 @@ class RateTrendsAnalyzer:
             "currency": currency,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
-            "total_rates": len(converted_rates),
-            "average_rate_change": numpy.mean(total_rate_changes) if total_rate_changes else 0,
-            "staff_class_trends": staff_class_trends,
-            "practice_area_trends": practice_area_trends,
-            "cagr": cagr,
+            **trends,
             "inflation": inflation_data
         }
         logger.info(f"Analyzed rate trends for client {client_id}")
@@ -197,62 +188,31 @@ class RateTrendsAnalyzer:
         Args:
             firm_id: UUID of the law firm
             client_id: Optional UUID of the client to filter by
-            start_date: Optional start date for the analysis period
+            start_date: Optional start date for the analysis period (default: start of the year DEFAULT_TREND_YEARS ago)
             end_date: Optional end date for the analysis period
             currency: Optional currency to convert all amounts to
             years: Optional number of years to analyze (default: DEFAULT_TREND_YEARS)
         
         Returns:
-            Firm rate trend analysis with aggregate statistics and breakdowns
+            Firm rate trend analysis with aggregate statistics and breakdowns by staff class and office
         """
         # Set default values for optional parameters if not provided
         if currency is None:
             currency = DEFAULT_CURRENCY
         if years is None:
             years = DEFAULT_TREND_YEARS
+        start_date = self._window_start(start_date, years)
+
+        # Load and convert the rates of all the firm's attorneys in one query, then analyze them in one pass
+        frame = self._load_frame(currency, firm_id=firm_id, client_id=client_id,
+                                 start_date=start_date, end_date=end_date)
+        trends = self._summarize_frame(frame, {
+            "staff_class_trends": TREND_GROUP_COLUMNS["staff_class"],
+            "office_trends": TREND_GROUP_COLUMNS["office"],
+        })
 
-        # Retrieve rate data for all attorneys associated with the firm
-        rates = self.rate_repository.get_by_firm(firm_id, client_id, start_date, end_date)
-
-        # Optionally filter by client_id if provided
-        if client_id:
-            rates = [rate for rate in rates if str(rate.client_id) == client_id]
-
-        # Convert all rates to the specified currency for consistent analysis
-        converted_rates = []
-        for rate in rates:
-            converted_rate = convert_currency(rate.amount, rate.currency, currency)
-            converted_rates.append({"effective_date": rate.effective_date, "amount": converted_rate, "staff_class_id": rate.staff_class_id, "office_id": rate.office_id})
-
-        # Calculate aggregate rate trends across all attorneys
-        total_rate_changes = []
-        for i in range(1, len(converted_rates)):
-            total_rate_changes.append((converted_rates[i]["amount"] - converted_rates[i - 1]["amount"]) / converted_rates[i - 1]["amount"] if converted_rates[i - 1]["amount"] else 0)
-
-        # Calculate trends by staff class for the firm
-        staff_class_trends = {}
-        for rate in converted_rates:
-            staff_class_id = str(rate["staff_class_id"])
-            if staff_class_id not in staff_class_trends:
-                staff_class_trends[staff_class_id] = []
-            staff_class_trends[staff_class_id].append(rate["amount"])
-
-        # Calculate trends by office location for the firm
-        office_trends = {}
-        for rate in converted_rates:
-            office_id = str(rate["office_id"])
-            if office_id not in office_trends:
-                office_trends[office_id] = []
-            office_trends[office_id].append(rate["amount"])
-
-        # Calculate CAGR and compare against inflation
-        start_value = converted_rates[0]["amount"] if converted_rates else 0
-        end_value = converted_rates[-1]["amount"] if converted_rates else 0
-        cagr = self.calculate_cagr(start_value, end_value, years)
-
-        start_year = get_current_date().year - years
-        end_year = get_current_date().year
-        inflation_data = self.get_inflation_for_period(start_year, end_year)
+        # Compare against inflation
+        inflation_data = self.get_inflation_for_period(get_current_date().year - years, get_current_date().year)
 
         # Format and return the analysis results
         analysis_results = {
@@ -261,16 +221,93 @@ class RateTrendsAnalyzer:
             "currency": currency,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
-            "total_rates": len(converted_rates),
-            "average_rate_change": numpy.mean(total_rate_changes) if total_rate_changes else 0,
-            "staff_class_trends": staff_class_trends,
-            "office_trends": office_trends,
-            "cagr": cagr,
+            **trends,
             "inflation": inflation_data
         }
         logger.info(f"Analyzed rate trends for firm {firm_id}")
         return analysis_results
 
+    def _load_frame(self, currency: str, attorney_id: Optional[str] = None, client_id: Optional[str] = None,
+                    firm_id: Optional[str] = None, start_date: Optional[date] = None,
+                    end_date: Optional[date] = None) -> pandas.DataFrame:
+        """
+        Loads a rate trend frame once per scope, period and currency for the lifetime of the analyzer
+        """
+        key = (currency, attorney_id, client_id, firm_id, start_date, end_date)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = load_rate_trend_frame(self.rate_repository, currency, attorney_id=attorney_id,
+                                          client_id=client_id, firm_id=firm_id,
+                                          start_date=start_date, end_date=end_date)
+            self._frames[key] = frame
+        return frame
+
+    def _load_entity_frame(self, entity_type: str, entity_id: str, related_id: Optional[str], currency: str,
+                           start_date: Optional[date] = None, end_date: Optional[date] = None) -> pandas.DataFrame:
+        """
+        Loads the rate trend frame of an attorney, client or firm, scoped by its related entity
+        (the client for attorneys and firms, the firm for clients)
+        """
+        if entity_type == 'attorney':
+            return self._load_frame(currency, attorney_id=entity_id, client_id=related_id,
+                                    start_date=start_date, end_date=end_date)
+        if entity_type == 'client':
+            return self._load_frame(currency, client_id=entity_id, firm_id=related_id,
+                                    start_date=start_date, end_date=end_date)
+        return self._load_frame(currency, firm_id=entity_id, client_id=related_id,
+                                start_date=start_date, end_date=end_date)
+
+    @staticmethod
+    def _window_start(start_date: Optional[date], years: int) -> date:
+        """
+        Returns the start of the analysis period, defaulting to the start of the year `years` years ago
+        """
+        if start_date is not None:
+            return start_date
+        return date(get_current_date().year - years, 1, 1)
+
+    def _summarize_frame(self, frame: pandas.DataFrame, breakdowns: Dict[str, str]) -> dict:
+        """
+        Computes year-over-year changes, CAGR, the change distribution and grouped trends of a rate trend frame
+
+        Args:
+            frame: Rate trend frame from load_rate_trend_frame
+            breakdowns: Output keys mapped to the frame column to break trends down by
+
+        Returns:
+            Aggregate trend statistics and one entry per breakdown
+        """
+        annual = calculate_annual_rate_changes(frame)
+        changes = annual["change"].dropna()
+
+        # Average rate per year across all series, and the average change into each year
+        yearly = annual.groupby("year", sort=True)["amount"].agg(["mean", "size"])
+        yearly_changes = annual.groupby("year", sort=True)["change"].mean().dropna()
+
+        # CAGR of the average rate between the first and last year of the period
+        cagr = 0.0
+        if len(yearly) > 1:
+            cagr = self.calculate_cagr(float(yearly["mean"].iloc[0]), float(yearly["mean"].iloc[-1]),
+                                       int(yearly.index[-1] - yearly.index[0]))
+
+        trends = {
+            "total_rates": len(frame),
+            "historical_rates": [
+                {"year": int(year), "amount": round(float(row["mean"]), 2), "count": int(row["size"])}
+                for year, row in yearly.iterrows()
+            ],
+            "rate_changes": [
+                {"year": int(year), "change": round(float(change), 4)}
+                for year, change in yearly_changes.items()
+            ],
+            "average_rate_change": round(float(changes.mean()), 4) if len(changes) else 0,
+            "rate_change_distribution": self.calculate_rate_distribution(changes.to_numpy()),
+            "cagr": cagr,
+        }
+        for key, column in breakdowns.items():
+            trends[key] = calculate_group_trends(annual, column)
+        return trends
+
     def calculate_cagr(self, start_value: float, end_value: float, years: int) -> float:
         """
         Calculates the Compound Annual Growth Rate for rates over a specified period
@@ -337,14 +374,15 @@ class RateTrendsAnalyzer:
         Args:
             entity_type: Type of entity ('attorney', 'client', 'firm')
             entity_id: UUID of the entity
-            related_id: Optional UUID of a related entity (e.g., client for attorney trends)
-            group_by: Optional field to group data by (e.g., 'staff_class', 'office')
-            start_date: Optional start date for the time series
+            related_id: Optional UUID of a related entity (the client for attorney and firm trends, the firm for client trends)
+            group_by: Optional dimension to group data by (one of TREND_GROUP_COLUMNS, e.g. 'staff_class', 'office', 'firm')
+            start_date: Optional start date for the time series (default: start of the year DEFAULT_TREND_YEARS ago)
             end_date: Optional end date for the time series
             currency: Optional currency to convert all amounts to
         
         Returns:
-            Time series data structured for visualization in charts
+            Time series data structured for visualization in charts, with the average rate and rate count of each
+            effective date per group
         """
         # Set default values for optional parameters if not provided
         if currency is None:
@@ -353,50 +391,18 @@ class RateTrendsAnalyzer:
         # Validate entity_type is one of 'attorney', 'client', 'firm'
         if entity_type not in ['attorney', 'client', 'firm']:
             raise ValueError("Invalid entity_type. Must be 'attorney', 'client', or 'firm'")
+        if group_by and group_by not in TREND_GROUP_COLUMNS:
+            raise ValueError(f"Invalid group_by. Must be one of {', '.join(TREND_GROUP_COLUMNS)}")
+        start_date = self._window_start(start_date, DEFAULT_TREND_YEARS)
         
-        # Retrieve appropriate rate data based on entity_type and entity_id
-        if entity_type == 'attorney':
-            rates = self.rate_repository.get_by_attorney(entity_id, related_id, start_date, end_date)
-        elif entity_type == 'client':
-            rates = self.rate_repository.get_by_client(entity_id, related_id, start_date, end_date)
-        elif entity_type == 'firm':
-            rates = self.rate_repository.get_by_firm(entity_id, related_id, start_date, end_date)
-        
-        # Apply filtering by related_id if provided
-        if related_id:
-            rates = [rate for rate in rates if str(getattr(rate, entity_type + '_id')) == related_id]
+        # Load the entity's rates, scoped by the related entity, reusing a frame already loaded for its trends
+        frame = self._load_entity_frame(entity_type, entity_id, related_id, currency, start_date, end_date)
         
-        # Convert all rates to the specified currency
-        converted_rates = []
-        for rate in rates:
-            converted_rate = convert_currency(rate.amount, rate.currency, currency)
-            converted_rates.append({"effective_date": rate.effective_date, "amount": converted_rate})
+        # Average the rates of each effective date, per group when group_by is given
+        time_series_data = build_time_series(frame, TREND_GROUP_COLUMNS[group_by] if group_by else None)
         
-        # Group data according to group_by parameter if provided (e.g., by staff_class, office, etc.)
-        if group_by:
-            grouped_rates = {}
-            for rate in converted_rates:
-                group_value = getattr(rate, group_by, 'Unknown')
-                if group_value not in grouped_rates:
-                    grouped_rates[group_value] = []
-                grouped_rates[group_value].append(rate)
-        else:
-            grouped_rates = {'All': converted_rates}
-        
-        # Organize data into time series format suitable for visualization
-        time_series_data = {}
-        for group, rates in grouped_rates.items():
-            time_series_data[group] = []
-            for rate in rates:
-                time_series_data[group].append({
-                    "date": rate["effective_date"].isoformat(),
-                    "value": float(rate["amount"])
-                })
-        
-        # Include inflation/CPI data for comparison
-        start_year = get_current_date().year - 5
-        end_year = get_current_date().year
-        inflation_data = self.get_inflation_for_period(start_year, end_year)
+        # Include inflation/CPI data for the same period for comparison
+        inflation_data = self.get_inflation_for_period(start_date.year, get_current_date().year)
         
         # Return the formatted time series data
         return {
@@ -405,7 +411,7 @@ class RateTrendsAnalyzer:
             "related_id": related_id,
             "group_by": group_by,
             "currency": currency,
-            "start_date": start_date.isoformat() if start_date else None,
+            "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat() if end_date else None,
             "time_series_data": time_series_data,
             "inflation": inflation_data
@@ -421,31 +427,74 @@ class RateTrendsAnalyzer:
             years: Number of years to analyze
         
         Returns:
-            Analysis of seasonal patterns in rate changes
+            Analysis of seasonal patterns in rate changes: counts of changes by month and quarter of their
+            effective date, the most common month and its share of all changes
         """
+        if entity_type not in ['attorney', 'client', 'firm']:
+            raise ValueError("Invalid entity_type. Must be 'attorney', 'client', or 'firm'")
+        if years is None:
+            years = DEFAULT_TREND_YEARS
+
         # Retrieve historical rate data for the specified entity
-        # Determine the timing of rate changes (month, quarter) over multiple years
-        # Identify patterns in when rate changes typically occur
+        frame = self._load_entity_frame(entity_type, entity_id, None, DEFAULT_CURRENCY,
+                                        start_date=self._window_start(None, years))
+
+        # A rate change is a rate that differs from the previous rate of the same attorney for the same client
+        ordered = frame.sort_values(RATE_SERIES_COLUMNS + ["effective_date"], kind="mergesort")
+        previous_amount = ordered.groupby(RATE_SERIES_COLUMNS, sort=False)["amount"].shift()
+        changes = ordered.loc[previous_amount.notna() & (ordered["amount"] != previous_amount), "effective_date"]
+
         # Calculate frequency statistics for rate change timing
-        # Return the seasonal pattern analysis
-        return {}
+        by_month = changes.dt.month.value_counts().reindex(range(1, 13), fill_value=0)
+        by_quarter = changes.dt.quarter.value_counts().reindex(range(1, 5), fill_value=0)
+        total_changes = int(by_month.sum())
+        most_common_month = int(by_month.idxmax()) if total_changes else None
+
+        return {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "years": years,
+            "total_changes": total_changes,
+            "by_month": {int(month): int(count) for month, count in by_month.items()},
+            "by_quarter": {int(quarter): int(count) for quarter, count in by_quarter.items()},
+            "most_common_month": most_common_month,
+            "most_common_month_share": round(float(by_month.max()) / total_changes, 4) if total_changes else 0,
+        }
 
-    def calculate_rate_distribution(self, rate_changes: List[float]) -> dict:
+    def calculate_rate_distribution(self, rate_changes: Union[List[float], numpy.ndarray]) -> dict:
         """
         Calculates the distribution of rate increases across different percentile ranges
         
         Args:
-            rate_changes: List of rate changes
+            rate_changes: List or array of rate changes; missing (NaN) changes are ignored
         
         Returns:
-            Rate change distribution statistics
+            Rate change distribution statistics, or an empty dict when there are no changes
         """
-        # Calculate percentiles (10th, 25th, 50th, 75th, 90th) of rate changes
-        # Determine the mean and median rate changes
-        # Calculate standard deviation to measure variability
+        values = numpy.asarray(rate_changes, dtype=float)
+        values = values[~numpy.isnan(values)]
+        if not values.size:
+            return {}
+
+        # Calculate all percentiles in one pass over the sorted changes
+        percentiles = numpy.percentile(values, list(DISTRIBUTION_PERCENTILES.values()))
+
         # Create histogram data for visualization
-        # Return the distribution statistics
-        return {}
+        counts, edges = numpy.histogram(values, bins=DISTRIBUTION_HISTOGRAM_BINS)
+
+        distribution = {
+            "count": int(values.size),
+            "mean": round(float(values.mean()), 4),
+            "median": round(float(numpy.median(values)), 4),
+            "standard_deviation": round(float(values.std()), 4),
+        }
+        for name, value in zip(DISTRIBUTION_PERCENTILES, percentiles):
+            distribution[name] = round(float(value), 4)
+        distribution["histogram"] = {
+            "bin_edges": [round(float(edge), 4) for edge in edges],
+            "counts": [int(count) for count in counts],
+        }
+        return distribution
 
     def predict_future_rates(self, entity_type: str, entity_id: str, related_id: Optional[str] = None,
                                 years_ahead: Optional[int] = 1, model_type: Optional[str] = 'linear') -> dict:
@@ -457,17 +506,39 @@ class RateTrendsAnalyzer:
             entity_id: UUID of the entity
             related_id: Optional UUID of a related entity (e.g., client for attorney trends)
             years_ahead: Number of years to forecast
-            model_type: Type of forecasting model ('linear', 'exponential', etc.)
+            model_type: Type of forecasting model (one of FORECAST_MODELS: 'linear', 'exponential', 'damped')
         
         Returns:
-            Predicted future rates and confidence intervals
+            Predicted future rates and confidence intervals of every attorney and staff class series, and the
+            average predicted rate per year
         """
-        # Retrieve historical rate data for the entity
-        # Apply the specified forecasting model (linear, exponential, etc.)
-        # Calculate predicted rates for each year in the forecast period
-        # Calculate confidence intervals for the predictions
-        # Return the forecast data
-        return {}
+        if entity_type not in ['attorney', 'client', 'firm']:
+            raise ValueError("Invalid entity_type. Must be 'attorney', 'client', or 'firm'")
+        if years_ahead is None:
+            years_ahead = 1
+        if model_type is None:
+            model_type = 'linear'
+
+        # Retrieve the entity's full rate history and forecast all of its series at once,
+        # refitting only series whose rates changed since the cached fit
+        frame = self._load_entity_frame(entity_type, entity_id, related_id, DEFAULT_CURRENCY)
+        forecast = forecast_rates(
+            frame, model_type, years_ahead,
+            cache_key=forecast_cache_key(entity_type, entity_id, related_id, model_type, DEFAULT_CURRENCY),
+        )
+
+        logger.info(f"Forecast {forecast['series_count']} rate series for {entity_type} {entity_id}, "
+                    f"{forecast['refitted']} refitted")
+        return {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "related_id": related_id,
+            "model_type": model_type,
+            "years_ahead": years_ahead,
+            "currency": DEFAULT_CURRENCY,
+            "confidence_level": DEFAULT_CONFIDENCE_LEVEL,
+            **forecast
+        }
 
     def compare_with_market_indicators(self, rate_changes: List[float], years: List[int],
                                         indicators: Optional[List[str]] = None) -> dict:
@@ -486,4 +557,144 @@ class RateTrendsAnalyzer:
         # Calculate correlation between rate changes and each indicator
         # Create visualization data showing rates vs. indicators over time
         # Return the comparative analysis
-        return {}
\ No newline at end of file
+        return {}
+
+
+def load_rate_trend_frame(rate_repository: RateRepository, currency: str, attorney_id: Optional[str] = None,
+                          client_id: Optional[str] = None, firm_id: Optional[str] = None,
+                          start_date: Optional[date] = None, end_date: Optional[date] = None) -> pandas.DataFrame:
+    """
+    Loads rate history into a columnar frame with one query and converts every amount to a currency
+
+    Args:
+        rate_repository: Repository for rate data access
+        currency: Currency to convert all amounts to, as of each rate's effective date
+        attorney_id: Optional UUID of the attorney to load rates for
+        client_id: Optional UUID of the client to load rates for
+        firm_id: Optional UUID of the law firm to load rates for
+        start_date: Optional earliest effective date
+        end_date: Optional latest effective date
+
+    Returns:
+        DataFrame with the TREND_FRAME_COLUMNS and a year column, ordered by attorney, client and effective date
+    """
+    rows = rate_repository.get_trend_rows(attorney_id=attorney_id, client_id=client_id, firm_id=firm_id,
+                                          start_date=start_date, end_date=end_date)
+    frame = pandas.DataFrame.from_records(rows, columns=TREND_FRAME_COLUMNS)
+
+    # Coerce columns into comparable, vectorizable types
+    frame[TREND_ID_COLUMNS] = frame[TREND_ID_COLUMNS].astype(str)
+    frame[TREND_LABEL_COLUMNS] = frame[TREND_LABEL_COLUMNS].fillna(UNSPECIFIED_GROUP)
+    frame["effective_date"] = pandas.to_datetime(frame["effective_date"])
+    frame["amount"] = frame["amount"].astype(float)
+    frame["year"] = frame["effective_date"].dt.year
+
+    # Convert every amount as of its effective date in one vectorized lookup
+    if not frame.empty:
+        load_historical_exchange_rates(frame["effective_date"].min().date(), frame["effective_date"].max().date())
+        frame = get_exchange_rate_table().convert_frame(frame, currency, date_column="effective_date")
+
+    logger.debug(f"Loaded {len(frame)} rates for trend analysis")
+    return frame
+
+
+def calculate_annual_rate_changes(frame: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Reduces a rate trend frame to one rate per attorney, client and year with its year-over-year change
+
+    The rate of a year is the last rate that took effect in it. The change is relative to the same
+    attorney's rate for the same client in the previous year that has a rate, annualized when years
+    were skipped, and NaN for the first year of each series.
+
+    Args:
+        frame: Rate trend frame from load_rate_trend_frame
+
+    Returns:
+        DataFrame with the series, year, amount, dimension and change columns
+    """
+    if frame.empty:
+        return frame.assign(change=pandas.Series(dtype=float))
+
+    annual = frame.sort_values(RATE_SERIES_COLUMNS + ["effective_date"], kind="mergesort").groupby(
+        RATE_SERIES_COLUMNS + ["year"], sort=True, as_index=False
+    ).last()
+
+    series = annual.groupby(RATE_SERIES_COLUMNS, sort=False)
+    previous_amount = series["amount"].shift()
+    gap = annual["year"] - series["year"].shift()
+    ratio = (annual["amount"] / previous_amount.where(previous_amount > 0)) ** (1 / gap)
+    annual["change"] = ratio - 1
+    return annual
+
+
+def calculate_group_trends(annual: pandas.DataFrame, column: str) -> Dict[str, Dict]:
+    """
+    Calculates rate trend statistics for every group of a column in one groupby
+
+    Args:
+        annual: Annual rates from calculate_annual_rate_changes
+        column: Column to group the rates by
+
+    Returns:
+        Statistics keyed by group value: rate and attorney counts, the average rate of the group's latest
+        year, the average year-over-year change and the CAGR of the group's yearly average rate
+    """
+    if annual.empty:
+        return {}
+
+    summary = annual.groupby(column, sort=True).agg(
+        rate_count=("amount", "size"),
+        attorney_count=("attorney_id", "nunique"),
+        average_change=("change", "mean"),
+    )
+
+    # CAGR of each group's yearly average rate between its first and last year
+    yearly = annual.groupby([column, "year"], sort=True, as_index=False)["amount"].mean()
+    span = yearly.groupby(column, sort=True).agg(
+        first_year=("year", "first"), last_year=("year", "last"),
+        first_rate=("amount", "first"), last_rate=("amount", "last"),
+    )
+    years = span["last_year"] - span["first_year"]
+    valid = (span["first_rate"] > 0) & (span["last_rate"] > 0) & (years > 0)
+    cagr = ((span["last_rate"] / span["first_rate"]) ** (1 / years.where(valid, 1)) - 1) * 100
+    summary["average_rate"] = span["last_rate"]
+    summary["cagr"] = cagr.where(valid, 0.0)
+    summary["average_change"] = summary["average_change"].fillna(0.0)
+
+    return {
+        str(group): {
+            "rate_count": int(row["rate_count"]),
+            "attorney_count": int(row["attorney_count"]),
+            "average_rate": round(float(row["average_rate"]), 2),
+            "average_change": round(float(row["average_change"]), 4),
+            "cagr": round(float(row["cagr"]), 2),
+        }
+        for group, row in summary.to_dict("index").items()
+    }
+
+
+def build_time_series(frame: pandas.DataFrame, group_column: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """
+    Builds chart series of the average rate on each effective date, per group of a column
+
+    Args:
+        frame: Rate trend frame from load_rate_trend_frame
+        group_column: Optional column to group the series by; all rates form one 'All' series otherwise
+
+    Returns:
+        Lists of {date, value, count} points keyed by group, in date order
+    """
+    if frame.empty:
+        return {}
+
+    keys = [group_column, "effective_date"] if group_column else ["effective_date"]
+    points = frame.groupby(keys, sort=True)["amount"].agg(["mean", "size"]).reset_index()
+    groups = points[group_column].astype(str) if group_column else pandas.Series("All", index=points.index)
+    dates = points["effective_date"].dt.strftime("%Y-%m-%d")
+
+    time_series_data: Dict[str, List[Dict]] = {}
+    for group, point_date, value, count in zip(groups, dates, points["mean"].round(2), points["size"]):
+        time_series_data.setdefault(group, []).append(
+            {"date": point_date, "value": float(value), "count": int(count)}
+        )
+    return time_series_data
@@ -197,7 +197,8 @@ def validate_access_token(token: str) -> Dict:
         "user_id": uuid.UUID(user_id),
         "email": email,
         "organization_id": uuid.UUID(organization_id),
-        "role": role
+        "role": role,
+        "jti": payload.get("jti")
     }
 
 
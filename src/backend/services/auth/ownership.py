@@ -0,0 +1,86 @@
+"""
+Entity ownership resolution for access control in the Justice Bid Rate Negotiation System.
+
+Maps (entity type, ID) pairs for rates, negotiations, messages, documents, OCGs, peer groups
+and attorneys to the organizations owning them. Lookups are batched, one query per entity type
+for a whole list of IDs, and cached per process until the entity's owners change.
+"""
+
+import uuid
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+from src.backend.db.repositories.ownership_repository import OWNED_ENTITY_TYPES, OwnershipRepository
+from src.backend.db.session import get_read_db
+from src.backend.utils.logging import logger
+from src.backend.utils.ownership_cache import cache_owners, get_cached_owners
+
+
+class EntityOwnershipResolver:
+    """
+    Resolves the organizations owning entities, batching database lookups and caching results.
+    """
+
+    def __init__(self, repository_factory: Optional[Callable[[], OwnershipRepository]] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            repository_factory: Function returning the OwnershipRepository to query, defaults to one
+                on the read database session
+        """
+        self._repository_factory = repository_factory or (lambda: OwnershipRepository(get_read_db()))
+
+    def resolve(self, entity_type: str, entity_id: Any) -> FrozenSet[uuid.UUID]:
+        """
+        Get the organizations owning an entity.
+
+        Args:
+            entity_type: Type of the entity (e.g. "rate", "negotiation")
+            entity_id: ID of the entity
+
+        Returns:
+            Owning organization IDs, empty if the entity does not exist
+        """
+        return self.resolve_many(entity_type, [entity_id])[entity_id]
+
+    def resolve_many(self, entity_type: str, entity_ids: Iterable[Any]) -> Dict[Any, FrozenSet[uuid.UUID]]:
+        """
+        Get the organizations owning several entities of one type.
+
+        Cached owners are served from the ownership cache; all remaining IDs are resolved
+        together with a single query.
+
+        Args:
+            entity_type: Type of the entities
+            entity_ids: IDs of the entities
+
+        Returns:
+            Dictionary mapping each requested ID to its owning organization IDs, empty for
+            entities that do not exist
+
+        Raises:
+            ValueError: If the entity type is not supported
+        """
+        if entity_type not in OWNED_ENTITY_TYPES:
+            raise ValueError(f"Unsupported entity type for ownership: {entity_type}")
+
+        entity_ids = list(dict.fromkeys(entity_ids))
+        owners = get_cached_owners(entity_type, entity_ids)
+        missing = [entity_id for entity_id in entity_ids if entity_id not in owners]
+        if missing:
+            found = self._repository_factory().get_owner_organization_ids(entity_type, missing)
+            resolved = {
+                entity_id: frozenset(found[str(entity_id)])
+                for entity_id in missing
+                if str(entity_id) in found
+            }
+            # Missing entities are not cached so that they resolve once they are created
+            cache_owners(entity_type, resolved)
+            owners.update(resolved)
+            logger.debug(f"Resolved owners of {len(missing)} {entity_type} entities, {len(resolved)} found")
+
+        return {entity_id: owners.get(entity_id, frozenset()) for entity_id in entity_ids}
+
+
+# Initialize the resolver
+ownership_resolver = EntityOwnershipResolver()
@@ -0,0 +1,117 @@
+"""
+Authenticated principal for the Justice Bid Rate Negotiation System.
+
+A principal is the part of a user that authentication and RBAC need on every request:
+identity, organization, roles, compiled effective permissions and the active flag.
+Principals are cached per access token by require_auth so that an authenticated request
+does not have to load the user from the database.
+"""
+
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.backend.db.models.user import User  # User model the principal is hydrated from
+from src.backend.services.auth.rbac import PermissionSet, get_user_roles, role_manager  # Role resolution and role permissions
+from src.backend.utils.constants import UserRole  # Role enumeration stored on users
+
+
+@dataclass
+class AuthenticatedPrincipal:
+    """
+    Snapshot of an authenticated user.
+
+    Attributes that are not part of the snapshot (preferences, MFA settings, ...) are
+    read from and written to the full User, which is loaded at most once per request
+    through the loader attached by bind(). Writes to snapshot fields of a bound
+    principal are applied to the User as well.
+    """
+
+    id: uuid.UUID  # ID of the user
+    organization_id: uuid.UUID  # ID of the user's organization
+    email: str  # Email address of the user
+    name: str  # Full name of the user
+    role: UserRole  # Primary role of the user
+    permissions: Dict[str, Any]  # Permissions granted directly to the user
+    roles: Tuple[str, ...]  # Role codes held by the user
+    effective_permissions: PermissionSet  # Permissions granted directly or by the user's roles and the roles they inherit
+    is_active: bool  # Whether the account is active
+    mfa_enabled: bool  # Whether the user has multi-factor authentication enabled
+    _loader: Optional[Callable[[uuid.UUID], Optional[User]]] = field(default=None, repr=False, compare=False)
+    _user: Optional[User] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_user(cls, user: User) -> 'AuthenticatedPrincipal':
+        """
+        Hydrate a principal from a user.
+
+        Args:
+            user: The User to snapshot
+
+        Returns:
+            A principal holding the user's identity, roles and effective permissions
+        """
+        roles = tuple(get_user_roles(user))
+
+        return cls(
+            id=user.id,
+            organization_id=user.organization_id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            permissions=dict(user.permissions or {}),
+            roles=roles,
+            effective_permissions=role_manager.get_permission_set(roles, user.permissions or ()),
+            is_active=user.is_active,
+            mfa_enabled=user.mfa_enabled,
+        )
+
+    def bind(self, loader: Callable[[uuid.UUID], Optional[User]],
+             user: Optional[User] = None) -> 'AuthenticatedPrincipal':
+        """
+        Get a per-request copy of the principal that can load the full user on demand.
+
+        The cached principal is shared between requests and threads, so the loaded user
+        is only ever stored on the copy.
+
+        Args:
+            loader: Function loading a User by ID
+            user: The User, if the request has already loaded it
+
+        Returns:
+            A copy of the principal bound to the loader
+        """
+        bound = replace(self, _loader=loader)
+        bound._user = user
+        return bound
+
+    def _load_user(self) -> Optional[User]:
+        # Load the full user once per bound copy
+        if self._user is None and self._loader is not None:
+            self._user = self._loader(self.id)
+        return self._user
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not part of the snapshot
+        if name.startswith('_'):
+            raise AttributeError(name)
+        user = self._load_user()
+        if user is None:
+            raise AttributeError(name)
+        return getattr(user, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+            return
+        if name in self.__dataclass_fields__:
+            object.__setattr__(self, name, value)
+            # Snapshot fields changed after hydration are mirrored onto the bound user, so a commit persists them
+            if self.__dict__.get('_loader') is not None and self._load_user() is not None:
+                setattr(self._user, name, value)
+            return
+        # Other attributes only exist on the user, e.g. mfa_secret or preferences
+        user = self._load_user()
+        if user is None:
+            raise AttributeError(f"Cannot set '{name}' on a principal without a bound user")
+        setattr(user, name, value)
@@ -6,7 +6,7 @@ Handles role definitions, permission checking, and access control at organizatio
 import enum  # latest
 import uuid  # latest
 from dataclasses import dataclass  # latest
-from typing import Dict, List, Optional, Callable  # latest
+from typing import Dict, FrozenSet, Iterable, List, Optional, Callable, Tuple  # latest
 
 import sqlalchemy  # ~=1.4.0
 from sqlalchemy.orm import Session
@@ -15,11 +15,9 @@ from src.backend.db.models.organization import Organization  # Access organizati
 from src.backend.db.models.user import User  # Access user model for role and permission information
 from src.backend.db.repositories.user_repository import UserRepository  # Data access for user information
 from src.backend.services.auth.jwt import verify_token  # Verify authentication tokens to extract user information
-from src.backend.services.auth.permissions import (  # Check individual permissions for RBAC validation
-    Permission,
-    get_permissions_for_action,  # Get required permissions for specific actions
-)
+from src.backend.services.auth.ownership import ownership_resolver  # Resolve the organizations owning entities
 from src.backend.utils.logging import logger  # Logging activities and error handling
+from src.backend.utils.principal_cache import clear_principal_cache  # Cached principals hold flattened role permissions
 from src.backend.utils.security import secure_compare  # Securely compare strings to prevent timing attacks
 
 
@@ -32,6 +30,110 @@ APPROVER_ROLE = "approver"  # Role for users who can approve rates
 ANALYST_ROLE = "analyst"  # Role for users who can view analytics
 STANDARD_USER_ROLE = "standard_user"  # Basic user role with limited permissions
 
+PERMISSION_SEPARATOR = ":"  # Separator between the segments of a permission code
+WILDCARD = "*"  # Wildcard permission segment
+PERMISSION_SET_CACHE_MAX_ENTRIES = 1024  # Compiled (roles, direct permissions) combinations kept before reset
+
+# Permission code prefix of each entity type whose access is checked by can_access_entities
+ENTITY_PERMISSION_PREFIXES = {
+    "rate": "rates",
+    "negotiation": "negotiations",
+    "message": "messages",
+    "document": "documents",
+    "ocg": "ocg",
+    "peer_group": "organizations",
+    "attorney": "attorneys",
+}
+PEER_GROUP_MANAGE_PERMISSION = "organizations:manage_peer_groups"  # Required for every peer group action but read
+
+
+class PermissionSet:
+    """
+    Immutable, precompiled set of permissions supporting O(1) membership checks.
+
+    Exact permissions are kept in a frozenset; wildcard permissions ("rates:*", "*") are
+    kept as frozenset of their prefixes, so a check costs one lookup per segment of the
+    permission being checked instead of a scan over every granted permission.
+    """
+
+    __slots__ = ('exact', 'wildcards')
+
+    def __init__(self, permissions: Iterable[str] = ()):
+        """
+        Compile a set of permissions.
+
+        Args:
+            permissions: Permission codes, optionally ending in a "*" wildcard segment
+        """
+        exact = set()
+        wildcards = set()
+        for permission in permissions:
+            if permission == WILDCARD:
+                wildcards.add("")
+            elif permission.endswith(PERMISSION_SEPARATOR + WILDCARD):
+                wildcards.add(permission[:-len(WILDCARD)])  # Keep the trailing separator: "rates:*" -> "rates:"
+            else:
+                exact.add(permission)
+        self.exact: FrozenSet[str] = frozenset(exact)
+        self.wildcards: FrozenSet[str] = frozenset(wildcards)
+
+    def __contains__(self, permission: str) -> bool:
+        """
+        Check if the set grants a permission, either exactly or through a wildcard.
+
+        Args:
+            permission: The permission to check for
+
+        Returns:
+            True if the permission is granted, False otherwise
+        """
+        if permission in self.exact:
+            return True
+        if not self.wildcards:
+            return False
+        if "" in self.wildcards:
+            return True
+        index = permission.find(PERMISSION_SEPARATOR)
+        while index != -1:
+            if permission[:index + 1] in self.wildcards:
+                return True
+            index = permission.find(PERMISSION_SEPARATOR, index + 1)
+        return False
+
+    def __iter__(self):
+        yield from self.exact
+        for prefix in self.wildcards:
+            yield prefix + WILDCARD
+
+    def __len__(self) -> int:
+        return len(self.exact) + len(self.wildcards)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PermissionSet):
+            return NotImplemented
+        return self.exact == other.exact and self.wildcards == other.wildcards
+
+    def __hash__(self) -> int:
+        return hash((self.exact, self.wildcards))
+
+    def __repr__(self) -> str:
+        return f"PermissionSet({sorted(self)!r})"
+
+    def union(self, *others: 'PermissionSet') -> 'PermissionSet':
+        """
+        Combine permission sets without recompiling their permissions.
+
+        Args:
+            others: Permission sets to combine with this one
+
+        Returns:
+            A permission set granting everything any of the sets grants
+        """
+        combined = PermissionSet()
+        combined.exact = self.exact.union(*(other.exact for other in others))
+        combined.wildcards = self.wildcards.union(*(other.wildcards for other in others))
+        return combined
+
 
 @dataclass
 class Role:
@@ -67,6 +169,9 @@ class Role:
         self.organization_type = organization_type
 
 
+EMPTY_PERMISSION_SET = PermissionSet()  # Permissions of users holding no registered role
+
+
 class RoleManager:
     """
     Manages role definitions, assignments, and permission checks throughout the system.
@@ -78,6 +183,8 @@ class RoleManager:
         """
         self._roles: Dict[str, Role] = {}  # Dictionary to store registered roles
         self._role_hierarchy: Dict[str, List[str]] = {}  # Dictionary to store role hierarchy
+        self._compiled: Optional[Dict[str, PermissionSet]] = None  # Effective permissions per role, built lazily
+        self._permission_sets: Dict[Tuple[Tuple[str, ...], FrozenSet[str]], PermissionSet] = {}  # Compiled user sets
         self._register_all()  # Register system-defined roles
         self._setup_role_hierarchy()  # Set up role hierarchy relationships
 
@@ -89,6 +196,7 @@ class RoleManager:
             role: The Role object to register
         """
         self._roles[role.code] = role  # Add the role to the roles dictionary
+        self._invalidate_compiled()
         logger.info(f"Registered role: {role.code}")  # Log the registration of the new role
 
     def get_role(self, role_code: str) -> Optional[Role]:
@@ -134,12 +242,10 @@ class RoleManager:
             permission: The permission to check for
 
         Returns:
-            True if the role has the permission, False otherwise
+            True if the role or one of the roles it inherits grants the permission, False otherwise
         """
-        role = self.get_role(role_code)  # Get the role by its code
-        if role:
-            return permission in role.permissions  # Check if the permission is in the role's permissions list
-        return False
+        permission_set = self._compile().get(role_code)
+        return permission_set is not None and permission in permission_set
 
     def set_parent_role(self, parent_role_code: str, child_role_code: str) -> None:
         """
@@ -156,6 +262,7 @@ class RoleManager:
             self._role_hierarchy[parent_role_code] = []
 
         self._role_hierarchy[parent_role_code].append(child_role_code)
+        self._invalidate_compiled()
 
     def get_effective_permissions(self, role_code: str) -> List[str]:
         """
@@ -165,18 +272,68 @@ class RoleManager:
             role_code: The code of the role to get permissions for
 
         Returns:
-            Set of all permissions effective for the role
-        """
-        effective_permissions = set()
-        role = self.get_role(role_code)
-        if role:
-            effective_permissions.update(role.permissions)
-            inherited_roles = self._get_inherited_roles(role_code)
-            for inherited_role_code in inherited_roles:
-                inherited_role = self.get_role(inherited_role_code)
-                if inherited_role:
-                    effective_permissions.update(inherited_role.permissions)
-        return list(effective_permissions)
+            List of all permissions effective for the role
+        """
+        permission_set = self._compile().get(role_code)
+        return list(permission_set) if permission_set is not None else []
+
+    def get_permission_set(self, role_codes: Iterable[str],
+                           permissions: Iterable[str] = ()) -> PermissionSet:
+        """
+        Get the compiled permissions of a combination of roles and directly granted permissions.
+
+        Combinations are compiled once and reused until a role or the hierarchy changes.
+
+        Args:
+            role_codes: Codes of the roles held
+            permissions: Permissions granted directly
+
+        Returns:
+            PermissionSet granting the effective permissions of every role plus the direct permissions
+        """
+        role_codes = tuple(role_codes)
+        if not permissions and len(role_codes) == 1:
+            return self._compile().get(role_codes[0], EMPTY_PERMISSION_SET)
+
+        key = (role_codes, frozenset(permissions))
+        permission_set = self._permission_sets.get(key)
+        if permission_set is None:
+            compiled = self._compile()
+            permission_set = PermissionSet(key[1]).union(
+                *(compiled[role_code] for role_code in key[0] if role_code in compiled)
+            )
+            if len(self._permission_sets) >= PERMISSION_SET_CACHE_MAX_ENTRIES:
+                self._permission_sets = {}
+            self._permission_sets[key] = permission_set
+        return permission_set
+
+    def _compile(self) -> Dict[str, PermissionSet]:
+        """
+        Get the effective permissions of every role, compiling them on first use after a change.
+
+        Returns:
+            Dictionary mapping role codes to their compiled transitive permissions
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = {}
+            for role_code, role in self._roles.items():
+                permissions = set(role.permissions)
+                for inherited_role_code in self._get_inherited_roles(role_code):
+                    inherited_role = self.get_role(inherited_role_code)
+                    if inherited_role:
+                        permissions.update(inherited_role.permissions)
+                compiled[role_code] = PermissionSet(permissions)
+            self._compiled = compiled
+        return compiled
+
+    def _invalidate_compiled(self) -> None:
+        """
+        Drop compiled permissions after a role or the hierarchy changed.
+        """
+        self._compiled = None
+        self._permission_sets = {}
+        clear_principal_cache()  # Cached principals hold the previously compiled permissions
 
     def _get_inherited_roles(self, role_code: str) -> List[str]:
         """
@@ -462,17 +619,44 @@ def has_permission(user: User, permission: str) -> bool:
     Returns:
         True if user has the permission, False otherwise
     """
-    # Check if the user has the permission directly
-    if user.permissions and permission in user.permissions:
-        return True
+    return permission in get_user_permission_set(user)
 
-    # Check if any of the user's roles have the permission
-    user_roles = get_user_roles(user)
-    for role in user_roles:
-        if role_manager.has_permission(role, permission):
-            return True
 
-    return False
+def check_many(user: User, permissions: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check a batch of permissions for a user at once.
+
+    The user's permissions are resolved once, after which every permission costs a
+    constant-time lookup, so endpoints and resolvers can authorize a whole batch together.
+
+    Args:
+        user: The User object to check
+        permissions: The permissions to check for
+
+    Returns:
+        Dictionary mapping each permission to whether the user has it
+    """
+    permission_set = get_user_permission_set(user)
+    return {permission: permission in permission_set for permission in permissions}
+
+
+def get_user_permission_set(user: User) -> PermissionSet:
+    """
+    Get the compiled effective permissions of a user.
+
+    Args:
+        user: The User object to get permissions for
+
+    Returns:
+        PermissionSet granting the user's direct permissions and those of their roles,
+        including permissions inherited through the role hierarchy
+    """
+    # Authenticated principals carry their compiled permissions
+    effective_permissions = getattr(user, 'effective_permissions', None)
+    if isinstance(effective_permissions, PermissionSet):
+        return effective_permissions
+
+    return role_manager.get_permission_set(get_user_roles(user), user.permissions or ())
 
 
 def can_access_organization(user: User, organization_id: uuid.UUID) -> bool:
@@ -494,6 +678,25 @@ def can_access_organization(user: User, organization_id: uuid.UUID) -> bool:
     return False
 
 
+def get_permissions_for_action(entity_type: str, action: str) -> List[str]:
+    """
+    Get the permissions required to perform an action on an entity type.
+
+    Args:
+        entity_type: The type of entity (e.g., "rate", "negotiation")
+        action: The action being performed (e.g., "read", "update")
+
+    Returns:
+        Permission codes the user must all hold, empty for unknown entity types
+    """
+    prefix = ENTITY_PERMISSION_PREFIXES.get(entity_type)
+    if prefix is None:
+        return []
+    if entity_type == "peer_group" and action != "read":
+        return [PEER_GROUP_MANAGE_PERMISSION]
+    return [f"{prefix}{PERMISSION_SEPARATOR}{action}"]
+
+
 def can_access_entity(user: User, entity_type: str, entity_id: uuid.UUID, action: str) -> bool:
     """
     Check if a user can access a specific entity (rate, negotiation, etc.).
@@ -507,36 +710,55 @@ def can_access_entity(user: User, entity_type: str, entity_id: uuid.UUID, action
     Returns:
         True if user can access the entity for the specified action, False otherwise
     """
-    # Determine organization ownership of the entity (replace with actual logic)
-    organization_id = _get_entity_organization_id(entity_type, entity_id)
-    if not organization_id:
-        logger.warning(f"Could not determine organization for entity {entity_type} with ID {entity_id}")
-        return False
-
-    if not can_access_organization(user, organization_id):  # Check if user has access to the organization
-        return False
+    return can_access_entities(user, entity_type, [entity_id], action)[entity_id]
 
-    required_permissions = get_permissions_for_action(entity_type, action)  # Get required permissions for the action
-    if not required_permissions:
-        logger.warning(f"No permissions defined for action {action} on entity type {entity_type}")
-        return False
 
-    for permission in required_permissions:  # Check if user has the required permissions
-        if not has_permission(user, permission):
-            return False
+def can_access_entities(user: User, entity_type: str, entity_ids: List[uuid.UUID], action: str) -> Dict[uuid.UUID, bool]:
+    """
+    Check if a user can access each of several entities of one type, e.g. a page of a listing.
 
-    return True  # Return True if all checks pass
+    The owners of all entities are resolved with one batched lookup and the required
+    permissions are checked once for the whole batch.
 
+    Args:
+        user: The User object to check
+        entity_type: The type of entity (e.g., "rate", "negotiation")
+        entity_ids: The IDs of the entities to check access to
+        action: The action being performed on the entities (e.g., "read", "update")
 
-def _get_entity_organization_id(entity_type: str, entity_id: uuid.UUID) -> Optional[uuid.UUID]:
-    """
-    Helper function to determine the organization ID for a given entity.
-    (Replace with actual implementation using database queries or similar)
+    Returns:
+        Dictionary mapping each entity ID to whether the user can access it for the action
     """
-    # Placeholder implementation - replace with actual logic to retrieve the organization ID
-    # based on the entity type and ID. This is just a stub and needs to be implemented
-    # based on the data model and database access patterns.
-    return uuid.uuid4()  # Placeholder - replace with actual logic
+    denied = {entity_id: False for entity_id in entity_ids}
+    if not denied:
+        return denied
+
+    required_permissions = get_permissions_for_action(entity_type, action)  # Get required permissions for the action
+    if not required_permissions:
+        logger.warning(f"No permissions defined for action {action} on entity type {entity_type}")
+        return denied
+
+    if not all(check_many(user, required_permissions).values()):  # Check if user has the required permissions
+        return denied
+
+    try:
+        owners = ownership_resolver.resolve_many(entity_type, denied.keys())  # Determine organization ownership
+    except ValueError as e:
+        logger.warning(f"Could not determine organizations for {entity_type} entities: {e}")
+        return denied
+
+    is_system_admin = has_role(user, SYSTEM_ADMIN_ROLE)  # System admins can access all organizations
+    organization_id = user.organization_id
+    if organization_id is not None and not isinstance(organization_id, uuid.UUID):
+        organization_id = uuid.UUID(str(organization_id))  # Owners are resolved as UUIDs
+    access = {}
+    for entity_id, organization_ids in owners.items():
+        if not organization_ids:
+            logger.warning(f"Could not determine organization for entity {entity_type} with ID {entity_id}")
+            access[entity_id] = False
+        else:
+            access[entity_id] = is_system_admin or organization_id in organization_ids
+    return access
 
 
 def get_role_hierarchy() -> Dict[str, List[str]]:
@@ -6,6 +6,8 @@ It supports generation of OCG templates, conversion of OCG data models to format
 import os  # standard library
 import uuid  # standard library
 import datetime  # standard library
+import hashlib  # standard library
+import time  # standard library
 import typing  # standard library
 import json  # standard library
 import io  # standard library
@@ -15,7 +17,10 @@ from typing import Union, Optional, Dict, List, Tuple, Any  # standard library
 from src.backend.db.models.ocg import OCG, OCGSection, OCGAlternative, OCGStatus  # internal
 from src.backend.db.repositories.ocg_repository import OCGRepository  # internal
 from src.backend.services.documents.pdf_generator import generate_ocg_pdf, generate_pdf_from_template  # internal
-from src.backend.services.documents.storage import store_ocg_document, store_document  # internal
+from src.backend.services.documents.storage import store_ocg_document, store_document, get_ocg_document_cache_path, retrieve_cached_ocg_document  # internal
+from src.backend.tasks.celery_app import celery_app  # internal
+from src.backend.utils.cache import acquire_recompute_lock, release_recompute_lock, RECOMPUTE_LOCK_PREFIX  # internal
+from src.backend.utils.redis_client import get_redis_client  # internal
 from src.backend.utils.logging import get_logger  # internal
 from src.backend.db.session import get_db  # internal
 from src.backend.db.models.document import DocumentType  # internal
@@ -40,6 +45,21 @@ INDUSTRY_TEMPLATES = {
     'generic': 'generic_standard.json'
 }
 
+# Formats generate_ocg_document can produce
+OCG_DOCUMENT_FORMATS = ('pdf', 'html', 'docx', 'json')
+
+# Part of every document cache key; bump it when templates or renderers change so that
+# documents rendered by the old code are no longer served
+OCG_DOCUMENT_RENDER_VERSION = 1
+
+# Rendering of a missing document is coalesced: the request holding its render lock renders it
+# at once, while every other request for it waits up to OCG_RENDER_WAIT_TIMEOUT seconds for that
+# render before rendering it itself. Documents can also be rendered ahead of time by OCG_RENDER_TASK
+OCG_RENDER_TASK = 'tasks.exports.render_ocg_document'
+OCG_RENDER_LOCK_TTL = 300
+OCG_RENDER_WAIT_TIMEOUT = 30.0
+OCG_RENDER_POLL_INTERVAL = 0.25
+
 
 def get_ocg_template(template_type: str, custom_template_path: Optional[str] = None) -> dict:
     """
@@ -132,6 +152,11 @@ def generate_ocg_document(ocg_id: str, format_type: str, firm_id: Optional[str]
     """
     Generates a formatted document from an OCG.
 
+    Documents of OCGs that are no longer drafts are cached in storage under a hash of the OCG
+    version, format, firm selections and options, and served from there without rendering.
+    On a miss the first request renders the document and concurrent requests for the same
+    document wait for its render instead of repeating it.
+
     Args:
         ocg_id (str): ID of the OCG to generate the document from
         format_type (str): Format of the document to generate (pdf, html, docx, json)
@@ -141,38 +166,160 @@ def generate_ocg_document(ocg_id: str, format_type: str, firm_id: Optional[str]
     Returns:
         bytes: Document content in the requested format
     """
-    # Create database session
-    db = get_db()
+    if format_type not in OCG_DOCUMENT_FORMATS:
+        raise ValueError(f"Unsupported format type: {format_type}")
 
-    # Create OCG repository instance
-    repository = OCGRepository(db)
+    # Load the OCG and the firm's selections, which are part of the document
+    repository = OCGRepository(get_db())
+    ocg, firm_selections = _load_ocg_for_document(repository, ocg_id, firm_id)
 
-    # Get OCG by ID from repository
-    ocg = repository.get_by_id(uuid.UUID(ocg_id))
+    # Drafts change without a version bump, so they are always rendered
+    if ocg.status == OCGStatus.DRAFT:
+        return _render_and_store(ocg, format_type, firm_id, firm_selections, options)
 
-    # If OCG not found, raise OCGNotFoundError
+    cache_key = ocg_document_cache_key(ocg, format_type, firm_selections, options)
+    document_content = retrieve_cached_ocg_document(cache_key, format_type)
+    if document_content is not None:
+        logger.debug(f"Serving cached {format_type} document for OCG {ocg_id}")
+        return document_content
+
+    # Render the document here unless another request or task is already rendering it
+    lock_key = ocg_document_lock_key(cache_key)
+    token = acquire_recompute_lock(lock_key, ttl=OCG_RENDER_LOCK_TTL)
+    if token is not None:
+        try:
+            return _render_and_store(ocg, format_type, firm_id, firm_selections, options, cache_key)
+        finally:
+            release_recompute_lock(lock_key, token)
+
+    document_content = _wait_for_render(cache_key, format_type)
+    if document_content is not None:
+        return document_content
+
+    # The other render failed or did not finish in time; render the document here
+    logger.warning(f"No {format_type} document of OCG {ocg_id} after waiting for its render, rendering it inline")
+    return _render_and_store(ocg, format_type, firm_id, firm_selections, options, cache_key)
+
+
+def queue_ocg_document_render(ocg: OCG, format_type: str, firm_id: Optional[str] = None,
+                              firm_selections: Optional[List] = None, options: Optional[dict] = None) -> bool:
+    """
+    Queues a background render of an OCG document into the document cache.
+
+    The render lock is taken for the task, so requests for the document meanwhile wait for
+    the task instead of rendering it again.
+
+    Args:
+        ocg (OCG): OCG to render the document of
+        format_type (str): Format of the document to render (pdf, html, docx, json)
+        firm_id (Optional[str]): ID of the law firm whose selections are included
+        firm_selections (Optional[List]): The firm's selections included in the document
+        options (Optional[dict]): Additional options for document generation
+
+    Returns:
+        bool: Whether a render was queued; False if the document is already being rendered or
+            the task could not be queued
+    """
+    cache_key = ocg_document_cache_key(ocg, format_type, firm_selections, options)
+    lock_key = ocg_document_lock_key(cache_key)
+    token = acquire_recompute_lock(lock_key, ttl=OCG_RENDER_LOCK_TTL)
+    if token is None:
+        return False
+
+    try:
+        celery_app.send_task(
+            OCG_RENDER_TASK,
+            args=[str(ocg.id), format_type, firm_id, options, cache_key, token]
+        )
+    except Exception as e:
+        logger.error(f"Failed to queue rendering of OCG {ocg.id} as {format_type}: {str(e)}")
+        release_recompute_lock(lock_key, token)
+        return False
+    return True
+
+
+def render_ocg_document(ocg_id: str, format_type: str, firm_id: Optional[str] = None, options: Optional[dict] = None,
+                        cache_key: Optional[str] = None) -> bytes:
+    """
+    Renders and stores an OCG document, under its cache key if one is given.
+
+    This is the work done by the background render task queued by queue_ocg_document_render.
+
+    Args:
+        ocg_id (str): ID of the OCG to generate the document from
+        format_type (str): Format of the document to generate (pdf, html, docx, json)
+        firm_id (Optional[str]): ID of the law firm to include selections for
+        options (Optional[dict]): Additional options for document generation
+        cache_key (Optional[str]): Cache key to store the document under
+
+    Returns:
+        bytes: Document content in the requested format
+    """
+    repository = OCGRepository(get_db())
+    ocg, firm_selections = _load_ocg_for_document(repository, ocg_id, firm_id)
+    return _render_and_store(ocg, format_type, firm_id, firm_selections, options, cache_key)
+
+
+def ocg_document_cache_key(ocg: OCG, format_type: str, firm_selections: Optional[List] = None,
+                           options: Optional[dict] = None) -> str:
+    """
+    Computes the cache key of a generated OCG document.
+
+    Args:
+        ocg (OCG): OCG the document is generated from
+        format_type (str): Format of the document
+        firm_selections (Optional[List]): The firm's selections included in the document
+        options (Optional[dict]): Additional options for document generation
+
+    Returns:
+        str: Hex SHA-256 of everything that determines the document's content
+    """
+    key_data = {
+        'render_version': OCG_DOCUMENT_RENDER_VERSION,
+        'ocg_id': str(ocg.id),
+        'version': ocg.version,
+        # OCGRepository.update edits an OCG in place without bumping its version
+        'updated_at': ocg.updated_at,
+        'format': format_type,
+        'selections': sorted(
+            [str(selection.section_id), str(selection.alternative_id)] for selection in firm_selections or []
+        ),
+        'options': options or {}
+    }
+    canonical = json.dumps(key_data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _load_ocg_for_document(repository: OCGRepository, ocg_id: str, firm_id: Optional[str]) -> Tuple[OCG, Optional[List]]:
+    """
+    Loads an OCG and, if a firm is given, the firm's selections for it.
+    """
+    ocg = repository.get_by_id(uuid.UUID(ocg_id))
     if not ocg:
         raise OCGNotFoundError(ocg_id)
 
-    # If format_type is 'pdf', use generate_ocg_pdf to create PDF
+    firm_selections = repository.get_selections_by_firm(ocg.id, uuid.UUID(firm_id)) if firm_id else None
+    return ocg, firm_selections
+
+
+def _render_and_store(ocg: OCG, format_type: str, firm_id: Optional[str], firm_selections: Optional[List],
+                      options: Optional[dict], cache_key: Optional[str] = None) -> bytes:
+    """
+    Renders an OCG document and stores it, at its content-addressed path if a cache key is given.
+    """
     if format_type == 'pdf':
-        document_content = generate_ocg_pdf(ocg, options=options)
-    elif format_type == 'html':
-        document_content = format_document(ocg, format_type)
-    elif format_type == 'docx':
+        document_content = generate_ocg_pdf(ocg, firm_selections=firm_selections, options=options)
+    elif format_type in ('html', 'docx'):
         document_content = format_document(ocg, format_type)
     elif format_type == 'json':
         document_content = json.dumps(ocg.to_dict())
     else:
         raise ValueError(f"Unsupported format type: {format_type}")
 
-    # If firm_id is provided, include firm selections in the document
-    if firm_id:
-        firm_selections = repository.get_selections_by_firm(ocg.id, uuid.UUID(firm_id))
-    else:
-        firm_selections = None
+    # Cached documents are read back as bytes, so every format is returned as bytes
+    if isinstance(document_content, str):
+        document_content = document_content.encode('utf-8')
 
-    # Store generated document using store_ocg_document
     store_ocg_document(
         file_data=document_content,
         filename=f"{ocg.name}.{format_type}",
@@ -181,13 +328,39 @@ def generate_ocg_document(ocg_id: str, format_type: str, firm_id: Optional[str]
         ocg_name=ocg.name,
         mime_type=f"application/{format_type}" if format_type != 'html' else "text/html",
         version=ocg.version,
-        metadata={'firm_id': firm_id} if firm_id else {}
+        metadata={'firm_id': firm_id} if firm_id else {},
+        storage_path=get_ocg_document_cache_path(cache_key, format_type) if cache_key else None
     )
 
-    # Return the document content
     return document_content
 
 
+def ocg_document_lock_key(cache_key: str) -> str:
+    """
+    Returns the name of the render lock of a generated OCG document.
+    """
+    return f"ocg_document:{cache_key}"
+
+
+def _wait_for_render(cache_key: str, format_type: str) -> Optional[bytes]:
+    """
+    Waits while the render lock of a document is held, then reads the rendered document.
+
+    Only the lock, a cheap Redis read, is polled; storage is read once the lock is gone.
+    """
+    lock_name = f"{RECOMPUTE_LOCK_PREFIX}:{ocg_document_lock_key(cache_key)}"
+    deadline = time.monotonic() + OCG_RENDER_WAIT_TIMEOUT
+    try:
+        redis_client = get_redis_client()
+        while time.monotonic() < deadline and redis_client.exists(lock_name):
+            time.sleep(OCG_RENDER_POLL_INTERVAL)
+    except Exception as e:
+        logger.error(f"Failed to wait for OCG document render {cache_key}: {str(e)}")
+        return None
+
+    return retrieve_cached_ocg_document(cache_key, format_type)
+
+
 def save_ocg_template(ocg_id: str, template_name: str, description: Optional[str] = None, metadata: Optional[dict] = None) -> str:
     """
     Saves an OCG as a reusable template.
@@ -272,19 +445,7 @@ def export_ocg_with_selections(ocg_id: str, firm_id: str, format_type: str, opti
     Returns:
         bytes: Document content with firm selections
     """
-    # Create database session
-    db = get_db()
-
-    # Create OCG repository instance
-    repository = OCGRepository(db)
-
-    # Get OCG by ID from repository
-    ocg = repository.get_by_id(uuid.UUID(ocg_id))
-
-    # Get firm selections from repository
-    firm_selections = repository.get_selections_by_firm(ocg.id, uuid.UUID(firm_id))
-
-    # Generate document with selections using generate_ocg_document
+    # Generate document with selections using generate_ocg_document, which loads them
     document_content = generate_ocg_document(ocg_id, format_type, firm_id, options)
 
     # Return the document content
@@ -544,8 +705,8 @@ class OCGGenerator:
         # Update OCG status to PUBLISHED
         ocg = self._repository.update_ocg_status(uuid.UUID(ocg_id), OCGStatus.PUBLISHED)
 
-        # Generate and store final OCG document
-        self.generate_document(ocg_id, 'pdf')
+        # Render and store the final OCG document in the background
+        queue_ocg_document_render(ocg, 'pdf')
 
         # Log publication of OCG
         logger.info(f"Published OCG: {ocg.name} (ID: {ocg.id})")
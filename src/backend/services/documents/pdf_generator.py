@@ -7,9 +7,11 @@ well-formatted documents with proper headers, footers, tables, and styling.
 import os  # standard library
 import io  # standard library
 import datetime  # standard library
+import functools  # standard library
+import itertools  # standard library
 import uuid  # standard library
 import typing  # standard library
-from typing import Union, Optional, Dict, List  # standard library
+from typing import Union, Optional, Dict, List, Iterable, Tuple  # standard library
 
 import reportlab  # reportlab v3.6.12
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle  # reportlab
@@ -18,9 +20,12 @@ from reportlab.lib.units import inch  # reportlab
 from reportlab.lib import colors  # reportlab
 from reportlab.lib.pagesizes import letter  # reportlab
 from reportlab.pdfgen import canvas  # reportlab
+from reportlab.pdfbase import pdfmetrics  # reportlab
+from reportlab.pdfbase.ttfonts import TTFont  # reportlab
 
 import weasyprint  # weasyprint v57.1
-from weasyprint import HTML  # weasyprint
+from weasyprint import HTML, CSS  # weasyprint
+from weasyprint.text.fonts import FontConfiguration  # weasyprint
 
 import jinja2  # jinja2 v3.1.2
 
@@ -32,8 +37,9 @@ from src.backend.utils.logging import get_logger  # internal
 from src.backend.utils.file_handling import create_temp_file, safe_file_name  # internal
 from src.backend.utils.formatting import format_currency, format_percentage, format_date, format_datetime, format_number  # internal
 from src.backend.services.documents.storage import store_document  # internal
-from src.backend.db.models.document import DocumentType  # internal
+from src.backend.db.models.document import Document, DocumentType  # internal
 from src.backend.utils.constants import DEFAULT_CURRENCY, DEFAULT_LOCALE  # internal
+from src.backend.services.documents.pdf_rendering import render_pdf  # internal
 from reportlab.pdfgen.canvas import Canvas
 
 # Initialize logger
@@ -78,6 +84,126 @@ SECONDARY_COLOR = reportlab.lib.colors.HexColor('#38A169')
 # Accent color
 ACCENT_COLOR = reportlab.lib.colors.HexColor('#DD6B20')
 
+# Table font size of streamed tables
+TABLE_FONT_SIZE = 8
+
+# Fixed row height of streamed tables, so the rows of a page are known before laying it out
+TABLE_ROW_HEIGHT = 14
+
+# Top of the table area, below the page title
+TABLE_TOP = DEFAULT_PAGE_SIZE[1] - 1.1 * inch
+
+# Bottom of the table area, above the page footer
+TABLE_BOTTOM = 1.1 * inch
+
+# Line height of the metadata lines above the table on the first page
+METADATA_LINE_HEIGHT = 12
+
+# Rate reports with more rows than this are streamed as a paged table instead of rendered from the HTML template
+RATE_REPORT_STREAMING_THRESHOLD = 500
+
+# Rate report fields formatted as currency amounts
+RATE_REPORT_CURRENCY_FIELDS = ('amount', 'original_amount', 'rate', 'current_rate', 'proposed_rate', 'approved_rate')
+
+# Columns of streamed rate reports, in order; only those present in the report's rows are shown.
+# The widths (in points) add up to the width between the page margins
+RATE_REPORT_COLUMNS = (
+    {'name': 'attorney_name', 'label': 'Attorney', 'width': 105},
+    {'name': 'staff_class', 'label': 'Staff Class', 'width': 75},
+    {'name': 'office', 'label': 'Office', 'width': 70},
+    {'name': 'current_rate', 'label': 'Current Rate', 'width': 60, 'type': 'currency'},
+    {'name': 'proposed_rate', 'label': 'Proposed Rate', 'width': 60, 'type': 'currency'},
+    {'name': 'currency', 'label': 'Currency', 'width': 40},
+    {'name': 'effective_date', 'label': 'Effective Date', 'width': 65, 'type': 'date'},
+    {'name': 'status', 'label': 'Status', 'width': 65},
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_environment() -> jinja2.Environment:
+    """Get the shared Jinja2 environment of the PDF templates
+
+    Templates are compiled on first use and kept; templates do not change while the process runs.
+
+    Returns:
+        jinja2.Environment: Environment loading templates from TEMPLATES_DIR
+    """
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(TEMPLATES_DIR), auto_reload=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_font_configuration() -> FontConfiguration:
+    """Get the shared WeasyPrint font configuration, which caches the fonts loaded by HTML renders
+
+    Returns:
+        FontConfiguration: Font configuration reused across renders
+    """
+    return FontConfiguration()
+
+
+@functools.lru_cache(maxsize=None)
+def register_fonts() -> Tuple[str, ...]:
+    """Register the TrueType fonts in PDF_FONT_DIR with ReportLab once per process
+
+    Returns:
+        Tuple[str, ...]: Names of the registered fonts
+    """
+    if not os.path.isdir(PDF_FONT_DIR):
+        return ()
+
+    font_names = []
+    for filename in sorted(os.listdir(PDF_FONT_DIR)):
+        name, extension = os.path.splitext(filename)
+        if extension.lower() != '.ttf':
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont(name, os.path.join(PDF_FONT_DIR, filename)))
+            font_names.append(name)
+        except Exception as e:
+            logger.warning(f"Could not register font {filename}: {str(e)}")
+    return tuple(font_names)
+
+
+@functools.lru_cache(maxsize=None)
+def get_paragraph_styles():
+    """Get the shared ReportLab paragraph style sheet
+
+    Returns:
+        StyleSheet1: Sample style sheet used for paragraphs
+    """
+    return getSampleStyleSheet()
+
+
+@functools.lru_cache(maxsize=None)
+def get_table_style() -> TableStyle:
+    """Get the shared style of streamed tables (borders, header formatting, row coloring)
+
+    Returns:
+        TableStyle: Table style for a header row followed by data rows
+    """
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -1), DEFAULT_FONT_NAME),
+        ('FONTSIZE', (0, 0), (-1, -1), TABLE_FONT_SIZE),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+    ])
+
+
+def warm_render_caches() -> None:
+    """Load fonts, styles and the template environment, so the first render of a process does not pay for them"""
+    register_fonts()
+    get_font_configuration()
+    get_paragraph_styles()
+    get_table_style()
+    get_template_environment()
+
 
 def generate_pdf(title: str, content: Union[str, dict, io.IOBase, List], template_name: Optional[str] = None, options: Optional[dict] = None) -> bytes:
     """Generic function to generate a PDF document from various inputs
@@ -130,6 +256,26 @@ def generate_pdf(title: str, content: Union[str, dict, io.IOBase, List], templat
 def generate_pdf_from_html(html_content: str, options: Optional[dict] = None) -> bytes:
     """Generate a PDF document from HTML content
 
+    Args:
+        html_content (str): HTML content to convert to PDF
+        options (Optional[dict]): Additional options for PDF generation
+
+    Returns:
+        bytes: Generated PDF content as bytes
+    """
+    # Initialize options with defaults if None provided
+    if options is None:
+        options = {}
+
+    # Render in the PDF render pool so the caller's worker is not blocked by layout
+    return render_pdf('html', render_html_pdf, html_content, options)
+
+
+def render_html_pdf(html_content: str, options: Optional[dict] = None) -> bytes:
+    """Render HTML content to PDF with WeasyPrint in the current process
+
+    Runs in the PDF render pool; callers use generate_pdf_from_html.
+
     Args:
         html_content (str): HTML content to convert to PDF
         options (Optional[dict]): Additional options for PDF generation
@@ -143,12 +289,14 @@ def generate_pdf_from_html(html_content: str, options: Optional[dict] = None) ->
 
     # Setup custom CSS based on options
     custom_css = options.get('css', '')
+    font_config = get_font_configuration()
+    stylesheets = [CSS(string=custom_css, font_config=font_config)] if custom_css else None
 
     # Create WeasyPrint HTML object from html_content
     html = HTML(string=html_content, base_url=TEMPLATES_DIR)
 
-    # Render the HTML to PDF
-    pdf_bytes = html.write_pdf()
+    # Render the HTML to PDF, reusing the fonts loaded by earlier renders
+    pdf_bytes = html.write_pdf(stylesheets=stylesheets, font_config=font_config)
 
     # Return the PDF content as bytes
     return pdf_bytes
@@ -169,20 +317,17 @@ def generate_pdf_from_template(template_name: str, context: dict, options: Optio
     if options is None:
         options = {}
 
-    # Setup Jinja2 environment with template directory
-    env = jinja2.Environment(loader=jinja2.FileSystemLoader(TEMPLATES_DIR))
-
-    # Load the template by name
-    template = env.get_template(template_name)
+    # Load the template from the shared, precompiled environment
+    template = get_template_environment().get_template(template_name)
 
     # Enrich context with common data (date, time, etc.)
     context['now'] = datetime.datetime.now()
 
-    # Render the template with the provided context
+    # Render the template here: the context may hold database objects, which are not sent to the render pool
     html_content = template.render(context)
 
-    # Generate PDF from rendered HTML using generate_pdf_from_html
-    pdf_bytes = generate_pdf_from_html(html_content, options)
+    # Generate PDF from rendered HTML in the render pool, recording metrics under the template name
+    pdf_bytes = render_pdf(os.path.splitext(template_name)[0], render_html_pdf, html_content, options)
 
     # Return the PDF content as bytes
     return pdf_bytes
@@ -295,47 +440,107 @@ def generate_table_pdf(title: str, data: List[dict], columns: List[dict], option
     if options is None:
         options = {}
 
-    # Format the data according to column specifications (date/currency formatting)
-    formatted_data = []
-    for row in data:
-        formatted_row = {}
-        for col in columns:
-            key = col['name']
-            value = row.get(key)
-            if value is not None:
-                if col.get('type') == 'currency':
-                    formatted_row[key] = format_currency(value, col.get('currency', DEFAULT_CURRENCY))
-                elif col.get('type') == 'percentage':
-                    formatted_row[key] = format_percentage(value)
-                elif col.get('type') == 'date':
-                    formatted_row[key] = format_date(value)
-                else:
-                    formatted_row[key] = str(value)
-            else:
-                formatted_row[key] = ''
-        formatted_data.append(formatted_row)
-
-    # Calculate column widths based on content and page size
-    column_widths = [col.get('width', 1 * inch) for col in columns]
-
-    # Create a table data structure for ReportLab
-    table_data = [[col['label'] for col in columns]]  # Header row
-    for row in formatted_data:
-        table_data.append([row.get(col['name'], '') for col in columns])
-
-    # Setup table styles (borders, header formatting, row coloring)
-    table_style = TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ])
+    # Format and lay out the table page by page in the render pool
+    return render_pdf('table', render_table_pdf, title, list(data), columns, options)
 
-    # Generate PDF with the table using generate_pdf_from_reportlab
-    return generate_pdf_from_reportlab(title, table_data, options)
+
+def render_table_pdf(title: str, data: Iterable[dict], columns: List[dict], options: Optional[dict] = None) -> bytes:
+    """Render a data table to PDF in the current process, one page at a time
+
+    Each page's rows are formatted, laid out and drawn before the next page's rows are read, so only one
+    page of table cells is held in memory. Runs in the PDF render pool; callers use generate_table_pdf.
+
+    Args:
+        title (str): Title of the PDF document
+        data (Iterable[dict]): Rows of the table
+        columns (List[dict]): List of column specifications (name, label, width, type, currency)
+        options (Optional[dict]): Additional options for PDF generation; 'metadata' is a dict of
+            lines shown above the table on the first page
+
+    Returns:
+        bytes: Generated PDF content as bytes
+    """
+    # Initialize options with defaults if None provided
+    if options is None:
+        options = {}
+
+    # Create a BytesIO buffer and a canvas with compressed page streams
+    buffer = io.BytesIO()
+    canvas_obj = canvas.Canvas(buffer, pagesize=DEFAULT_PAGE_SIZE, pageCompression=1)
+    canvas_obj.setAuthor("Justice Bid")
+    canvas_obj.setTitle(title)
+
+    # Calculate column widths, sharing the width not claimed by the columns' own widths
+    column_widths = _table_column_widths(columns)
+    header = [col.get('label', col['name']) for col in columns]
+    metadata_lines = [f"{key}: {value}" for key, value in (options.get('metadata') or {}).items()]
+
+    rows = iter(data)
+    first_page = True
+    while True:
+        table_top = TABLE_TOP
+        if first_page and metadata_lines:
+            table_top = _draw_metadata(canvas_obj, metadata_lines, table_top)
+
+        # Read only as many rows as fit on this page
+        rows_per_page = max(1, int((table_top - TABLE_BOTTOM) // TABLE_ROW_HEIGHT) - 1)
+        page_rows = list(itertools.islice(rows, rows_per_page))
+        if not page_rows and not first_page:
+            break
+
+        add_header_footer(canvas_obj, title, options)
+        table_data = [header] + [[_format_table_cell(row, col) for col in columns] for row in page_rows]
+        table = Table(table_data, colWidths=column_widths, rowHeights=TABLE_ROW_HEIGHT)
+        table.setStyle(get_table_style())
+        _, table_height = table.wrapOn(canvas_obj, DEFAULT_PAGE_SIZE[0] - 2 * DEFAULT_MARGIN, table_top - TABLE_BOTTOM)
+        table.drawOn(canvas_obj, DEFAULT_MARGIN, table_top - table_height)
+        canvas_obj.showPage()
+
+        first_page = False
+        if len(page_rows) < rows_per_page:
+            break
+
+    # Save the canvas to the buffer
+    canvas_obj.save()
+    return buffer.getvalue()
+
+
+def _table_column_widths(columns: List[dict]) -> List[float]:
+    # Share the width not claimed by the columns' own widths, then shrink every column
+    # proportionally if the table is still wider than the space between the margins
+    available_width = DEFAULT_PAGE_SIZE[0] - 2 * DEFAULT_MARGIN
+    fixed_width = sum(col['width'] for col in columns if col.get('width'))
+    flexible_count = sum(1 for col in columns if not col.get('width'))
+    flexible_width = max(inch, (available_width - fixed_width) / flexible_count) if flexible_count else inch
+    widths = [col.get('width') or flexible_width for col in columns]
+    total_width = sum(widths)
+    if total_width > available_width:
+        widths = [width * available_width / total_width for width in widths]
+    return widths
+
+
+def _format_table_cell(row: dict, col: dict) -> str:
+    # Format a value according to its column specification (date/currency formatting)
+    value = row.get(col['name'])
+    if value is None:
+        return ''
+    if col.get('type') == 'currency':
+        return format_currency(value, col.get('currency') or row.get('currency') or DEFAULT_CURRENCY)
+    if col.get('type') == 'percentage':
+        return format_percentage(value)
+    if col.get('type') == 'date':
+        return format_date(value)
+    return str(value)
+
+
+def _draw_metadata(canvas_obj: Canvas, lines: List[str], top: float) -> float:
+    # Draw the metadata lines below the title and return the new top of the table area
+    canvas_obj.saveState()
+    canvas_obj.setFont(DEFAULT_FONT_NAME, DEFAULT_FONT_SIZE)
+    for index, line in enumerate(lines):
+        canvas_obj.drawString(DEFAULT_MARGIN, top - (index + 1) * METADATA_LINE_HEIGHT, line)
+    canvas_obj.restoreState()
+    return top - (len(lines) + 1) * METADATA_LINE_HEIGHT
 
 
 def generate_chart_pdf(title: str, chart_data: List[dict], options: Optional[dict] = None) -> bytes:
@@ -406,6 +611,13 @@ def generate_rate_report_pdf(title: str, rate_data: List[dict], metadata: dict,
     if options is None:
         options = {}
 
+    # Large reports are streamed page by page as a table rather than laid out as one HTML document
+    threshold = options.get('streaming_threshold', RATE_REPORT_STREAMING_THRESHOLD)
+    if len(rate_data) > threshold:
+        columns = options.get('columns') or rate_report_columns(rate_data)
+        table_options = {**options, 'metadata': metadata}
+        return render_pdf('rate_report', render_table_pdf, title, list(rate_data), columns, table_options)
+
     # Format rate data with proper currency and percentage formatting
     # Group rates by appropriate category (staff class, attorney, etc.)
     # Add summary statistics (averages, increases, etc.)
@@ -420,6 +632,32 @@ def generate_rate_report_pdf(title: str, rate_data: List[dict], metadata: dict,
     return generate_pdf_from_template(template_name, context, options)
 
 
+def rate_report_columns(rate_data: List[dict]) -> List[dict]:
+    """Get the table columns of a rate report for the fields of its first row
+
+    The report shows the RATE_REPORT_COLUMNS present in the row. Rows with none of them get a
+    column per field, sized by render_table_pdf to fit the page.
+
+    Args:
+        rate_data (List[dict]): List of rate data dictionaries
+
+    Returns:
+        List[dict]: Column specifications, with currency and date types for amount and date fields
+    """
+    fields = rate_data[0].keys() if rate_data else ()
+    columns = [dict(column) for column in RATE_REPORT_COLUMNS if column['name'] in fields]
+    if columns:
+        return columns
+    for key in fields:
+        column = {'name': key, 'label': key.replace('_', ' ').title()}
+        if key in RATE_REPORT_CURRENCY_FIELDS:
+            column['type'] = 'currency'
+        elif key.endswith('_date'):
+            column['type'] = 'date'
+        columns.append(column)
+    return columns
+
+
 def generate_analytics_pdf(title: str, analytics_data: dict, charts: Optional[List[dict]] = None, options: Optional[dict] = None) -> bytes:
     """Generate a PDF report for analytics data
 
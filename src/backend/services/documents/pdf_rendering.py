@@ -0,0 +1,329 @@
+"""
+Process pool that runs PDF builds for the Justice Bid Rate Negotiation System outside the calling web or task worker.
+Render functions are submitted by reference together with picklable arguments (HTML strings, row dictionaries), so
+ORM objects never cross the process boundary. Each pool process loads fonts, styles and templates once when it
+starts and reuses them for every render it runs. The pool records queue depth and render times per kind of document.
+"""
+import os  # standard library
+import time  # standard library
+import threading  # standard library
+import multiprocessing  # standard library
+from concurrent.futures import Future, ProcessPoolExecutor  # standard library
+from concurrent.futures.process import BrokenProcessPool  # standard library
+from typing import Any, Callable, Dict, Optional  # standard library
+
+from src.backend.config import settings  # internal
+from src.backend.utils.logging import get_logger  # internal
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Number of rendering processes per web or task worker process; 0 renders in the calling process.
+# Kept small because every worker process starts its own pool
+PDF_RENDER_WORKERS = int(getattr(settings, 'PDF_RENDER_WORKERS', 2))
+
+# Seconds a caller waits for a render before giving up
+PDF_RENDER_TIMEOUT = float(os.getenv('PDF_RENDER_TIMEOUT', '120'))
+
+# Renders a pool process runs before it is replaced, bounding memory held by fonts and layout caches
+PDF_RENDER_MAX_TASKS_PER_WORKER = int(os.getenv('PDF_RENDER_MAX_TASKS_PER_WORKER', '200'))
+
+# Pool processes are spawned rather than forked: web and Celery workers run background threads
+# (event dispatch, connection pools) whose locks a forked child could inherit in a held state
+PDF_RENDER_START_METHOD = os.getenv('PDF_RENDER_START_METHOD', 'spawn')
+
+
+# Set in Celery workers, whose task processes already occupy every core
+_render_inline = False
+
+
+class PDFRenderError(Exception):
+    """Exception raised when a PDF render fails or does not finish in time."""
+    pass
+
+
+def render_in_calling_process() -> None:
+    """
+    Render PDFs in the calling process from now on, in this process and the processes it forks.
+
+    Called when a Celery worker starts.
+    """
+    global _render_inline
+    _render_inline = True
+
+
+def _renders_inline() -> bool:
+    # Daemonic processes, such as Celery prefork pool children, are not allowed to have children
+    return _render_inline or multiprocessing.current_process().daemon
+
+
+def _init_render_worker() -> None:
+    # Load fonts, paragraph and table styles and the template environment once per pool process
+    from src.backend.services.documents.pdf_generator import warm_render_caches
+    warm_render_caches()
+
+
+def _timed_render(render_func: Callable[..., bytes], args: tuple, kwargs: dict) -> tuple:
+    # Runs in the pool process; the render time excludes the time the job spent queued
+    start = time.perf_counter()
+    result = render_func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class PDFRenderPool:
+    """
+    Runs PDF render functions in a pool of processes and keeps render metrics.
+    """
+
+    def __init__(self, max_workers: int = PDF_RENDER_WORKERS,
+                 max_tasks_per_worker: int = PDF_RENDER_MAX_TASKS_PER_WORKER,
+                 start_method: str = PDF_RENDER_START_METHOD):
+        """
+        Initialize the pool; processes are started on the first submitted render.
+
+        Renders run in the calling process when max_workers is 0, in Celery workers and in
+        daemonic processes, which cannot start rendering processes.
+
+        Args:
+            max_workers: Number of rendering processes, 0 to render in the calling process
+            max_tasks_per_worker: Renders a process runs before it is replaced
+            start_method: multiprocessing start method of the rendering processes
+        """
+        self.max_workers = max(0, max_workers)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._failed = 0
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                kwargs = {}
+                if self.start_method != 'fork':
+                    # Only available with spawned processes
+                    kwargs['max_tasks_per_child'] = self.max_tasks_per_worker
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_render_worker,
+                    **kwargs
+                )
+            return self._executor
+
+    def submit(self, kind: str, render_func: Callable[..., bytes], *args: Any, **kwargs: Any) -> Future:
+        """
+        Submit a render without waiting for it.
+
+        Args:
+            kind: Kind of document, used to group render metrics (e.g. 'rate_report', 'ocg')
+            render_func: Module-level function that returns the PDF bytes
+            *args: Picklable positional arguments of render_func
+            **kwargs: Picklable keyword arguments of render_func
+
+        Returns:
+            Future: Future resolving to the PDF bytes
+        """
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            self._submitted += 1
+
+        if self.max_workers == 0 or _renders_inline():
+            future: Future = Future()
+            try:
+                result = _timed_render(render_func, args, kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        else:
+            try:
+                future = self._get_executor().submit(_timed_render, render_func, args, kwargs)
+            except BrokenProcessPool:
+                # A pool process died (e.g. killed for memory); start a fresh pool for this and later renders
+                self._discard_executor()
+                future = self._get_executor().submit(_timed_render, render_func, args, kwargs)
+
+        result_future: Future = Future()
+
+        def _record(done: Future) -> None:
+            try:
+                pdf_bytes, render_seconds = done.result()
+            except Exception as e:
+                self._finish(kind, None, time.perf_counter() - submitted_at)
+                if isinstance(e, BrokenProcessPool):
+                    self._discard_executor()
+                result_future.set_exception(e)
+            else:
+                self._finish(kind, render_seconds, time.perf_counter() - submitted_at)
+                result_future.set_result(pdf_bytes)
+
+        future.add_done_callback(_record)
+        return result_future
+
+    def render(self, kind: str, render_func: Callable[..., bytes], *args: Any,
+               timeout: Optional[float] = None, **kwargs: Any) -> bytes:
+        """
+        Render a PDF in the pool and wait for it.
+
+        Args:
+            kind: Kind of document, used to group render metrics
+            render_func: Module-level function that returns the PDF bytes
+            *args: Picklable positional arguments of render_func
+            timeout: Seconds to wait, PDF_RENDER_TIMEOUT by default
+            **kwargs: Picklable keyword arguments of render_func
+
+        Returns:
+            bytes: Rendered PDF content
+
+        Raises:
+            PDFRenderError: If the render fails or does not finish in time
+        """
+        future = self.submit(kind, render_func, *args, **kwargs)
+        try:
+            return future.result(timeout=PDF_RENDER_TIMEOUT if timeout is None else timeout)
+        except PDFRenderError:
+            raise
+        except TimeoutError as e:
+            raise PDFRenderError(f"Rendering {kind} PDF did not finish in time") from e
+        except Exception as e:
+            raise PDFRenderError(f"Error rendering {kind} PDF: {str(e)}") from e
+
+    def _finish(self, kind: str, render_seconds: Optional[float], total_seconds: float) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if render_seconds is None:
+                self._failed += 1
+                return
+            timing = self._timings.setdefault(kind, {
+                'count': 0, 'render_seconds_total': 0.0, 'render_seconds_max': 0.0,
+                'wait_seconds_total': 0.0, 'last_render_seconds': 0.0
+            })
+            timing['count'] += 1
+            timing['render_seconds_total'] += render_seconds
+            timing['render_seconds_max'] = max(timing['render_seconds_max'], render_seconds)
+            timing['wait_seconds_total'] += max(0.0, total_seconds - render_seconds)
+            timing['last_render_seconds'] = render_seconds
+
+    def _discard_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the queue depth and render time metrics of the pool.
+
+        Returns:
+            Dict[str, Any]: Worker count, renders in flight and queued, submitted and failed counts,
+                and per kind the render count with total, mean, max and last render seconds and
+                mean seconds spent queued
+        """
+        with self._lock:
+            kinds = {}
+            for kind, timing in self._timings.items():
+                count = timing['count']
+                kinds[kind] = {
+                    'count': count,
+                    'render_seconds_total': round(timing['render_seconds_total'], 4),
+                    'render_seconds_mean': round(timing['render_seconds_total'] / count, 4),
+                    'render_seconds_max': round(timing['render_seconds_max'], 4),
+                    'last_render_seconds': round(timing['last_render_seconds'], 4),
+                    'wait_seconds_mean': round(timing['wait_seconds_total'] / count, 4),
+                }
+            return {
+                'workers': self.max_workers,
+                'in_flight': self._in_flight,
+                'queue_depth': max(0, self._in_flight - self.max_workers),
+                'submitted': self._submitted,
+                'failed': self._failed,
+                'kinds': kinds,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the rendering processes.
+
+        Args:
+            wait: Whether to wait for running renders to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Render pool of this process
+_render_pool: Optional[PDFRenderPool] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_pdf_render_pool() -> PDFRenderPool:
+    """
+    Get this process's PDF render pool, creating it on first use.
+
+    Returns:
+        PDFRenderPool: The shared render pool
+    """
+    global _render_pool
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                _render_pool = PDFRenderPool()
+    return _render_pool
+
+
+def render_pdf(kind: str, render_func: Callable[..., bytes], *args: Any, **kwargs: Any) -> bytes:
+    """
+    Render a PDF in this process's render pool and wait for the result.
+
+    Args:
+        kind: Kind of document, used to group render metrics
+        render_func: Module-level function that returns the PDF bytes
+        *args: Picklable positional arguments of render_func
+        **kwargs: Picklable keyword arguments of render_func
+
+    Returns:
+        bytes: Rendered PDF content
+    """
+    return get_pdf_render_pool().render(kind, render_func, *args, **kwargs)
+
+
+def get_pdf_render_stats() -> Dict[str, Any]:
+    """
+    Get the queue depth and render time metrics of this process's render pool.
+
+    Returns:
+        Dict[str, Any]: Render pool metrics
+    """
+    return get_pdf_render_pool().stats()
+
+
+def shutdown_pdf_render_pool(wait: bool = True) -> None:
+    """
+    Stop this process's rendering processes; the next render starts a new pool.
+
+    Args:
+        wait: Whether to wait for running renders to finish
+    """
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def _reset_render_pool_after_fork() -> None:
+    # The child does not own its parent's rendering processes or their result pipes
+    global _render_pool, _render_pool_lock
+    _render_pool = None
+    _render_pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_render_pool_after_fork)
@@ -19,6 +19,9 @@ logger = get_logger(__name__)
 # Define the base path for document storage
 DOCUMENT_STORAGE_PATH = os.getenv('DOCUMENT_STORAGE_PATH', 'documents')
 
+# Storage path of generated OCG documents, addressed by a hash of their inputs
+OCG_DOCUMENT_CACHE_PATH = os.path.join(DOCUMENT_STORAGE_PATH, 'ocg-cache')
+
 # Default expiration time for pre-signed URLs (in seconds)
 DEFAULT_PRESIGNED_URL_EXPIRATION = 3600
 
@@ -89,9 +92,14 @@ def store_document(
     name: str,
     mime_type: Optional[str] = None,
     metadata: Optional[dict] = None,
-    encrypt: Optional[bool] = None
+    encrypt: Optional[bool] = None,
+    storage_path: Optional[str] = None
 ) -> Tuple[Document, str]:
-    """Stores a document file in the storage backend and creates a Document record in the database"""
+    """Stores a document file in the storage backend and creates a Document record in the database
+
+    The file is stored under a new unique key unless storage_path gives its full path. A file
+    stored again at the same storage_path reuses the Document record of that path.
+    """
     # Determine MIME type from file extension if not provided
     if mime_type is None:
         mime_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
@@ -104,6 +112,9 @@ def store_document(
 
     # Generate full storage path by joining DOCUMENT_STORAGE_PATH and the storage key
     full_storage_path = os.path.join(DOCUMENT_STORAGE_PATH, storage_key)
+    if storage_path:
+        full_storage_path = storage_path
+        storage_key = os.path.relpath(storage_path, DOCUMENT_STORAGE_PATH)
 
     # Determine if encryption is needed based on document_type or explicit parameter
     should_encrypt = encrypt if encrypt is not None else document_type in ENCRYPTED_DOCUMENT_TYPES
@@ -123,6 +134,18 @@ def store_document(
     db = current_app.db
     document_repository = DocumentRepository(db.session)
 
+    # Content-addressed paths hold the same file each time, so their record is kept
+    existing = document_repository.get_document_by_file_path(full_storage_path) if storage_path else None
+    if existing is not None:
+        document = document_repository.update_document(
+            str(existing.id),
+            file_name=name,
+            content_type=mime_type,
+            status='active',
+            metadata=metadata
+        )
+        return document, storage_key
+
     document = document_repository.create_document(
         organization_id=organization_id,
         document_type=document_type.value,
@@ -146,7 +169,8 @@ def store_ocg_document(
     ocg_name: str,
     mime_type: Optional[str] = None,
     version: Optional[int] = None,
-    metadata: Optional[dict] = None
+    metadata: Optional[dict] = None,
+    storage_path: Optional[str] = None
 ) -> Tuple[Document, str]:
     """Specialized function for storing OCG documents with appropriate metadata"""
     # Initialize or update metadata dictionary with OCG-specific information
@@ -167,13 +191,32 @@ def store_ocg_document(
         organization_id=organization_id,
         name=ocg_name,
         mime_type=mime_type,
-        metadata=metadata
+        metadata=metadata,
+        storage_path=storage_path
     )
 
     # Return the result from store_document
     return document, storage_key
 
 
+def get_ocg_document_cache_path(cache_key: str, format_type: str) -> str:
+    """Returns the content-addressed storage path of a generated OCG document"""
+    return os.path.join(OCG_DOCUMENT_CACHE_PATH, cache_key[:2], f"{cache_key}.{format_type}")
+
+
+def retrieve_cached_ocg_document(cache_key: str, format_type: str) -> Optional[bytes]:
+    """Retrieves a generated OCG document by its cache key, or None if it has not been stored"""
+    file_path = get_ocg_document_cache_path(cache_key, format_type)
+    try:
+        if not check_file_exists(file_path):
+            return None
+        return decrypt_data(download_file(file_path))
+    except Exception as e:
+        # A storage error is treated as a miss, so the document is rendered again
+        logger.warning(f"Failed to retrieve cached OCG document {file_path}: {str(e)}")
+        return None
+
+
 def retrieve_document(
     document_id: Union[str, uuid.UUID],
     download_path: Optional[str] = None,
@@ -7,23 +7,38 @@ It supports HTML templated emails and integrates with Celery for asynchronous se
 """
 
 import os
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
 from ...app.config import settings
 from ...tasks.celery_app import app as celery_app
+from ...utils.email import get_smtp_pool, _deliver
 from ...utils.logging import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Set up template directory and Jinja environment
+# Set up template directory and Jinja environment. Compiled templates stay cached for the life
+# of the process instead of being checked against their files on every render.
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
-jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), auto_reload=False)
+
+
+def _smtp_config() -> Dict:
+    """
+    SMTP settings in the form used by the shared connection pool.
+    """
+    return {
+        'smtp_host': settings.SMTP_SERVER,
+        'smtp_port': settings.SMTP_PORT,
+        'smtp_username': settings.SMTP_USERNAME,
+        'smtp_password': settings.SMTP_PASSWORD,
+        'use_tls': settings.SMTP_USE_TLS,
+        'use_ssl': False
+    }
 
 
 def send_email(to_email: str, subject: str, content: str, is_html: bool = True) -> bool:
@@ -54,18 +69,9 @@ def send_email(to_email: str, subject: str, content: str, is_html: bool = True)
         else:
             message.attach(MIMEText(content, 'plain'))
         
-        # Connect to the SMTP server using settings from config
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            # Start TLS if enabled
-            if settings.SMTP_USE_TLS:
-                server.starttls()
-            
-            # Login if credentials are provided
-            if settings.SMTP_USERNAME and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            
-            # Send the email
-            server.send_message(message)
+        # Send over a pooled connection, already upgraded to TLS and logged in as configured,
+        # retrying once on a fresh connection if the pooled one was dropped by the server
+        _deliver(get_smtp_pool(_smtp_config()), settings.EMAIL_SENDER, [to_email], message.as_string())
             
         logger.info(f"Email sent successfully to {to_email}", 
                    extra={"additional_data": {"subject": subject}})
@@ -103,6 +109,69 @@ def send_email_async(to_email: str, subject: str, content: str, is_html: bool =
     return task.id
 
 
+def send_batch_email(to_emails: List[str], subject: str, content: str, is_html: bool = True) -> bool:
+    """
+    Sends the same email to a batch of recipients as one message over one SMTP connection.
+
+    Recipients are addressed as blind copies, so they do not see each other's addresses.
+
+    Args:
+        to_emails: Recipient email addresses
+        subject: Email subject line
+        content: Email body content (HTML or plain text)
+        is_html: Whether content is HTML (True) or plain text (False)
+
+    Returns:
+        bool: Success status of the email sending operation
+    """
+    if not to_emails:
+        return True
+
+    try:
+        message = MIMEMultipart()
+        message['From'] = settings.EMAIL_SENDER
+        message['To'] = settings.EMAIL_SENDER
+        message['Subject'] = subject
+        message.attach(MIMEText(content, 'html' if is_html else 'plain'))
+
+        # The envelope recipients receive the message without appearing in its headers
+        _deliver(get_smtp_pool(_smtp_config()), settings.EMAIL_SENDER, list(to_emails), message.as_string())
+
+        logger.info(f"Batch email sent successfully to {len(to_emails)} recipients",
+                   extra={"additional_data": {"subject": subject}})
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to send batch email to {len(to_emails)} recipients: {str(e)}",
+                    extra={"additional_data": {"subject": subject, "error": str(e)}})
+        return False
+
+
+def send_batch_email_async(to_emails: List[str], subject: str, content: str, is_html: bool = True) -> str:
+    """
+    Queues a batch email to be sent asynchronously via Celery.
+
+    Args:
+        to_emails: Recipient email addresses
+        subject: Email subject line
+        content: Email body content
+        is_html: Whether content is HTML (True) or plain text (False)
+
+    Returns:
+        str: Celery task ID
+    """
+    task = celery_app.send_task(
+        'tasks.notifications.send_batch_email',
+        args=[list(to_emails), subject, content, is_html],
+        queue='notifications'
+    )
+
+    logger.debug(f"Batch email queued for async delivery to {len(to_emails)} recipients",
+                extra={"additional_data": {"subject": subject, "task_id": task.id}})
+
+    return task.id
+
+
 def render_template(template_name: str, context: Dict) -> str:
     """
     Renders an email template with provided context data.
@@ -130,6 +199,28 @@ def render_template(template_name: str, context: Dict) -> str:
         return f"<p>Error rendering email template. Please contact support.</p>"
 
 
+def get_email_template(template_name: str, context: Dict) -> Optional[str]:
+    """
+    Renders an email template by name, without its .html extension, for the email tasks.
+    
+    Args:
+        template_name: Name of the template, with or without the .html extension
+        context: Dictionary of variables to pass to the template
+    
+    Returns:
+        Optional[str]: Rendered HTML content, or None if the template could not be rendered
+    """
+    if not template_name.endswith('.html'):
+        template_name += '.html'
+    
+    try:
+        return jinja_env.get_template(template_name).render(**context)
+    except Exception as e:
+        logger.error(f"Failed to render template {template_name}: {str(e)}", 
+                    extra={"additional_data": {"error": str(e)}})
+        return None
+
+
 def send_rate_request_notification(recipient_email: str, firm_name: str, 
                                   request_id: str, additional_context: Optional[Dict] = None) -> bool:
     """
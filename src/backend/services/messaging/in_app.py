@@ -15,6 +15,7 @@ from datetime import datetime
 from src.backend.utils.logging import get_logger  # Import logging functionality
 from src.backend.db.repositories.message_repository import MessageRepository  # Access message data for notifications
 from src.backend.db.repositories.user_repository import UserRepository  # Access user data for notification recipients
+from src.backend.db.repositories.notification_repository import NotificationRepository  # Persist in-app notifications in bulk
 from src.backend.utils.event_tracking import track_event  # Track notification-related events
 from src.backend.utils.constants import RateStatus, NegotiationStatus, ApprovalStatus, OCGStatus  # Import status enums for entity-specific notifications
 from src.backend.db.models.message import Message  # Import Message model for notification-related data
@@ -141,6 +142,22 @@ class Notification:
             updated_at=updated_at,
         )
 
+    def to_record(self) -> Dict:
+        """Convert notification to the column values of its database row"""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "notification_type": self.notification_type.value,
+            "title": self.title,
+            "content": self.content,
+            "priority": self.priority.value,
+            "notification_metadata": self.metadata,
+            "action_url": self.action_url,
+            "is_read": self.is_read,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
     def mark_as_read(self) -> None:
         """Mark the notification as read"""
         self.is_read = True  # Set is_read to True
@@ -150,10 +167,12 @@ class Notification:
 class InAppMessageService:
     """Service for managing in-app notifications and messages"""
 
-    def __init__(self, message_repository: MessageRepository, user_repository: UserRepository):
+    def __init__(self, message_repository: MessageRepository, user_repository: UserRepository,
+                 notification_repository: Optional[NotificationRepository] = None):
         """Initialize the in-app message service"""
         self._message_repository = message_repository  # Store message_repository as _message_repository
         self._user_repository = user_repository  # Store user_repository as _user_repository
+        self._notification_repository = notification_repository  # Persists notifications when provided
         logger.info("InAppMessageService initialized")  # Log service initialization
 
     def create_notification(
@@ -194,12 +213,20 @@ class InAppMessageService:
         priority: NotificationPriority = NotificationPriority.MEDIUM,
         metadata: Dict = None,
         action_url: str = None,
+        validate_users: bool = True,
+        delivery_key: str = None,
     ) -> List[Notification]:
-        """Create identical notifications for multiple users"""
-        self._user_repository.get_by_ids(user_ids)  # Validate users exist by calling user_repository.get_by_ids
-        notifications = []
-        for user_id in user_ids:
-            notification = Notification(
+        """Create identical notifications for multiple users
+
+        Recipients are validated with a single query, skipped when the caller already loaded them,
+        and the notifications are written with bulk INSERTs instead of one row at a time. Users who
+        already received a notification with the same delivery_key are not notified again.
+        """
+        if validate_users:
+            existing_ids = {str(user.id) for user in self._user_repository.get_by_ids(user_ids)}  # Validate users exist with one query
+            user_ids = [user_id for user_id in user_ids if str(user_id) in existing_ids]
+        notifications = [
+            Notification(
                 user_id=user_id,
                 notification_type=notification_type,
                 title=title,
@@ -208,7 +235,12 @@ class InAppMessageService:
                 metadata=metadata,
                 action_url=action_url,
             )
-            notifications.append(notification)  # Create notifications for each valid user ID
+            for user_id in user_ids  # Create notifications for each valid user ID
+        ]
+        if self._notification_repository is not None:
+            self._notification_repository.bulk_create([
+                {**notification.to_record(), "delivery_key": delivery_key} for notification in notifications
+            ])
 
         track_event(  # Track bulk notification creation event
             event_type="bulk_notifications_created",
@@ -8,18 +8,27 @@ import enum
 from datetime import datetime
 import uuid
 from celery import current_app as celery_app  # Import Celery's current_app
+from celery import group  # Fan large audiences out to chunked subtasks
+from celery.result import GroupResult  # Report the progress of fanned-out subtasks
 
 from src.backend.utils.logging import get_logger  # Import logging functionality
 from src.backend.services.messaging.in_app import InAppMessageService, NotificationType, NotificationPriority  # For creating and managing in-app notifications
-from src.backend.services.messaging.email import send_email, send_email_async, send_rate_request_notification, send_rate_submission_notification, send_counter_proposal_notification, send_approval_notification, send_message_notification, send_ocg_negotiation_notification  # Functions for sending email notifications
+from src.backend.services.messaging.email import send_email, send_email_async, send_batch_email_async, send_rate_request_notification, send_rate_submission_notification, send_counter_proposal_notification, send_approval_notification, send_message_notification, send_ocg_negotiation_notification  # Functions for sending email notifications
 from src.backend.db.repositories.user_repository import UserRepository  # Accessing user data and notification preferences
 from src.backend.db.repositories.message_repository import MessageRepository  # Accessing message data for notifications
 from src.backend.db.repositories.negotiation_repository import NegotiationRepository  # Accessing negotiation data for context in notifications
+from src.backend.db.repositories.notification_repository import NotificationRepository  # Bulk-inserting in-app notifications
+from src.backend.db.session import session_scope  # Database session for batch deliveries
 from src.backend.utils.event_tracking import track_event  # Track notification-related events
+from src.backend.utils.redis_client import get_redis_client  # Markers of email batches already queued by a delivery
 from src.backend.utils.constants import RateStatus, NegotiationStatus, ApprovalStatus, OCGStatus  # Status enums for different entity types
 
 logger = get_logger(__name__)
 NOTIFICATION_TASK_PATH = 'src.backend.tasks.notification_tasks'
+NOTIFICATION_CHUNK_SIZE = 500  # Recipients delivered per chunk; larger audiences are split into Celery subtasks
+EMAIL_BATCH_SIZE = 50  # Recipients per batched email send
+EMAIL_BATCH_MARKER_PREFIX = 'notification_delivery'
+EMAIL_BATCH_MARKER_TTL = 86400  # Seconds a delivery remembers the email batches it queued, longer than its retries
 
 
 def get_user_notification_preferences(user_id: uuid.UUID, event_type: str) -> dict:
@@ -169,10 +178,14 @@ def send_notification_async(user_id: uuid.UUID, event_type: str, title: str, con
     return str(result.id)
 
 
-def send_batch_notification(user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str) -> dict:
+def send_batch_notification(user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str, delivery_key: typing.Optional[str] = None) -> dict:
     """
     Send the same notification to multiple users
     
+    Audiences of up to NOTIFICATION_CHUNK_SIZE users are delivered in place by deliver_notification_chunk;
+    larger ones are split into chunked Celery subtasks by fan_out_notification. Calls repeated with the
+    same delivery_key, e.g. by a retried task, skip the recipients already notified.
+    
     Args:
         user_ids (list): List of User IDs
         event_type (str): Event type
@@ -182,30 +195,180 @@ def send_batch_notification(user_ids: list, event_type: str, title: str, content
         channels (list): List of notification channels
         is_high_priority (bool): Whether notification is high priority
         action_url (str): URL for notification action
+        delivery_key (str): Optional idempotency key of the delivery
     
     Returns:
-        dict: Results of batch notification with success and failure counts
+        dict: Results of batch notification with success and failure counts, or the group ID and
+            chunk count of the subtasks delivering a large audience
     """
-    # Initialize success and failure counters
-    success_count = 0
-    failure_count = 0
     # If not real-time mode, queue batch notification task and return
     if not context.get('real_time', True):
         task_id = send_batch_notification_async(user_ids, event_type, title, content, context, channels, is_high_priority, action_url)
         return {'task_id': task_id}
-    # For each user_id in the batch:
-    for user_id in user_ids:
-        # Attempt to send individual notification
-        try:
-            send_notification(user_id, event_type, title, content, context, channels, is_high_priority, action_url)
-            success_count += 1
-        # Update success or failure counter based on result
-        except Exception:
-            failure_count += 1
+    user_ids = list(dict.fromkeys(user_ids))
+    # Split large audiences into chunked subtasks instead of delivering them in the caller
+    if len(user_ids) > NOTIFICATION_CHUNK_SIZE:
+        return fan_out_notification(user_ids, event_type, title, content, context, channels, is_high_priority, action_url, delivery_key=delivery_key)
+    results = deliver_notification_chunk(user_ids, event_type, title, content, context, channels, is_high_priority, action_url, delivery_key=delivery_key)
     # Track batch notification event
-    track_event(event_type='batch_notification_sent', data={'success_count': success_count, 'failure_count': failure_count}, user_id=str(user_id))
+    track_event(event_type='batch_notification_sent', data={'success_count': results['success_count'], 'failure_count': results['failure_count']})
     # Return dictionary with success and failure counts
-    return {'success_count': success_count, 'failure_count': failure_count}
+    return results
+
+
+def deliver_notification_chunk(user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str, progress_callback: typing.Optional[typing.Callable[[str, int, int], None]] = None, delivery_key: typing.Optional[str] = None) -> dict:
+    """
+    Deliver a notification to a chunk of users with a fixed number of queries
+    
+    The recipients' preferences are loaded with one query, in-app notifications are written with bulk
+    INSERTs, and email recipients are grouped into batched sends of EMAIL_BATCH_SIZE addresses.
+    
+    With a delivery_key the chunk can be delivered again safely: in-app notifications already written
+    under the key are skipped by the INSERT, and email batches queued under it are marked in Redis and
+    not queued a second time.
+    
+    Args:
+        user_ids (list): List of User IDs
+        event_type (str): Event type
+        title (str): Notification title
+        content (str): Notification content
+        context (dict): Context data for notification
+        channels (list): List of notification channels
+        is_high_priority (bool): Whether notification is high priority
+        action_url (str): URL for notification action
+        progress_callback (Callable): Optional function called with the stage ('in_app' or 'email'),
+            the number of recipients handled in that stage and the stage's total
+        delivery_key (str): Optional idempotency key of the chunk
+    
+    Returns:
+        dict: success_count and failure_count of recipients, in_app_count of notifications created,
+            email_count of email recipients and email_batches queued
+    """
+    channels = [NotificationChannel(channel) for channel in channels]
+    with session_scope() as session:
+        recipients = UserRepository(session).get_notification_recipients(user_ids)
+        # Group recipients by channel according to their preferences
+        in_app_ids = []
+        email_addresses = []
+        for recipient in recipients:
+            preferences = (recipient.preferences or {}).get('notifications', {})
+            if NotificationChannel.IN_APP in channels and should_send_notification(preferences, event_type, NotificationChannel.IN_APP, is_high_priority):
+                in_app_ids.append(recipient.id)
+            if NotificationChannel.EMAIL in channels and recipient.email and should_send_notification(preferences, event_type, NotificationChannel.EMAIL, is_high_priority):
+                email_addresses.append(recipient.email)
+        # Bulk-insert in-app notifications
+        if in_app_ids:
+            in_app_service = InAppMessageService(MessageRepository(session), UserRepository(session), NotificationRepository(session))
+            in_app_service.create_notifications_for_users(in_app_ids, _get_notification_type(event_type), title, content, NotificationPriority.HIGH if is_high_priority else NotificationPriority.MEDIUM, context, action_url, validate_users=False, delivery_key=delivery_key)
+            if progress_callback:
+                progress_callback('in_app', len(in_app_ids), len(in_app_ids))
+    # Queue one email per batch of recipients, skipping batches an earlier attempt already queued
+    redis_client = get_redis_client() if delivery_key and email_addresses else None
+    email_batches = 0
+    for start in range(0, len(email_addresses), EMAIL_BATCH_SIZE):
+        marker = f'{EMAIL_BATCH_MARKER_PREFIX}:{delivery_key}:email:{start // EMAIL_BATCH_SIZE}'
+        if redis_client is not None and redis_client.exists(marker):
+            logger.info(f"Skipping email batch {start // EMAIL_BATCH_SIZE} of delivery {delivery_key}, already queued")
+        else:
+            send_batch_email_async(email_addresses[start:start + EMAIL_BATCH_SIZE], title, content)
+            if redis_client is not None:
+                redis_client.set(marker, 1, ex=EMAIL_BATCH_MARKER_TTL)
+            email_batches += 1
+        if progress_callback:
+            progress_callback('email', min(start + EMAIL_BATCH_SIZE, len(email_addresses)), len(email_addresses))
+    logger.info(f"Delivered {event_type} notification to {len(recipients)} of {len(user_ids)} users: {len(in_app_ids)} in-app, {len(email_addresses)} email in {email_batches} batches")
+    return {
+        'success_count': len(recipients),
+        'failure_count': len(user_ids) - len(recipients),
+        'in_app_count': len(in_app_ids),
+        'email_count': len(email_addresses),
+        'email_batches': email_batches
+    }
+
+
+def fan_out_notification(user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str, chunk_size: int = NOTIFICATION_CHUNK_SIZE, delivery_key: typing.Optional[str] = None) -> dict:
+    """
+    Split a notification to a large audience into chunked Celery subtasks running in parallel
+    
+    Each subtask gets the delivery key of its chunk, '<delivery_key>:<chunk index>', so a retried
+    subtask, or a fan-out repeated with the same delivery_key, does not notify a recipient twice.
+    
+    Args:
+        user_ids (list): List of User IDs
+        event_type (str): Event type
+        title (str): Notification title
+        content (str): Notification content
+        context (dict): Context data for notification
+        channels (list): List of notification channels
+        is_high_priority (bool): Whether notification is high priority
+        action_url (str): URL for notification action
+        chunk_size (int): Recipients per subtask
+        delivery_key (str): Idempotency key of the fan-out, generated when not given
+    
+    Returns:
+        dict: group_id to pass to get_fan_out_progress, chunk_count and recipient_count
+    """
+    user_ids = [str(user_id) for user_id in user_ids]
+    delivery_key = delivery_key or uuid.uuid4().hex
+    # Channels travel as their values, since task arguments are serialized as JSON
+    channel_values = [NotificationChannel(channel).value for channel in channels]
+    chunks = group(
+        celery_app.signature(
+            f'{NOTIFICATION_TASK_PATH}.send_notification_chunk',
+            args=(user_ids[start:start + chunk_size], event_type, title, content, context, channel_values, is_high_priority, action_url),
+            kwargs={'delivery_key': f'{delivery_key}:{start // chunk_size}'},
+            queue='notifications'
+        )
+        for start in range(0, len(user_ids), chunk_size)
+    )
+    result = chunks.apply_async()
+    # Saved so that progress can be looked up by group ID from any process
+    result.save()
+    chunk_count = len(result.results)
+    logger.info(f"Fanned {event_type} notification out to {len(user_ids)} users in {chunk_count} subtasks (group {result.id})")
+    track_event(event_type='batch_notification_fanned_out', data={'group_id': result.id, 'recipient_count': len(user_ids), 'chunk_count': chunk_count})
+    return {'group_id': result.id, 'chunk_count': chunk_count, 'recipient_count': len(user_ids)}
+
+
+def get_fan_out_progress(group_id: str) -> dict:
+    """
+    Get the progress of a notification fanned out by fan_out_notification
+    
+    Args:
+        group_id (str): Group ID returned by fan_out_notification
+    
+    Returns:
+        dict: chunk_count, completed_chunks, whether delivery is done, and the success and failure
+            counts of the completed chunks
+    """
+    result = GroupResult.restore(group_id, app=celery_app)
+    if result is None:
+        raise ValueError(f"Unknown notification group: {group_id}")
+    success_count = 0
+    failure_count = 0
+    completed_chunks = 0
+    for chunk in result.results:
+        if chunk.successful():
+            completed_chunks += 1
+            success_count += chunk.result.get('success_count', 0)
+            failure_count += chunk.result.get('failure_count', 0)
+        elif chunk.failed():
+            completed_chunks += 1
+    return {
+        'chunk_count': len(result.results),
+        'completed_chunks': completed_chunks,
+        'done': completed_chunks == len(result.results),
+        'success_count': success_count,
+        'failure_count': failure_count
+    }
+
+
+def _get_notification_type(event_type: str) -> NotificationType:
+    """Map an event type to its in-app notification type, defaulting to a system update"""
+    try:
+        return NotificationType(event_type)
+    except ValueError:
+        return NotificationType.SYSTEM_UPDATE
 
 
 def send_batch_notification_async(user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str) -> str:
@@ -236,14 +399,13 @@ def send_batch_notification_async(user_ids: list, event_type: str, title: str, c
     return str(result.id)
 
 
+@enum.unique
 class NotificationChannel(enum.Enum):
     """Enum defining the available notification channels"""
-    @enum.unique
-    class NotificationChannel(enum.Enum):
-        EMAIL = "email"
-        IN_APP = "in_app"
-        BOTH = "both"
-        NONE = "none"
+    EMAIL = "email"
+    IN_APP = "in_app"
+    BOTH = "both"
+    NONE = "none"
 
 
 class NotificationTemplateType(enum.Enum):
@@ -336,22 +336,26 @@ def mark_thread_read(thread_id: str, user_id: str) -> bool:
     # Check if the user is a participant in the thread
     check_permission(user_id, "messages:read")
 
-    # Mark all unread messages in the thread as read for the user
-    # Update read status in the database
-    # Return success indicator
+    # Move the user's read watermark in the thread; a thread without unread messages is already read
+    MessageRepository().mark_thread_as_read(thread_id, user_id)
     return True
 
 
-def search_threads(user_id: str, organization_id: str, search_term: str, filters: dict, page: int, page_size: int) -> dict:
+def search_threads(user_id: str, organization_id: str, search_term: str, filters: dict, page: int, page_size: int,
+                   cursor: Optional[str] = None) -> dict:
     """Searches for threads matching specific criteria
 
+    Threads are ranked by their best-matching message and served one keyset page at a time;
+    pass the returned next_cursor back as cursor to fetch the following page.
+
     Args:
         user_id (str): ID of the user
         organization_id (str): ID of the organization
-        search_term (str): Search term
-        filters (dict): Filters to apply to the search
-        page (int): Page number for pagination
-        page_size (int): Number of messages per page
+        search_term (str): Search term, in web-search syntax ("phrases", or, -exclusions)
+        filters (dict): Filters to apply to the search (thread_id, negotiation_id, related entity, date range)
+        page (int): Unused, kept for existing callers; results are paged by cursor
+        page_size (int): Number of threads per page
+        cursor (Optional[str]): Cursor returned with the previous page
 
     Returns:
         dict: Dictionary containing search results and pagination information
@@ -360,13 +364,28 @@ def search_threads(user_id: str, organization_id: str, search_term: str, filters
     # Validate user permissions
     check_permission(user_id, "messages:read")
 
-    # Search for threads where user is a participant
-    # Apply full-text search on thread subject and message content
-    # Apply additional filters if provided (thread_type, date range, etc.)
-    # Sort results by relevance and/or recency
-    # Apply pagination
+    # Search the full-text index for threads where the user is a participant
+    message_repository = MessageRepository()
+    thread_page = message_repository.search_threads_page(
+        search_term,
+        filters={**(filters or {}), 'participant_id': user_id},
+        cursor=cursor,
+        limit=page_size
+    )
+
     # Return search results with pagination metadata
-    return {}
+    return {
+        "threads": [
+            {
+                "thread_id": str(match.thread_id),
+                "search_rank": float(match.search_rank),
+                "match_count": match.match_count,
+                "last_match_at": match.last_match_at.isoformat() if match.last_match_at else None
+            }
+            for match in thread_page.items
+        ],
+        "pagination": thread_page.pagination
+    }
 
 
 def get_unread_thread_count(user_id: str, organization_id: str) -> int:
@@ -383,9 +402,8 @@ def get_unread_thread_count(user_id: str, organization_id: str) -> int:
     # Validate user permissions
     check_permission(user_id, "messages:read")
 
-    # Count threads where user is a participant and has unread messages
-    # Return the count
-    return 0
+    # Count threads where user has unread messages, from the user's unread counters
+    return MessageRepository().get_unread_thread_count(user_id)
 
 
 def _build_thread_hierarchy(messages: List[Message]) -> List[dict]:
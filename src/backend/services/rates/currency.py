@@ -5,20 +5,34 @@ exchange rate management, and multi-currency calculations.
 
 import requests  # Making HTTP requests to the currency API
 import json  # Processing JSON responses from the API
+import time  # Expiry of days the currency API could not serve
+import bisect  # Finding the trading day before a non-trading day
 from decimal import Decimal  # Precise decimal calculations for currency conversions
-from datetime import datetime, timedelta  # Date and time operations for exchange rate validity
+from datetime import date, datetime, timedelta  # Date and time operations for exchange rate validity
 from typing import Dict, List, Optional, Union  # Type hints for function parameters and returns
 
-from ..utils.cache import cache_exchange_rate, get_cached_exchange_rate  # Cache exchange rates to avoid frequent external API calls
-from ..integrations.currency.exchange_rate_api import get_exchange_rate  # Fetch current exchange rates from external API
+from src.backend.integrations.currency.exchange_rate_api import ExchangeRateClient  # Fetch historical exchange rates from external API
 from ..utils.logging import logger  # Logging currency conversion operations and errors
 from ..db.session import db_session  # Database session for storing and retrieving custom exchange rates
 from ..utils.constants import SUPPORTED_CURRENCIES, DEFAULT_CURRENCY  # Constants for currency-related operations
 from ..utils.formatting import format_currency  # Format currency amounts according to locale
+from src.backend.utils.currency import convert_amounts, get_exchange_rate_table  # Vectorized conversion against the in-process exchange rate table
+from src.backend.db.repositories.exchange_rate_repository import ExchangeRateRepository  # Persisted daily exchange rate history
+from src.backend.db.session import get_db  # Database session factory
+from src.backend.app.config import AppConfig  # Currency API settings
 
 EXCHANGE_RATE_CACHE_TTL = 86400  # Cache exchange rates for 24 hours
 CURRENCY_PRECISION = 4  # Number of decimal places for exchange rate calculations
 
+# Seconds before a day the currency API could not serve is requested again
+UNAVAILABLE_HISTORY_RETRY_SECONDS = 3600
+
+# Source of persisted rates copied forward from the previous trading day
+CARRIED_FORWARD_SOURCE = 'carried_forward'
+
+# Days the currency API could not serve, with the time.monotonic() value after which they are retried
+_unavailable_history_days: Dict[date, float] = {}
+
 
 def convert_rate(amount: Decimal, from_currency: str, to_currency: str, rate_date: datetime, use_custom_rates: bool) -> Decimal:
     """
@@ -72,28 +86,201 @@ def get_exchange_rate_for_date(from_currency: str, to_currency: str, rate_date:
     Returns:
         Decimal: Exchange rate to convert from source to target currency
     """
-    # Check if exchange rate is cached
-    cache_key = f"exchange_rate:{from_currency}:{to_currency}:{rate_date.strftime('%Y-%m-%d')}"
-    cached_rate = get_cached_exchange_rate(cache_key)
+    # Past dates are served from persisted history, loaded into the exchange rate table once
+    if rate_date is not None:
+        load_historical_exchange_rates(rate_date, rate_date)
 
-    # If cached and valid, return cached rate
-    if cached_rate:
-        logger.info(f"Returning cached exchange rate for {from_currency} to {to_currency} on {rate_date}")
-        return Decimal(cached_rate)
+    # Look up the rate as of the requested date from memory
+    return get_exchange_rate_table().rate(from_currency, to_currency, rate_date)
 
-    # If not cached or invalid, fetch from external API
-    try:
-        exchange_rate = get_exchange_rate(from_currency, to_currency)
-    except Exception as e:
-        logger.error(f"Failed to retrieve exchange rate from API: {str(e)}")
-        raise
 
-    # Cache the fetched exchange rate
-    cache_exchange_rate(cache_key, str(exchange_rate), EXCHANGE_RATE_CACHE_TTL)
-    logger.info(f"Caching exchange rate for {from_currency} to {to_currency} on {rate_date}")
+def load_historical_exchange_rates(start_date: Union[date, datetime], end_date: Union[date, datetime],
+                                   exchange_rate_repository: Optional[ExchangeRateRepository] = None,
+                                   client: Optional[ExchangeRateClient] = None) -> int:
+    """
+    Ensures the in-process exchange rate table holds daily rates for every day in a date range.
+
+    Days already in memory cost nothing, persisted days are read with a single query, and only
+    days never stored before are fetched from the currency API, with one request per date range,
+    and persisted for later use. Days the API skipped before the last day it served are
+    non-trading days (weekends, holidays): they are persisted with the rates of the previous
+    trading day, so no process asks for them again. Other days the API could not serve are
+    requested again after UNAVAILABLE_HISTORY_RETRY_SECONDS.
+
+    Args:
+        start_date (date): First day of the range
+        end_date (date): Last day of the range
+        exchange_rate_repository (ExchangeRateRepository): Optional repository for persisted rates
+        client (ExchangeRateClient): Optional currency API client
+
+    Returns:
+        int: Number of days fetched from the currency API
+    """
+    table = get_exchange_rate_table()
+    start_date = _as_date(start_date)
+    # Today's rates come from the latest-rate refresh of the table
+    end_date = min(_as_date(end_date), datetime.utcnow().date() - timedelta(days=1))
+    if start_date > end_date:
+        return 0
+
+    # 1. Days already held in memory need nothing
+    held_days = set(table.dates) | _get_unavailable_history_days()
+    missing_days = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+        if start_date + timedelta(days=offset) not in held_days
+    ]
+    if not missing_days:
+        return 0
+
+    # 2. Load persisted days in one query
+    exchange_rate_repository = exchange_rate_repository or ExchangeRateRepository(get_db())
+    persisted = exchange_rate_repository.get_rates_by_date(table.base_currency, missing_days[0], missing_days[-1])
+    table.load_many(persisted)
+    missing_days = [day for day in missing_days if day not in persisted]
+    if not missing_days:
+        return 0
+
+    # 3. Fetch the remaining days from the API once and persist them
+    client = client or _get_exchange_rate_client()
+    fetched = client.get_historical_rates_for_dates(missing_days, table.base_currency, table.currencies)
+    if fetched:
+        try:
+            exchange_rate_repository.bulk_upsert(table.base_currency, fetched)
+        except Exception as e:
+            logger.error(f"Failed to persist historical exchange rates: {str(e)}")
+        table.load_many(fetched)
+
+    # 4. Persist non-trading days with the previous trading day's rates, retry the others later
+    unavailable_days = sorted(set(missing_days) - set(fetched))
+    last_served_day = max(fetched) if fetched else None
+    carried = _carry_forward_rates(
+        [day for day in unavailable_days if last_served_day and day < last_served_day],
+        {**persisted, **fetched}, exchange_rate_repository, table.base_currency
+    )
+    if carried:
+        try:
+            exchange_rate_repository.bulk_upsert(table.base_currency, carried, source=CARRIED_FORWARD_SOURCE)
+        except Exception as e:
+            logger.error(f"Failed to persist carried forward exchange rates: {str(e)}")
+        table.load_many(carried)
+    retry_at = time.monotonic() + UNAVAILABLE_HISTORY_RETRY_SECONDS
+    for day in unavailable_days:
+        if day not in carried:
+            _unavailable_history_days[day] = retry_at
+
+    logger.info(f"Fetched historical exchange rates for {len(fetched)} of {len(missing_days)} missing days")
+    return len(fetched)
+
+
+def _carry_forward_rates(days: List[date], known_rates: Dict[date, Dict], exchange_rate_repository: ExchangeRateRepository,
+                         base_currency: str) -> Dict[date, Dict]:
+    """
+    Gives each non-trading day the rates of the last trading day before it.
+
+    Args:
+        days (List[date]): Non-trading days, in ascending order
+        known_rates (Dict[date, Dict]): Rates by day of the trading days loaded alongside them
+        exchange_rate_repository (ExchangeRateRepository): Repository read when no earlier trading day is known
+        base_currency (str): Currency code the rates are quoted against
+
+    Returns:
+        Dict[date, Dict]: Rates by day of the days an earlier trading day was found for
+    """
+    carried = {}
+    known_days = sorted(known_rates)
+    earlier_rates = None
+    for day in days:
+        position = bisect.bisect_left(known_days, day)
+        if position:
+            carried[day] = known_rates[known_days[position - 1]]
+            continue
+        # The previous trading day lies before the loaded range; read it once
+        if earlier_rates is None:
+            earlier_rates = exchange_rate_repository.get_latest_rates_before(base_currency, day)
+        if earlier_rates:
+            carried[day] = earlier_rates
+    return carried
+
+
+def _get_unavailable_history_days() -> set:
+    """
+    Gets the days the currency API could not serve recently, forgetting days whose retry time has passed.
+
+    Returns:
+        set: Days not to request from the currency API yet
+    """
+    now = time.monotonic()
+    for day, retry_at in list(_unavailable_history_days.items()):
+        if retry_at <= now:
+            _unavailable_history_days.pop(day, None)
+    return set(_unavailable_history_days)
+
+
+def _get_exchange_rate_client() -> ExchangeRateClient:
+    """
+    Creates a currency API client from the application configuration.
+
+    Returns:
+        ExchangeRateClient: Client for the configured currency API
+    """
+    config = AppConfig().config
+    return ExchangeRateClient(
+        api_key=getattr(config, 'CURRENCY_API_KEY', None),
+        base_url=getattr(config, 'CURRENCY_API_URL', None),
+    )
+
+
+def convert_as_of_effective_date(rates: List, target_currency: str) -> List[float]:
+    """
+    Converts rate amounts using the exchange rate in effect on each rate's effective date.
+
+    Historical rates for the whole span are loaded once, so repeated conversions make no outbound calls.
+
+    Args:
+        rates (List): Rate objects with amount, currency and effective_date
+        target_currency (str): The currency code of the target currency
+
+    Returns:
+        List[float]: Converted amounts in the same order as the rates
+    """
+    if not rates:
+        return []
+
+    effective_dates = [rate.effective_date for rate in rates]
+    _load_history_for_dates(effective_dates)
+    return convert_amounts(
+        [rate.amount for rate in rates], [rate.currency for rate in rates], target_currency, effective_dates
+    ).tolist()
+
+
+def _load_history_for_dates(dates: List[Optional[Union[date, datetime, str]]]) -> None:
+    """
+    Loads historical exchange rates spanning a list of dates with a single range load.
+
+    Args:
+        dates (List[Optional[date]]): Dates conversions will be made as of; None entries are ignored
+    """
+    days = [_as_date(value) for value in dates if value is not None]
+    if days:
+        load_historical_exchange_rates(min(days), max(days))
+
 
-    # Return the exchange rate
-    return exchange_rate
+def _as_date(value: Union[date, datetime, str]) -> date:
+    """
+    Normalizes a date, datetime or ISO date string to a date.
+
+    Args:
+        value (Union[date, datetime, str]): The value to normalize
+
+    Returns:
+        date: The calendar day of the value
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
 
 
 def get_custom_exchange_rate(from_currency: str, to_currency: str, rate_date: datetime) -> Optional[Decimal]:
@@ -168,43 +355,64 @@ def set_custom_exchange_rate(from_currency: str, to_currency: str, rate: Decimal
         return False
 
 
-def convert_rates_batch(rate_data: List[Dict], target_currency: str, use_custom_rates: bool) -> List[Dict]:
+def convert_rates_batch(rate_data: List[Dict], target_currency: str, use_custom_rates: bool,
+                        date_key: str = 'effective_date') -> List[Dict]:
     """
     Converts multiple rate amounts from various currencies to a target currency.
 
+    Each rate is converted as of its own date when it carries one, otherwise at the latest rates.
+
     Args:
         rate_data (List[Dict]): List of dictionaries containing rate information
         target_currency (str): The currency code of the target currency
         use_custom_rates (bool): Flag to indicate whether to use custom exchange rate overrides
+        date_key (str): The key in each rate that contains the date to convert as of
 
     Returns:
         List[Dict]: List of rates converted to target currency
     """
     converted_rates = []
-    # Group rates by source currency to minimize API calls
-    grouped_rates = {}
+
+    # Skip rates in unsupported currencies instead of failing the whole batch
+    convertible = []
     for rate in rate_data:
-        from_currency = rate['currency']
-        if from_currency not in grouped_rates:
-            grouped_rates[from_currency] = []
-        grouped_rates[from_currency].append(rate)
+        if validate_currency(rate['currency']):
+            convertible.append(rate)
+        else:
+            logger.error(f"Error converting rate from {rate['currency']} to {target_currency}: unsupported currency")
 
-    # For each currency group, get the exchange rate once
-    for from_currency, rates in grouped_rates.items():
-        try:
-            # Get the exchange rate once
-            exchange_rate = get_exchange_rate_for_date(from_currency, target_currency, datetime.now())
-
-            # Apply conversion to all rates in the group
-            for rate in rates:
-                amount = rate['amount']
-                converted_amount = amount * exchange_rate
-                rate['amount'] = converted_amount
-                rate['currency'] = target_currency
-                converted_rates.append(rate)
-        except Exception as e:
-            logger.error(f"Error converting rates from {from_currency} to {target_currency}: {str(e)}")
-            # Handle error appropriately, e.g., skip the rates or return an error value
+    if not convertible:
+        return converted_rates
+
+    try:
+        # Load history for the whole span once, then convert every amount in one vectorized lookup
+        dates = [rate.get(date_key) for rate in convertible]
+        _load_history_for_dates(dates)
+        converted_amounts = convert_amounts(
+            [rate['amount'] for rate in convertible],
+            [rate['currency'] for rate in convertible],
+            target_currency,
+            dates,
+        )
+    except Exception as e:
+        logger.error(f"Error converting rates to {target_currency}: {str(e)}")
+        return converted_rates
+
+    # Custom overrides are looked up once per source currency, not once per rate
+    custom_rates = {}
+    if use_custom_rates:
+        for from_currency in {rate['currency'] for rate in convertible} - {target_currency}:
+            custom_rate = get_custom_exchange_rate(from_currency, target_currency, datetime.now())
+            if custom_rate:
+                custom_rates[from_currency] = custom_rate
+
+    for rate, converted_amount in zip(convertible, converted_amounts):
+        if rate['currency'] in custom_rates:
+            rate['amount'] = Decimal(str(rate['amount'])) * custom_rates[rate['currency']]
+        else:
+            rate['amount'] = Decimal(str(round(converted_amount, CURRENCY_PRECISION)))
+        rate['currency'] = target_currency
+        converted_rates.append(rate)
 
     # Return list of converted rates with same structure as input
     return converted_rates
@@ -365,23 +573,26 @@ class CurrencyConverter:
         Returns:
             List[Dict]: List of items with converted amounts
         """
-        # Group items by currency
-        grouped_items = {}
-        for item in items:
-            from_currency = item[currency_key]
-            if from_currency not in grouped_items:
-                grouped_items[from_currency] = []
-            grouped_items[from_currency].append(item)
-
-        # For each currency group, convert amounts in batch
-        for from_currency, items in grouped_items.items():
-            amounts = [item[amount_key] for item in items]
-            converted_amounts = batch_convert_currency(amounts, from_currency, target_currency)
-
-            # Update the items with the converted amounts
-            for i, item in enumerate(items):
-                item[amount_key] = converted_amounts[i]
-                item[currency_key] = target_currency
+        if not items:
+            return items
+
+        # Amounts are converted as of each item's date when the items carry one
+        dates = [item.get(date_key) for item in items] if any(date_key in item for item in items) else None
+        if dates:
+            _load_history_for_dates(dates)
+
+        # Convert every amount in one vectorized lookup against the exchange rate table
+        converted_amounts = convert_amounts(
+            [item[amount_key] for item in items],
+            [item[currency_key] for item in items],
+            target_currency,
+            dates,
+        )
+
+        # Update the items with the converted amounts
+        for item, converted_amount in zip(items, converted_amounts):
+            item[amount_key] = Decimal(str(round(converted_amount, CURRENCY_PRECISION)))
+            item[currency_key] = target_currency
 
         # Return transformed list with converted amounts
         return items
\ No newline at end of file
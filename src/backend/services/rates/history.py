@@ -7,6 +7,7 @@ supporting audit trails, trend analysis, and negotiation history tracking.
 import typing  # standard library
 from typing import List, Optional, Dict, Any, Union  # Import necessary types
 import datetime  # standard library
+from decimal import Decimal  # standard library
 from datetime import date  # Import the date class
 import pandas  # data manipulation and analysis
 from uuid import UUID  # Import UUID
@@ -14,7 +15,8 @@ from uuid import UUID  # Import UUID
 from src.backend.db.repositories.rate_repository import RateRepository  # src/backend/db/repositories/rate_repository.py
 from src.backend.db.models.rate import Rate  # src/backend/db/models/rate.py
 from src.backend.utils.datetime_utils import get_current_date, date_diff_years  # src/backend/utils/datetime_utils.py
-from src.backend.utils.currency import convert_currency  # src/backend/utils/currency.py
+from src.backend.utils.currency import convert_currency, round_currency  # src/backend/utils/currency.py
+from src.backend.services.rates.currency import convert_as_of_effective_date  # src/backend/services/rates/currency.py
 from src.backend.services.negotiations.audit import create_audit_entry  # src/backend/services/negotiations/audit.py
 from src.backend.utils.logging import logger  # src/backend/utils/logging.py
 
@@ -208,8 +210,8 @@ def get_rate_history_by_attorney(attorney_id: str, client_id: Optional[str] = No
     rates = rate_repository.get_by_attorney(attorney_id, client_id, as_of_date=end_date)
     # Convert all rate amounts to target_currency if specified
     if target_currency:
-        for rate in rates:
-            rate.amount = convert_currency(rate.amount, rate.currency, target_currency)
+        for rate, amount in zip(rates, convert_as_of_effective_date(rates, target_currency)):
+            rate.amount = round_currency(Decimal(str(amount)), target_currency)
             rate.currency = target_currency
     # Sort the rates by effective_date in chronological order
     rates.sort(key=lambda r: r.effective_date)
@@ -262,8 +264,8 @@ def get_rate_history_by_client(client_id: str, firm_id: Optional[str] = None,
     rates = rate_repository.get_by_client(client_id, firm_id, as_of_date=end_date)
     # Convert all rate amounts to target_currency if specified
     if target_currency:
-        for rate in rates:
-            rate.amount = convert_currency(rate.amount, rate.currency, target_currency)
+        for rate, amount in zip(rates, convert_as_of_effective_date(rates, target_currency)):
+            rate.amount = round_currency(Decimal(str(amount)), target_currency)
             rate.currency = target_currency
     # Group rates by attorney
     rates_by_attorney = {}
@@ -324,8 +326,8 @@ def get_rate_history_by_firm(firm_id: str, client_id: Optional[str] = None,
     rates = rate_repository.get_by_firm(firm_id, client_id, as_of_date=end_date)
     # Convert all rate amounts to target_currency if specified
     if target_currency:
-        for rate in rates:
-            rate.amount = convert_currency(rate.amount, rate.currency, target_currency)
+        for rate, amount in zip(rates, convert_as_of_effective_date(rates, target_currency)):
+            rate.amount = round_currency(Decimal(str(amount)), target_currency)
             rate.currency = target_currency
     # Group rates by attorney
     rates_by_attorney = {}
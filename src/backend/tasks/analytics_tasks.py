@@ -19,7 +19,7 @@ from ..services.analytics.peer_comparison import PeerComparisonService  # Servic
 from ..services.analytics.attorney_performance import AttorneyPerformanceService  # Service for analyzing attorney performance metrics
 from ..services.analytics.custom_reports import execute_custom_report  # Function for executing custom reports with user-defined parameters
 from ..services.analytics.custom_reports import export_custom_report  # Function for exporting custom reports in various formats
-from ..utils.cache import cache_result, invalidate_cache  # Cache decorator for analytics results to improve performance
+from ..utils.cache import store_cached_result, invalidate_cache, cache_tag, invalidate_tags  # Tag-aware caching of analytics results
 from ..utils.logging import get_logger  # Function to get a logger for the module
 from ..db.repositories.organization_repository import OrganizationRepository  # Repository for accessing organization data
 from ..db.repositories.rate_repository import RateRepository  # Repository for accessing rate data
@@ -59,7 +59,7 @@ def process_rate_impact_analysis(self, params: dict) -> dict:
         impact_results = impact_service.calculate_impact(client_id, firm_id, proposed_rates, reference_period, filters, view_type, currency)
 
         cache_key = f"impact_analysis:{client_id}:{firm_id}"
-        cache_result(cache_key, impact_results)
+        store_cached_result(cache_key, impact_results, tags=[cache_tag('client', client_id), cache_tag('firm', firm_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -102,7 +102,7 @@ def process_impact_by_staff_class(self, params: dict) -> dict:
         impact_results = impact_service.calculate_impact_by_staff_class(client_id, firm_id, proposed_rates, reference_period, currency)
 
         cache_key = f"impact_by_staff_class:{client_id}:{firm_id}"
-        cache_result(cache_key, impact_results)
+        store_cached_result(cache_key, impact_results, tags=[cache_tag('client', client_id), cache_tag('firm', firm_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -145,7 +145,7 @@ def process_impact_by_practice_area(self, params: dict) -> dict:
         impact_results = impact_service.calculate_impact_by_practice_area(client_id, firm_id, proposed_rates, reference_period, currency)
 
         cache_key = f"impact_by_practice_area:{client_id}:{firm_id}"
-        cache_result(cache_key, impact_results)
+        store_cached_result(cache_key, impact_results, tags=[cache_tag('client', client_id), cache_tag('firm', firm_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -187,7 +187,7 @@ def process_peer_comparison(self, params: dict) -> dict:
         comparison_results = peer_comparison_service.get_comparison(organization_id, peer_group_id, filters, target_currency, as_of_date)
 
         cache_key = f"peer_comparison:{organization_id}:{peer_group_id}"
-        cache_result(cache_key, comparison_results)
+        store_cached_result(cache_key, comparison_results, tags=[cache_tag('organization', organization_id), cache_tag('peer_group', peer_group_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -229,7 +229,7 @@ def process_staff_class_peer_comparison(self, params: dict) -> dict:
         comparison_results = peer_comparison_service.get_staff_class_comparison(organization_id, peer_group_id, filters, target_currency, as_of_date)
 
         cache_key = f"staff_class_peer_comparison:{organization_id}:{peer_group_id}"
-        cache_result(cache_key, comparison_results)
+        store_cached_result(cache_key, comparison_results, tags=[cache_tag('organization', organization_id), cache_tag('peer_group', peer_group_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -271,7 +271,7 @@ def process_practice_area_peer_comparison(self, params: dict) -> dict:
         comparison_results = peer_comparison_service.get_practice_area_comparison(organization_id, peer_group_id, filters, target_currency, as_of_date)
 
         cache_key = f"practice_area_peer_comparison:{organization_id}:{peer_group_id}"
-        cache_result(cache_key, comparison_results)
+        store_cached_result(cache_key, comparison_results, tags=[cache_tag('organization', organization_id), cache_tag('peer_group', peer_group_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -320,7 +320,7 @@ def process_historical_rate_trends(self, params: dict) -> dict:
             raise ValueError(f"Invalid entity_type: {entity_type}")
 
         cache_key = f"historical_rate_trends:{entity_type}:{entity_id}"
-        cache_result(cache_key, trend_results)
+        store_cached_result(cache_key, trend_results, tags=[cache_tag(entity_type, entity_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -363,7 +363,7 @@ def process_rate_trends_time_series(self, params: dict) -> dict:
         time_series_data = rate_trends_analyzer.get_time_series_data(entity_type, entity_id, related_id, group_by, start_date, end_date, currency)
 
         cache_key = f"rate_trends_time_series:{entity_type}:{entity_id}"
-        cache_result(cache_key, time_series_data)
+        store_cached_result(cache_key, time_series_data, tags=[cache_tag(entity_type, entity_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -377,6 +377,49 @@ def process_rate_trends_time_series(self, params: dict) -> dict:
         return {'error': str(e)}
 
 
+@shared_task(bind=True, name='tasks.analytics.process_rate_forecasts')
+def process_rate_forecasts(self, params: dict) -> dict:
+    """
+    Celery task for forecasting the rates of every timekeeper of an entity, e.g. before a negotiation cycle
+
+    Args:
+        params (dict): Parameters for the forecast including entity_type, entity_id, related_id, years_ahead, model_type
+
+    Returns:
+        dict: Predicted rates and confidence intervals per attorney and staff class series
+    """
+    start_time = time.time()
+    logger.info(f"Starting rate forecast task", extra={'additional_data': {'params': params}})
+    try:
+        entity_type = params['entity_type']
+        entity_id = params['entity_id']
+        related_id = params.get('related_id')
+        years_ahead = params.get('years_ahead', 1)
+        model_type = params.get('model_type', 'linear')
+
+        rate_repository = RateRepository()
+        billing_repository = BillingRepository()
+        rate_trends_analyzer = RateTrendsAnalyzer(rate_repository, billing_repository)
+
+        forecast = rate_trends_analyzer.predict_future_rates(entity_type, entity_id, related_id, years_ahead, model_type)
+
+        cache_key = f"rate_forecasts:{entity_type}:{entity_id}:{related_id or 'all'}:{model_type}:{years_ahead}"
+        store_cached_result(cache_key, forecast, tags=[cache_tag(entity_type, entity_id)])
+
+        end_time = time.time()
+        execution_time = end_time - start_time
+        logger.info(f"Rate forecast task completed in {execution_time:.2f} seconds",
+                    extra={'additional_data': {'entity_type': entity_type, 'entity_id': entity_id,
+                                               'series_count': forecast['series_count'],
+                                               'refitted': forecast['refitted'], 'execution_time': execution_time}})
+
+        return forecast
+
+    except Exception as e:
+        logger.error(f"Error during rate forecasting: {str(e)}", exc_info=True)
+        return {'error': str(e)}
+
+
 @shared_task(bind=True, name='tasks.analytics.process_attorney_performance_analysis')
 def process_attorney_performance_analysis(self, params: dict) -> dict:
     """
@@ -408,7 +451,7 @@ def process_attorney_performance_analysis(self, params: dict) -> dict:
         performance_metrics = attorney_performance_service.get_comprehensive_metrics(attorney_id, client_id, start_date, end_date, include_unicourt, include_ratings, include_rate_comparison)
 
         cache_key = f"attorney_performance:{attorney_id}"
-        cache_result(cache_key, performance_metrics)
+        store_cached_result(cache_key, performance_metrics, tags=[cache_tag('attorney', attorney_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -454,7 +497,7 @@ def process_top_performers_analysis(self, params: dict) -> dict:
         top_performers = attorney_performance_service.find_top_performers(client_id, firm_id, practice_area, staff_class_id, start_date, end_date, metrics, limit)
 
         cache_key = f"top_performers:{client_id}:{firm_id}"
-        cache_result(cache_key, top_performers)
+        store_cached_result(cache_key, top_performers, tags=[cache_tag('client', client_id), cache_tag('firm', firm_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -492,7 +535,7 @@ def process_custom_report(self, params: dict) -> dict:
         report_results = execute_custom_report(report_id, organization_id, parameters, filters, page, page_size)
 
         cache_key = f"custom_report:{report_id}:{organization_id}"
-        cache_result(cache_key, report_results)
+        store_cached_result(cache_key, report_results, tags=[cache_tag('organization', organization_id)])
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -635,9 +678,8 @@ def update_analytics_after_rate_change(self, organization_id: str, affected_rate
     start_time = time.time()
     logger.info(f"Starting analytics update task after rate change", extra={'additional_data': {'organization_id': organization_id, 'affected_rate_ids': affected_rate_ids}})
     try:
-        # Determine which analytics reports and caches are affected by the rate changes
-        # (This is a placeholder - in a real implementation, we would
-        # determine this based on the rate change and the report dependencies)
+        # Analytics are registered under the organization's tags (as organization, client
+        # or firm), so the affected entries are found without scanning the keyspace
         affected_analytics = [
             "impact_analysis",
             "peer_comparison",
@@ -645,9 +687,11 @@ def update_analytics_after_rate_change(self, organization_id: str, affected_rate
         ]
 
         # Invalidate all affected cache entries
-        for analytic in affected_analytics:
-            cache_key = f"{analytic}:{organization_id}"
-            invalidate_cache(cache_key)
+        invalidated_count = invalidate_tags(
+            cache_tag('organization', organization_id),
+            cache_tag('client', organization_id),
+            cache_tag('firm', organization_id)
+        )
 
         # Schedule tasks to regenerate critical analytics (impact analysis, peer comparisons, trends)
         # (This is a placeholder - in a real implementation, we would
@@ -659,7 +703,7 @@ def update_analytics_after_rate_change(self, organization_id: str, affected_rate
         logger.info(f"Analytics update task completed in {execution_time:.2f} seconds, invalidated caches and scheduled regenerations for {len(affected_analytics)} analytics",
                     extra={'additional_data': {'organization_id': organization_id, 'affected_rate_ids': affected_rate_ids, 'regenerated_analytics': regenerated_analytics}})
 
-        return {'status': 'success', 'invalidated_caches': affected_analytics, 'regenerated_analytics': regenerated_analytics}
+        return {'status': 'success', 'invalidated_caches': affected_analytics, 'invalidated_count': invalidated_count, 'regenerated_analytics': regenerated_analytics}
 
     except Exception as e:
         logger.error(f"Error during analytics update after rate change: {str(e)}", exc_info=True)
@@ -7,6 +7,7 @@ task processing, including background jobs, scheduled tasks, and API integration
 
 import os
 from celery import Celery
+from celery.signals import worker_init
 from kombu.utils.url import maybe_sanitize_url
 
 from ..app.config import Config, AppConfig
@@ -106,6 +107,17 @@ def configure_celery(app):
 # Configure Celery application
 celery_app = configure_celery(celery_app)
 
+@worker_init.connect
+def render_pdfs_in_task_processes(**kwargs):
+    """
+    Render PDFs inside the task processes of a Celery worker instead of per-process render pools.
+
+    Task processes already run one per core, and prefork children are daemonic and cannot
+    start processes of their own.
+    """
+    from ..services.documents.pdf_rendering import render_in_calling_process
+    render_in_calling_process()
+
 def shared_task(name=None, bind=False, max_retries=3, default_retry_delay=60, 
                 ignore_result=False, acks_late=True):
     """
@@ -11,7 +11,7 @@ import time
 import json
 
 from ..utils.logging import get_logger
-from ..utils.email import send_email
+from ..utils.email import send_email, send_emails
 from ..services.messaging.email import get_email_template
 from .celery_app import CELERY_APP
 
@@ -169,6 +169,10 @@ def send_batch_emails_task(email_data_list, retry_on_failure=True):
     """
     Asynchronous task to send multiple emails in batch.
     
+    The emails are sent by this task over one pooled SMTP connection. A failed email does not
+    stop the batch; failures that may succeed later (dropped connections, temporary SMTP
+    errors) are queued as individual send_email_task retries.
+    
     Args:
         email_data_list (list): List of email data dictionaries
         retry_on_failure (bool): Whether to retry on failure
@@ -179,36 +183,39 @@ def send_batch_emails_task(email_data_list, retry_on_failure=True):
     logger.info(f"Starting batch email sending task", 
                extra={"additional_data": {"count": len(email_data_list)}})
     
-    # Initialize counters
-    success_count = 0
-    failure_count = 0
-    
-    # Process each email in the batch
-    for email_data in email_data_list:
-        try:
-            # Queue individual email tasks
-            send_email_task.delay(email_data, retry_on_failure)
-            success_count += 1
-        except Exception as e:
-            recipient = email_data.get("recipient", "unknown")
-            logger.error(f"Error processing email in batch: {str(e)}", 
-                        extra={"additional_data": {"recipient": recipient, "error": str(e)}})
-            failure_count += 1
+    result = send_emails(email_data_list)
+    
+    # Queue individual retries for transient failures
+    retried_count = 0
+    if retry_on_failure:
+        for failure in result["failures"]:
+            if not failure["retryable"]:
+                continue
+            try:
+                send_email_task.apply_async(
+                    args=[email_data_list[failure["index"]], retry_on_failure],
+                    countdown=RETRY_DELAY
+                )
+                retried_count += 1
+            except Exception as e:
+                logger.error(f"Error queueing email retry from batch: {str(e)}", 
+                            extra={"additional_data": {"recipient": failure["recipient"], "error": str(e)}})
     
     # Log the batch results
-    total_count = len(email_data_list)
     logger.info(f"Batch email sending completed", 
                extra={"additional_data": {
-                   "total": total_count,
-                   "success": success_count,
-                   "failure": failure_count
+                   "total": result["total_count"],
+                   "success": result["success_count"],
+                   "failure": result["failure_count"],
+                   "retried": retried_count
                }})
     
     # Return a summary of the batch operation
     return {
-        "success_count": success_count,
-        "failure_count": failure_count,
-        "total_count": total_count
+        "success_count": result["success_count"],
+        "failure_count": result["failure_count"],
+        "retried_count": retried_count,
+        "total_count": result["total_count"]
     }
 
 
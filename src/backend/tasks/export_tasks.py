@@ -5,16 +5,21 @@ export operations in the background to ensure system responsiveness.
 """
 
 import io  # standard library
+import tempfile  # standard library
 import typing  # standard library
 from datetime import datetime  # standard library
 
 from celery import shared_task  # celery v5.3+ - Distributed task queue
+from src.backend.db.repositories.rate_repository import RateRepository, RATE_EXPORT_FIELDS  # Internal import
 from src.backend.integrations.ebilling.teamconnect import TeamConnectAdapter  # Internal import
 from src.backend.integrations.file.excel_processor import ExcelProcessor  # Internal import
+from src.backend.services.documents.ocg_generation import render_ocg_document, ocg_document_lock_key, OCG_RENDER_TASK  # Internal import
 from src.backend.services.rates.export import RateExportService  # Internal import
+from src.backend.utils.cache import release_recompute_lock  # Internal import
 from src.backend.utils.email import send_email  # Internal import
+from src.backend.utils.file_handling import stream_tabular_export  # Internal import
 from src.backend.utils.logging import get_logger  # Internal import
-from src.backend.utils.storage import save_file  # Internal import
+from src.backend.utils.storage import save_file, upload_file  # Internal import
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -22,14 +27,20 @@ logger = get_logger(__name__)
 # Initialize RateExportService
 rate_export_service = RateExportService()
 
+# File extensions of the formats supported by streaming file exports
+EXPORT_FILE_EXTENSIONS = {"excel": "xlsx", "xlsx": "xlsx", "csv": "csv", "jsonl": "jsonl"}
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
 def export_rates_to_file_task(self, filters: dict, file_format: str, currency: str, user_id: str, email: str) -> dict:
-    """Asynchronous task for exporting rates to a file format (Excel or CSV)
+    """Asynchronous task for exporting rates to a file format (Excel, CSV or JSON lines)
+
+    Rates are streamed from the database in chunks and written incrementally to a temporary
+    file, which is then uploaded to storage, so worker memory stays flat for large exports.
 
     Args:
-        filters (dict): Filters to apply to the rate data
-        file_format (str): File format for the export (excel or csv)
+        filters (dict): Filters to apply to the rate data (client_id, firm_id, status)
+        file_format (str): File format for the export (excel, csv or jsonl)
         currency (str): Currency for the exported rates
         user_id (str): User ID initiating the export
         email (str): Email address to send the export notification
@@ -41,11 +52,26 @@ def export_rates_to_file_task(self, filters: dict, file_format: str, currency: s
         # Log the start of the export task
         logger.info(f"Starting export to file task for user {user_id} with format {file_format}")
 
-        # Call rate_export_service.export_to_file with the provided parameters
-        filename, file_content = rate_export_service.export_to_file(filters, file_format, currency)
-
-        # If export is successful, save the file to storage
-        file_url = save_file(filename, file_content)
+        # Validate the requested file format
+        extension = EXPORT_FILE_EXTENSIONS.get(file_format.lower())
+        if not extension:
+            raise ValueError(f"Unsupported export format: {file_format}")
+        filename = f"rates_export_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.{extension}"
+
+        # Stream the matching rates chunk by chunk into a temporary file
+        chunks = RateRepository().iter_export_chunks(
+            client_id=filters.get("client_id"),
+            firm_id=filters.get("firm_id"),
+            status=filters.get("status"),
+            currency=currency,
+        )
+        with tempfile.TemporaryFile() as export_file:
+            for block in stream_tabular_export(chunks, file_format, RATE_EXPORT_FIELDS):
+                export_file.write(block)
+
+            # Upload the finished file to storage without reading it back into memory
+            export_file.seek(0)
+            file_url = upload_file(export_file, f"exports/{filename}")
 
         # If email is provided, send an email notification with the download link
         if email:
@@ -332,4 +358,36 @@ def scheduled_export_rates_task(self) -> dict:
     except Exception as e:
         # Log errors for failed exports
         logger.error(f"Scheduled export task failed: {str(e)}", exc_info=True)
-        return {"status": "failed", "error": str(e)}
\ No newline at end of file
+        return {"status": "failed", "error": str(e)}
+
+
+@shared_task(bind=True, name=OCG_RENDER_TASK)
+def render_ocg_document_task(self, ocg_id: str, format_type: str, firm_id: typing.Optional[str], options: typing.Optional[dict],
+                             cache_key: str, lock_token: str) -> dict:
+    """Asynchronous task that renders a missing OCG document into the document cache
+
+    Queued by queue_ocg_document_render, holding the render lock so that concurrent requests
+    for the same document wait for this render. The lock is released when the document is
+    stored or rendering fails, letting the waiting requests read the document or render it
+    themselves.
+
+    Args:
+        ocg_id (str): ID of the OCG to render
+        format_type (str): Format of the document (pdf, html, docx, json)
+        firm_id (Optional[str]): ID of the law firm whose selections are included
+        options (Optional[dict]): Additional options for document generation
+        cache_key (str): Cache key the document is stored under
+        lock_token (str): Token of the render lock held for the document
+
+    Returns:
+        dict: Render result including cache key and document size
+    """
+    try:
+        logger.info(f"Rendering {format_type} document for OCG {ocg_id} into cache {cache_key}")
+        document_content = render_ocg_document(ocg_id, format_type, firm_id, options, cache_key)
+        return {"status": "success", "cache_key": cache_key, "size": len(document_content)}
+    except Exception as e:
+        logger.error(f"Error rendering {format_type} document for OCG {ocg_id}: {str(e)}")
+        return {"status": "error", "cache_key": cache_key, "error": str(e)}
+    finally:
+        release_recompute_lock(ocg_document_lock_key(cache_key), lock_token)
@@ -8,11 +8,13 @@ import tempfile  # Create temporary files for import processing
 import typing  # Type hints for function parameters and returns
 from datetime import datetime  # Date and time handling for import logs and timestamps
 import json  # JSON parsing and serialization
+import functools  # Bind repository writers for streamed imports
 from dataclasses import dataclass  # Data class decorators for import data structures
 
 from celery import shared_task  # Access Celery application and task decorators for defining async tasks # Version: 
 from src.backend.integrations.file.csv_processor import CSVProcessor  # Process and validate CSV file imports
 from src.backend.integrations.file.excel_processor import ExcelProcessor  # Process and validate Excel file imports
+from src.backend.integrations.file.validators import validate_rate_import_rows  # Validate streamed rate rows with the rate import rules
 from src.backend.integrations.ebilling.onit import OnitClient  # Interact with Onit eBilling system API
 from src.backend.integrations.ebilling.teamconnect import TeamConnectClient  # Interact with TeamConnect eBilling system API
 from src.backend.integrations.ebilling.legal_tracker import LegalTrackerClient  # Interact with Legal Tracker eBilling system API
@@ -23,6 +25,7 @@ from src.backend.db.repositories.attorney_repository import AttorneyRepository
 from src.backend.db.repositories.rate_repository import RateRepository  # Store and retrieve rate data
 from src.backend.db.repositories.billing_repository import BillingRepository  # Store and retrieve billing history data
 from src.backend.db.repositories.organization_repository import OrganizationRepository  # Retrieve organization data for imports
+from src.backend.db.session import session_scope  # Database session for the repositories of streamed imports
 from src.backend.services.rates.validation import validate_rate_data  # 
 from src.backend.utils.storage import storage_client  # Handle file storage for imports
 from src.backend.services.messaging.notifications import send_notification  # 
@@ -247,38 +250,43 @@ def process_file_import(self, file_path: str, file_type: str, import_type: str,
             temp_file.write(file_content)
             temp_file_path = temp_file.name
 
+        # Only the temporary copy is read from here on
+        del file_content
+
         # Select the appropriate file processor based on file_type (CSV or Excel)
         if file_type == "csv":
-            file_processor = CSVProcessor()
+            # CSV files are parsed, validated and stored chunk by chunk to bound worker memory
+            results = import_csv_file(temp_file_path, import_type, mapping, organization_id, user_id)
         elif file_type == "excel":
             file_processor = ExcelProcessor()
-        else:
-            raise ValueError(f"Unsupported file type: {file_type}")
 
-        # Validate the file schema using the processor
-        validation_schema = {}  # TODO: Define validation schema based on import_type
-        if not file_processor.validate_schema(temp_file_path, validation_schema):
-            raise ValueError(f"File schema validation failed: {file_processor.get_validation_errors()}")
+            # Validate the file schema using the processor
+            validation_schema = {}  # TODO: Define validation schema based on import_type
+            if not file_processor.validate_schema(temp_file_path, validation_schema):
+                raise ValueError(f"File schema validation failed: {file_processor.get_validation_errors()}")
 
-        # Process the file into a list of records
-        data = file_processor.process_file(temp_file_path)
+            # Process the file into a list of records
+            data = file_processor.process_file(temp_file_path)
 
-        # Map the records to internal models using the provided field mapping
-        # TODO: Implement field mapping logic
+            # Map the records to internal models using the provided field mapping
+            # TODO: Implement field mapping logic
 
-        # Validate the data using appropriate validation functions
-        # TODO: Implement data validation logic
+            # Validate the data using appropriate validation functions
+            # TODO: Implement data validation logic
 
-        # Store the data using the appropriate repository based on import_type
-        # TODO: Implement data storage logic
+            # Store the data using the appropriate repository based on import_type
+            # TODO: Implement data storage logic
+
+            results = {
+                "status": IMPORT_STATUS["COMPLETED"],
+                "created": 0,  # TODO: Update with actual counts
+                "updated": 0,  # TODO: Update with actual counts
+                "skipped": 0,  # TODO: Update with actual counts
+                "errors": []  # TODO: Update with actual errors
+            }
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
 
-        results = {
-            "status": IMPORT_STATUS["COMPLETED"],
-            "created": 0,  # TODO: Update with actual counts
-            "updated": 0,  # TODO: Update with actual counts
-            "skipped": 0,  # TODO: Update with actual counts
-            "errors": []  # TODO: Update with actual errors
-        }
         logger.info(f"File import completed for organization {organization_id} from {file_path} with results: {results}")
         send_notification(user_id, "file_import_complete", "File Import Complete",
                           f"Imported data from {file_path}.",
@@ -294,6 +302,61 @@ def process_file_import(self, file_path: str, file_type: str, import_type: str,
         return {"status": IMPORT_STATUS["FAILED"], "error": str(e)}
 
 
+def import_csv_file(file_path: str, import_type: str, mapping: dict, organization_id: str, user_id: str) -> dict:
+    """Stream a local CSV file into the repository for import_type, one chunk of rows at a time"""
+    with session_scope() as session:
+        if import_type == "rates":
+            # Rows failing the rate import rules are reported and never reach the repository
+            validator = validate_rate_import_rows
+            writer = functools.partial(RateRepository(session).import_rates, import_type="NEW", user_id=user_id)
+        elif import_type == "attorneys":
+            validator = None
+            writer = functools.partial(write_attorney_rows, AttorneyRepository(session), organization_id)
+        elif import_type == "billing":
+            validator = None
+            writer = functools.partial(write_billing_rows, BillingRepository(session))
+        else:
+            raise ValueError(f"Unsupported import type: {import_type}")
+
+        stream_result = CSVProcessor().process_import_stream(file_path, field_mapping=mapping, validator=validator,
+                                                             writer=writer)
+    if not stream_result["success"]:
+        raise ValueError(f"CSV import failed: {stream_result['errors'][-1]['error']}")
+
+    logger.info(f"Imported {stream_result['rows']} CSV rows in {stream_result['chunks']} chunks")
+    return {
+        "status": IMPORT_STATUS["COMPLETED"],
+        "created": stream_result["written"],
+        "updated": 0,
+        "skipped": stream_result["rows"] - stream_result["written"],
+        "errors": stream_result["errors"]
+    }
+
+
+def write_attorney_rows(attorney_repo: AttorneyRepository, organization_id: str, rows: list) -> dict:
+    """Store a chunk of attorney rows for the organization, reporting the rows the repository rejected"""
+    imported, errors = attorney_repo.bulk_import(rows, organization_id)
+    return {"successful": len(imported), "errors": [{"index": error["index"], "error": error["error"]} for error in errors]}
+
+
+def write_billing_rows(billing_repo: BillingRepository, rows: list) -> dict:
+    """Store a chunk of billing rows and their aggregates, reporting the rows the repository rejected"""
+    try:
+        return {"successful": len(billing_repo.bulk_create(rows)), "errors": []}
+    except Exception:
+        # The chunk was rolled back; store its rows one at a time to find the rejected ones
+        logger.warning("Billing import chunk rejected, storing its rows one at a time")
+
+    successful, errors = 0, []
+    for index, row in enumerate(rows):
+        try:
+            billing_repo.bulk_create([row])
+            successful += 1
+        except Exception as e:
+            errors.append({"index": index, "error": str(e)})
+    return {"successful": successful, "errors": errors}
+
+
 def validate_import_data(data: list, import_type: str, organization_id: str) -> tuple:
     """Validate data before import to ensure it meets system requirements"""
     valid_data = []
@@ -8,12 +8,14 @@ import json
 from datetime import datetime
 
 from celery import shared_task  # Third-party import: celery - version: N/A
-from src.backend.services.messaging.notifications import NotificationService  # Internal import
+from src.backend.services.messaging.notifications import NotificationService, NotificationChannel, deliver_notification_chunk, send_batch_notification as deliver_batch_notification  # Internal import
+from src.backend.services.messaging.email import send_batch_email as send_batch_email_now  # Internal import
+from src.backend.db.repositories.user_repository import UserRepository  # Internal import
 from src.backend.services.messaging.in_app import InAppNotificationService  # Internal import
 from src.backend.utils.email import EmailService  # Internal import
 from src.backend.utils.logging import logger  # Internal import
-from src.backend.db.session import db  # Internal import
-from src.backend.utils.constants import NOTIFICATION_TYPES  # Internal import
+from src.backend.db.session import db, session_scope  # Internal import
+from src.backend.utils.constants import NOTIFICATION_TYPES, UserRole  # Internal import
 
 
 @shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 5})
@@ -56,51 +58,97 @@ def send_user_notification(self, user_id: str, notification_type: str, context:
 
 
 @shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
-def send_organization_notification(self, organization_id: str, notification_type: str, context: dict, priority: str, role_filters: list) -> None:
+def send_organization_notification(self, organization_id: str, notification_type: str, context: dict, priority: str, role_filters: list) -> dict:
     """
     Celery task for sending notifications to all relevant users within an organization
+
+    Recipient IDs are loaded with one query and delivered through the batch notification pipeline,
+    which splits large organizations into chunked subtasks. The task ID, which is kept across retries,
+    is the delivery key, so a retry does not notify the users reached by the failed attempt again.
     """
     logger.info(f"Starting send_organization_notification task for org {organization_id}, type {notification_type}")
     try:
-        # Query users belonging to the organization that match the role filters
-        user_repository = UserRepository(db)
-        users = user_repository.get_users_by_role(organization_id=organization_id, role_filters=role_filters)
-
-        # Group users by notification preferences for batch processing
-        email_users = []
-        in_app_users = []
-        notification_service = NotificationService(db)
+        # Query the IDs of users belonging to the organization that match the role filters
+        with session_scope() as session:
+            user_ids = UserRepository(session).get_user_ids_by_organization(
+                organization_id, roles=[UserRole(role) for role in role_filters or []]
+            )
 
-        for user in users:
-            user_preferences = notification_service.get_user_preferences(user.id, notification_type)
-            if user_preferences.get('email', True):
-                email_users.append(user.id)
-            if user_preferences.get('in_app', True) or priority == 'high':
-                in_app_users.append(user.id)
+        if not user_ids:
+            logger.info(f"No users to notify in organization {organization_id}")
+            return {'success_count': 0, 'failure_count': 0}
 
         # Prepare batch notifications
         title = f"Organization Notification: {notification_type}"
         content = f"Your organization has a new notification of type {notification_type}"
 
-        # Send in-app notifications in batch for efficiency
-        if in_app_users:
-            in_app_service = InAppNotificationService(db)
-            in_app_service.create_notifications_for_users(user_ids=in_app_users, notification_type=notification_type, title=title, content=content, priority=priority, metadata=context)
-            logger.info(f"Batch in-app notifications created for {len(in_app_users)} users")
-
-        # Send email notifications in batch for efficiency
-        if email_users:
-            email_service = EmailService()
-            email_service.send_batch_email(to_emails=email_users, subject=title, content=content)
-            logger.info(f"Batch email notifications sent to {len(email_users)} users")
+        # Deliver in-app and email notifications in batches, or fan out to chunked subtasks
+        results = deliver_batch_notification(
+            user_ids, notification_type, title, content, {**(context or {}), 'real_time': True},
+            [NotificationChannel.IN_APP, NotificationChannel.EMAIL], priority == 'high', None,
+            delivery_key=self.request.id
+        )
 
-        logger.info(f"Successfully dispatched notifications to organization {organization_id}")
+        logger.info(f"Successfully dispatched notifications to {len(user_ids)} users of organization {organization_id}")
+        return results
 
     except Exception as e:
         logger.error(f"Error sending organization notification: {str(e)}", exc_info=True)
         raise self.retry(exc=e)
 
 
+@shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
+def send_batch_notification(self, user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str) -> dict:
+    """
+    Celery task for sending the same notification to multiple users queued by send_batch_notification_async,
+    keyed by its task ID so that retries skip the users already notified
+    """
+    logger.info(f"Starting send_batch_notification task for {len(user_ids)} users, type {event_type}")
+    try:
+        return deliver_batch_notification(
+            user_ids, event_type, title, content, {**(context or {}), 'real_time': True},
+            channels, is_high_priority, action_url, delivery_key=self.request.id
+        )
+
+    except Exception as e:
+        logger.error(f"Error sending batch notification: {str(e)}", exc_info=True)
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
+def send_notification_chunk(self, user_ids: list, event_type: str, title: str, content: str, context: dict, channels: list, is_high_priority: bool, action_url: str, delivery_key: typing.Optional[str] = None) -> dict:
+    """
+    Celery task delivering one chunk of a fanned-out notification, reporting its progress in the task state
+
+    The chunk's delivery key (the task ID when fan_out_notification did not assign one) makes retries
+    idempotent: recipients whose in-app notification or email batch was written before the failure are skipped.
+    """
+    logger.info(f"Starting send_notification_chunk task for {len(user_ids)} users, type {event_type}")
+    try:
+        def report_progress(stage: str, processed: int, total: int) -> None:
+            self.update_state(state='PROGRESS', meta={'stage': stage, 'processed': processed, 'total': total, 'recipients': len(user_ids)})
+
+        return deliver_notification_chunk(
+            user_ids, event_type, title, content, context, channels, is_high_priority, action_url,
+            progress_callback=report_progress, delivery_key=delivery_key or self.request.id
+        )
+
+    except Exception as e:
+        logger.error(f"Error sending notification chunk: {str(e)}", exc_info=True)
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, name='tasks.notifications.send_batch_email', retry_backoff=True, retry_kwargs={'max_retries': 3})
+def send_batch_email(self, to_emails: list, subject: str, content: str, is_html: bool = True) -> bool:
+    """
+    Celery task sending the same email to a batch of recipients over one SMTP connection
+    """
+    logger.info(f"Starting send_batch_email task for {len(to_emails)} recipients")
+    if not send_batch_email_now(to_emails, subject, content, is_html):
+        raise self.retry(exc=RuntimeError(f"Failed to send batch email to {len(to_emails)} recipients"))
+    return True
+
+
 @shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
 def send_negotiation_update_notification(self, negotiation_id: str, update_type: str, context: dict, notify_firm: bool, notify_client: bool) -> None:
     """
@@ -14,6 +14,7 @@ from .analytics_tasks import refresh_analytics_cache, schedule_recurring_analyti
 from .data_cleanup_tasks import archive_expired_active_data, purge_expired_archived_data, anonymize_personal_data, verify_archived_data_integrity, cleanup_temporary_files, cleanup_expired_sessions  # Internal import: Tasks for data cleanup operations
 from .notification_tasks import process_notification_queue, clean_old_notifications  # Internal import: Tasks for processing the notification queue
 from ..integrations.currency.exchange_rate_api import update_exchange_rates  # Internal import: Module for updating currency exchange rates
+from ..utils.currency import refresh_exchange_rate_table  # Internal import: In-process exchange rate table
 from ..utils.logging import get_logger  # Internal import: Logging utility for scheduled tasks
 from ..app.config import Config  # Internal import: Configuration settings for scheduled tasks
 
@@ -30,6 +31,9 @@ def update_currency_exchange_rates() -> dict:
         # Call the exchange_rate_api.update_exchange_rates function
         update_status = update_exchange_rates()
 
+        # Reload this worker's in-process exchange rate table; other processes refresh on their own interval
+        refresh_exchange_rate_table()
+
         # Log successful updates or errors encountered
         if update_status["success_count"] > 0:
             logger.info(f"Successfully updated {update_status['success_count']} exchange rates")
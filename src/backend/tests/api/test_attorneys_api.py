@@ -65,6 +65,28 @@ def test_get_attorneys_with_filters(client, attorney, law_firm_organization, law
     # assert response.status_code == 200
 
 
+def test_get_attorneys_as_client(client, attorney, client_organization, client_token, db_session):
+    """Test that clients list the attorneys of the firms they hold rates with, and only those"""
+    # Without a rate the client does not work with the attorney's firm
+    response = client.get('/api/v1/attorneys?page=1', headers={'Authorization': f'Bearer {client_token}'})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['items'] == []
+    assert data['total'] == 0
+
+    # Once the client holds a rate with the firm, the firm's attorneys are listed and counted
+    from ...db.models.rate import Rate
+    db_session.add(Rate(attorney_id=attorney.id, client_id=client_organization.id, firm_id=attorney.organization_id,
+                        amount=500.00, currency='USD', effective_date=datetime.date(2024, 1, 1)))
+    db_session.commit()
+
+    response = client.get('/api/v1/attorneys?page=1', headers={'Authorization': f'Bearer {client_token}'})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [item['name'] for item in data['items']] == [attorney.name]
+    assert data['total'] == 1
+
+
 def test_get_attorney_by_id(client, attorney, law_firm_token):
     """Test retrieving a specific attorney by ID"""
     # Make a GET request to /api/v1/attorneys/{attorney_id}
@@ -0,0 +1,6 @@
+"""Benchmark package for the Justice Bid Rate Negotiation System.
+
+Contains standalone scripts that measure the performance of backend hot paths.
+Benchmarks are not collected by pytest; run each module directly, e.g.
+``python -m src.backend.tests.benchmarks.bench_peer_comparison``.
+"""
@@ -0,0 +1,107 @@
+"""
+Benchmark of CSV rate import throughput and memory for a large billing export.
+
+Writes a synthetic rate export to a temporary file and imports it two ways: reading the whole file
+with read_csv, then mapping and cleaning every row (the list-of-dicts path), and with
+process_import_stream, which parses, types, validates and hands each chunk to a writer before
+reading the next. The writer only counts rows so the report measures parsing rather than database
+time. The report lists rows per second and peak traced memory of each path.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_csv_import [--rows 500000] [--chunk-size 20000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import pandas
+
+from src.backend.integrations.file.csv_processor import CSVProcessor
+
+STAFF_CLASSES = ["Partner", "Senior Associate", "Associate", "Paralegal", "Of Counsel"]
+OFFICES = ["New York", "London", "Chicago", "San Francisco", "Washington DC"]
+FIELD_MAPPING = {
+    "Timekeeper ID": "attorney_id",
+    "Client ID": "client_id",
+    "Staff Class": "staff_class",
+    "Office": "office",
+    "Rate": "amount",
+    "Currency": "currency",
+    "Effective Date": "effective_date",
+}
+
+
+def write_export(path: str, rows: int, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(",".join(FIELD_MAPPING) + ",Narrative\n")
+        for index in range(rows):
+            rate = "" if index % 997 == 0 else f"{rng.randrange(250, 1500)}.00"
+            handle.write(
+                f"TK{index % 40000:06d},C{index % 250:04d},{rng.choice(STAFF_CLASSES)},{rng.choice(OFFICES)},"
+                f"{rate},USD,2026-{index % 12 + 1:02d}-01,\"Review and revise agreement, call with client\"\n"
+            )
+
+
+def import_whole_file(path: str) -> int:
+    processor = CSVProcessor()
+    processor.set_field_mapping(FIELD_MAPPING)
+    headers, data = processor.read_csv(path)
+    mapped = processor.apply_field_mapping(headers, data)
+    cleaned = processor.infer_and_clean_data(list(FIELD_MAPPING.values()), mapped)
+    return sum(1 for row in cleaned if row["amount"] is not None)
+
+
+def import_stream(path: str, chunk_size: int) -> int:
+    def validator(frame: pandas.DataFrame) -> pandas.Series:
+        return pandas.Series(None, index=frame.index, dtype=object).where(frame["amount"].notna(), "Rate is required")
+
+    result = CSVProcessor().process_import_stream(
+        path, field_mapping=FIELD_MAPPING, validator=validator, writer=len, chunk_size=chunk_size
+    )
+    return result["written"]
+
+
+def measure(run: Callable[[], int]) -> Tuple[float, float, int]:
+    """Return seconds, peak traced MiB and valid rows of an import; tracing runs separately as it slows parsing."""
+    start = time.perf_counter()
+    valid = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500000, help="Rows in the CSV export")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Rows per chunk of the streaming import")
+    args = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        write_export(path, args.rows)
+        size = os.path.getsize(path) / (1024 * 1024)
+        results = {
+            "whole file": measure(lambda: import_whole_file(path)),
+            f"stream ({args.chunk_size} rows)": measure(lambda: import_stream(path, args.chunk_size)),
+        }
+    finally:
+        os.remove(path)
+
+    print(f"{args.rows} rows, {size:.1f} MiB file")
+    print(f"{'scenario':<24} {'seconds':>9} {'rows/s':>10} {'peak MiB':>9} {'valid':>9}")
+    for name, (seconds, peak, valid) in results.items():
+        print(f"{name:<24} {seconds:>9.2f} {args.rows / seconds:>10.0f} {peak:>9.1f} {valid:>9}")
+
+
+if __name__ == "__main__":
+    main()
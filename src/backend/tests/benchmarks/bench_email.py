@@ -0,0 +1,161 @@
+"""
+Benchmark of email throughput with per-message SMTP connections and with pooled connections.
+
+A local aiosmtpd server stands in for the mail relay and discards every message it accepts.
+Its EHLO handler sleeps for --handshake-ms to stand in for the TLS handshake and login that a
+real relay costs on every new connection. The report compares the previous send path, which
+opened and closed a connection per message, with send_email over the connection pool and with
+the send_emails batch path, and compares rendering a template through a fresh Jinja
+environment per email with the shared precompiled templates.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_email [--messages 2000] [--handshake-ms 20]
+"""
+
+import argparse
+import asyncio
+import socket
+import smtplib
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from aiosmtpd.controller import Controller
+
+from src.backend.utils import email
+
+TEMPLATE = """<html><body>
+<p>Dear {{ recipient_name }},</p>
+<p>{{ organization_name }} has requested rates for {{ rate_count }} timekeepers, due {{ deadline }}.</p>
+<ul>{% for office in offices %}<li>{{ office }}</li>{% endfor %}</ul>
+<p><a href="{{ app_url }}/rates/requests/{{ request_id }}">Review the request</a></p>
+</body></html>"""
+TEMPLATE_CONTEXT = {
+    "recipient_name": "Jane Partner", "organization_name": "Acme Corp", "rate_count": 42,
+    "deadline": "2026-11-30", "offices": ["New York", "London", "Chicago"],
+    "app_url": "https://app.justicebid.com", "request_id": "0f8c1d2e",
+}
+
+
+class SinkHandler:
+    """Accepts and discards messages, counting connections and messages."""
+
+    def __init__(self, handshake: float):
+        self.handshake = handshake
+        self.connections = 0
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        await asyncio.sleep(self.handshake)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 Message accepted for delivery"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_emails(count: int) -> List[Dict]:
+    return [
+        {"recipient": f"partner{index}@firm.example.com", "subject": "Rate request deadline",
+         "body": f"<p>Reminder {index}</p>", "is_html": True}
+        for index in range(count)
+    ]
+
+
+def legacy_send(config: Dict, email_data: Dict) -> None:
+    """The previous send path: connect, authenticate, send and quit for every message."""
+    _, recipients, message = email._build_message(
+        config, [email_data["recipient"]], email_data["subject"], email_data["body"],
+        None, True, [], [], None, None
+    )
+    smtp = smtplib.SMTP(config["smtp_host"], config["smtp_port"])
+    smtp.sendmail(config["default_sender"], recipients, message)
+    smtp.quit()
+
+
+def time_sends(handler: SinkHandler, send) -> Dict:
+    email.close_smtp_pools()
+    connections, messages = handler.connections, handler.messages
+    start = time.perf_counter()
+    send()
+    elapsed = time.perf_counter() - start
+    email.close_smtp_pools()
+    return {
+        "seconds": elapsed,
+        "connections": handler.connections - connections,
+        "messages": handler.messages - messages,
+    }
+
+
+def time_rendering(count: int) -> Dict:
+    with tempfile.TemporaryDirectory() as templates_dir:
+        Path(templates_dir, "rate_request.html").write_text(TEMPLATE)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            # A new template manager per email, as send_template_email used to create
+            email.EmailTemplate(Path(templates_dir)).render_template("rate_request", TEMPLATE_CONTEXT)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(count):
+            email.get_email_template_renderer(Path(templates_dir)).render_template("rate_request", TEMPLATE_CONTEXT)
+        shared = time.perf_counter() - start
+
+    return {"legacy": legacy, "shared": shared}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="Emails sent per scenario")
+    parser.add_argument("--handshake-ms", type=float, default=20.0,
+                        help="Simulated TLS handshake and login time per new connection")
+    args = parser.parse_args()
+
+    handler = SinkHandler(args.handshake_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    config = {
+        "smtp_host": controller.hostname, "smtp_port": controller.port, "smtp_username": "",
+        "smtp_password": "", "use_tls": False, "use_ssl": False,
+        "default_sender": "no-reply@justicebid.com",
+    }
+    emails = build_emails(args.messages)
+
+    try:
+        results = {
+            "per-message connection": time_sends(
+                handler, lambda: [legacy_send(config, email_data) for email_data in emails]),
+            "pooled send_email": time_sends(
+                handler, lambda: [email.send_email(to_email=e["recipient"], subject=e["subject"], body=e["body"],
+                                                   html=True, config=config) for e in emails]),
+            "send_emails batch": time_sends(handler, lambda: email.send_emails(emails, config=config)),
+        }
+    finally:
+        controller.stop()
+
+    print(f"{'scenario':<24} {'connections':>12} {'messages':>9} {'seconds':>9} {'msgs/s':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['connections']:>12} {result['messages']:>9} "
+            f"{result['seconds']:>9.2f} {result['messages'] / result['seconds']:>9.0f}"
+        )
+
+    rendering = time_rendering(args.messages)
+    print()
+    print(f"template rendering x{args.messages}: per-email environment {rendering['legacy'] * 1000:.1f} ms, "
+          f"shared precompiled {rendering['shared'] * 1000:.1f} ms "
+          f"({rendering['legacy'] / rendering['shared']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
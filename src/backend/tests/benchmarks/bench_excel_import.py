@@ -0,0 +1,85 @@
+"""
+Benchmark of reading a multi-sheet e-billing workbook.
+
+Writes a synthetic workbook with several wide sheets of timekeeper rates and reads every sheet
+three ways: with pandas.read_excel per sheet and all columns (opening the workbook again for each
+sheet), with read_sheets in this process from one read-only handle keeping only the mapped
+columns, and with read_sheets on a pool of sheet reading processes. The report lists total time
+and the per-sheet timings kept by the processor.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_excel_import [--sheets 4] [--rows 20000] [--columns 30] [--workers 4]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+
+import pandas
+from openpyxl import Workbook
+
+from src.backend.integrations.file.excel_processor import ExcelProcessor, detect_sheet_names
+
+MAPPED_COLUMNS = ["Timekeeper ID", "Staff Class", "Rate", "Currency", "Effective Date"]
+STAFF_CLASSES = ["Partner", "Senior Associate", "Associate", "Paralegal", "Of Counsel"]
+
+
+def write_workbook(path: str, sheets: int, rows: int, columns: int, seed: int = 5) -> None:
+    rng = random.Random(seed)
+    extra = [f"Field {index}" for index in range(max(0, columns - len(MAPPED_COLUMNS)))]
+    workbook = Workbook(write_only=True)
+    for sheet in range(sheets):
+        worksheet = workbook.create_sheet(f"Matter Group {sheet + 1}")
+        worksheet.append(MAPPED_COLUMNS + extra)
+        for index in range(rows):
+            worksheet.append(
+                [f"TK{index:06d}", rng.choice(STAFF_CLASSES), rng.randrange(250, 1500), "USD",
+                 datetime.datetime(2026, index % 12 + 1, 1)]
+                + [rng.random() if position % 2 else f"note {index}" for position in range(len(extra))]
+            )
+    workbook.save(path)
+
+
+def read_per_sheet(path: str) -> dict:
+    return {sheet_name: pandas.read_excel(path, sheet_name=sheet_name) for sheet_name in detect_sheet_names(path)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sheets", type=int, default=4, help="Sheets in the workbook")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per sheet")
+    parser.add_argument("--columns", type=int, default=30, help="Columns per sheet")
+    parser.add_argument("--workers", type=int, default=4, help="Sheet reading processes")
+    args = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(handle)
+    try:
+        write_workbook(path, args.sheets, args.rows, args.columns)
+        size = os.path.getsize(path) / (1024 * 1024)
+        processor = ExcelProcessor()
+
+        start = time.perf_counter()
+        read_per_sheet(path)
+        results = {"read_excel per sheet": (time.perf_counter() - start, None)}
+
+        for name, workers in (("read-only, mapped columns", 1), (f"{args.workers} processes", args.workers)):
+            start = time.perf_counter()
+            processor.read_sheets(path, columns=MAPPED_COLUMNS, max_workers=workers)
+            results[name] = (time.perf_counter() - start, dict(processor.sheet_timings))
+    finally:
+        os.remove(path)
+
+    print(f"{args.sheets} sheets x {args.rows} rows x {args.columns} columns, {size:.1f} MiB workbook")
+    print(f"{'scenario':<28} {'seconds':>9} {'speedup':>8}  per-sheet seconds")
+    baseline = results["read_excel per sheet"][0]
+    for name, (seconds, timings) in results.items():
+        per_sheet = " ".join(f"{timing['seconds']:.2f}" for timing in timings.values()) if timings else "-"
+        print(f"{name:<28} {seconds:>9.2f} {baseline / seconds:>7.1f}x  {per_sheet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark comparing the per-row import validators with the vectorized rule engine.
+
+Builds synthetic rate and billing imports in which about one row in twenty fails a rule and
+validates them twice: with the iterrows loops the validators used before (reproduced below, one
+Decimal and one pd.to_datetime call per cell) and with validate_rate_import_data and
+validate_billing_import_data, which evaluate every rule as a column operation and render messages
+for failing rows only. The per-row loops are only run up to --legacy-max-rows.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_import_validation [--legacy-max-rows 10000]
+"""
+
+import argparse
+import decimal
+import random
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Dict
+
+import pandas
+
+from src.backend.integrations.file.validators import (
+    validate_billing_import_data, validate_dataframe_structure, validate_rate_import_data,
+    BILLING_IMPORT_OPTIONAL_FIELDS, BILLING_IMPORT_REQUIRED_FIELDS, RATE_IMPORT_OPTIONAL_FIELDS,
+    RATE_IMPORT_REQUIRED_FIELDS, SUPPORTED_CURRENCIES
+)
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+CURRENCIES = ["USD", "EUR", "GBP", "usd", "XXX"]
+
+
+def build_rate_frame(count: int, seed: int = 0) -> pandas.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        broken = index % 20 == 0
+        # The per-row loop also reported a bad expiration date when the effective date was bad,
+        # so rows with a bad effective date have no expiration date to keep the outputs comparable
+        bad_effective_date = broken and index % 3 == 0
+        rows.append({
+            "Firm Name": f"Firm {index % 40}",
+            "Attorney Name": f"Attorney {index}",
+            "Rate Amount": rng.choice(["abc", -10, 512.125]) if broken else round(rng.uniform(200, 1500), 2),
+            "Effective Date": "2025-13-01" if bad_effective_date else f"2025-{index % 12 + 1:02d}-01",
+            "Expiration Date": None if bad_effective_date else "2024-12-31" if broken else f"2026-{index % 12 + 1:02d}-01",
+            "Currency": rng.choice(CURRENCIES) if broken else "USD",
+        })
+    return pandas.DataFrame(rows)
+
+
+def build_billing_frame(count: int, seed: int = 1) -> pandas.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        broken = index % 20 == 0
+        rows.append({
+            "Firm Name": f"Firm {index % 40}",
+            "Attorney Name": f"Attorney {index % 2000}",
+            "Hours": rng.choice([-1, 30, "n/a"]) if broken else round(rng.uniform(0.1, 10), 1),
+            "Fees": round(rng.uniform(100, 10000), 2),
+            "Date": "2099-01-01" if broken else f"2025-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "AFA Flag": rng.choice(["maybe", 2]) if broken else rng.choice(["Y", "N", 0, 1]),
+            "Currency": "USD",
+        })
+    return pandas.DataFrame(rows)
+
+
+def legacy_validate_rates(df: pandas.DataFrame, max_decimals: int = 2) -> Dict:
+    validate_dataframe_structure(df, RATE_IMPORT_REQUIRED_FIELDS, RATE_IMPORT_OPTIONAL_FIELDS)
+    errors = []
+    for idx, row in df.iterrows():
+        row_num = idx + 2
+        try:
+            rate_amount = Decimal(str(row["Rate Amount"]))
+            if rate_amount < 0:
+                errors.append(f"Row {row_num}: Rate amount cannot be negative")
+            if rate_amount < Decimal("0"):
+                errors.append(f"Row {row_num}: Rate amount must be at least 0")
+            exponent = rate_amount.as_tuple().exponent
+            if exponent < 0 and abs(exponent) > max_decimals:
+                errors.append(f"Row {row_num}: Rate amount has too many decimal places (max {max_decimals})")
+        except (ValueError, TypeError, decimal.InvalidOperation):
+            errors.append(f"Row {row_num}: Invalid rate amount format")
+        if not pandas.isna(row["Currency"]):
+            currency = str(row["Currency"]).strip().upper()
+            if currency not in SUPPORTED_CURRENCIES:
+                errors.append(f"Row {row_num}: Invalid currency code: {currency}")
+        try:
+            pandas.to_datetime(row["Effective Date"]).date()
+        except Exception:
+            errors.append(f"Row {row_num}: Invalid effective date format")
+        if not pandas.isna(row["Expiration Date"]):
+            try:
+                expiration_date = pandas.to_datetime(row["Expiration Date"]).date()
+                if expiration_date <= pandas.to_datetime(row["Effective Date"]).date():
+                    errors.append(f"Row {row_num}: Expiration date must be after effective date")
+            except Exception:
+                errors.append(f"Row {row_num}: Invalid expiration date format")
+    return {"valid": not errors, "errors": errors, "warnings": []}
+
+
+def legacy_validate_billing(df: pandas.DataFrame) -> Dict:
+    validate_dataframe_structure(df, BILLING_IMPORT_REQUIRED_FIELDS, BILLING_IMPORT_OPTIONAL_FIELDS)
+    errors, warnings = [], []
+    oldest = (date.today() - pandas.DateOffset(years=10)).date()
+    for idx, row in df.iterrows():
+        row_num = idx + 2
+        try:
+            hours = Decimal(str(row["Hours"]))
+            if hours < 0:
+                errors.append(f"Row {row_num}: Hours cannot be negative")
+            if hours > 24:
+                warnings.append(f"Row {row_num}: Hours value {hours} seems unusually high")
+        except (ValueError, TypeError, decimal.InvalidOperation):
+            errors.append(f"Row {row_num}: Invalid hours format")
+        try:
+            if Decimal(str(row["Fees"])) < 0:
+                errors.append(f"Row {row_num}: Fees cannot be negative")
+        except (ValueError, TypeError, decimal.InvalidOperation):
+            errors.append(f"Row {row_num}: Invalid fees format")
+        try:
+            billing_date = pandas.to_datetime(row["Date"]).date()
+            if billing_date > date.today():
+                errors.append(f"Row {row_num}: Billing date cannot be in the future")
+            if billing_date < oldest:
+                warnings.append(f"Row {row_num}: Billing date is more than 10 years old")
+        except Exception:
+            errors.append(f"Row {row_num}: Invalid date format")
+        afa_flag = row["AFA Flag"]
+        if isinstance(afa_flag, str):
+            if afa_flag.lower() not in ("true", "false", "yes", "no", "1", "0", "y", "n"):
+                errors.append(f"Row {row_num}: Invalid AFA Flag value: {afa_flag}")
+        elif int(afa_flag) not in (0, 1):
+            errors.append(f"Row {row_num}: Invalid AFA Flag value: {afa_flag}")
+    return {"valid": not errors, "errors": errors, "warnings": warnings}
+
+
+def timed(function, df: pandas.DataFrame):
+    start = time.perf_counter()
+    result = function(df)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--legacy-max-rows", type=int, default=10_000, help="Largest import run through the per-row loops")
+    args = parser.parse_args()
+
+    scenarios = [
+        ("rate", build_rate_frame, legacy_validate_rates, validate_rate_import_data),
+        ("billing", build_billing_frame, legacy_validate_billing, validate_billing_import_data),
+    ]
+    print(f"{'import':<8} {'rows':>8} {'errors':>7} {'per-row ms':>11} {'vectorized ms':>14} {'speedup':>8}")
+    for name, build, legacy, vectorized in scenarios:
+        for count in ROW_COUNTS:
+            df = build(count)
+            vectorized_ms, result = timed(vectorized, df)
+            if count <= args.legacy_max_rows:
+                legacy_ms, legacy_result = timed(legacy, df)
+                if legacy_result["errors"] != result["errors"]:
+                    raise AssertionError(f"{name} errors differ between the per-row and vectorized validators")
+                legacy_text, speedup = f"{legacy_ms:.0f}", f"{legacy_ms / vectorized_ms:.1f}x"
+            else:
+                legacy_text, speedup = "-", "-"
+            print(f"{name:<8} {count:>8} {len(result['errors']):>7} {legacy_text:>11} {vectorized_ms:>14.0f} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
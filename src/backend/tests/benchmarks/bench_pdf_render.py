@@ -0,0 +1,124 @@
+"""
+Benchmark of rate report PDF rendering for a large report.
+
+Builds a synthetic rate report and renders it three ways: as a single table flowable laid out by
+SimpleDocTemplate with every row in memory (how a whole-document build lays out a large table),
+with the page-by-page streamed table of render_table_pdf in this process, and as several
+concurrent reports through the PDF render pool. The report lists render time and peak traced
+memory of the in-process renders, and throughput and pool metrics of the pooled renders.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_pdf_render [--rows 10000] [--reports 4] [--workers 2]
+"""
+
+import argparse
+import datetime
+import io
+import random
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
+
+from reportlab.platypus import SimpleDocTemplate, Table
+
+from src.backend.services.documents import pdf_generator
+from src.backend.services.documents.pdf_rendering import PDFRenderPool
+
+STAFF_CLASSES = ["Partner", "Senior Associate", "Associate", "Paralegal", "Of Counsel"]
+OFFICES = ["New York", "London", "Chicago", "San Francisco", "Washington DC"]
+
+
+def build_rate_data(rows: int, seed: int = 7) -> List[Dict]:
+    rng = random.Random(seed)
+    effective_date = datetime.date(2027, 1, 1)
+    data = []
+    for index in range(rows):
+        current_rate = Decimal(rng.randrange(250, 1500))
+        data.append({
+            "attorney_name": f"Timekeeper {index:05d}",
+            "staff_class": rng.choice(STAFF_CLASSES),
+            "office": rng.choice(OFFICES),
+            "current_rate": current_rate,
+            "proposed_rate": (current_rate * Decimal(rng.uniform(1.0, 1.12))).quantize(Decimal("1")),
+            "currency": "USD",
+            "effective_date": effective_date,
+        })
+    return data
+
+
+def render_single_table(title: str, data: List[Dict], columns: List[Dict], options: Dict) -> bytes:
+    """Lay out every row as one table flowable, so the whole table is held and split in memory."""
+    buffer = io.BytesIO()
+    table_data = [[col["label"] for col in columns]]
+    table_data.extend([pdf_generator._format_table_cell(row, col) for col in columns] for row in data)
+    table = Table(table_data, colWidths=pdf_generator._table_column_widths(columns), repeatRows=1)
+    table.setStyle(pdf_generator.get_table_style())
+    doc = SimpleDocTemplate(buffer, pagesize=pdf_generator.DEFAULT_PAGE_SIZE, title=title)
+    doc.build([table], onFirstPage=lambda c, d: pdf_generator.add_header_footer(c, title, options),
+              onLaterPages=lambda c, d: pdf_generator.add_header_footer(c, title, options))
+    return buffer.getvalue()
+
+
+def measure(render: Callable[[], bytes]) -> Tuple[float, float, int]:
+    """Return seconds, peak traced MiB and PDF size of a render; tracing runs separately as it slows rendering."""
+    start = time.perf_counter()
+    pdf_bytes = render()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), len(pdf_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Rows in the rate report")
+    parser.add_argument("--reports", type=int, default=4, help="Concurrent reports rendered through the pool")
+    parser.add_argument("--workers", type=int, default=2, help="Render pool processes")
+    args = parser.parse_args()
+
+    title = "2027 Rate Submission"
+    data = build_rate_data(args.rows)
+    columns = pdf_generator.rate_report_columns(data)
+    options = {"metadata": {"Client": "Acme Corp", "Firm": "Example LLP", "Rows": args.rows}}
+    pdf_generator.warm_render_caches()
+
+    results = {
+        "single table flowable": measure(lambda: render_single_table(title, data, columns, options)),
+        "streamed pages": measure(lambda: pdf_generator.render_table_pdf(title, data, columns, options)),
+    }
+
+    print(f"{args.rows} rows")
+    print(f"{'scenario':<24} {'seconds':>9} {'peak MiB':>9} {'PDF KiB':>9}")
+    for name, (seconds, peak, size) in results.items():
+        print(f"{name:<24} {seconds:>9.2f} {peak:>9.1f} {size / 1024:>9.0f}")
+
+    pool = PDFRenderPool(max_workers=args.workers)
+    try:
+        # Start the processes and load their caches before timing
+        pool.render("warmup", pdf_generator.render_table_pdf, title, data[:10], columns, options)
+        start = time.perf_counter()
+        futures = [
+            pool.submit("rate_report", pdf_generator.render_table_pdf, title, data, columns, options)
+            for _ in range(args.reports)
+        ]
+        depth = pool.stats()["queue_depth"]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+        stats = pool.stats()["kinds"]["rate_report"]
+    finally:
+        pool.shutdown()
+
+    sequential = results["streamed pages"][0] * args.reports
+    print()
+    print(f"{args.reports} reports on {args.workers} pool processes: {elapsed:.2f} s "
+          f"(sequential in-process estimate {sequential:.2f} s, {sequential / elapsed:.1f}x)")
+    print(f"queue depth after submit {depth}, mean render {stats['render_seconds_mean']:.2f} s, "
+          f"max render {stats['render_seconds_max']:.2f} s, mean queued {stats['wait_seconds_mean']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
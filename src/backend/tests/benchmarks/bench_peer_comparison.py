@@ -0,0 +1,213 @@
+"""
+Benchmark comparing the per-organization peer comparison loop with the single-query comparison engine.
+
+Repositories are replaced with in-memory fakes that sleep for a fixed simulated round-trip latency
+on every call, so the report shows both the number of database round trips and the wall time
+as the peer group grows.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_peer_comparison [--latency-ms 2] [--staff-classes 8]
+"""
+
+import argparse
+import datetime
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+from unittest import mock
+
+import numpy
+import pandas
+
+from src.backend.services.analytics import peer_comparison
+from src.backend.utils.currency import ExchangeRateTable
+
+PEER_GROUP_SIZES = [5, 10, 20, 40, 80]
+ATTORNEYS_PER_STAFF_CLASS = 25
+CURRENCIES = ["USD", "EUR", "GBP"]
+EXCHANGE_RATES = {"USD": 1.0, "EUR": 1.08, "GBP": 1.27}
+PRACTICE_AREAS = ["Litigation", "Corporate", "Tax", "IP"]
+GEOGRAPHIES = ["North America", "Europe", "APAC"]
+
+
+class RoundTripCounter:
+    """Counts simulated database round trips and sleeps for the configured latency on each."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+
+    def hit(self):
+        self.count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class FakeOrganizationRepository:
+    def __init__(self, counter: RoundTripCounter, staff_classes: List[SimpleNamespace]):
+        self._counter = counter
+        self._staff_classes = staff_classes
+
+    def get_by_id(self, organization_id):
+        self._counter.hit()
+        return SimpleNamespace(id=organization_id, name="Benchmark Firm", staff_classes=self._staff_classes)
+
+
+class FakePeerGroupRepository:
+    def __init__(self, counter: RoundTripCounter, member_ids: List[str]):
+        self._counter = counter
+        self._member_ids = member_ids
+
+    def get_member_ids(self, peer_group_id):
+        self._counter.hit()
+        return [uuid.UUID(member_id) for member_id in self._member_ids]
+
+
+class FakeRateRepository:
+    def __init__(self, counter: RoundTripCounter, rows: List[Dict]):
+        self._counter = counter
+        self._rows = rows
+
+    def get_by_firm(self, firm_id: str, staff_class_id: Optional[str] = None, as_of_date=None, **kwargs):
+        self._counter.hit()
+        return [
+            SimpleNamespace(**row)
+            for row in self._rows
+            if row["firm_id"] == firm_id and (staff_class_id is None or row["staff_class_id"] == staff_class_id)
+        ]
+
+    def get_comparison_rows(self, firm_ids: List[str], as_of_date=None, **kwargs):
+        self._counter.hit()
+        wanted = set(firm_ids)
+        return [row for row in self._rows if row["firm_id"] in wanted]
+
+
+def build_dataset(peer_group_size: int, staff_class_count: int, seed: int = 0):
+    """Builds synthetic firms, staff classes and rates for one benchmark run."""
+    rng = numpy.random.default_rng(seed)
+    organization_id = str(uuid.uuid4())
+    member_ids = [organization_id] + [str(uuid.uuid4()) for _ in range(peer_group_size)]
+    staff_classes = [
+        SimpleNamespace(id=str(uuid.uuid4()), name=f"Staff Class {index}") for index in range(staff_class_count)
+    ]
+
+    rows = []
+    for firm_id in member_ids:
+        for index, staff_class in enumerate(staff_classes):
+            for _ in range(ATTORNEYS_PER_STAFF_CLASS):
+                rows.append({
+                    "firm_id": firm_id,
+                    "staff_class_id": staff_class.id,
+                    "staff_class": staff_class.name,
+                    "practice_area": PRACTICE_AREAS[index % len(PRACTICE_AREAS)],
+                    "geography": GEOGRAPHIES[int(rng.integers(len(GEOGRAPHIES)))],
+                    "type": "standard",
+                    "amount": float(rng.uniform(200, 1500)),
+                    "currency": CURRENCIES[int(rng.integers(len(CURRENCIES)))],
+                })
+    return organization_id, member_ids, staff_classes, rows
+
+
+def legacy_compare_rates_by_staff_class(organization_id, member_ids, organization_repository,
+                                        rate_repository, target_currency, as_of_date) -> Dict:
+    """The previous algorithm: one get_by_firm per staff class per organization and a growing concat."""
+    organization = organization_repository.get_by_id(organization_id)
+    comparison_data = {}
+    for staff_class in organization.staff_classes:
+        org_rates = rate_repository.get_by_firm(
+            firm_id=organization_id, staff_class_id=staff_class.id, as_of_date=as_of_date
+        )
+        org_rates_df = pandas.DataFrame([rate.__dict__ for rate in org_rates])
+
+        peer_rates_df = pandas.DataFrame()
+        for peer_id in member_ids[1:]:
+            peer_rates = rate_repository.get_by_firm(
+                firm_id=peer_id, staff_class_id=staff_class.id, as_of_date=as_of_date
+            )
+            peer_rates_df = pandas.concat(
+                [peer_rates_df, pandas.DataFrame([rate.__dict__ for rate in peer_rates])],
+                ignore_index=True,
+            )
+
+        org_rates_df = peer_comparison.normalize_currencies(org_rates_df, target_currency, as_of_date)
+        peer_rates_df = peer_comparison.normalize_currencies(peer_rates_df, target_currency, as_of_date)
+
+        comparison_data[staff_class.name] = {
+            "organization": peer_comparison.calculate_rate_statistics(org_rates_df),
+            "peer_group": peer_comparison.calculate_rate_statistics(peer_rates_df),
+        }
+    return comparison_data
+
+
+def run(latency: float, staff_class_count: int) -> List[Dict]:
+    as_of_date = datetime.date.today()
+    peer_group_id = str(uuid.uuid4())
+    results = []
+
+    for size in PEER_GROUP_SIZES:
+        organization_id, member_ids, staff_classes, rows = build_dataset(size, staff_class_count)
+
+        legacy_counter = RoundTripCounter(latency)
+        start = time.perf_counter()
+        legacy_compare_rates_by_staff_class(
+            organization_id,
+            member_ids,
+            FakeOrganizationRepository(legacy_counter, staff_classes),
+            FakeRateRepository(legacy_counter, rows),
+            "USD",
+            as_of_date,
+        )
+        legacy_seconds = time.perf_counter() - start
+
+        engine_counter = RoundTripCounter(latency)
+        start = time.perf_counter()
+        peer_comparison.compare_rates_by_dimensions(
+            organization_id,
+            peer_group_id,
+            {},
+            "USD",
+            as_of_date,
+            peer_group_repository=FakePeerGroupRepository(engine_counter, member_ids),
+            rate_repository=FakeRateRepository(engine_counter, rows),
+            organization_repository=FakeOrganizationRepository(engine_counter, staff_classes),
+        )
+        engine_seconds = time.perf_counter() - start
+
+        results.append({
+            "peer_group_size": size,
+            "rates": len(rows),
+            "legacy_round_trips": legacy_counter.count,
+            "legacy_ms": legacy_seconds * 1000,
+            "engine_round_trips": engine_counter.count,
+            "engine_ms": engine_seconds * 1000,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per round trip")
+    parser.add_argument("--staff-classes", type=int, default=8, help="Staff classes per organization")
+    args = parser.parse_args()
+
+    # Exchange rates are fixed so the benchmark never reaches Redis or the currency API
+    exchange_rate_table = ExchangeRateTable("USD")
+    exchange_rate_table.load_rates(datetime.date.today(), {code: 1 / rate for code, rate in EXCHANGE_RATES.items()})
+    with mock.patch.object(peer_comparison, "get_exchange_rate_table", lambda: exchange_rate_table), \
+            mock.patch.object(peer_comparison, "load_historical_exchange_rates", lambda start_date, end_date: 0):
+        results = run(args.latency_ms / 1000, args.staff_classes)
+
+    print(f"{'peers':>6} {'rates':>8} {'legacy trips':>13} {'legacy ms':>10} "
+          f"{'engine trips':>13} {'engine ms':>10} {'speedup':>8}")
+    for result in results:
+        print(
+            f"{result['peer_group_size']:>6} {result['rates']:>8} "
+            f"{result['legacy_round_trips']:>13} {result['legacy_ms']:>10.1f} "
+            f"{result['engine_round_trips']:>13} {result['engine_ms']:>10.1f} "
+            f"{result['legacy_ms'] / result['engine_ms']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
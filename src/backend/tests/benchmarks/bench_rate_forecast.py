@@ -0,0 +1,113 @@
+"""
+Benchmark of batch rate forecasting over many attorney and staff class series.
+
+Builds a synthetic rate trend frame with one rate per series and year, with some years missing,
+and compares fitting each series separately with numpy.polyfit against the vectorized fit over the
+padded series matrix. It then times a full forecast_rates call, and a second call after new rates
+land for a share of the series, when cached parameters are reused for the rest. The cache is held
+in memory (pickled like the Redis tier) so the report measures fitting rather than network time.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_rate_forecast [--series 50000] [--years 8] [--changed 0.02]
+"""
+
+import argparse
+import pickle
+import time
+from typing import Dict
+from unittest import mock
+
+import numpy
+import pandas
+
+from src.backend.services.analytics import rate_forecasting
+
+STAFF_CLASSES = ["Partner", "Counsel", "Senior Associate", "Associate", "Paralegal"]
+LOOP_SAMPLE = 2000
+
+
+def build_frame(series: int, years: int, seed: int = 11) -> pandas.DataFrame:
+    rng = numpy.random.default_rng(seed)
+    year_values = numpy.arange(2026 - years, 2026)
+    series_index = numpy.repeat(numpy.arange(series), years)
+    year_column = numpy.tile(year_values, series)
+    base = rng.uniform(250, 1500, series)
+    growth = rng.normal(0.05, 0.02, series)
+    amount = base[series_index] * (1 + growth[series_index]) ** (year_column - year_values[0])
+    amount *= rng.normal(1.0, 0.01, amount.size)
+    keep = rng.random(amount.size) > 0.1
+    frame = pandas.DataFrame({
+        "attorney_id": series_index.astype(str),
+        "client_id": "client",
+        "staff_class": numpy.array(STAFF_CLASSES)[series_index % len(STAFF_CLASSES)],
+        "effective_date": pandas.to_datetime(pandas.Series(year_column).astype(str) + "-01-01"),
+        "year": year_column,
+        "amount": amount.round(0),
+    })
+    return frame[keep].reset_index(drop=True)
+
+
+def fit_in_loop(matrix: rate_forecasting.SeriesMatrix, rows: int) -> float:
+    """Fit the first rows series one at a time, as a per-series implementation would."""
+    start = time.perf_counter()
+    for values in matrix.values[:rows]:
+        observed = ~numpy.isnan(values)
+        if observed.sum() > 1:
+            numpy.polyfit(matrix.years[observed], values[observed], 1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=50000, help="Attorney and staff class series")
+    parser.add_argument("--years", type=int, default=8, help="Years of rate history per series")
+    parser.add_argument("--changed", type=float, default=0.02, help="Share of series receiving a new rate")
+    args = parser.parse_args()
+
+    frame = build_frame(args.series, args.years)
+    start = time.perf_counter()
+    matrix = rate_forecasting.build_series_matrix(frame)
+    build_seconds = time.perf_counter() - start
+
+    sample = min(LOOP_SAMPLE, len(matrix))
+    loop_seconds = fit_in_loop(matrix, sample) * len(matrix) / sample
+
+    print(f"{len(matrix)} series, {len(frame)} rates, series matrix built in {build_seconds:.2f} s")
+    print(f"{'model':<12} {'per-series loop (est.)':>23} {'vectorized fit':>15} {'speedup':>8}")
+    for model in rate_forecasting.FORECAST_MODELS:
+        start = time.perf_counter()
+        rate_forecasting.fit_forecast_models(matrix.values, matrix.years, model)
+        vectorized = time.perf_counter() - start
+        loop = f"{loop_seconds:.2f} s" if model == "linear" else "-"
+        speedup = f"{loop_seconds / vectorized:.0f}x" if model == "linear" else "-"
+        print(f"{model:<12} {loop:>23} {vectorized:>13.2f} s {speedup:>8}")
+
+    store: Dict[str, bytes] = {}
+
+    def get_cache(key):
+        return pickle.loads(store[key]) if key in store else None
+
+    def set_cache(key, value, ttl=None, tags=None):
+        store[key] = pickle.dumps(value)
+        return True
+
+    # New rates land for a share of the series before the second forecast
+    changed_ids = set(numpy.arange(int(len(matrix) * args.changed)).astype(str))
+    new_rates = frame[frame["attorney_id"].isin(changed_ids)].drop_duplicates(["attorney_id", "staff_class"]).assign(
+        effective_date=pandas.Timestamp("2026-01-01"), year=2026
+    )
+    updated = pandas.concat([frame, new_rates], ignore_index=True)
+
+    print()
+    with mock.patch.object(rate_forecasting, "get_cache", get_cache), \
+            mock.patch.object(rate_forecasting, "set_cache", set_cache):
+        for name, data in (("first forecast", frame), ("unchanged data", frame), ("after new rates", updated)):
+            start = time.perf_counter()
+            result = rate_forecasting.forecast_rates(data, "linear", 2, cache_key="bench")
+            elapsed = time.perf_counter() - start
+            print(f"forecast_rates {name:<16} {elapsed:>6.2f} s, {result['refitted']:>6} of "
+                  f"{result['series_count']} series refitted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Benchmark comparing the per-row rate import loop with the set-based bulk import engine.
+
+The database session is replaced with an in-memory fake that sleeps for a fixed simulated
+round-trip latency on every statement, commit and COPY, so the report shows both the number
+of database round trips and the wall time for imports of 1k, 10k and 100k rows. The per-row
+loop is only run up to --legacy-max-rows because it grows linearly with the row count.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_rate_import [--latency-ms 1] [--legacy-max-rows 10000]
+"""
+
+import argparse
+import datetime
+import time
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest import mock
+
+import numpy
+
+from src.backend.db.repositories import rate_repository
+from src.backend.db.repositories.rate_repository import RateRepository
+from src.backend.utils.constants import RateStatus, RateType
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+CURRENCIES = ["USD", "EUR", "GBP"]
+FIRMS = 20
+ATTORNEYS_PER_FIRM = 50
+
+
+class RoundTripCounter:
+    """Counts simulated database round trips and sleeps for the configured latency on each."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+
+    def hit(self):
+        self.count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class FakeQuery:
+    def __init__(self, counter: RoundTripCounter):
+        self._counter = counter
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def distinct(self):
+        return self
+
+    def all(self):
+        self._counter.hit()
+        return []
+
+
+class FakeCursor:
+    def __init__(self, counter: RoundTripCounter):
+        self._counter = counter
+
+    def copy_expert(self, sql: str, buffer):
+        buffer.read()
+        self._counter.hit()
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session stand-in for a PostgreSQL/psycopg2 connection; statements and commits are round trips."""
+
+    def __init__(self, counter: RoundTripCounter):
+        self._counter = counter
+
+    def add(self, instance):
+        pass
+
+    def execute(self, statement, params=None):
+        self._counter.hit()
+        return SimpleNamespace(all=lambda: [])
+
+    def query(self, *entities):
+        return FakeQuery(self._counter)
+
+    def commit(self):
+        self._counter.hit()
+
+    def rollback(self):
+        pass
+
+    @contextmanager
+    def begin_nested(self):
+        yield
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="psycopg2"))
+
+    def connection(self):
+        return SimpleNamespace(connection=SimpleNamespace(cursor=lambda: FakeCursor(self._counter)))
+
+
+def build_rows(count: int, seed: int = 0) -> List[Dict]:
+    """Builds synthetic import rows shaped like a parsed rate import file."""
+    rng = numpy.random.default_rng(seed)
+    client_id = str(uuid.uuid4())
+    office_id = str(uuid.uuid4())
+    staff_class_ids = [str(uuid.uuid4()) for _ in range(5)]
+    firm_ids = [str(uuid.uuid4()) for _ in range(FIRMS)]
+    attorney_ids = [str(uuid.uuid4()) for _ in range(FIRMS * ATTORNEYS_PER_FIRM)]
+
+    rows = []
+    for index in range(count):
+        attorney = int(rng.integers(len(attorney_ids)))
+        rows.append({
+            "attorney_id": attorney_ids[attorney],
+            "client_id": client_id,
+            "firm_id": firm_ids[attorney // ATTORNEYS_PER_FIRM],
+            "office_id": office_id,
+            "staff_class_id": staff_class_ids[attorney % len(staff_class_ids)],
+            "amount": round(float(rng.uniform(200, 1500)), 2),
+            "currency": CURRENCIES[int(rng.integers(len(CURRENCIES)))],
+            "effective_date": "2025-01-01",
+            "expiration_date": "2025-12-31",
+        })
+    return rows
+
+
+def legacy_import_rates(repository: RateRepository, rows: List[Dict]) -> Dict:
+    """The previous algorithm: validate each row in Python and call create(), which commits, per row."""
+    results = {"total": len(rows), "successful": 0, "failed": 0, "errors": []}
+    required_fields = ["attorney_id", "client_id", "firm_id", "amount", "currency", "effective_date"]
+    for index, data in enumerate(rows):
+        missing = [field for field in required_fields if field not in data]
+        if missing:
+            results["failed"] += 1
+            results["errors"].append({"index": index, "error": f"Missing required fields: {', '.join(missing)}"})
+            continue
+        repository.create(
+            attorney_id=data["attorney_id"],
+            client_id=data["client_id"],
+            firm_id=data["firm_id"],
+            office_id=data["office_id"],
+            staff_class_id=data["staff_class_id"],
+            amount=data["amount"],
+            currency=data["currency"],
+            type=RateType.STANDARD,
+            effective_date=datetime.date.fromisoformat(data["effective_date"]),
+            expiration_date=datetime.date.fromisoformat(data["expiration_date"]),
+            status=RateStatus.DRAFT,
+        )
+        results["successful"] += 1
+    return results
+
+
+def run(latency: float, legacy_max_rows: int) -> List[Dict]:
+    results = []
+
+    for count in ROW_COUNTS:
+        rows = build_rows(count)
+        result = {"rows": count}
+
+        if count <= legacy_max_rows:
+            legacy_counter = RoundTripCounter(latency)
+            start = time.perf_counter()
+            legacy_import_rates(RateRepository(FakeSession(legacy_counter)), rows)
+            result["legacy_round_trips"] = legacy_counter.count
+            result["legacy_ms"] = (time.perf_counter() - start) * 1000
+
+        engine_counter = RoundTripCounter(latency)
+        start = time.perf_counter()
+        summary = RateRepository(FakeSession(engine_counter)).import_rates(rows, "NEW")
+        result["engine_round_trips"] = engine_counter.count
+        result["engine_ms"] = (time.perf_counter() - start) * 1000
+        assert summary["successful"] == count, summary["errors"][:3]
+
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Simulated latency per round trip")
+    parser.add_argument("--legacy-max-rows", type=int, default=10_000, help="Largest import run through the per-row loop")
+    args = parser.parse_args()
+
+    # Cache invalidation is a Redis call per write in the legacy path; keep the benchmark off Redis
+    with mock.patch.object(rate_repository, "invalidate_tags", lambda *tags: 0):
+        results = run(args.latency_ms / 1000, args.legacy_max_rows)
+
+    print(f"{'rows':>8} {'legacy trips':>13} {'legacy ms':>10} {'engine trips':>13} {'engine ms':>10} {'speedup':>8}")
+    for result in results:
+        if "legacy_ms" in result:
+            legacy = f"{result['legacy_round_trips']:>13} {result['legacy_ms']:>10.1f}"
+            speedup = f"{result['legacy_ms'] / result['engine_ms']:>7.1f}x"
+        else:
+            legacy = f"{'-':>13} {'-':>10}"
+            speedup = f"{'-':>8}"
+        print(
+            f"{result['rows']:>8} {legacy} "
+            f"{result['engine_round_trips']:>13} {result['engine_ms']:>10.1f} {speedup}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of the per-call overhead of permission-checking decorators.
+
+Compares the legacy check, which scanned the user's permissions and then every role's permission
+list, with the compiled permission sets, for single permissions through a require_permission style
+decorator and for batches of permissions checked one by one versus with check_many. Compiled
+checks are timed both for plain users, whose role combination is looked up per call, and for
+authenticated principals, which carry their compiled permissions as require_auth provides them.
+
+Usage:
+    python -m src.backend.tests.benchmarks.bench_rbac [--calls 200000] [--batch-size 10]
+"""
+
+import argparse
+import time
+from functools import wraps
+from types import SimpleNamespace
+from typing import Callable, List
+
+from src.backend.services.auth import rbac
+
+PERMISSIONS = [
+    "rates:read", "rates:approve", "rates:delete", "negotiations:read", "negotiations:approve",
+    "messages:create", "analytics:view", "ocg:read", "users:update", "system:settings",
+]
+USERS = {
+    "standard_user": SimpleNamespace(role=SimpleNamespace(value=rbac.STANDARD_USER_ROLE), permissions={}),
+    "rate_administrator": SimpleNamespace(role=SimpleNamespace(value=rbac.RATE_ADMIN_ROLE),
+                                          permissions={"ocg:read": True}),
+    "system_administrator": SimpleNamespace(role=SimpleNamespace(value=rbac.SYSTEM_ADMIN_ROLE), permissions={}),
+}
+
+
+def legacy_has_permission(user, permission: str) -> bool:
+    """The permission check before compilation: direct permissions, then each role's own list."""
+    if user.permissions and permission in user.permissions:
+        return True
+    for role_code in rbac.get_user_roles(user):
+        role = rbac.role_manager.get_role(role_code)
+        if role and permission in role.permissions:
+            return True
+    return False
+
+
+def require(check: Callable, user, permission: str) -> Callable:
+    """Builds a require_permission style decorator around a no-op endpoint."""
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not check(user, permission):
+                return {'message': 'Forbidden'}, 403
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator(lambda: None)
+
+
+def time_calls(endpoint: Callable, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        endpoint()
+    return time.perf_counter() - start
+
+
+def time_batches(check: Callable, user, permissions: List[str], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        check(user, permissions)
+    return time.perf_counter() - start
+
+
+def legacy_batch(user, permissions: List[str]):
+    return {permission: legacy_has_permission(user, permission) for permission in permissions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000, help="Decorated calls per measurement")
+    parser.add_argument("--batch-size", type=int, default=len(PERMISSIONS), help="Permissions per batch check")
+    args = parser.parse_args()
+
+    batch = (PERMISSIONS * (args.batch_size // len(PERMISSIONS) + 1))[:args.batch_size]
+
+    principals = {
+        name: SimpleNamespace(effective_permissions=rbac.get_user_permission_set(user))
+        for name, user in USERS.items()
+    }
+
+    print(f"{'user':<22}{'check':<18}{'legacy ns':>12}{'compiled ns':>14}{'principal ns':>14}{'speedup':>10}")
+    for name, user in USERS.items():
+        for permission in ("rates:read", "system:settings"):
+            legacy = time_calls(require(legacy_has_permission, user, permission), args.calls)
+            compiled = time_calls(require(rbac.has_permission, user, permission), args.calls)
+            principal = time_calls(require(rbac.has_permission, principals[name], permission), args.calls)
+            print(f"{name:<22}{permission:<18}{legacy / args.calls * 1e9:>12.0f}"
+                  f"{compiled / args.calls * 1e9:>14.0f}{principal / args.calls * 1e9:>14.0f}"
+                  f"{legacy / principal:>9.1f}x")
+
+    print()
+    print(f"{'user':<22}{'batch':<18}{'legacy ns':>12}{'check_many ns':>14}{'principal ns':>14}{'speedup':>10}")
+    batch_calls = max(1, args.calls // len(batch))
+    for name, user in USERS.items():
+        legacy = time_batches(legacy_batch, user, batch, batch_calls)
+        compiled = time_batches(rbac.check_many, user, batch, batch_calls)
+        principal = time_batches(rbac.check_many, principals[name], batch, batch_calls)
+        print(f"{name:<22}{len(batch):<18}{legacy / batch_calls * 1e9:>12.0f}"
+              f"{compiled / batch_calls * 1e9:>14.0f}{principal / batch_calls * 1e9:>14.0f}"
+              f"{legacy / principal:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import pytest
 import pandas as pd
+import datetime
 import io
 import os
 import tempfile
+import multiprocessing
+from types import SimpleNamespace
 
 from src.backend.integrations.file.csv_processor import CSVProcessor
+from src.backend.integrations.file import excel_processor
 from src.backend.integrations.file.excel_processor import ExcelProcessor
-from src.backend.integrations.file.validators import validate_csv_file, validate_excel_file, validate_dataframe_structure, RATE_IMPORT_REQUIRED_FIELDS
+from src.backend.integrations.file.validators import validate_csv_file, validate_excel_file, validate_dataframe_structure, validate_rate_import_rows, RATE_IMPORT_REQUIRED_FIELDS, FileValidator
 from src.backend.utils.file_handling import create_temp_file, read_excel_file, read_csv_file
 
 # Define a fixture for creating a sample CSV content string or file
@@ -173,6 +177,99 @@ def test_csv_processor_process_import():
     assert result['data'][0]['firm_name'] == 'Acme Corp'
     os.remove(csv_path)
 
+@pytest.mark.integration
+def test_csv_processor_process_import_stream():
+    """Tests chunked CSV import with typing, validation and a bulk writer per chunk"""
+    # LD1: Create a semicolon separated sample CSV file with one row missing its rate
+    csv_content = create_sample_csv(delimiter=";") + "Delta LLP;Carol White;;2024-04-01\n"
+    csv_path = create_temp_file(content=csv_content.encode('utf-8'), suffix=".csv")
+    mapping = {'Firm Name': 'firm_name', 'Rate Amount': 'rate_amount', 'Effective Date': 'effective_date'}
+    written = []
+
+    def validator(frame):
+        return pd.Series(None, index=frame.index, dtype=object).where(frame['rate_amount'].notna(), 'Rate is required')
+
+    def writer(records):
+        written.append(records)
+        return len(records)
+
+    # LD1: Stream the file two rows at a time
+    processor = CSVProcessor()
+    result = processor.process_import_stream(csv_path, field_mapping=mapping, validator=validator, writer=writer,
+                                             chunk_size=2)
+    # LD1: Verify each chunk was handed to the writer with valid, mapped and typed rows
+    assert processor.delimiter == ';'
+    assert result['success'] is True
+    assert (result['rows'], result['chunks'], result['written'], result['invalid']) == (4, 2, 3, 1)
+    assert [len(records) for records in written] == [2, 1]
+    assert written[0][0] == {'firm_name': 'Acme Corp', 'rate_amount': 100.0, 'effective_date': datetime.date(2024, 1, 1)}
+    # LD1: Verify the invalid row is reported with its row number in the file
+    assert result['errors'] == [{'row': 5, 'error': 'Rate is required'}]
+    os.remove(csv_path)
+
+@pytest.mark.integration
+def test_csv_processor_process_import_stream_widens_column_types():
+    """Tests that values of later chunks are never truncated to the types inferred from the first chunk"""
+    # LD1: Whole rates and plain IDs in the first chunk, a fractional rate and a zero-padded ID in the second
+    csv_content = "Timekeeper ID,Rate Amount\n101,500\n102,600\n0042,512.75\n"
+    written = []
+
+    def writer(records):
+        written.extend(records)
+        return len(records)
+
+    processor = CSVProcessor()
+    result = processor.process_import_stream(csv_content, is_content=True, writer=writer, chunk_size=2)
+    # LD1: Verify the later values are kept as written and the column types were widened
+    assert result['success'] is True
+    assert written[2] == {'Timekeeper ID': '0042', 'Rate Amount': 512.75}
+    assert result['column_types'] == {'Timekeeper ID': 'str', 'Rate Amount': 'float'}
+
+@pytest.mark.integration
+def test_csv_processor_process_import_stream_reports_rule_and_writer_errors():
+    """Tests that rate rule failures and rows rejected by the writer are both reported with their file rows"""
+    csv_content = ("Rate Amount,Currency,Effective Date\n"
+                   "500,USD,2024-01-01\n-10,USD,2024-01-01\n600,XXX,2024-01-01\n700,USD,2024-02-01\n")
+    mapping = {'Rate Amount': 'amount', 'Currency': 'currency', 'Effective Date': 'effective_date'}
+    written = []
+
+    def writer(records):
+        # LD1: Reject the last row the way RateRepository.import_rates reports a failed row
+        written.extend(records[:-1])
+        return {'successful': len(records) - 1, 'errors': [{'index': len(records) - 1, 'error': 'Attorney not found'}]}
+
+    processor = CSVProcessor()
+    result = processor.process_import_stream(csv_content, is_content=True, field_mapping=mapping,
+                                             validator=validate_rate_import_rows, writer=writer)
+    # LD1: Verify invalid rows never reached the writer and every error carries its file row number
+    assert [record['amount'] for record in written] == [500]
+    assert (result['written'], result['valid'], result['invalid']) == (1, 1, 3)
+    assert result['errors'] == [
+        {'row': 3, 'error': 'Rate amount cannot be negative; Rate amount must be at least 0'},
+        {'row': 4, 'error': 'Invalid currency code: XXX'},
+        {'row': 5, 'error': 'Attorney not found'},
+    ]
+
+@pytest.mark.integration
+def test_csv_processor_process_import_stream_reports_unconvertible_values():
+    """Tests that values which cannot be converted to their column type are reported instead of imported as nulls"""
+    csv_content = "Rate Amount,Effective Date\n500,2024-01-01\n600,2024-02-01\nTBD,2024-03-01\n700,someday\n"
+    written = []
+
+    def writer(records):
+        written.extend(records)
+        return len(records)
+
+    processor = CSVProcessor()
+    result = processor.process_import_stream(csv_content, is_content=True, writer=writer, chunk_size=2)
+    # LD1: Verify only the convertible rows were written and the others carry their file rows
+    assert [record['Rate Amount'] for record in written] == [500, 600]
+    assert (result['written'], result['invalid']) == (2, 2)
+    assert result['errors'] == [
+        {'row': 4, 'error': 'Invalid int value for Rate Amount: TBD'},
+        {'row': 5, 'error': 'Invalid date value for Effective Date: someday'},
+    ]
+
 @pytest.mark.integration
 def test_csv_processor_process_export():
     """Tests exporting data to CSV format"""
@@ -266,6 +363,65 @@ def test_excel_processor_read_excel_multiple_sheets():
     assert list(df_clients.columns) == ['Client Name', 'Matter ID']
     os.remove(excel_path)
 
+@pytest.mark.integration
+def test_excel_processor_read_sheets():
+    """Tests reading selected columns of several sheets with per-sheet timings"""
+    # LD1: Create sample Excel file with multiple sheets
+    excel_path = create_sample_excel(multi_sheet=True)
+    processor = ExcelProcessor()
+    # LD1: Read only the mapped columns of the rates sheet, lazily in chunks of two rows
+    chunks = list(processor.iter_excel_chunks(excel_path, sheet_name='Rates',
+                                              columns=['Rate Amount', 'Firm Name'], chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ['Rate Amount', 'Firm Name']
+    assert chunks[1].iloc[0]['Firm Name'] == 'Gamma Inc'
+    # LD1: Read every sheet and verify data and timings are kept per sheet
+    frames = processor.read_sheets(excel_path, max_workers=1)
+    assert list(frames) == ['Rates', 'Clients']
+    assert list(frames['Clients'].columns) == ['Client Name', 'Matter ID']
+    assert processor.sheet_timings['Rates']['rows'] == 3
+    assert processor.sheet_timings['Clients']['columns'] == 2
+    # LD1: Verify a missing column is reported
+    with pytest.raises(ValueError):
+        processor.read_excel(excel_path, sheet_name='Clients', options={'columns': ['Rate Amount']})
+    # LD1: Read the sheets in a pool of processes and verify the frames match the in-process read
+    parallel_frames = processor.read_sheets(excel_path, columns=None, max_workers=2)
+    assert list(parallel_frames) == ['Rates', 'Clients']
+    for sheet_name, df in frames.items():
+        pd.testing.assert_frame_equal(parallel_frames[sheet_name], df)
+    assert set(processor.sheet_timings) == {'Rates', 'Clients'}
+    os.remove(excel_path)
+
+@pytest.mark.integration
+def test_excel_processor_infers_column_types_over_all_chunks():
+    """Tests that a column empty in the first chunk still gets the type of the values in later chunks"""
+    excel_path = create_temp_file(content=b'', suffix=".xlsx")
+    pd.DataFrame({'Firm Name': ['Acme Corp', 'Beta Ltd', 'Gamma Inc', 'Delta LLP'],
+                  'Rate Amount': [None, None, 500.0, 650.5]}).to_excel(excel_path, index=False)
+    workbook = excel_processor.open_workbook(excel_path)
+    try:
+        df = excel_processor.read_sheet_frame(workbook.active, chunk_size=2)
+    finally:
+        workbook.close()
+    assert df['Rate Amount'].dtype == 'float64'
+    assert df['Rate Amount'].tolist()[2:] == [500.0, 650.5]
+    os.remove(excel_path)
+
+@pytest.mark.integration
+def test_excel_processor_read_sheets_in_daemonic_process(monkeypatch):
+    """Tests that sheets are read one after another in daemonic processes, which cannot start a pool"""
+    excel_path = create_sample_excel(multi_sheet=True)
+    monkeypatch.setattr(multiprocessing, 'current_process', lambda: SimpleNamespace(daemon=True))
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError('daemonic processes are not allowed to have children')
+
+    monkeypatch.setattr(excel_processor, 'ProcessPoolExecutor', no_pool)
+    frames = ExcelProcessor().read_sheets(excel_path, max_workers=2)
+    assert list(frames) == ['Rates', 'Clients']
+    assert len(frames['Clients']) == 3
+    os.remove(excel_path)
+
 @pytest.mark.integration
 def test_excel_processor_set_field_mapping():
     """Tests setting and applying field mapping for Excel data"""
@@ -336,6 +492,26 @@ def test_excel_processor_process_import():
     assert result['data'][0]['firm_name'] == 'Acme Corp'
     os.remove(excel_path)
 
+@pytest.mark.integration
+def test_excel_processor_process_import_reports_sheet_rows_after_blank_rows():
+    """Tests that import errors name the sheet row of the failing row when blank rows precede it"""
+    # LD1: Write a rates sheet with a blank row between the first and second data rows
+    excel_path = create_temp_file(content=b'', suffix=".xlsx")
+    df = pd.DataFrame({'Firm Name': ['Acme Corp', None, 'Beta Ltd'],
+                       'Attorney Name': ['John Smith', None, 'Alice Johnson'],
+                       'Rate Amount': [100.00, None, -150.00],
+                       'Effective Date': ['2024-01-01', None, '2024-02-15']})
+    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Sheet1', index=False)
+    mapping = {'firm_name': 'Firm Name', 'attorney_name': 'Attorney Name', 'rate_amount': 'Rate Amount'}
+    processor = ExcelProcessor()
+    # LD1: Verify the sheet rows are kept as labels and the negative rate is reported on sheet row 4
+    assert list(processor.read_excel(excel_path).index) == [0, 2]
+    result = processor.process_import(excel_path, field_mapping=mapping, import_type='rate', validation_rules={})
+    assert result['success'] is False
+    assert result['errors'][0].startswith('Row 4: Rate amount cannot be negative')
+    os.remove(excel_path)
+
 @pytest.mark.integration
 def test_excel_processor_process_export():
     """Tests exporting data to Excel format"""
@@ -448,4 +624,40 @@ def test_rate_import_validation():
     #validation_results = processor.validate_excel_file(df, import_type='rate')
     #assert validation_results['valid'] is False
     #assert len(validation_results['errors']) > 0
-    pass
\ No newline at end of file
+    pass
+
+@pytest.mark.integration
+def test_file_validator_validate_dataframe():
+    """Tests vectorized rate and billing validation with messages and error codes per failing row"""
+    # LD1: Create sample rate data with issues in every row after the first
+    data = {'Firm Name': ['Acme Corp', 'Beta Ltd', 'Gamma Inc', 'Delta LLP'],
+            'Attorney Name': ['John Smith', 'Alice Johnson', 'Bob Williams', 'Carol White'],
+            'Rate Amount': [100.00, -100.00, 'abc', 200.125],
+            'Effective Date': ['2024-01-01', '2024-02-15', '03/01/2024', 'invalid'],
+            'Expiration Date': ['2025-01-01', '2024-01-01', None, None],
+            'Currency': ['usd', 'USD', 'XYZ', 'EUR']}
+    validator = FileValidator()
+    # LD1: Validate the rate data and verify messages are ordered by row, then rule
+    results = validator.validate_dataframe(pd.DataFrame(data), 'rate', {'include_error_codes': True})
+    assert results['valid'] is False
+    assert results['errors'] == [
+        'Row 3: Rate amount cannot be negative',
+        'Row 3: Rate amount must be at least 0',
+        'Row 3: Expiration date must be after effective date',
+        'Row 4: Invalid rate amount format',
+        'Row 4: Invalid currency code: XYZ',
+        'Row 5: Rate amount has too many decimal places (max 2)',
+        'Row 5: Invalid effective date format',
+    ]
+    assert results['error_codes'][4] == ['rate_invalid', 'currency_invalid']
+    assert 2 not in results['error_codes']
+
+    # LD1: Verify billing warnings and AFA flag checks
+    billing = pd.DataFrame({'Firm Name': ['Acme Corp', 'Beta Ltd'],
+                            'Attorney Name': ['John Smith', 'Alice Johnson'],
+                            'Hours': [25.5, 2], 'Fees': [1000, 200],
+                            'Date': [datetime.date.today().isoformat(), '2024-02-15'],
+                            'AFA Flag': ['yes', 'maybe']})
+    results = validator.validate_dataframe(billing, 'billing')
+    assert results['errors'] == ['Row 3: Invalid AFA Flag value: maybe']
+    assert results['warnings'] == ['Row 2: Hours value 25.5 seems unusually high']
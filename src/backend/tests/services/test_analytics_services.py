@@ -1,18 +1,25 @@
 import pytest
+import uuid
+import pandas
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from datetime import date
 from decimal import Decimal
 
 from src.backend.services.analytics import rate_trends
+from src.backend.services.analytics import rate_forecasting
 from src.backend.services.analytics import peer_comparison
 from src.backend.services.analytics import attorney_performance
 from src.backend.services.analytics import impact_analysis
 from src.backend.services.analytics import reports
 from src.backend.services.analytics import custom_reports
 from src.backend.db.repositories.rate_repository import RateRepository
+from src.backend.db.repositories import billing_repository
 from src.backend.db.repositories.billing_repository import BillingRepository
+from src.backend.db.models.billing import BillingAggregate
 from src.backend.db.repositories.attorney_repository import AttorneyRepository
 from src.backend.db.repositories.peer_group_repository import PeerGroupRepository
+from src.backend.utils.currency import ExchangeRateTable
 
 # Unit tests for analytics services in the Justice Bid Rate Negotiation System
 
@@ -63,6 +70,113 @@ def test_calculate_rate_growth():
     cagr = rate_trends.calculate_rate_growth(historical_rates)
     assert cagr == -10.0
 
+# Test that RateTrendsAnalyzer serves client trends and time series from one converted query
+def test_rate_trends_by_client_and_time_series_share_one_query(monkeypatch):
+    client_id = str(uuid.uuid4())
+    partner_id, associate_id = str(uuid.uuid4()), str(uuid.uuid4())
+
+    def trend_row(attorney_id, staff_class, office, effective_date, amount, currency='USD'):
+        return {'attorney_id': attorney_id, 'client_id': client_id, 'firm_id': 'firm', 'staff_class_id': staff_class,
+                'staff_class': staff_class, 'practice_area': None, 'office_id': office, 'office': office,
+                'effective_date': effective_date, 'amount': Decimal(amount), 'currency': currency}
+
+    # Two attorneys whose rates interleave by date; the associate's rates are in EUR
+    mock_rate_repository = MagicMock(spec=RateRepository)
+    mock_rate_repository.get_trend_rows.return_value = [
+        trend_row(partner_id, 'Partner', 'London', date(2021, 1, 1), '1000'),
+        trend_row(partner_id, 'Partner', 'London', date(2022, 1, 1), '1100'),
+        trend_row(partner_id, 'Partner', 'London', date(2023, 1, 1), '1210'),
+        trend_row(associate_id, 'Associate', 'Paris', date(2021, 1, 1), '200', 'EUR'),
+        trend_row(associate_id, 'Associate', 'Paris', date(2023, 1, 1), '242', 'EUR'),
+    ]
+    exchange_rate_table = ExchangeRateTable('USD')
+    exchange_rate_table.load_rates(date(2021, 1, 1), {'EUR': Decimal('0.5')})
+    monkeypatch.setattr(rate_trends, 'get_exchange_rate_table', lambda: exchange_rate_table)
+    monkeypatch.setattr(rate_trends, 'load_historical_exchange_rates', lambda start_date, end_date: 0)
+    analyzer = rate_trends.RateTrendsAnalyzer(mock_rate_repository, MagicMock(spec=BillingRepository))
+
+    trends = analyzer.get_rate_trends_by_client(client_id, start_date=date(2021, 1, 1), years=2)
+    series = analyzer.get_time_series_data('client', client_id, group_by='staff_class', start_date=date(2021, 1, 1))
+
+    # Assert that both results came from a single query
+    mock_rate_repository.get_trend_rows.assert_called_once()
+
+    # Changes are per attorney, with the associate's two-year gap annualized to 10%
+    assert trends['total_rates'] == 5
+    assert trends['average_rate_change'] == pytest.approx(0.1)
+    assert trends['staff_class_trends']['Partner']['cagr'] == 10.0
+    assert trends['staff_class_trends']['Associate']['average_rate'] == 484.0
+    assert trends['practice_area_trends']['Unspecified']['attorney_count'] == 2
+    assert trends['rate_change_distribution']['count'] == 3
+
+    # Verify the time series is grouped by staff class in date order
+    assert set(series['time_series_data']) == {'Partner', 'Associate'}
+    assert series['time_series_data']['Associate'] == [
+        {'date': '2021-01-01', 'value': 400.0, 'count': 1},
+        {'date': '2023-01-01', 'value': 484.0, 'count': 1},
+    ]
+    # Without a start date the time series covers the default trend window
+    default_start = date(rate_trends.get_current_date().year - rate_trends.DEFAULT_TREND_YEARS, 1, 1)
+    assert analyzer.get_time_series_data('client', client_id)['start_date'] == default_start.isoformat()
+    with pytest.raises(ValueError):
+        analyzer.get_time_series_data('client', client_id, group_by='unknown')
+
+# Test the calculate_rate_distribution method of RateTrendsAnalyzer
+def test_calculate_rate_distribution():
+    analyzer = rate_trends.RateTrendsAnalyzer(MagicMock(spec=RateRepository), MagicMock(spec=BillingRepository))
+
+    distribution = analyzer.calculate_rate_distribution([0.0, 0.05, 0.1, float('nan'), 0.15, 0.2])
+
+    assert distribution['count'] == 5
+    assert distribution['median'] == 0.1
+    assert distribution['10th_percentile'] == 0.02
+    assert distribution['90th_percentile'] == 0.18
+    assert sum(distribution['histogram']['counts']) == 5
+    assert analyzer.calculate_rate_distribution([]) == {}
+
+# Test the forecast_rates function from rate_forecasting
+def test_forecast_rates_fits_series_and_refits_only_changed_series(monkeypatch):
+    # Two attorneys with exact linear and exponential histories, the second missing a year
+    frame = pandas.DataFrame({
+        'attorney_id': ['a1', 'a1', 'a1', 'a2', 'a2'],
+        'client_id': 'c1',
+        'staff_class': ['Partner', 'Partner', 'Partner', 'Associate', 'Associate'],
+        'effective_date': pandas.to_datetime(['2021-01-01', '2022-01-01', '2023-01-01', '2021-01-01', '2023-01-01']),
+        'year': [2021, 2022, 2023, 2021, 2023],
+        'amount': [1000.0, 1100.0, 1200.0, 400.0, 484.0],
+    })
+    store = {}
+    monkeypatch.setattr(rate_forecasting, 'get_cache', store.get)
+    monkeypatch.setattr(rate_forecasting, 'set_cache', lambda key, value, ttl=None, tags=None: store.update({key: value}))
+
+    forecast = rate_forecasting.forecast_rates(frame, 'linear', 2, cache_key='forecast')
+
+    # Assert that every series was fitted and forecast for the next two years
+    assert forecast['forecast_years'] == [2024, 2025]
+    assert forecast['refitted'] == 2
+    partner = next(series for series in forecast['series'] if series['attorney_id'] == 'a1')
+    assert [point['rate'] for point in partner['forecasts']] == [1300.0, 1400.0]
+    assert partner['forecasts'][0]['lower'] == partner['forecasts'][0]['upper'] == 1300.0
+
+    # Exponential and damped models extrapolate the associate's 10% annual growth
+    for model in ('exponential', 'damped'):
+        associate = next(series for series in rate_forecasting.forecast_rates(frame, model, 1)['series']
+                         if series['attorney_id'] == 'a2')
+        expected = 532.4 if model == 'exponential' else 522.72
+        assert associate['forecasts'][0]['rate'] == pytest.approx(expected)
+
+    # Verify unchanged series reuse cached parameters and a new rate refits only its series
+    assert rate_forecasting.forecast_rates(frame, 'linear', 2, cache_key='forecast')['refitted'] == 0
+    new_rate = frame.iloc[[4]].assign(effective_date=pandas.Timestamp('2024-01-01'), year=2024, amount=532.4)
+    extended = pandas.concat([frame, new_rate], ignore_index=True)
+    updated = rate_forecasting.forecast_rates(extended, 'linear', 1, cache_key='forecast')
+    assert updated['refitted'] == 1
+    # An edited amount changes its series' watermark even though the dates and counts are unchanged
+    edited = extended.assign(amount=extended['amount'].where(extended.index != 1, 1150.0))
+    assert rate_forecasting.forecast_rates(edited, 'linear', 1, cache_key='forecast')['refitted'] == 1
+    with pytest.raises(ValueError):
+        rate_forecasting.forecast_rates(frame, 'quadratic', 1)
+
 # Test the compare_rates_to_peer_group function from peer_comparison
 def test_compare_rates_to_peer_group():
     # Mock PeerGroupRepository to return test peer group data
@@ -136,6 +250,78 @@ def test_get_peer_group_statistics():
     )
     assert isinstance(statistics, dict)
 
+# Test the calculate_grouped_rate_statistics function from peer_comparison
+def test_calculate_grouped_rate_statistics():
+    # Setup a rates frame with two staff classes
+    rates_df = pandas.DataFrame({
+        'staff_class': ['Partner', 'Partner', 'Partner', 'Associate', 'Associate'],
+        'amount': [900.0, 1000.0, 1100.0, 400.0, 500.0],
+    })
+
+    # Call calculate_grouped_rate_statistics grouped by staff class
+    statistics = peer_comparison.calculate_grouped_rate_statistics(rates_df, 'staff_class')
+
+    # Assert that every group matches the ungrouped calculation for its rows
+    assert set(statistics) == {'Partner', 'Associate'}
+    for staff_class, stats in statistics.items():
+        assert stats == peer_comparison.calculate_rate_statistics(rates_df[rates_df['staff_class'] == staff_class])
+
+    # Verify an empty frame yields no groups
+    assert peer_comparison.calculate_grouped_rate_statistics(rates_df.iloc[0:0], 'staff_class') == {}
+
+# Test the compare_rates_by_dimensions function from peer_comparison
+def test_compare_rates_by_dimensions(monkeypatch):
+    organization_id = str(uuid.uuid4())
+    peer_id = str(uuid.uuid4())
+
+    # Mock repositories so the organization and one peer share a staff class
+    mock_organization = MagicMock()
+    mock_organization.name = 'Test Firm'
+    mock_organization_repository = MagicMock()
+    mock_organization_repository.get_by_id.return_value = mock_organization
+    mock_peer_group_repository = MagicMock(spec=PeerGroupRepository)
+    mock_peer_group_repository.get_member_ids.return_value = [uuid.UUID(organization_id), uuid.UUID(peer_id)]
+    mock_rate_repository = MagicMock(spec=RateRepository)
+    mock_rate_repository.get_comparison_rows.return_value = [
+        {'firm_id': organization_id, 'staff_class': 'Partner', 'practice_area': 'Litigation',
+         'geography': 'Europe', 'type': 'standard', 'amount': Decimal('500'), 'currency': 'EUR'},
+        {'firm_id': peer_id, 'staff_class': 'Partner', 'practice_area': 'Litigation',
+         'geography': None, 'type': 'standard', 'amount': Decimal('800'), 'currency': 'USD'},
+    ]
+    exchange_rate_table = ExchangeRateTable('USD')
+    exchange_rate_table.load_rates(date(2023, 1, 1), {'EUR': Decimal('0.5')})
+    monkeypatch.setattr(peer_comparison, 'get_exchange_rate_table', lambda: exchange_rate_table)
+    monkeypatch.setattr(peer_comparison, 'load_historical_exchange_rates', lambda start_date, end_date: 0)
+
+    # Call compare_rates_by_dimensions for all dimensions
+    comparison = peer_comparison.compare_rates_by_dimensions(
+        organization_id, str(uuid.uuid4()), {}, 'USD', date(2023, 1, 1),
+        peer_group_repository=mock_peer_group_repository,
+        rate_repository=mock_rate_repository,
+        organization_repository=mock_organization_repository,
+    )
+
+    # Assert that all peer rates were loaded with a single query
+    mock_rate_repository.get_comparison_rows.assert_called_once()
+    assert set(comparison) == {'staff_class', 'practice_area', 'geography'}
+
+    # Verify currency normalization and organization vs peer split
+    partner = comparison['staff_class']['Partner']
+    assert partner['organization']['stats']['mean'] == 1000.0
+    assert partner['peer_group']['stats']['mean'] == 800.0
+    assert comparison['geography']['Europe']['peer_group']['stats']['mean'] == 0
+
+# Test that attorney_performance imports with its cache decorators applied
+def test_attorney_performance_module_imports():
+    import importlib
+
+    module = importlib.reload(attorney_performance)
+
+    # The decorated helpers stay callable functions, wrapped by utils.cache.cached
+    assert callable(module.get_attorney_billing_performance)
+    assert module.get_attorney_billing_performance.__wrapped__.__name__ == 'get_attorney_billing_performance'
+    assert callable(module.AttorneyPerformanceService.get_billing_performance)
+
 # Test the get_attorney_performance_metrics function from attorney_performance
 def test_get_attorney_performance_metrics():
     # Mock AttorneyRepository and BillingRepository with test data
@@ -238,6 +424,149 @@ def test_calculate_rate_impact(proposed_rates, historical_hours, expected_impact
     impact = impact_analysis.calculate_rate_impact(proposed_rates_data, historical_hours_data)
     assert impact == 37500
 
+# Test calculate_rate_impact reading historical hours from the billing aggregates
+def test_calculate_rate_impact_from_billing_aggregates():
+    client_id = str(uuid.uuid4())
+    firm_id = str(uuid.uuid4())
+    partner_id = uuid.uuid4()
+    associate_id = uuid.uuid4()
+    staff_class_id = uuid.uuid4()
+
+    # Mock repositories with aggregated hours and one current approved rate per attorney
+    mock_billing_repository = MagicMock(spec=BillingRepository)
+    mock_billing_repository.get_rate_impact_hours.return_value = [
+        {'attorney_id': partner_id, 'staff_class_id': staff_class_id, 'hours': Decimal('100'), 'fees': Decimal('50000')},
+        {'attorney_id': associate_id, 'staff_class_id': None, 'hours': Decimal('200'), 'fees': Decimal('40000')},
+    ]
+    mock_rate_repository = MagicMock(spec=RateRepository)
+    mock_rate_repository.get_current_rates.return_value = [
+        MagicMock(attorney_id=partner_id, amount=Decimal('500')),
+        MagicMock(attorney_id=associate_id, amount=Decimal('200')),
+    ]
+    proposed_rates = [
+        {'attorney_id': str(partner_id), 'amount': 550},
+        {'attorney_id': str(associate_id), 'amount': 200},
+    ]
+
+    # Call calculate_rate_impact with the mocked repositories
+    impact = impact_analysis.calculate_rate_impact(
+        client_id, firm_id, proposed_rates, (date(2021, 1, 1), date(2023, 12, 31)), 'USD',
+        billing_repository=mock_billing_repository,
+        rate_repository=mock_rate_repository,
+    )
+
+    # Assert that hours were read once from the aggregates rather than raw billing rows
+    mock_billing_repository.get_rate_impact_hours.assert_called_once_with(
+        client_id=uuid.UUID(client_id), firm_id=uuid.UUID(firm_id),
+        start_date=date(2021, 1, 1), end_date=date(2023, 12, 31)
+    )
+
+    # Verify totals and the attorney and staff class breakdowns
+    assert impact['total_impact'] == 5000.0
+    assert impact['percentage_change'] == pytest.approx(5000 / 90000 * 100)
+    assert impact['attorney_impact'][str(partner_id)]['difference'] == 5000.0
+    assert impact['attorney_impact'][str(associate_id)]['difference'] == 0.0
+    assert impact['staff_class_impact'][str(staff_class_id)]['proposed'] == 55000.0
+    assert impact['staff_class_impact']['unassigned']['hours'] == 200.0
+
+# Test which whole months of a date range are read from the billing aggregates
+@pytest.mark.parametrize('start_date, end_date, expected_span', [
+    (date(2024, 1, 1), date(2024, 1, 31), (date(2024, 1, 1), date(2024, 1, 1))),
+    (date(2024, 1, 2), date(2024, 1, 31), (None, None)),
+    (date(2024, 1, 1), date(2024, 1, 30), (None, None)),
+    (date(2024, 1, 31), date(2024, 2, 1), (None, None)),
+    (date(2024, 1, 15), date(2024, 3, 10), (date(2024, 2, 1), date(2024, 2, 1))),
+    (date(2024, 2, 1), date(2024, 2, 29), (date(2024, 2, 1), date(2024, 2, 1))),
+    (date(2023, 2, 1), date(2023, 2, 28), (date(2023, 2, 1), date(2023, 2, 1))),
+    (date(2023, 12, 1), date(2024, 1, 31), (date(2023, 12, 1), date(2024, 1, 1))),
+])
+def test_full_month_span(start_date, end_date, expected_span):
+    assert billing_repository._full_month_span(start_date, end_date) == expected_span
+
+def _record_aggregate_upserts(monkeypatch):
+    """Replaces the PostgreSQL insert of the billing repository with one recording the upserted rows"""
+    upserted = []
+
+    class RecordingInsert:
+        def __init__(self, model):
+            self.excluded = model.__table__.c
+
+        def values(self, values):
+            upserted.extend(values)
+            return self
+
+        def on_conflict_do_update(self, **kwargs):
+            return self
+
+    monkeypatch.setattr(billing_repository, 'insert', RecordingInsert)
+    return upserted
+
+def _billing_record(**fields):
+    record = dict(
+        attorney_id=uuid.uuid4(), client_id=uuid.uuid4(), firm_id=uuid.uuid4(), staff_class_id=uuid.uuid4(),
+        hours=Decimal('10'), fees=Decimal('5000'), billing_date=date(2024, 3, 15), is_afa=False,
+        currency='USD', practice_area='Litigation', office_id=None,
+    )
+    record.update(fields)
+    return SimpleNamespace(**record)
+
+# Test that updating a billing record moves its contribution under the firm and staff class stored with it
+def test_billing_update_reverses_stored_aggregate_key(monkeypatch):
+    upserted = _record_aggregate_upserts(monkeypatch)
+    record = _billing_record()
+    stored_firm_id, stored_staff_class_id = record.firm_id, record.staff_class_id
+
+    repository = BillingRepository(MagicMock())
+    repository.get_by_id = MagicMock(return_value=record)
+    # The attorney has since moved; the stored firm and staff class must still be used
+    repository._attorney_dimensions = MagicMock(return_value={record.attorney_id: (uuid.uuid4(), None)})
+
+    repository.update(uuid.uuid4(), {'hours': Decimal('12'), 'fees': Decimal('6000')})
+
+    repository._attorney_dimensions.assert_not_called()
+    assert [(row['firm_id'], row['staff_class_id'], row['month'], row['hours'], row['fees'], row['record_count'])
+            for row in upserted] == [
+        (stored_firm_id, stored_staff_class_id, date(2024, 3, 1), Decimal('-10'), Decimal('-5000'), -1),
+        (stored_firm_id, stored_staff_class_id, date(2024, 3, 1), Decimal('12'), Decimal('6000'), 1),
+    ]
+
+# Test that moving a billing record to another attorney restamps it with that attorney's firm and staff class
+def test_billing_update_of_attorney_restamps_aggregate_key(monkeypatch):
+    upserted = _record_aggregate_upserts(monkeypatch)
+    record = _billing_record(billing_date=date(2024, 1, 31))
+    old_attorney_id, old_firm_id, old_staff_class_id = record.attorney_id, record.firm_id, record.staff_class_id
+    new_attorney_id, new_firm_id = uuid.uuid4(), uuid.uuid4()
+
+    repository = BillingRepository(MagicMock())
+    repository.get_by_id = MagicMock(return_value=record)
+    repository._attorney_dimensions = MagicMock(return_value={new_attorney_id: (new_firm_id, None)})
+
+    repository.update(uuid.uuid4(), {'attorney_id': new_attorney_id})
+
+    assert [(row['attorney_id'], row['firm_id'], row['staff_class_id'], row['record_count']) for row in upserted] == [
+        (old_attorney_id, old_firm_id, old_staff_class_id, -1),
+        (new_attorney_id, new_firm_id, None, 1),
+    ]
+    assert (record.firm_id, record.staff_class_id) == (new_firm_id, None)
+
+# Test that deleting a billing record subtracts it and drops aggregate rows left without records
+def test_billing_delete_subtracts_from_aggregates(monkeypatch):
+    upserted = _record_aggregate_upserts(monkeypatch)
+    record = _billing_record()
+    session = MagicMock()
+
+    repository = BillingRepository(session)
+    repository.get_by_id = MagicMock(return_value=record)
+
+    assert repository.delete(uuid.uuid4()) is True
+
+    assert [(row['firm_id'], row['hours'], row['fees'], row['record_count']) for row in upserted] == [
+        (record.firm_id, Decimal('-10'), Decimal('-5000'), -1),
+    ]
+    session.query.assert_called_once_with(BillingAggregate)
+    session.query.return_value.filter.return_value.delete.assert_called_once_with(synchronize_session=False)
+    session.delete.assert_called_once_with(record)
+
 # Test the project_annual_impact function from impact_analysis
 def test_project_annual_impact():
     # Mock BillingRepository to return historical billing data
@@ -0,0 +1,197 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.backend.db.repositories.ownership_repository import OwnershipRepository
+from src.backend.services.auth import rbac
+from src.backend.services.auth import mfa
+from src.backend.services.auth.ownership import EntityOwnershipResolver
+from src.backend.services.auth.principal import AuthenticatedPrincipal
+from src.backend.services.auth.rbac import PermissionSet, Role, RoleManager, check_many, has_permission
+from src.backend.utils.ownership_cache import clear_ownership_cache, invalidate_owners
+
+
+def make_user(role_code, permissions=None):
+    """Creates a lightweight user holding a single role and optional direct permissions."""
+    return SimpleNamespace(role=SimpleNamespace(value=role_code), permissions=permissions or {})
+
+
+class TestPermissionSet:
+    def test_exact_and_wildcard_membership(self):
+        permission_set = PermissionSet(["rates:read", "analytics:*"])
+
+        assert "rates:read" in permission_set
+        assert "rates:update" not in permission_set
+        assert "analytics:view" in permission_set
+        assert "analytics:reports:export" in permission_set
+        assert "analyticsx:view" not in permission_set
+        assert sorted(permission_set) == ["analytics:*", "rates:read"]
+
+    def test_global_wildcard_grants_everything(self):
+        assert "negotiations:approve" in PermissionSet(["*"])
+
+    def test_union_combines_exact_and_wildcards(self):
+        combined = PermissionSet(["rates:read"]).union(PermissionSet(["ocg:*"]))
+
+        assert combined == PermissionSet(["rates:read", "ocg:*"])
+
+
+class TestRoleManager:
+    def test_role_permissions_include_inherited_roles(self):
+        manager = RoleManager()
+
+        assert manager.has_permission(rbac.APPROVER_ROLE, "messages:read")  # Inherited from standard user
+        assert manager.has_permission(rbac.RATE_ADMIN_ROLE, "analytics:export")  # Inherited from analyst
+        assert not manager.has_permission(rbac.ANALYST_ROLE, "rates:approve")
+        assert manager.has_permission(rbac.SYSTEM_ADMIN_ROLE, "system:settings")  # Granted by system:*
+
+    def test_role_changes_recompile_permissions(self):
+        manager = RoleManager()
+        assert not manager.has_permission(rbac.ANALYST_ROLE, "documents:read")
+
+        manager.register_role(Role(code="document_reader", name="Document Reader", description="Reads documents",
+                                   permissions=["documents:read"], is_admin=False))
+        manager.set_parent_role(rbac.ANALYST_ROLE, "document_reader")
+
+        assert manager.has_permission(rbac.ANALYST_ROLE, "documents:read")
+        assert manager.has_permission(rbac.RATE_ADMIN_ROLE, "documents:read")
+        assert "documents:read" in manager.get_effective_permissions(rbac.RATE_ADMIN_ROLE)
+
+    def test_permission_sets_are_reused_per_role_combination(self):
+        manager = RoleManager()
+
+        first = manager.get_permission_set([rbac.ANALYST_ROLE], {"ocg:read": True})
+        second = manager.get_permission_set([rbac.ANALYST_ROLE], {"ocg:read": True})
+
+        assert first is second
+        assert "ocg:read" in first and "analytics:view" in first
+
+
+class TestPermissionChecks:
+    def test_has_permission_uses_direct_and_role_permissions(self):
+        user = make_user(rbac.APPROVER_ROLE, {"ocg:read": True})
+
+        assert has_permission(user, "rates:approve")
+        assert has_permission(user, "messages:create")
+        assert has_permission(user, "ocg:read")
+        assert not has_permission(user, "rates:delete")
+
+    def test_check_many_reports_each_permission(self):
+        user = make_user(rbac.ANALYST_ROLE)
+
+        result = check_many(user, ["analytics:view", "rates:read", "rates:approve"])
+
+        assert result == {"analytics:view": True, "rates:read": True, "rates:approve": False}
+
+    def test_check_many_uses_principal_permissions(self):
+        principal = SimpleNamespace(effective_permissions=PermissionSet(["rates:*"]))
+
+        assert check_many(principal, ["rates:approve", "ocg:read"]) == {"rates:approve": True, "ocg:read": False}
+
+
+class TestAuthenticatedPrincipal:
+    def setup_method(self):
+        self.user_id = uuid.uuid4()
+        self.user = SimpleNamespace(id=self.user_id, mfa_enabled=True, mfa_secret="SECRET",
+                                    preferences={"mfa": {"method": "totp"}})
+        self.loader = MagicMock(return_value=self.user)
+        self.principal = AuthenticatedPrincipal(
+            id=self.user_id, organization_id=uuid.uuid4(), email="user@example.com", name="User",
+            role=SimpleNamespace(value=rbac.ANALYST_ROLE), permissions={}, roles=(rbac.ANALYST_ROLE,),
+            effective_permissions=PermissionSet([]), is_active=True, mfa_enabled=True,
+        )
+
+    def test_reads_outside_the_snapshot_load_the_user_once(self):
+        bound = self.principal.bind(self.loader)
+
+        assert bound.mfa_secret == "SECRET"
+        assert bound.preferences["mfa"]["method"] == "totp"
+        self.loader.assert_called_once_with(self.user_id)
+
+    def test_writes_reach_the_bound_user(self):
+        bound = self.principal.bind(self.loader)
+
+        bound.mfa_secret = None
+        bound.mfa_enabled = False
+
+        assert self.user.mfa_secret is None
+        assert self.user.mfa_enabled is False
+        assert bound.mfa_enabled is False
+        # The shared, cached principal is not changed
+        assert self.principal.mfa_enabled is True
+
+    def test_disable_mfa_through_a_principal_updates_the_user(self):
+        bound = self.principal.bind(self.loader)
+        session = MagicMock()
+
+        with patch.object(mfa, "is_mfa_required", return_value=False):
+            assert mfa.disable_mfa(session, bound) is True
+
+        assert self.user.mfa_secret is None
+        assert self.user.mfa_enabled is False
+        assert "method" not in self.user.preferences["mfa"]
+        session.commit.assert_called_once()
+
+    def test_writes_outside_the_snapshot_need_a_bound_user(self):
+        with pytest.raises(AttributeError):
+            self.principal.mfa_secret = None
+
+
+class TestEntityOwnershipResolver:
+    def setup_method(self):
+        clear_ownership_cache()
+        self.client_id = uuid.uuid4()
+        self.firm_id = uuid.uuid4()
+        self.rate_ids = [uuid.uuid4() for _ in range(3)]
+        self.repository = MagicMock(spec=OwnershipRepository)
+        self.repository.get_owner_organization_ids.side_effect = lambda entity_type, ids: {
+            str(entity_id): {self.client_id, self.firm_id} for entity_id in ids if entity_id != self.rate_ids[2]
+        }
+        self.resolver = EntityOwnershipResolver(lambda: self.repository)
+
+    def teardown_method(self):
+        clear_ownership_cache()
+
+    def test_resolve_many_batches_and_caches_lookups(self):
+        owners = self.resolver.resolve_many("rate", self.rate_ids)
+
+        assert owners[self.rate_ids[0]] == frozenset({self.client_id, self.firm_id})
+        assert owners[self.rate_ids[2]] == frozenset()
+        self.repository.get_owner_organization_ids.assert_called_once_with("rate", self.rate_ids)
+
+        # Found entities are cached, missing ones are looked up again
+        self.resolver.resolve_many("rate", self.rate_ids)
+        self.repository.get_owner_organization_ids.assert_called_with("rate", [self.rate_ids[2]])
+
+    def test_invalidation_forces_a_new_lookup(self):
+        self.resolver.resolve("rate", self.rate_ids[0])
+        invalidate_owners("rate", self.rate_ids[0])
+        self.resolver.resolve("rate", self.rate_ids[0])
+
+        assert self.repository.get_owner_organization_ids.call_count == 2
+
+    def test_unsupported_entity_type_is_rejected(self):
+        with pytest.raises(ValueError):
+            self.resolver.resolve("invoice", uuid.uuid4())
+
+    def test_can_access_entities_authorizes_a_page_with_one_lookup(self):
+        user = SimpleNamespace(role=SimpleNamespace(value=rbac.STANDARD_USER_ROLE), permissions={},
+                               organization_id=self.firm_id)
+        other_user = SimpleNamespace(role=SimpleNamespace(value=rbac.STANDARD_USER_ROLE), permissions={},
+                                     organization_id=uuid.uuid4())
+
+        with patch.object(rbac, "ownership_resolver", self.resolver):
+            access = rbac.can_access_entities(user, "rate", self.rate_ids, "read")
+            other_access = rbac.can_access_entities(other_user, "rate", self.rate_ids, "read")
+
+        assert access == {self.rate_ids[0]: True, self.rate_ids[1]: True, self.rate_ids[2]: False}
+        assert not any(other_access.values())
+        self.repository.get_owner_organization_ids.assert_any_call("rate", self.rate_ids)
+
+    def test_get_permissions_for_action(self):
+        assert rbac.get_permissions_for_action("rate", "read") == ["rates:read"]
+        assert rbac.get_permissions_for_action("negotiation", "update") == ["negotiations:update"]
+        assert rbac.get_permissions_for_action("attorney", "read") == ["attorneys:read"]
+        assert rbac.get_permissions_for_action("peer_group", "update") == ["organizations:manage_peer_groups"]
+        assert rbac.get_permissions_for_action("invoice", "read") == []
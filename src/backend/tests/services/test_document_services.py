@@ -4,18 +4,23 @@ Contains comprehensive unit tests for document storage, retrieval, PDF generatio
 Ensures that document services properly handle various document types, maintain correct metadata, perform proper error handling, and integrate correctly with storage backends.
 """
 import io  # IO handling for document content testing
+import multiprocessing  # Simulating daemonic worker processes
 import os  # Operating system interfaces for file path manipulation
+import re  # Regular expressions for inspecting rendered PDF content
 import unittest.mock  # Mocking functionality for unit tests
 import uuid  # UUID generation for test document IDs
 from datetime import datetime  # Date and time handling for document timestamps
+from types import SimpleNamespace  # Stand-in for the current process
 
 import pytest  # Python testing framework
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.backend.db.models.document import Document, DocumentType  # Document data model for tests
 from src.backend.db.models.ocg import OCG, OCGSection, OCGAlternative, OCGStatus  # OCG data models for tests
-from src.backend.services.documents.ocg_generation import OCGGenerator, get_ocg_template, create_ocg_from_template, generate_ocg_document, OCGFormatException, OCGTemplateException, OCGNotFoundError  # OCG generation service functions to be tested
+from src.backend.services.documents.ocg_generation import OCGGenerator, get_ocg_template, create_ocg_from_template, generate_ocg_document, ocg_document_cache_key, OCGFormatException, OCGTemplateException, OCGNotFoundError  # OCG generation service functions to be tested
 from src.backend.services.documents.pdf_generator import generate_pdf, generate_pdf_from_html, generate_pdf_from_template, generate_pdf_from_markdown, generate_ocg_pdf, store_pdf, PDFGenerator, ReportLabPDFGenerator, HTMLPDFGenerator  # PDF generation service functions to be tested
+from src.backend.services.documents.pdf_generator import render_table_pdf, rate_report_columns, _table_column_widths, TABLE_TOP, TABLE_BOTTOM, TABLE_ROW_HEIGHT, DEFAULT_PAGE_SIZE, DEFAULT_MARGIN  # Streamed table rendering to be tested
+from src.backend.services.documents.pdf_rendering import PDFRenderPool, PDFRenderError  # PDF render pool to be tested
 from src.backend.services.documents.storage import store_document, retrieve_document, get_document_url, delete_document, create_document_version, list_documents, DocumentStorageError, DocumentNotFoundError, DocumentAccessError  # Document storage service functions to be tested
 from src.backend.services.documents.ocg_negotiation import OCGNegotiationService, PointBudgetExceededError  # OCG negotiation service class to be tested
 from src.backend.tests.conftest import db_session, client, app, client_organization, law_firm_organization  # Test fixtures for database sessions and test client
@@ -62,4 +67,129 @@ def test_store_document(db_session, document_type, encrypt):
         if encrypt:
             assert b"Test file content" not in args[0].getvalue()
         else:
-            assert b"Test file content" in args[0].getvalue()
\ No newline at end of file
+            assert b"Test file content" in args[0].getvalue()
+
+
+def test_generate_ocg_document_serves_cached_document():
+    """Test that a cached OCG document is served from storage without rendering or uploading it again"""
+    ocg = MagicMock(id=uuid.uuid4(), version=2, status=OCGStatus.PUBLISHED)
+    firm_id = str(uuid.uuid4())
+
+    with patch('src.backend.services.documents.ocg_generation.get_db'), \
+            patch('src.backend.services.documents.ocg_generation.OCGRepository') as mock_repository, \
+            patch('src.backend.services.documents.ocg_generation.retrieve_cached_ocg_document') as mock_retrieve, \
+            patch('src.backend.services.documents.ocg_generation.generate_ocg_pdf') as mock_generate_pdf, \
+            patch('src.backend.services.documents.ocg_generation.store_ocg_document') as mock_store:
+        mock_repository.return_value.get_by_id.return_value = ocg
+        mock_repository.return_value.get_selections_by_firm.return_value = []
+        mock_retrieve.return_value = b"%PDF cached"
+
+        document = generate_ocg_document(str(ocg.id), 'pdf', firm_id)
+
+        assert document == b"%PDF cached"
+        mock_repository.return_value.get_selections_by_firm.assert_called_once_with(ocg.id, uuid.UUID(firm_id))
+        mock_generate_pdf.assert_not_called()
+        mock_store.assert_not_called()
+
+
+def test_generate_ocg_document_renders_miss_while_holding_lock():
+    """Test that the request taking the render lock of a missing OCG document renders it at once"""
+    ocg = MagicMock(id=uuid.uuid4(), version=2, status=OCGStatus.PUBLISHED, client_id=uuid.uuid4())
+    ocg.name = 'Guidelines'
+
+    with patch('src.backend.services.documents.ocg_generation.get_db'), \
+            patch('src.backend.services.documents.ocg_generation.OCGRepository') as mock_repository, \
+            patch('src.backend.services.documents.ocg_generation.retrieve_cached_ocg_document', return_value=None), \
+            patch('src.backend.services.documents.ocg_generation.acquire_recompute_lock', return_value='token') as mock_acquire, \
+            patch('src.backend.services.documents.ocg_generation.release_recompute_lock') as mock_release, \
+            patch('src.backend.services.documents.ocg_generation._wait_for_render') as mock_wait, \
+            patch('src.backend.services.documents.ocg_generation.celery_app') as mock_celery, \
+            patch('src.backend.services.documents.ocg_generation.generate_ocg_pdf', return_value=b"%PDF rendered"), \
+            patch('src.backend.services.documents.ocg_generation.store_ocg_document') as mock_store:
+        mock_repository.return_value.get_by_id.return_value = ocg
+
+        document = generate_ocg_document(str(ocg.id), 'pdf')
+
+        # Rendered and stored under its cache key without queueing a task or waiting
+        assert document == b"%PDF rendered"
+        cache_key = ocg_document_cache_key(ocg, 'pdf')
+        assert mock_store.call_args.kwargs['storage_path'].endswith(f"{cache_key}.pdf")
+        mock_celery.send_task.assert_not_called()
+        mock_wait.assert_not_called()
+        mock_release.assert_called_once_with(mock_acquire.call_args[0][0], 'token')
+
+
+def test_ocg_document_cache_key_covers_document_inputs():
+    """Test that the OCG document cache key changes with version, edits, format, selections and options only"""
+    ocg = MagicMock(id=uuid.uuid4(), version=1, updated_at=datetime(2026, 1, 5, 9, 30))
+    selections = [MagicMock(section_id=uuid.uuid4(), alternative_id=uuid.uuid4()) for _ in range(3)]
+
+    key = ocg_document_cache_key(ocg, 'pdf', selections, {'page_size': 'letter'})
+
+    assert key == ocg_document_cache_key(ocg, 'pdf', list(reversed(selections)), {'page_size': 'letter'})
+    assert key != ocg_document_cache_key(ocg, 'html', selections, {'page_size': 'letter'})
+    assert key != ocg_document_cache_key(ocg, 'pdf', selections[:2], {'page_size': 'letter'})
+    assert key != ocg_document_cache_key(ocg, 'pdf', selections, {'page_size': 'a4'})
+    ocg.updated_at = datetime(2026, 1, 5, 9, 45)
+    edited_key = ocg_document_cache_key(ocg, 'pdf', selections, {'page_size': 'letter'})
+    assert edited_key != key
+    ocg.version = 2
+    assert ocg_document_cache_key(ocg, 'pdf', selections, {'page_size': 'letter'}) not in (key, edited_key)
+
+
+def test_render_table_pdf_streams_rows_across_pages():
+    """Test that a large table is drawn page by page with every row on a page"""
+    rows_per_page = int((TABLE_TOP - TABLE_BOTTOM) // TABLE_ROW_HEIGHT) - 1
+    rate_data = [
+        {'attorney_name': f'Timekeeper {index}', 'staff_class': 'Associate', 'proposed_rate': 500 + index, 'currency': 'USD'}
+        for index in range(rows_per_page * 3 + 1)
+    ]
+
+    pdf_bytes = render_table_pdf('Rate Report', rate_data, rate_report_columns(rate_data))
+
+    assert pdf_bytes.startswith(b'%PDF')
+    assert len(re.findall(rb'/Type /Page[^s]', pdf_bytes)) == 4
+
+
+def test_rate_report_columns_fit_the_page():
+    """Test that streamed rate reports show the report columns present in the rows within the page width"""
+    available_width = DEFAULT_PAGE_SIZE[0] - 2 * DEFAULT_MARGIN
+    rate_row = {'id': str(uuid.uuid4()), 'attorney_name': 'Timekeeper 1', 'staff_class': 'Associate', 'office': 'London',
+                'current_rate': 500, 'proposed_rate': 550, 'currency': 'USD', 'effective_date': '2027-01-01',
+                'status': 'submitted', 'client_id': str(uuid.uuid4()), 'firm_id': str(uuid.uuid4())}
+
+    columns = rate_report_columns([rate_row])
+
+    # Internal fields such as IDs are left out and the report columns fill the page exactly
+    assert [col['name'] for col in columns] == ['attorney_name', 'staff_class', 'office', 'current_rate', 'proposed_rate', 'currency', 'effective_date', 'status']
+    assert sum(_table_column_widths(columns)) == pytest.approx(available_width)
+
+    # A table with more columns than fit at their own or minimum width is scaled down to the page
+    wide_columns = [{'name': f'field_{index}'} for index in range(12)] + [{'name': 'notes', 'width': 200}]
+    assert sum(_table_column_widths(wide_columns)) == pytest.approx(available_width)
+
+
+def test_pdf_render_pool_records_render_metrics():
+    """Test that the render pool returns render results and counts renders and failures per kind"""
+    pool = PDFRenderPool(max_workers=0)
+
+    assert pool.render('rate_report', lambda title: b'%PDF ' + title.encode(), 'Report') == b'%PDF Report'
+    with pytest.raises(PDFRenderError):
+        pool.render('ocg', lambda: 1 / 0)
+
+    stats = pool.stats()
+    assert stats['submitted'] == 2
+    assert stats['failed'] == 1
+    assert stats['in_flight'] == 0
+    assert stats['queue_depth'] == 0
+    assert stats['kinds']['rate_report']['count'] == 1
+    assert 'ocg' not in stats['kinds']
+
+
+def test_pdf_render_pool_renders_inline_in_daemonic_processes(monkeypatch):
+    """Test that a pool in a daemonic process, such as a Celery prefork child, renders without starting processes"""
+    monkeypatch.setattr(multiprocessing, 'current_process', lambda: SimpleNamespace(daemon=True))
+    pool = PDFRenderPool(max_workers=2)
+
+    assert pool.render('rate_report', lambda title: b'%PDF ' + title.encode(), 'Report') == b'%PDF Report'
+    assert pool._executor is None
@@ -5,7 +5,7 @@ from freezegun import freeze_time
 from src.backend.services.messaging.email import EmailService, send_email
 from src.backend.services.messaging.in_app import InAppMessageService
 from src.backend.services.messaging.thread import ThreadService
-from src.backend.services.messaging.notifications import NotificationService
+from src.backend.services.messaging.notifications import NotificationService, NotificationChannel, EMAIL_BATCH_SIZE, deliver_notification_chunk, send_batch_notification
 from src.backend.db.models.message import Message
 from src.backend.db.repositories.message_repository import MessageRepository
 from src.backend.utils.validators import validate_email
@@ -339,4 +339,79 @@ class TestInAppMessagingService:
         assert rate_message["related_entity_type"] == "rate"
         assert rate_message["related_entity_id"] == "rate123"
         assert ocg_message["related_entity_type"] == "ocg"
-        assert ocg_message["related_entity_id"] == "ocg123"
\ No newline at end of file
+        assert ocg_message["related_entity_id"] == "ocg123"
+
+
+# Test class for the batch notification fan-out pipeline
+class TestBatchNotificationFanOut:
+    # Setup method run before each test
+    def setup_method(self):
+        # Recipients as loaded by UserRepository.get_notification_recipients
+        self.recipients = [
+            Mock(id=f"user{index}", email=f"user{index}@example.com", preferences=None)
+            for index in range(EMAIL_BATCH_SIZE + 10)
+        ]
+        # One recipient opted out of email for the event type
+        self.recipients[0].preferences = {"notifications": {"rate_request": {"email": False}}}
+        self.user_ids = [recipient.id for recipient in self.recipients] + ["missing_user"]
+
+    # Test that a chunk is delivered with one recipient query, one bulk insert and batched emails
+    @patch('src.backend.services.messaging.notifications.send_batch_email_async')
+    @patch('src.backend.services.messaging.notifications.NotificationRepository')
+    @patch('src.backend.services.messaging.notifications.UserRepository')
+    @patch('src.backend.services.messaging.notifications.session_scope')
+    def test_deliver_notification_chunk(self, mock_session_scope, mock_user_repository, mock_notification_repository, mock_send_batch_email_async):
+        mock_user_repository.return_value.get_notification_recipients.return_value = self.recipients
+        progress = MagicMock()
+
+        results = deliver_notification_chunk(self.user_ids, "rate_request", "Title", "Content", {}, ["in_app", "email"], False, None, progress_callback=progress)
+
+        # Preferences are loaded once for the whole chunk
+        mock_user_repository.return_value.get_notification_recipients.assert_called_once_with(self.user_ids)
+        # In-app notifications are written with a single bulk insert
+        mock_notification_repository.return_value.bulk_create.assert_called_once()
+        assert len(mock_notification_repository.return_value.bulk_create.call_args[0][0]) == len(self.recipients)
+        # Email recipients are grouped into batches, skipping the opted-out user
+        assert mock_send_batch_email_async.call_count == 2
+        assert len(mock_send_batch_email_async.call_args_list[0][0][0]) == EMAIL_BATCH_SIZE
+        assert "user0@example.com" not in mock_send_batch_email_async.call_args_list[0][0][0]
+        assert results["success_count"] == len(self.recipients)
+        assert results["failure_count"] == 1
+        assert results["email_batches"] == 2
+        progress.assert_any_call("email", len(self.recipients) - 1, len(self.recipients) - 1)
+
+    # Test that delivering a chunk again with its delivery key skips what the first attempt delivered
+    @patch('src.backend.services.messaging.notifications.get_redis_client')
+    @patch('src.backend.services.messaging.notifications.send_batch_email_async')
+    @patch('src.backend.services.messaging.notifications.NotificationRepository')
+    @patch('src.backend.services.messaging.notifications.UserRepository')
+    @patch('src.backend.services.messaging.notifications.session_scope')
+    def test_deliver_notification_chunk_retry_is_idempotent(self, mock_session_scope, mock_user_repository, mock_notification_repository, mock_send_batch_email_async, mock_get_redis_client):
+        mock_user_repository.return_value.get_notification_recipients.return_value = self.recipients
+        # The first attempt queued the first email batch before failing
+        markers = {"notification_delivery:fanout1:0:email:0"}
+        mock_get_redis_client.return_value.exists.side_effect = lambda key: key in markers
+        mock_get_redis_client.return_value.set.side_effect = lambda key, value, ex: markers.add(key)
+
+        results = deliver_notification_chunk(self.user_ids, "rate_request", "Title", "Content", {}, ["in_app", "email"], False, None, delivery_key="fanout1:0")
+
+        # In-app notifications carry the key, so the INSERT skips the ones already written
+        records = mock_notification_repository.return_value.bulk_create.call_args[0][0]
+        assert {record["delivery_key"] for record in records} == {"fanout1:0"}
+        # Only the email batch that was not queued yet is sent, and it is marked as queued
+        mock_send_batch_email_async.assert_called_once()
+        assert "user1@example.com" not in mock_send_batch_email_async.call_args[0][0]
+        assert "notification_delivery:fanout1:0:email:1" in markers
+        assert results["email_batches"] == 1
+
+    # Test that large audiences are split into chunked subtasks
+    @patch('src.backend.services.messaging.notifications.NOTIFICATION_CHUNK_SIZE', 20)
+    @patch('src.backend.services.messaging.notifications.fan_out_notification')
+    @patch('src.backend.services.messaging.notifications.deliver_notification_chunk')
+    def test_send_batch_notification_fans_out_large_audiences(self, mock_deliver_notification_chunk, mock_fan_out_notification):
+        mock_fan_out_notification.return_value = {"group_id": "group1", "chunk_count": 4, "recipient_count": len(self.user_ids)}
+
+        results = send_batch_notification(self.user_ids, "rate_request", "Title", "Content", {}, [NotificationChannel.IN_APP], False, None)
+
+        mock_deliver_notification_chunk.assert_not_called()
+        assert results["group_id"] == "group1"
@@ -1,4 +1,5 @@
 import pytest
+import uuid
 from unittest.mock import MagicMock
 from datetime import date, datetime
 from decimal import Decimal
@@ -10,6 +11,10 @@ from src.backend.services.rates.calculation import calculate_rate_impact
 from src.backend.services.rates.history import track_rate_history
 from src.backend.services.rates.rules import check_rate_rules
 from src.backend.services.rates.currency import convert_currency
+from src.backend.services.rates import currency as rates_currency
+from src.backend.utils.constants import RateType
+from src.backend.utils.currency import ExchangeRateTable
+from src.backend.integrations.currency.exchange_rate_api import ExchangeRateClient
 from src.backend.api.core.errors import ValidationError, FreezeError
 
 # Define test functions for rate validation, calculation, and rule enforcement
@@ -169,6 +174,196 @@ def test_convert_currency():
     assert converted_rate.currency == 'EUR'
 
 
+def test_load_historical_exchange_rates_fetches_each_day_once(monkeypatch):
+    """Tests that historical rates come from storage first and each missing day is fetched from the API once"""
+    table = ExchangeRateTable('USD')
+    table.load_rates(date.today(), {'EUR': Decimal('0.9')})
+    monkeypatch.setattr(rates_currency, 'get_exchange_rate_table', lambda: table)
+
+    # Persisted history covers the first day of the range and the API serves the rest
+    repository = MagicMock()
+    repository.get_rates_by_date.return_value = {date(2020, 1, 1): {'EUR': Decimal('0.8')}}
+    client = MagicMock()
+    client.get_historical_rates_for_dates.side_effect = lambda days, base, symbols: {day: {'EUR': 0.5} for day in days}
+
+    fetched = rates_currency.load_historical_exchange_rates(date(2020, 1, 1), date(2020, 1, 3), repository, client)
+
+    assert fetched == 2
+    client.get_historical_rates_for_dates.assert_called_once_with([date(2020, 1, 2), date(2020, 1, 3)], 'USD', table.currencies)
+    repository.bulk_upsert.assert_called_once()
+
+    # A second load of the same range is served from memory without storage or API calls
+    assert rates_currency.load_historical_exchange_rates(date(2020, 1, 1), date(2020, 1, 3), repository, client) == 0
+    assert repository.get_rates_by_date.call_count == 1
+    assert table.rate('EUR', 'USD', date(2020, 1, 1)) == Decimal('1.25')
+    assert table.rate('EUR', 'USD', date(2020, 1, 3)) == Decimal('2.0')
+
+
+def test_load_historical_exchange_rates_retries_unavailable_days_later(monkeypatch):
+    """Tests that days the API could not serve are skipped until their retry time has passed"""
+    table = ExchangeRateTable('USD')
+    table.load_rates(date.today(), {'EUR': Decimal('0.9')})
+    monkeypatch.setattr(rates_currency, 'get_exchange_rate_table', lambda: table)
+    monkeypatch.setattr(rates_currency, '_unavailable_history_days', {})
+    clock = [1000.0]
+    monkeypatch.setattr(rates_currency.time, 'monotonic', lambda: clock[0])
+
+    repository = MagicMock()
+    repository.get_rates_by_date.return_value = {}
+    client = MagicMock()
+    client.get_historical_rates_for_dates.return_value = {}
+
+    assert rates_currency.load_historical_exchange_rates(date(2020, 1, 1), date(2020, 1, 1), repository, client) == 0
+    assert rates_currency.load_historical_exchange_rates(date(2020, 1, 1), date(2020, 1, 1), repository, client) == 0
+    assert client.get_historical_rates_for_dates.call_count == 1
+
+    # Once the retry time has passed the day is requested again
+    clock[0] += rates_currency.UNAVAILABLE_HISTORY_RETRY_SECONDS
+    client.get_historical_rates_for_dates.return_value = {date(2020, 1, 1): {'EUR': 0.5}}
+    assert rates_currency.load_historical_exchange_rates(date(2020, 1, 1), date(2020, 1, 1), repository, client) == 1
+
+
+
+def test_load_historical_exchange_rates_persists_non_trading_days(monkeypatch):
+    """Tests that days skipped by the API before a served day are stored with the previous trading day's rates"""
+    table = ExchangeRateTable('USD')
+    table.load_rates(date.today(), {'EUR': Decimal('0.9')})
+    monkeypatch.setattr(rates_currency, 'get_exchange_rate_table', lambda: table)
+    monkeypatch.setattr(rates_currency, '_unavailable_history_days', {})
+
+    # Saturday 2020-01-04 opens the range, so its trading day is read from storage; the API serves Monday only
+    repository = MagicMock()
+    repository.get_rates_by_date.return_value = {}
+    repository.get_latest_rates_before.return_value = {'EUR': Decimal('0.8')}
+    client = MagicMock()
+    client.get_historical_rates_for_dates.return_value = {date(2020, 1, 6): {'EUR': 0.5}, date(2020, 1, 8): {'EUR': 0.4}}
+
+    fetched = rates_currency.load_historical_exchange_rates(date(2020, 1, 4), date(2020, 1, 9), repository, client)
+
+    # The weekend and the Tuesday holiday are stored with the rates of the trading day before them
+    assert fetched == 2
+    repository.get_latest_rates_before.assert_called_once_with('USD', date(2020, 1, 4))
+    repository.bulk_upsert.assert_called_with('USD', {
+        date(2020, 1, 4): {'EUR': Decimal('0.8')},
+        date(2020, 1, 5): {'EUR': Decimal('0.8')},
+        date(2020, 1, 7): {'EUR': 0.5},
+    }, source=rates_currency.CARRIED_FORWARD_SOURCE)
+    assert table.rate('EUR', 'USD', date(2020, 1, 5)) == Decimal('1.25')
+
+    # Thursday, after the last served day, may not be published yet and is retried later
+    assert set(rates_currency._unavailable_history_days) == {date(2020, 1, 9)}
+
+def test_exchange_rate_client_fetches_dates_with_timeseries_requests(monkeypatch):
+    """Tests that historical dates are fetched with one timeseries request per window and by day as a fallback"""
+    client = ExchangeRateClient.__new__(ExchangeRateClient)
+    requests_made = []
+
+    def make_request(endpoint, params):
+        requests_made.append((endpoint, params.get('start_date'), params.get('end_date')))
+        if endpoint == 'timeseries' and params['start_date'] == '2021-01-01':
+            raise KeyError('rates')
+        if endpoint == 'timeseries':
+            return {'rates': {'2020-01-01': {'EUR': 0.8}, '2020-01-02': {'EUR': 0.81}, '2020-06-01': {'EUR': 0.9}}}
+        return {'rates': {'EUR': 0.7}}
+
+    monkeypatch.setattr(client, '_make_request', make_request)
+    dates = [date(2020, 1, 1), date(2020, 6, 1), date(2021, 1, 1)]
+
+    rates = client.get_historical_rates_for_dates(dates, 'USD', ['EUR'])
+
+    # Days that were not requested are dropped, and the failed window is fetched day by day
+    assert rates == {date(2020, 1, 1): {'EUR': 0.8}, date(2020, 6, 1): {'EUR': 0.9}, date(2021, 1, 1): {'EUR': 0.7}}
+    assert requests_made == [
+        ('timeseries', '2020-01-01', '2020-06-01'),
+        ('timeseries', '2021-01-01', '2021-01-01'),
+        ('2021-01-01', None, None),
+    ]
+
+
+def test_import_rates_bulk_inserts_and_reports_row_errors(monkeypatch):
+    """Tests that rate imports validate in bulk, insert valid rows in one statement and keep per-row errors"""
+    # Mock the session as a non-PostgreSQL connection so rows are written with a multi-row INSERT
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = 'sqlite'
+    monkeypatch.setattr('src.backend.db.repositories.rate_repository.invalidate_tags', MagicMock())
+    repository = RateRepository(session)
+
+    row = {
+        'attorney_id': '6f1c2a4e-8d1b-4c1e-9a7d-1f0e2b3c4d5e',
+        'client_id': '0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d',
+        'firm_id': '1b2c3d4e-5f6a-4b7c-8d9e-0f1a2b3c4d5e',
+        'office_id': '2c3d4e5f-6a7b-4c8d-9e0f-1a2b3c4d5e6f',
+        'staff_class_id': '3d4e5f6a-7b8c-4d9e-8f1a-2b3c4d5e6f7a',
+        'amount': 500,
+        'currency': 'usd',
+        'effective_date': '2024-01-01',
+    }
+    rate_data = [
+        row,
+        {**row, 'amount': 0},
+        {key: value for key, value in row.items() if key != 'firm_id'},
+        {**row, 'type': 'approved', 'expiration_date': '2024-12-31'},
+    ]
+
+    # Call import_rates with a mix of valid and invalid rows
+    results = repository.import_rates(rate_data, 'NEW')
+
+    # Assert that invalid rows are reported against their index and valid rows are inserted
+    assert results['total'] == 4
+    assert results['successful'] == 2
+    assert [(error['index'], error['error']) for error in results['errors']] == [
+        (1, 'Rate amount must be greater than zero'),
+        (2, 'Missing required fields: firm_id'),
+    ]
+
+    # Verify both valid rows went out in a single statement with normalized values
+    assert session.execute.call_count == 1
+    inserted = session.execute.call_args[0][1]
+    assert [rate['currency'] for rate in inserted] == ['USD', 'USD']
+    assert [rate['type'] for rate in inserted] == [RateType.STANDARD, RateType.APPROVED]
+    assert inserted[1]['expiration_date'] == date(2024, 12, 31)
+
+
+def test_get_rate_analytics_aggregates_match_row_by_row(db_session, attorney, client_organization):
+    """Tests that rate analytics are identical whether aggregated in the database or from loaded rates"""
+    partner_id = uuid.UUID('3d4e5f6a-7b8c-4d9e-8f1a-2b3c4d5e6f7a')
+    associate_id = uuid.UUID('4e5f6a7b-8c9d-4e0f-9a1b-3c4d5e6f7a8b')
+    office_id = uuid.UUID('2c3d4e5f-6a7b-4c8d-9e0f-1a2b3c4d5e6f')
+    # Two staff classes in one currency and a second currency of its own
+    for staff_class_id, amount, currency in [
+        (partner_id, Decimal('500.00'), 'USD'),
+        (partner_id, Decimal('650.50'), 'USD'),
+        (associate_id, Decimal('300.00'), 'USD'),
+        (associate_id, Decimal('410.25'), 'EUR'),
+    ]:
+        db_session.add(Rate(attorney_id=attorney.id, client_id=client_organization.id, firm_id=attorney.organization_id,
+                            office_id=office_id, staff_class_id=staff_class_id, amount=amount, currency=currency,
+                            effective_date=date(2024, 1, 1)))
+    db_session.commit()
+    repository = RateRepository(db_session)
+
+    # Run the GROUP BY and the row-by-row paths against the same database
+    aggregated = repository.get_rate_analytics(client_id=str(client_organization.id), aggregate_in_db=True)
+    collected = repository.get_rate_analytics(client_id=str(client_organization.id), aggregate_in_db=False)
+
+    assert aggregated == collected
+    assert aggregated == {
+        'total_rates': 4,
+        'currency_breakdown': {'USD': 3, 'EUR': 1},
+        'average_rates': {
+            'USD': Decimal('1450.50') / 3,
+            'EUR': Decimal('410.25'),
+            'staff_class': {
+                'USD': {str(partner_id): Decimal('575.25'), str(associate_id): Decimal('300.00')},
+                'EUR': {str(associate_id): Decimal('410.25')},
+            },
+        },
+        'rate_increases': {},
+        'staff_class_breakdown': {},
+        'office_breakdown': {},
+    }
+
+
 def test_check_rate_rules_compliant():
     """Tests that compliant rate changes pass rule checks"""
     # Create a mock Rate object with current and proposed values within allowed limits
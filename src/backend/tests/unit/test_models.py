@@ -718,4 +718,26 @@ def test_rate_approval_methods():
     rate.status = "Rejected"
 
     # Verify is_approved returns False for non-approved statuses
-    assert rate.is_approved() is False
\ No newline at end of file
+    assert rate.is_approved() is False
+
+def test_message_search_vector_ddl_per_dialect():
+    """Test that the message search column is only generated and GIN indexed on PostgreSQL"""
+    from sqlalchemy import create_mock_engine
+    from src.backend.db.models.message import Message  # type: ignore
+
+    def emitted_ddl(url):
+        statements = []
+        engine = create_mock_engine(url, lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect))))
+        Message.__table__.create(engine, checkfirst=False)
+        return '\n'.join(statements)
+
+    # PostgreSQL maintains the search document itself
+    postgres_ddl = emitted_ddl('postgresql://')
+    assert "search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', coalesce(content, ''))) STORED" in postgres_ddl
+    assert 'CREATE INDEX ix_messages_search_vector ON messages USING gin (search_vector)' in postgres_ddl
+
+    # SQLite gets a plain nullable column and no search index
+    sqlite_ddl = emitted_ddl('sqlite://')
+    assert 'to_tsvector' not in sqlite_ddl
+    assert 'search_vector TEXT' in sqlite_ddl
+    assert 'ix_messages_search_vector' not in sqlite_ddl
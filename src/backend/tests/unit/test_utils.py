@@ -2,8 +2,12 @@
 Unit tests for utility functions in the backend of the Justice Bid Rate Negotiation System
 that validate core helper functionality used throughout the application
 """
+import datetime
+import uuid
 import pytest  # pytest v7.3.1
 import unittest.mock  # unittest v3.11.0
+from decimal import Decimal
+import numpy
 from freezegun import freeze_time  # freezegun v1.2.2
 
 from src.backend.utils import validators  # Import validation utility functions to test
@@ -16,6 +20,11 @@ from src.backend.utils import file_handling  # Import file handling utility func
 from src.backend.utils import storage  # Import storage utility functions to test
 from src.backend.utils import email  # Import email utility functions to test
 from src.backend.utils import cache  # Import cache utility functions to test
+from src.backend.utils import pagination  # Import pagination utility functions to test
+from src.backend.utils import principal_cache  # Import principal cache functions to test
+from src.backend.utils import search_index  # Import full-text search index to test
+from src.backend.utils import unread_counters  # Import unread message counters to test
+from src.backend.utils import event_tracking  # Import event dispatch queue to test
 
 
 @pytest.mark.parametrize('email,expected', [
@@ -158,6 +167,26 @@ def test_convert_currency():
         assert converted_amount == 120.00
 
 
+def test_exchange_rate_table_converts_columns_as_of_date():
+    """Tests vectorized conversion against the latest rates on or before each amount's date"""
+    table = currency.ExchangeRateTable('USD')
+    table.load_rates('2022-01-01', {'EUR': 0.5, 'GBP': 0.25})
+    table.load_rates('2023-01-01', {'EUR': 0.8, 'GBP': 0.5})
+
+    converted = table.convert(
+        [100, 100, 100, 100],
+        ['EUR', 'EUR', 'GBP', 'USD'],
+        'USD',
+        ['2022-06-30', '2023-02-01', '2021-01-01', None],
+    )
+
+    # Dates before the first row use the earliest rates and missing dates use the latest
+    assert list(converted) == [200.0, 125.0, 400.0, 100.0]
+    assert table.rate('GBP', 'EUR', '2023-01-01') == Decimal('1.6')
+    with pytest.raises(ValueError):
+        table.convert([100], 'XYZ', 'USD')
+
+
 @pytest.mark.parametrize('filename,allowed_extensions,expected', [
     ('test.pdf', ['pdf', 'docx'], True),
     ('test.doc', ['pdf', 'docx'], False),
@@ -172,6 +201,51 @@ def test_validate_file_type(filename, allowed_extensions, expected):
     assert result == expected
 
 
+def test_stream_tabular_export_serializes_chunks_incrementally():
+    """Tests that chunked exports yield one block per chunk and write the CSV header once"""
+    # Create two chunks of rows with an extra key that is not exported
+    chunks = [
+        [{'id': '1', 'amount': 100.0, 'internal': 'x'}, {'id': '2', 'amount': 200.0}],
+        [{'id': '3', 'amount': 300.0}],
+    ]
+    # Call file_handling.stream_tabular_export for CSV and JSON lines output
+    csv_blocks = list(file_handling.stream_tabular_export(iter(chunks), 'csv', ['id', 'amount']))
+    jsonl_blocks = list(file_handling.stream_tabular_export(iter(chunks), 'jsonl', ['id', 'amount']))
+    # Assert that the header and each chunk produced their own block and the header appears only at the start
+    assert len(csv_blocks) == 3
+    assert b''.join(csv_blocks).decode('utf-8').splitlines() == ['id,amount', '1,100.0', '2,200.0', '3,300.0']
+    # Assert that a CSV export without rows still has its header
+    assert b''.join(file_handling.stream_tabular_export(iter([]), 'csv', ['id', 'amount'])) == b'id,amount\r\n'
+    assert b''.join(jsonl_blocks).decode('utf-8').splitlines()[2] == '{"id": "3", "amount": 300.0}'
+    # Assert that unsupported formats are rejected
+    with pytest.raises(ValueError):
+        list(file_handling.stream_tabular_export(iter(chunks), 'pdf', ['id']))
+
+
+def test_keyset_cursor_round_trips_sort_value_and_id():
+    """Tests that keyset cursors are opaque, round-trip typed values and are bound to their sort"""
+    # Encode the position of a row sorted by date with a UUID tie-breaker
+    row_id = uuid.uuid4()
+    cursor = pagination.encode_cursor('effective_date', [datetime.date(2024, 3, 1), row_id])
+    # Assert that the cursor is URL safe and decodes to the original typed values
+    assert all(character.isalnum() or character in '-_' for character in cursor)
+    assert pagination.decode_cursor(cursor, 'effective_date') == [datetime.date(2024, 3, 1), row_id]
+    # Assert that cursors from another sort or malformed cursors are rejected
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(cursor, 'amount')
+    with pytest.raises(ValueError):
+        pagination.decode_cursor('not-a-cursor', 'effective_date')
+
+
+def test_keyset_cursor_round_trips_float_ranks_exactly():
+    """Tests that relevance ranks widened from float4 come back from a cursor as the same double"""
+    # 0.0607927 stored as float4 and read back as float8
+    rank = float(numpy.float32(0.0607927))
+    assert rank != 0.0607927
+    cursor = pagination.encode_cursor('rank', [rank, uuid.UUID(int=1)])
+    assert pagination.decode_cursor(cursor, 'rank')[0] == rank
+
+
 def test_generate_unique_filename():
     """Tests the unique filename generation function"""
     # Create a test filename
@@ -258,6 +332,109 @@ def test_set_cached_value():
         mock_redis.setex.assert_called_with('test_key', 60, b'0:"test_value"')
 
 
+def test_principal_cache_is_keyed_by_token_and_invalidated_per_user():
+    """Tests that cached principals are served per token and dropped when the user changes"""
+    principal_cache.clear_principal_cache()
+    user_id = uuid.uuid4()
+    other_user_id = uuid.uuid4()
+
+    principal_cache.cache_principal(user_id, 'jti-1', 'principal-1')
+    principal_cache.cache_principal(user_id, 'jti-2', 'principal-2')
+    principal_cache.cache_principal(other_user_id, 'jti-3', 'principal-3')
+
+    assert principal_cache.get_cached_principal(user_id, 'jti-1') == 'principal-1'
+    assert principal_cache.get_cached_principal(user_id, 'jti-unknown') is None
+    assert principal_cache.get_cached_principal(user_id, None) is None
+
+    # Logging out drops only that token
+    assert principal_cache.invalidate_principal_token(user_id, 'jti-1')
+    assert principal_cache.get_cached_principal(user_id, 'jti-1') is None
+    assert principal_cache.get_cached_principal(user_id, 'jti-2') == 'principal-2'
+
+    # Updating the user drops every token of that user only
+    assert principal_cache.invalidate_principal(user_id) == 1
+    assert principal_cache.get_cached_principal(user_id, 'jti-2') is None
+    assert principal_cache.get_cached_principal(other_user_id, 'jti-3') == 'principal-3'
+
+
+def test_parse_search_query_handles_phrases_or_and_exclusions():
+    """Tests that web-search style queries are parsed into required and excluded phrases"""
+    query = search_index.parse_search_query('rate "Annual Increase" or discount -draft')
+
+    assert query.required == [[['rate']], [['annual', 'increase'], ['discount']]]
+    assert query.excluded == [['draft']]
+    assert not search_index.parse_search_query('or -draft')
+
+
+def test_inverted_index_ranks_matches_and_respects_phrases():
+    """Tests that the inverted index matches phrases and exclusions and ranks denser matches higher"""
+    index = search_index.InvertedIndex()
+    index.add('a', 'Proposed rate increase for partners, rate increase applies in January')
+    index.add('b', 'The rate for associates includes an increase after review of the rate card')
+    index.add('c', 'Draft rate increase, do not share')
+
+    scores = index.search('"rate increase" -draft')
+    assert set(scores) == {'a'}
+    assert index.search('rate increase')['a'] > index.search('rate increase')['b']
+    assert set(index.search('partners or associates')) == {'a', 'b'}
+
+
+def test_inverted_index_updates_incrementally():
+    """Tests that replacing and removing documents updates the postings"""
+    index = search_index.InvertedIndex()
+    index.add('a', 'initial proposal')
+    index.add('a', 'counter proposal')
+
+    assert set(index.search('counter')) == {'a'}
+    assert index.search('initial') == {}
+    assert index.remove('a')
+    assert len(index) == 0 and index.search('proposal') == {}
+
+
+def test_get_unread_counts_distinguishes_unseeded_counters():
+    """Tests that unseeded counters are reported as a miss and the seeded marker is not a thread"""
+    with unittest.mock.patch('src.backend.utils.unread_counters.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+
+        mock_redis.hgetall.return_value = {}
+        assert unread_counters.get_unread_counts('user-1') is None
+
+        mock_redis.hgetall.return_value = {unread_counters.SEEDED_FIELD: '0', 'thread-1': '2', 'thread-2': '0'}
+        assert unread_counters.get_unread_counts('user-1') == {'thread-1': 2}
+        mock_redis.hgetall.assert_called_with('unread:{user-1}')
+
+
+def test_seed_unread_counts_skips_read_threads():
+    """Tests that seeding writes the marker plus only the threads with unread messages"""
+    with unittest.mock.patch('src.backend.utils.unread_counters.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+        mock_redis.eval.return_value = 1
+
+        assert unread_counters.seed_unread_counts('user-1', {'thread-1': 3, 'thread-2': 0}, '4', ttl=60)
+        mock_redis.eval.assert_called_once_with(
+            unread_counters.SEED_SCRIPT, 2, 'unread:{user-1}', 'unread:{user-1}:sync', 60, '4',
+            unread_counters.SEEDED_FIELD, 0, 'thread-1', 3
+        )
+
+
+def test_seed_unread_counts_requires_the_version_read_before_the_snapshot():
+    """Tests that counters are only seeded against the version read before the database snapshot"""
+    with unittest.mock.patch('src.backend.utils.unread_counters.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+
+        # A user whose counters were never updated is at version 0
+        mock_redis.hget.return_value = None
+        assert unread_counters.get_unread_seed_version('user-1') == '0'
+        mock_redis.hget.assert_called_once_with('unread:{user-1}:sync', 'version')
+
+        # Without a version, e.g. when Redis was unavailable before the snapshot, nothing is seeded
+        assert not unread_counters.seed_unread_counts('user-1', {'thread-1': 3}, None)
+        mock_redis.eval.assert_not_called()
+
+
 def test_upload_file_to_storage():
     """Tests the file upload function with mocked storage service"""
     # Mock the storage backend
@@ -308,6 +485,51 @@ def test_send_email():
         assert mock_smtp.called
 
 
+SMTP_TEST_CONFIG = {
+    'smtp_host': 'smtp.test', 'smtp_port': 25, 'smtp_username': '', 'smtp_password': '',
+    'use_tls': False, 'use_ssl': False, 'default_sender': 'no-reply@example.com'
+}
+
+
+def test_send_email_reuses_pooled_connection():
+    """Tests that consecutive emails are sent over one pooled SMTP connection"""
+    email.close_smtp_pools()
+    with unittest.mock.patch('src.backend.utils.email.smtplib.SMTP') as mock_smtp:
+        for recipient in ('a@example.com', 'b@example.com', 'c@example.com'):
+            assert email.send_email(to_email=recipient, subject='Deadline', body='Reminder',
+                                    config=SMTP_TEST_CONFIG) is True
+        mock_smtp.assert_called_once_with('smtp.test', 25)
+        assert mock_smtp.return_value.sendmail.call_count == 3
+        mock_smtp.return_value.quit.assert_not_called()
+        email.close_smtp_pools()
+        mock_smtp.return_value.quit.assert_called_once()
+
+
+def test_send_emails_isolates_failed_messages():
+    """Tests that a refused recipient fails only its own message and a dropped connection is replaced"""
+    email.close_smtp_pools()
+    with unittest.mock.patch('src.backend.utils.email.smtplib.SMTP') as mock_smtp:
+        mock_smtp.return_value.sendmail.side_effect = [
+            None,
+            email.smtplib.SMTPRecipientsRefused({'bad@example.com': (550, b'No such user')}),
+            email.smtplib.SMTPServerDisconnected('Connection unexpectedly closed'),
+            None,
+        ]
+        result = email.send_emails([
+            {'recipient': 'a@example.com', 'subject': 'Deadline', 'body': 'Reminder'},
+            {'recipient': 'bad@example.com', 'subject': 'Deadline', 'body': 'Reminder'},
+            {'recipient': 'c@example.com', 'subject': 'Deadline', 'body': 'Reminder'},
+            {'recipient': 'd@example.com', 'subject': 'Deadline'},
+        ], config=SMTP_TEST_CONFIG)
+
+        assert result['success_count'] == 2
+        assert result['failure_count'] == 2
+        assert [(f['index'], f['retryable']) for f in result['failures']] == [(1, False), (3, False)]
+        # Only the dropped connection was reopened
+        assert mock_smtp.call_count == 2
+    email.close_smtp_pools()
+
+
 def test_get_cached_value():
     """Tests the cache retrieval function with mocked cache service"""
     with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
@@ -327,6 +549,133 @@ def test_set_cached_value():
         mock_redis.setex.assert_called_with('test_key', 60, b'0:"test_value"')
 
 
+def test_cached_serves_repeat_hits_from_local_tier():
+    """Tests that repeat cache hits are answered in-process without a Redis round trip"""
+    cache.local_cache.clear()
+    with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+        mock_redis.get.return_value = None
+        mock_redis.set.return_value = True
+        compute = unittest.mock.Mock(return_value={'total': 42})
+
+        @cache.cached(ttl=60, key_prefix='test_local_tier')
+        def expensive():
+            return compute()
+
+        assert expensive() == {'total': 42}
+        redis_reads = mock_redis.get.call_count
+        assert expensive() == {'total': 42}
+        assert expensive() == {'total': 42}
+
+        # The function ran once and later hits never touched Redis
+        assert compute.call_count == 1
+        assert mock_redis.get.call_count == redis_reads
+        assert cache.get_cache_stats()['test_local_tier']['local_hits'] >= 2
+
+
+def test_cached_serves_stale_value_while_another_worker_recomputes():
+    """Tests that a miss serves the stale local copy when the recompute lock is held elsewhere"""
+    cache.local_cache.clear()
+    with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+        mock_redis.get.return_value = None
+        mock_redis.set.return_value = None  # Recompute lock is held by another worker
+        compute = unittest.mock.Mock(return_value='fresh')
+
+        @cache.cached(ttl=60, key_prefix='test_stale')
+        def expensive():
+            return compute()
+
+        key = cache.generate_cache_key('test_stale', (), {})
+        cache.local_cache.set(key, cache.serialize_value('stale'), ttl=0, stale_ttl=60)
+
+        assert expensive() == 'stale'
+        compute.assert_not_called()
+
+
+def test_local_cache_tier_returns_copies():
+    """Tests that mutating a value served from the local tier does not change the cached value"""
+    cache.local_cache.clear()
+    with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
+        mock_get_redis_client.return_value = unittest.mock.Mock()
+        cache.set_cache('test_copies', {'rates': [100, 200]}, ttl=60)
+
+        served = cache.get_cache('test_copies')
+        served['rates'].append(300)
+
+        assert cache.get_cache('test_copies') == {'rates': [100, 200]}
+        mock_get_redis_client.return_value.get.assert_not_called()
+
+
+def test_invalidate_tags_deletes_only_tagged_keys():
+    """Tests that tag invalidation deletes the keys registered under the tag atomically without scanning"""
+    cache.local_cache.clear()
+    cache.local_cache.set('peer_comparison:abc', 'cached', ttl=60)
+    with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+        mock_redis.eval.return_value = [2, [b'peer_comparison:abc', b'impact_analysis:def']]
+
+        count = cache.invalidate_tags(cache.cache_tag('firm', 'firm-1'))
+
+        assert count == 2
+        mock_redis.eval.assert_called_once_with(cache.INVALIDATE_TAGS_SCRIPT, 1, 'tag:firm:firm-1')
+        assert cache.local_cache.get('peer_comparison:abc') is None
+        mock_redis.delete.assert_not_called()
+        mock_redis.scan_iter.assert_not_called()
+
+
+def test_set_cache_registers_tags_in_the_same_transaction():
+    """Tests that a tagged value and its tag registrations are written in one MULTI/EXEC pipeline"""
+    with unittest.mock.patch('src.backend.utils.cache.get_redis_client') as mock_get_redis_client:
+        mock_redis = unittest.mock.Mock()
+        mock_get_redis_client.return_value = mock_redis
+        mock_pipeline = unittest.mock.Mock()
+        mock_redis.pipeline.return_value = mock_pipeline
+
+        assert cache.set_cache('test_key', 'test_value', ttl=60, tags=[cache.cache_tag('firm', 'firm-1')])
+
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        mock_pipeline.setex.assert_called_once_with('test_key', 60, b'0:"test_value"')
+        mock_pipeline.sadd.assert_called_once_with('tag:firm:firm-1', 'test_key')
+        mock_pipeline.execute.assert_called_once()
+        mock_redis.setex.assert_not_called()
+
+
+def test_event_dispatcher_delivers_events_in_batches():
+    """Tests that queued events reach batch handlers in batches no larger than the batch size"""
+    batches = []
+    handler = lambda events: batches.append([event['event_id'] for event in events])
+    event_tracking.register_batch_handler(handler)
+    try:
+        dispatcher = event_tracking.EventDispatcher(max_size=100, flush_interval=0.01, batch_size=3)
+        for index in range(7):
+            assert dispatcher.enqueue({'event_type': 'api_request', 'event_id': index}) is True
+        dispatcher.stop()
+    finally:
+        event_tracking.unregister_batch_handler(handler)
+
+    assert sorted(event_id for batch in batches for event_id in batch) == list(range(7))
+    assert all(len(batch) <= 3 for batch in batches)
+    stats = dispatcher.stats()
+    assert stats['enqueued'] == stats['dispatched'] == 7
+    assert stats['dropped'] == 0
+
+
+@pytest.mark.parametrize('policy,kept', [('drop_newest', [0, 1]), ('drop_oldest', [1, 2])])
+def test_event_dispatcher_drops_events_when_full(policy, kept):
+    """Tests that a full event queue drops events according to its overflow policy and counts them"""
+    dispatcher = event_tracking.EventDispatcher(max_size=2, overflow_policy=policy)
+    with unittest.mock.patch.object(dispatcher, '_ensure_started'):
+        results = [dispatcher.enqueue({'event_type': 'api_request', 'event_id': index}) for index in range(3)]
+
+    assert results == [True, True, policy == 'drop_oldest']
+    assert [dispatcher._queue.get_nowait()['event_id'] for _ in range(2)] == kept
+    assert dispatcher.stats()['dropped'] == 1
+
+
 def test_upload_file_to_storage():
     """Tests the file upload function with mocked storage service"""
     with unittest.mock.patch('src.backend.utils.storage.upload_file') as mock_upload_file:
@@ -4,13 +4,25 @@ Utility module providing caching functionality for the Justice Bid application.
 This module implements a flexible caching system with Redis as the backend storage,
 supporting function result caching, key-based operations, and pattern-based cache
 invalidation.
+
+Reads go through a bounded per-process LRU tier before Redis, and the cached decorator
+coalesces concurrent recomputes of a missing key so only one worker rebuilds it.
+
+Entries can be registered under dependency tags (e.g. "firm:<id>"), each backed by a
+Redis set of keys, so invalidation deletes exactly the keys under a tag without
+scanning the keyspace.
 """
 
 import json
 import pickle
 import hashlib
+import fnmatch
 import functools
-from typing import Any, Callable, Dict, Tuple, Optional, Union
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
 from datetime import datetime, timedelta
 
 from utils.redis_client import get_redis_client
@@ -24,6 +36,345 @@ CACHE_ENABLED = True
 DEFAULT_TTL = 3600  # Default TTL in seconds (1 hour)
 SERIALIZATION_METHODS = {'json': 0, 'pickle': 1}
 
+# In-process cache tier configuration
+LOCAL_CACHE_ENABLED = True
+LOCAL_CACHE_MAX_ENTRIES = 1024  # Entries kept per process before least recently used are evicted
+LOCAL_CACHE_TTL = 60  # Upper bound in seconds on how long a process serves a value without asking Redis
+DEFAULT_STALE_TTL = 300  # Seconds an expired value may still be served while another worker recomputes it
+
+# Recompute lock configuration for stampede protection
+RECOMPUTE_LOCK_PREFIX = "lock"
+RECOMPUTE_LOCK_TTL = 30  # Seconds before an abandoned recompute lock expires
+RECOMPUTE_WAIT_TIMEOUT = 10.0  # Seconds to wait for another worker's recompute before computing locally
+RECOMPUTE_POLL_INTERVAL = 0.05  # Seconds between checks for another worker's result
+
+# Dependency tag configuration
+CACHE_TAG_PREFIX = "tag"
+CACHE_TAG_TYPES = ('organization', 'client', 'firm', 'attorney', 'staff_class', 'peer_group', 'prefix')
+CACHE_TAG_TTL = 7 * 86400  # Tag sets outlive their members; stale members are harmless to delete
+
+# Compare-and-delete so a worker only releases the recompute lock it holds
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Deletes every key registered under the tags in KEYS, then the tag sets themselves, in one
+# atomic step so a key tagged concurrently is either deleted with its tag or survives intact.
+# Returns the number of entries deleted and the list of their keys.
+INVALIDATE_TAGS_SCRIPT = """
+local count = 0
+local deleted = {}
+for _, tag_key in ipairs(KEYS) do
+    local members = redis.call('smembers', tag_key)
+    for i = 1, #members, 500 do
+        local batch = {unpack(members, i, math.min(i + 499, #members))}
+        count = count + redis.call('del', unpack(batch))
+        for _, member in ipairs(batch) do
+            deleted[#deleted + 1] = member
+        end
+    end
+    redis.call('del', tag_key)
+end
+return {count, deleted}
+"""
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe, in-process LRU cache with per-entry expiry.
+    
+    Entries keep a fresh window, during which they are returned by get, and a longer
+    stale window, during which they are only returned by get_stale.
+    """
+    
+    def __init__(self, max_entries: int = LOCAL_CACHE_MAX_ENTRIES):
+        """
+        Initialize the local cache.
+        
+        Args:
+            max_entries: Maximum number of entries before least recently used are evicted
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """
+        Get a fresh value from the local cache.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            The cached value or None if missing or no longer fresh
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, fresh_until, stale_until = entry
+            if now >= stale_until:
+                del self._entries[key]
+                return None
+            if now >= fresh_until:
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def get_stale(self, key: str) -> Any:
+        """
+        Get a value that is fresh or still inside its stale window.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            The cached value or None if missing or past its stale window
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry[2]:
+                return None
+            return entry[0]
+    
+    def set(self, key: str, value: Any, ttl: int, stale_ttl: int = 0) -> None:
+        """
+        Set a value in the local cache.
+        
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl: Seconds the value is fresh
+            stale_ttl: Additional seconds the value may be served stale
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the local cache.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            True if the key was present, False otherwise
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+    
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        Delete all local entries matching a Redis-style glob pattern.
+        
+        Args:
+            pattern: Key pattern to match (e.g., "user:*")
+            
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+    
+    def clear(self) -> None:
+        """Remove every entry from the local cache."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class TTLCache:
+    """
+    Per-process cache of values served for a fixed TTL and dropped early on invalidation.
+    
+    Backs the principal and entity ownership caches, which only live in the local tier: the
+    TTL bounds how long another process may serve a value after a change made elsewhere.
+    Values are returned as stored and must be immutable.
+    """
+    
+    def __init__(self, name: str, ttl: int, max_entries: int, enabled: bool = True):
+        """
+        Initialize the cache.
+        
+        Args:
+            name: Name of the cached values, used in log messages
+            ttl: Default seconds a value is served
+            max_entries: Maximum number of entries before least recently used are evicted
+            enabled: Whether values are cached at all
+        """
+        self.name = name
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries = LocalCache(max_entries)
+    
+    def get(self, key: str) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            The cached value or None if missing, expired or caching is disabled
+        """
+        if not self.enabled:
+            return None
+        return self._entries.get(key)
+    
+    def get_many(self, keys: Dict[Any, str]) -> Dict[Any, Any]:
+        """
+        Get several cached values.
+        
+        Args:
+            keys: Dictionary mapping identifiers to their cache keys
+            
+        Returns:
+            Dictionary mapping the identifiers found in the cache to their values
+        """
+        found = {}
+        for identifier, key in keys.items():
+            value = self.get(key)
+            if value is not None:
+                found[identifier] = value
+        return found
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Cache a value.
+        
+        Args:
+            key: The cache key
+            value: The immutable value to cache
+            ttl: Seconds the value is served, defaults to the cache's TTL
+        """
+        if self.enabled:
+            self._entries.set(key, value, self.ttl if ttl is None else ttl)
+    
+    def delete(self, *keys: str) -> int:
+        """
+        Drop cached values.
+        
+        Args:
+            keys: The cache keys
+            
+        Returns:
+            Number of entries dropped
+        """
+        deleted = sum(self._entries.delete(key) for key in keys)
+        if deleted:
+            logger.debug(f"Invalidated {deleted} cached {self.name}")
+        return deleted
+    
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        Drop every cached value whose key matches a glob pattern.
+        
+        Args:
+            pattern: Key pattern to match (e.g., "user:*")
+            
+        Returns:
+            Number of entries dropped
+        """
+        deleted = self._entries.delete_pattern(pattern)
+        if deleted:
+            logger.debug(f"Invalidated {deleted} cached {self.name} matching {pattern}")
+        return deleted
+    
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+
+
+class CacheStats:
+    """
+    Thread-safe hit, miss and latency counters grouped by cache key prefix.
+    """
+    
+    COUNTERS = ('local_hits', 'redis_hits', 'misses', 'stale_hits', 'recomputes', 'lock_waits', 'errors')
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+    
+    def _bucket(self, key: str) -> Dict[str, float]:
+        prefix = key.split(':', 1)[0]
+        bucket = self._stats.get(prefix)
+        if bucket is None:
+            bucket = dict.fromkeys(self.COUNTERS, 0)
+            bucket.update({'lookups': 0, 'lookup_time_ms': 0.0})
+            self._stats[prefix] = bucket
+        return bucket
+    
+    def increment(self, key: str, counter: str) -> None:
+        """
+        Increment a counter for the prefix of a key.
+        
+        Args:
+            key: The cache key
+            counter: Name of the counter to increment
+        """
+        with self._lock:
+            self._bucket(key)[counter] += 1
+    
+    def record_lookup(self, key: str, elapsed: float) -> None:
+        """
+        Record the latency of a cache lookup for the prefix of a key.
+        
+        Args:
+            key: The cache key
+            elapsed: Lookup duration in seconds
+        """
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket['lookups'] += 1
+            bucket['lookup_time_ms'] += elapsed * 1000
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get a copy of all counters with the derived hit ratio and average latency.
+        
+        Returns:
+            Counters keyed by key prefix
+        """
+        with self._lock:
+            snapshot = {}
+            for prefix, bucket in self._stats.items():
+                stats = dict(bucket)
+                hits = stats['local_hits'] + stats['redis_hits']
+                stats['hit_ratio'] = round(hits / stats['lookups'], 4) if stats['lookups'] else 0.0
+                stats['avg_lookup_ms'] = round(stats['lookup_time_ms'] / stats['lookups'], 3) if stats['lookups'] else 0.0
+                snapshot[prefix] = stats
+            return snapshot
+    
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide cache tier, statistics and in-process single-flight locks. The local tier holds
+# serialized values, so every hit deserializes a private copy that callers may mutate freely.
+local_cache = LocalCache()
+cache_stats = CacheStats()
+_flight_locks: Dict[str, list] = {}  # key -> [lock, reference count]
+_flight_locks_guard = threading.Lock()
+
 
 def generate_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
     """
@@ -102,14 +453,112 @@ def deserialize_value(serialized_value: bytes) -> Any:
         return None
 
 
-def set_cache(key: str, value: Any, ttl: int = DEFAULT_TTL) -> bool:
+def cache_tag(tag_type: str, value: Any) -> str:
+    """
+    Builds a dependency tag for cache invalidation.
+    
+    Args:
+        tag_type: Kind of dependency, one of CACHE_TAG_TYPES
+        value: Identifier of the dependency (e.g. an organization UUID)
+        
+    Returns:
+        Tag string such as "firm:<uuid>"
+    """
+    if tag_type not in CACHE_TAG_TYPES:
+        raise ValueError(f"Unsupported cache tag type: {tag_type}")
+    return f"{tag_type}:{value}"
+
+
+def register_cache_tags(key: str, tags: Optional[List[str]]) -> bool:
+    """
+    Registers a cache key under dependency tags so it can be invalidated by tag.
+    
+    Args:
+        key: The cache key
+        tags: Tags built with cache_tag
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not CACHE_ENABLED or not tags:
+        return False
+    
+    try:
+        redis_client = get_redis_client()
+        pipeline = redis_client.pipeline(transaction=True)
+        _queue_cache_tags(pipeline, key, tags)
+        pipeline.execute()
+        return True
+    except Exception as e:
+        logger.error(f"Failed to register cache tags for key {key}: {str(e)}")
+        return False
+
+
+def _queue_cache_tags(pipeline: Any, key: str, tags: List[str]) -> None:
+    """
+    Queues the commands that register a cache key under dependency tags.
+    
+    Args:
+        pipeline: Redis pipeline to queue the commands on
+        key: The cache key
+        tags: Tags built with cache_tag
+    """
+    for tag in set(tags):
+        tag_key = f"{CACHE_TAG_PREFIX}:{tag}"
+        pipeline.sadd(tag_key, key)
+        pipeline.expire(tag_key, CACHE_TAG_TTL)
+
+
+def invalidate_tags(*tags: str) -> int:
+    """
+    Deletes every cache entry registered under any of the given tags.
+    
+    The tag sets are read and deleted together with their members in a single Lua
+    script, so keys tagged while an invalidation runs are never orphaned. Cost is proportional to the number of keys under the tags. Only this process's
+    local tier is cleared; other processes drop their copies within LOCAL_CACHE_TTL.
+    
+    Args:
+        tags: Tags built with cache_tag
+        
+    Returns:
+        Number of cache entries deleted
+    """
+    if not CACHE_ENABLED or not tags:
+        return 0
+    
+    try:
+        redis_client = get_redis_client()
+        tag_keys = [f"{CACHE_TAG_PREFIX}:{tag}" for tag in set(tags)]
+        
+        # Delete the tagged keys and the tag sets atomically in Redis
+        count, keys = redis_client.eval(INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys)
+        
+        # Drop this process's local copies of the deleted keys
+        for key in keys:
+            local_cache.delete(key.decode() if isinstance(key, bytes) else key)
+        
+        logger.debug(f"Invalidated {count} cache entries for tags {', '.join(tags)}")
+        return count
+    except Exception as e:
+        logger.error(f"Failed to invalidate cache tags {', '.join(tags)}: {str(e)}")
+        return 0
+
+
+def set_cache(key: str, value: Any, ttl: int = DEFAULT_TTL, stale_ttl: int = 0,
+              tags: Optional[List[str]] = None) -> bool:
     """
     Sets a value in the cache with the specified key and TTL.
     
+    The serialized value is written to Redis and to the local tier, where it stays fresh
+    for at most LOCAL_CACHE_TTL seconds.
+    
     Args:
         key: The cache key
         value: The value to cache
         ttl: Time-to-live in seconds
+        stale_ttl: Seconds after expiry that this process may still serve the value
+            while another worker recomputes it
+        tags: Optional dependency tags, built with cache_tag, to register the key under
         
     Returns:
         True if successful, False otherwise
@@ -118,12 +567,25 @@ def set_cache(key: str, value: Any, ttl: int = DEFAULT_TTL) -> bool:
         return False
     
     try:
-        redis_client = get_redis_client()
         serialized_value = serialize_value(value)
-        redis_client.setex(key, ttl, serialized_value)
+        if LOCAL_CACHE_ENABLED:
+            local_ttl = min(ttl, LOCAL_CACHE_TTL)
+            local_cache.set(key, serialized_value, local_ttl, ttl - local_ttl + stale_ttl)
+        
+        redis_client = get_redis_client()
+        if tags:
+            # Write the value and its tags in one MULTI/EXEC so an invalidation never
+            # runs between them and leaves the value untagged
+            pipeline = redis_client.pipeline(transaction=True)
+            pipeline.setex(key, ttl, serialized_value)
+            _queue_cache_tags(pipeline, key, tags)
+            pipeline.execute()
+        else:
+            redis_client.setex(key, ttl, serialized_value)
         logger.debug(f"Cache set for key {key}, TTL: {ttl}s")
         return True
     except Exception as e:
+        cache_stats.increment(key, 'errors')
         logger.error(f"Failed to set cache for key {key}: {str(e)}")
         return False
 
@@ -132,6 +594,9 @@ def get_cache(key: str) -> Any:
     """
     Retrieves a value from the cache by key.
     
+    The local tier is checked first; Redis hits are copied into it. Both tiers hold
+    serialized values, so every caller receives its own copy.
+    
     Args:
         key: The cache key
         
@@ -141,20 +606,35 @@ def get_cache(key: str) -> Any:
     if not CACHE_ENABLED:
         return None
     
+    start = time.perf_counter()
     try:
+        if LOCAL_CACHE_ENABLED:
+            local_value = local_cache.get(key)
+            if local_value is not None:
+                cache_stats.increment(key, 'local_hits')
+                logger.debug(f"Local cache hit for key {key}")
+                return deserialize_value(local_value)
+        
         redis_client = get_redis_client()
         value = redis_client.get(key)
         
         if value:
             deserialized = deserialize_value(value)
+            if LOCAL_CACHE_ENABLED and deserialized is not None:
+                local_cache.set(key, value, LOCAL_CACHE_TTL)
+            cache_stats.increment(key, 'redis_hits')
             logger.debug(f"Cache hit for key {key}")
             return deserialized
         
+        cache_stats.increment(key, 'misses')
         logger.debug(f"Cache miss for key {key}")
         return None
     except Exception as e:
+        cache_stats.increment(key, 'errors')
         logger.error(f"Failed to get cache for key {key}: {str(e)}")
         return None
+    finally:
+        cache_stats.record_lookup(key, time.perf_counter() - start)
 
 
 def delete_cache(key: str) -> bool:
@@ -170,6 +650,8 @@ def delete_cache(key: str) -> bool:
     if not CACHE_ENABLED:
         return False
     
+    local_cache.delete(key)
+    
     try:
         redis_client = get_redis_client()
         result = redis_client.delete(key)
@@ -199,6 +681,8 @@ def clear_cache_pattern(pattern: str) -> int:
     if not CACHE_ENABLED:
         return 0
     
+    local_cache.delete_pattern(pattern)
+    
     try:
         redis_client = get_redis_client()
         keys = list(redis_client.scan_iter(match=pattern))
@@ -218,13 +702,121 @@ def clear_cache_pattern(pattern: str) -> int:
         return 0
 
 
-def cached(ttl: int = DEFAULT_TTL, key_prefix: str = None):
+def _get_flight_lock(key: str) -> threading.Lock:
+    """
+    Gets the in-process lock that serializes recomputes of a cache key.
+    
+    Every call must be paired with _release_flight_lock once the lock is released.
+    
+    Args:
+        key: The cache key
+        
+    Returns:
+        Lock shared by all threads recomputing the key
+    """
+    with _flight_locks_guard:
+        entry = _flight_locks.get(key)
+        if entry is None:
+            entry = [threading.Lock(), 0]
+            _flight_locks[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_flight_lock(key: str) -> None:
+    """
+    Drops a reference to an in-process recompute lock, forgetting it when unused.
+    
+    Args:
+        key: The cache key
+    """
+    with _flight_locks_guard:
+        entry = _flight_locks.get(key)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _flight_locks[key]
+
+
+def acquire_recompute_lock(key: str, ttl: int = RECOMPUTE_LOCK_TTL) -> Optional[str]:
+    """
+    Tries to take the cross-process lock for recomputing a cache key.
+    
+    Args:
+        key: The cache key
+        ttl: Seconds before the lock expires if never released
+        
+    Returns:
+        Lock token if acquired, None if another worker holds the lock. If Redis is
+        unavailable a token is returned so the caller computes the value itself.
+    """
+    token = uuid.uuid4().hex
+    try:
+        redis_client = get_redis_client()
+        if redis_client.set(f"{RECOMPUTE_LOCK_PREFIX}:{key}", token, nx=True, ex=ttl):
+            return token
+        return None
+    except Exception as e:
+        logger.error(f"Failed to acquire recompute lock for key {key}: {str(e)}")
+        return token
+
+
+def release_recompute_lock(key: str, token: str) -> bool:
+    """
+    Releases a cross-process recompute lock if it is still held with the given token.
+    
+    Args:
+        key: The cache key
+        token: Token returned by acquire_recompute_lock
+        
+    Returns:
+        True if the lock was released, False otherwise
+    """
+    try:
+        redis_client = get_redis_client()
+        return bool(redis_client.eval(RELEASE_LOCK_SCRIPT, 1, f"{RECOMPUTE_LOCK_PREFIX}:{key}", token))
+    except Exception as e:
+        logger.error(f"Failed to release recompute lock for key {key}: {str(e)}")
+        return False
+
+
+def _wait_for_recompute(key: str, timeout: float = RECOMPUTE_WAIT_TIMEOUT) -> Any:
+    """
+    Polls the cache for a value another worker is recomputing.
+    
+    Args:
+        key: The cache key
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        The cached value, or None if it did not appear before the timeout
+    """
+    cache_stats.increment(key, 'lock_waits')
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(RECOMPUTE_POLL_INTERVAL)
+        value = get_cache(key)
+        if value is not None:
+            return value
+    return None
+
+
+def cached(ttl: int = DEFAULT_TTL, key_prefix: str = None, stale_ttl: int = DEFAULT_STALE_TTL,
+           tags: Optional[Callable[..., List[str]]] = None):
     """
     Decorator that caches the result of a function.
     
+    On a miss only one caller recomputes the value: threads in the same process wait
+    on a shared lock, and other processes either serve a stale local copy or wait
+    for the lock holder's result. Every result is tagged with its key prefix so
+    invalidate_cached can find it without scanning.
+    
     Args:
         ttl: Time-to-live in seconds for cached results
         key_prefix: Prefix for cache keys (defaults to function name)
+        stale_ttl: Seconds after expiry a stale result may be served during a recompute
+        tags: Optional callable receiving the function's arguments and returning the
+            dependency tags (built with cache_tag) the result should be invalidated by
         
     Returns:
         Decorated function with caching behavior
@@ -245,18 +837,66 @@ def cached(ttl: int = DEFAULT_TTL, key_prefix: str = None):
                 logger.debug(f"Cache hit for function {func.__name__}")
                 return cached_result
             
-            # If not in cache, execute the function
-            logger.debug(f"Cache miss for function {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            # Cache the result
-            set_cache(cache_key, result, ttl)
-            
-            return result
+            flight_lock = _get_flight_lock(cache_key)
+            flight_lock.acquire()
+            try:
+                # Another thread may have filled the key while we waited
+                cached_result = get_cache(cache_key)
+                if cached_result is not None:
+                    return cached_result
+                
+                token = acquire_recompute_lock(cache_key)
+                if token is None:
+                    # Another worker is recomputing; serve stale or wait for its result
+                    stale_value = local_cache.get_stale(cache_key)
+                    if stale_value is not None:
+                        cache_stats.increment(cache_key, 'stale_hits')
+                        logger.debug(f"Serving stale result for function {func.__name__}")
+                        return deserialize_value(stale_value)
+                    
+                    cached_result = _wait_for_recompute(cache_key)
+                    if cached_result is not None:
+                        return cached_result
+                    logger.warning(f"Timed out waiting for recompute of {cache_key}, computing locally")
+                
+                # If not in cache, execute the function
+                logger.debug(f"Cache miss for function {func.__name__}")
+                cache_stats.increment(cache_key, 'recomputes')
+                try:
+                    result = func(*args, **kwargs)
+                    
+                    # Cache the result under its prefix and dependency tags
+                    result_tags = [cache_tag('prefix', prefix)]
+                    if tags:
+                        result_tags.extend(tags(*args, **kwargs))
+                    set_cache(cache_key, result, ttl, stale_ttl, tags=result_tags)
+                finally:
+                    if token is not None:
+                        release_recompute_lock(cache_key, token)
+                
+                return result
+            finally:
+                flight_lock.release()
+                _release_flight_lock(cache_key)
         return inner
     return wrapper
 
 
+def get_cache_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Gets cache hit, miss and latency counters for this process.
+    
+    Returns:
+        Counters keyed by cache key prefix
+    """
+    return cache_stats.snapshot()
+
+
+def reset_cache_stats() -> None:
+    """Resets the cache counters for this process."""
+    cache_stats.reset()
+
+
 def invalidate_cached(key_prefix: str) -> int:
     """
     Invalidates cache entries for a specific function prefix.
@@ -267,7 +907,52 @@ def invalidate_cached(key_prefix: str) -> int:
     Returns:
         Number of invalidated cache entries
     """
-    pattern = f"{key_prefix}:*"
+    return invalidate_tags(cache_tag('prefix', key_prefix))
+
+
+def cache_result(ttl: int = DEFAULT_TTL, key_prefix: str = None):
+    """
+    Decorator that caches the result of a function, as cached with the default stale window.
+    
+    Args:
+        ttl: Time-to-live in seconds for cached results
+        key_prefix: Prefix for cache keys (defaults to function name)
+        
+    Returns:
+        Decorated function with caching behavior
+    """
+    return cached(ttl=ttl, key_prefix=key_prefix)
+
+
+def store_cached_result(key: str, value: Any, ttl: int = DEFAULT_TTL, tags: Optional[List[str]] = None) -> bool:
+    """
+    Caches a precomputed result, such as the output of a background task.
+    
+    Args:
+        key: The cache key
+        value: The value to cache
+        ttl: Time-to-live in seconds
+        tags: Optional dependency tags, built with cache_tag, to register the key under
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    return set_cache(key, value, ttl, tags=tags)
+
+
+def invalidate_cache(pattern: str) -> int:
+    """
+    Invalidates cache entries matching a key pattern by scanning the keyspace.
+    
+    Prefer invalidate_tags for targeted invalidation; this is intended for bulk
+    refreshes where a full scan is acceptable.
+    
+    Args:
+        pattern: Redis key pattern to match (e.g., "impact_analysis:*")
+        
+    Returns:
+        Number of invalidated cache entries
+    """
     return clear_cache_pattern(pattern)
 
 
@@ -335,4 +1020,44 @@ class CacheManager:
         Returns:
             Number of keys deleted
         """
-        return clear_cache_pattern(pattern)
\ No newline at end of file
+        return clear_cache_pattern(pattern)
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get cache hit, miss and latency counters for this process.
+        
+        Returns:
+            Counters keyed by cache key prefix
+        """
+        return get_cache_stats()
+    
+    def clear_local(self) -> None:
+        """Clear this process's local cache tier without touching Redis."""
+        local_cache.clear()
+    
+    def set_with_tags(self, key: str, value: Any, tags: List[str], ttl: int = DEFAULT_TTL) -> bool:
+        """
+        Set a value in the cache registered under dependency tags.
+        
+        Args:
+            key: The cache key
+            value: The value to cache
+            tags: Tags built with cache_tag
+            ttl: Time-to-live in seconds
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return set_cache(key, value, ttl, tags=tags)
+    
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every cache entry registered under any of the given tags.
+        
+        Args:
+            tags: Tags built with cache_tag
+            
+        Returns:
+            Number of cache entries deleted
+        """
+        return invalidate_tags(*tags)
@@ -5,9 +5,14 @@ to support multi-currency rate negotiations across the application.
 
 import requests
 import json
+import threading
+import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime, timedelta
+
+import numpy
+import pandas
 
 from ..utils.redis_client import get_redis_client
 from ..app.config import AppConfig
@@ -61,6 +66,9 @@ CURRENCY_PRECISION = {
 # Cache TTL for exchange rates in seconds (1 day)
 EXCHANGE_RATE_CACHE_TTL = 86400
 
+# Seconds before the in-process exchange rate table reloads the latest rates (1 hour)
+EXCHANGE_RATE_TABLE_REFRESH_INTERVAL = 3600
+
 # Set up logger
 logger = get_logger(__name__)
 
@@ -160,6 +168,13 @@ def get_exchange_rate(from_currency: str, to_currency: str, force_refresh: bool
     if from_currency == to_currency:
         return Decimal('1.0')
     
+    # Serve from the in-process exchange rate table, falling back to the pair cache and API
+    if not force_refresh:
+        try:
+            return get_exchange_rate_table().rate(from_currency, to_currency)
+        except Exception as e:
+            logger.warning(f"Exchange rate table unavailable for {from_currency} to {to_currency}: {str(e)}")
+    
     # Try to get from cache first if not forcing refresh
     if not force_refresh:
         redis_client = get_redis_client()
@@ -367,13 +382,10 @@ def batch_convert_currency(amounts: List[Decimal], from_currency: str,
     if from_currency == to_currency:
         return amounts
     
-    # Get exchange rate once for efficiency
-    exchange_rate = get_exchange_rate(from_currency, to_currency)
-    
-    # Convert all amounts
+    # Convert all amounts in one vectorized step against the exchange rate table
     converted_amounts = [
-        round_currency(amount * exchange_rate, to_currency)
-        for amount in amounts
+        round_currency(Decimal(str(amount)), to_currency)
+        for amount in convert_amounts(amounts, from_currency, to_currency)
     ]
     
     logger.debug(f"Batch converted {len(amounts)} amounts from {from_currency} to {to_currency}")
@@ -390,6 +402,9 @@ def refresh_exchange_rates() -> bool:
         # Refresh rates for each supported currency
         for base_currency in SUPPORTED_CURRENCIES:
             get_all_exchange_rates(base_currency, force_refresh=True)
+        
+        # Reload the in-process table from the refreshed base rates
+        get_exchange_rate_table(force_refresh=True)
             
         logger.info("Successfully refreshed all exchange rates")
         return True
@@ -436,6 +451,10 @@ def set_custom_exchange_rate(from_currency: str, to_currency: str,
         inverse_cache_key = f"exchange_rate:{to_currency}:{from_currency}"
         redis_client.set(inverse_cache_key, str(inverse_rate), ttl)
         
+        # Apply to this process immediately; other processes pick it up on their next table refresh
+        if _exchange_rate_table is not None:
+            _exchange_rate_table.set_override(from_currency, to_currency, rate)
+        
         logger.info(f"Set custom exchange rate: {from_currency} to {to_currency} = {rate} (ttl: {ttl}s)")
         return True
     except Exception as e:
@@ -467,4 +486,320 @@ def round_currency(amount: Decimal, currency_code: str) -> Decimal:
     # Round to the appropriate number of decimal places
     rounded = amount.quantize(Decimal('0.1') ** precision)
     
-    return rounded
\ No newline at end of file
+    return rounded
+
+class ExchangeRateTable:
+    """
+    In-memory, date-indexed matrix of exchange rates for every supported currency.
+    
+    Each row holds the rates of all supported currencies against a single base currency
+    for one day, so the rate for any pair on any day is rates[to] / rates[from] of the
+    latest row on or before that day. Amounts are converted in bulk with NumPy indexing
+    instead of one cache or API lookup per value.
+    """
+    
+    def __init__(self, base_currency: str = DEFAULT_CURRENCY, currencies: Optional[List[str]] = None):
+        """
+        Initializes an empty exchange rate table.
+        
+        Args:
+            base_currency: The currency every row of rates is quoted against
+            currencies: The currency codes held in the table (defaults to SUPPORTED_CURRENCIES)
+        """
+        self.base_currency = base_currency.upper()
+        self.currencies = list(currencies or SUPPORTED_CURRENCIES)
+        self._currency_index = {code: index for index, code in enumerate(self.currencies)}
+        # Dates and matrix are always replaced together so readers never see a partial update
+        self._state = (numpy.empty(0, dtype='datetime64[D]'), numpy.empty((0, len(self.currencies))))
+        self._overrides: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[float] = None
+    
+    def __len__(self) -> int:
+        return len(self._state[0])
+    
+    @property
+    def dates(self) -> List[date]:
+        """The days with a row of rates, in ascending order."""
+        return [day.item() for day in self._state[0]]
+    
+    def load_rates(self, rate_date: Union[date, datetime, str], rates: Dict[str, Union[Decimal, float]]) -> None:
+        """
+        Loads the rates of one day, replacing any rates already held for that day.
+        
+        Args:
+            rate_date: The day the rates apply from
+            rates: Mapping of currency code to units of that currency per unit of the base currency
+        """
+        self.load_many({rate_date: rates})
+    
+    def load_many(self, rates_by_date: Dict[Union[date, datetime, str], Dict[str, Union[Decimal, float]]]) -> None:
+        """
+        Loads the rates of several days at once, replacing any rates already held for those days.
+        
+        Args:
+            rates_by_date: Mapping of day to a mapping of currency code to units per unit of the base currency
+        """
+        if not rates_by_date:
+            return
+        
+        new_days = _to_day_array(list(rates_by_date.keys()))
+        new_rows = numpy.full((len(new_days), len(self.currencies)), numpy.nan)
+        for row, rates in enumerate(rates_by_date.values()):
+            for code, rate in rates.items():
+                index = self._currency_index.get(code.upper())
+                if index is not None and rate:
+                    new_rows[row, index] = float(rate)
+            new_rows[row, self._currency_index[self.base_currency]] = 1.0
+        
+        with self._lock:
+            days, matrix = self._state
+            keep = ~numpy.isin(days, new_days)
+            days = numpy.concatenate([days[keep], new_days])
+            matrix = numpy.concatenate([matrix[keep], new_rows])
+            order = numpy.argsort(days, kind='stable')
+            self._state = (days[order], matrix[order])
+            self.loaded_at = time.time()
+    
+    def set_overrides(self, overrides: Dict[tuple, Union[Decimal, float]]) -> None:
+        """
+        Replaces the pair overrides applied to conversions at the latest rates.
+        
+        Args:
+            overrides: Mapping of (from_currency, to_currency) to the rate to use for that pair
+        """
+        self._overrides = {
+            (from_currency.upper(), to_currency.upper()): float(rate)
+            for (from_currency, to_currency), rate in overrides.items()
+        }
+    
+    def set_override(self, from_currency: str, to_currency: str, rate: Union[Decimal, float]) -> None:
+        """
+        Sets the override for one pair and its inverse.
+        
+        Args:
+            from_currency: The source currency code
+            to_currency: The target currency code
+            rate: The rate to use for the pair
+        """
+        overrides = dict(self._overrides)
+        overrides[(from_currency.upper(), to_currency.upper())] = float(rate)
+        overrides[(to_currency.upper(), from_currency.upper())] = 1.0 / float(rate)
+        self._overrides = overrides
+    
+    def rate(self, from_currency: str, to_currency: str,
+             rate_date: Optional[Union[date, datetime, str]] = None) -> Decimal:
+        """
+        Returns the rate to convert from one currency to another.
+        
+        Args:
+            from_currency: The source currency code
+            to_currency: The target currency code
+            rate_date: The day to take the rate as of (defaults to the latest rates)
+            
+        Returns:
+            The exchange rate from the source to the target currency
+        """
+        factor = self.factors([from_currency], to_currency, None if rate_date is None else [rate_date])[0]
+        return Decimal(str(factor))
+    
+    def factors(self, from_currencies: Any, to_currency: str, dates: Any = None) -> numpy.ndarray:
+        """
+        Returns the conversion factor for each (currency, date) pair in one vectorized lookup.
+        
+        Args:
+            from_currencies: A currency code or a sequence of currency codes
+            to_currency: The target currency code
+            dates: None for the latest rates, a single day, or a sequence of days aligned with from_currencies
+            
+        Returns:
+            Array of factors that convert an amount in each source currency to the target currency
+        """
+        days, matrix = self._state
+        if not len(days):
+            raise ValueError("Exchange rate table is empty")
+        
+        to_currency = to_currency.upper()
+        if to_currency not in self._currency_index:
+            raise ValueError(f"Unsupported currency code: {to_currency}")
+        
+        codes = pandas.Series(numpy.atleast_1d(numpy.asarray(from_currencies, dtype=object))).str.upper()
+        from_index = pandas.Categorical(codes, categories=self.currencies).codes
+        if (from_index < 0).any():
+            raise ValueError(f"Unsupported currency code: {codes[from_index < 0].iloc[0]}")
+        
+        # As-of lookup: the latest row on or before each day, clamped to the earliest row held
+        latest = len(days) - 1
+        if dates is None:
+            rows = numpy.full(len(from_index), latest)
+        else:
+            wanted = _to_day_array(dates)
+            rows = numpy.clip(numpy.searchsorted(days, wanted, side='right') - 1, 0, latest)
+            rows[numpy.isnat(wanted)] = latest
+            rows = numpy.broadcast_to(rows, from_index.shape)
+        
+        factors = matrix[rows, self._currency_index[to_currency]] / matrix[rows, from_index]
+        
+        # Pair overrides apply to the latest rates only; historical rows are left untouched
+        for (override_from, override_to), override_rate in self._overrides.items():
+            if override_to == to_currency and override_from in self._currency_index:
+                factors[(from_index == self._currency_index[override_from]) & (rows == latest)] = override_rate
+        
+        if numpy.isnan(factors).any():
+            missing = codes[numpy.isnan(factors)].iloc[0]
+            raise ValueError(f"No exchange rate available for {missing} to {to_currency}")
+        return factors
+    
+    def convert(self, amounts: Any, from_currencies: Any, to_currency: str, dates: Any = None) -> numpy.ndarray:
+        """
+        Converts a column of amounts to a target currency in one vectorized operation.
+        
+        Args:
+            amounts: Sequence of amounts to convert
+            from_currencies: A currency code or a sequence of currency codes aligned with amounts
+            to_currency: The target currency code
+            dates: None for the latest rates, a single day, or a sequence of days aligned with amounts
+            
+        Returns:
+            Array of converted amounts as floats
+        """
+        amounts = numpy.asarray(amounts, dtype=float)
+        if not amounts.size:
+            return amounts
+        if isinstance(from_currencies, str):
+            from_currencies = [from_currencies] * amounts.size
+        return amounts * self.factors(from_currencies, to_currency, dates)
+    
+    def convert_frame(self, frame: pandas.DataFrame, to_currency: str, amount_column: str = 'amount',
+                      currency_column: str = 'currency', date_column: Optional[str] = None,
+                      rate_date: Optional[Union[date, datetime, str]] = None) -> pandas.DataFrame:
+        """
+        Converts the amounts of a DataFrame to a target currency.
+        
+        Args:
+            frame: DataFrame holding an amount column and a currency column
+            to_currency: The target currency code
+            amount_column: Name of the column holding amounts
+            currency_column: Name of the column holding currency codes
+            date_column: Optional name of a column holding the day of each amount
+            rate_date: Day to convert every row as of when no date column is given
+            
+        Returns:
+            Copy of the DataFrame with converted amounts and the currency column set to the target
+        """
+        frame = frame.copy()
+        if frame.empty:
+            return frame
+        
+        dates = frame[date_column] if date_column else rate_date
+        frame[amount_column] = self.convert(frame[amount_column], frame[currency_column], to_currency, dates)
+        frame[currency_column] = to_currency.upper()
+        return frame
+
+
+def _to_day_array(dates: Any) -> numpy.ndarray:
+    """
+    Normalizes a day or a sequence of days to a NumPy datetime64[D] array.
+    
+    Args:
+        dates: A date, datetime, string, or a sequence or Series of them
+        
+    Returns:
+        Array of days, with NaT for missing values
+    """
+    values = pandas.to_datetime(dates)
+    if isinstance(values, (pandas.Series, pandas.Index)):
+        return values.to_numpy(dtype='datetime64[D]')
+    return numpy.atleast_1d(numpy.asarray(values, dtype='datetime64[D]'))
+
+
+_exchange_rate_table: Optional[ExchangeRateTable] = None
+_exchange_rate_table_lock = threading.Lock()
+
+
+def get_exchange_rate_table(force_refresh: bool = False) -> ExchangeRateTable:
+    """
+    Returns the process-wide exchange rate table, loading or refreshing it when it is stale.
+    
+    The table is loaded once per process and refreshed after EXCHANGE_RATE_TABLE_REFRESH_INTERVAL
+    seconds, so conversions between refreshes never reach Redis or the currency API.
+    
+    Args:
+        force_refresh: Whether to reload the latest rates regardless of the table's age
+        
+    Returns:
+        The loaded exchange rate table
+    """
+    global _exchange_rate_table
+    
+    table = _exchange_rate_table
+    if table is not None and not force_refresh and len(table) and \
+            time.time() - table.loaded_at < EXCHANGE_RATE_TABLE_REFRESH_INTERVAL:
+        return table
+    
+    with _exchange_rate_table_lock:
+        table = _exchange_rate_table or ExchangeRateTable(DEFAULT_CURRENCY)
+        # Another thread may have refreshed the table while this one waited for the lock
+        if force_refresh or not len(table) or \
+                time.time() - table.loaded_at >= EXCHANGE_RATE_TABLE_REFRESH_INTERVAL:
+            try:
+                _load_latest_rates(table)
+            except Exception as e:
+                if not len(table):
+                    raise
+                logger.error(f"Failed to refresh exchange rate table, keeping rates from {table.dates[-1]}: {str(e)}")
+                # Back off until the next interval instead of retrying on every conversion
+                table.loaded_at = time.time()
+        _exchange_rate_table = table
+    return table
+
+
+def _load_latest_rates(table: ExchangeRateTable) -> None:
+    """
+    Loads today's rates against the table's base currency and the cached pair overrides.
+    
+    Args:
+        table: The table to load into
+    """
+    # 1. One cached lookup (or API call) for every supported currency against the base
+    rates = get_all_exchange_rates(table.base_currency)
+    table.load_rates(datetime.utcnow().date(), rates)
+    
+    # 2. Pair rates cached in Redis (including custom rates) keep precedence, fetched in one MGET
+    pairs = [(a, b) for a in table.currencies for b in table.currencies if a != b]
+    redis_client = get_redis_client()
+    cached = redis_client.mget([f"exchange_rate:{a}:{b}" for a, b in pairs])
+    table.set_overrides({pair: Decimal(value) for pair, value in zip(pairs, cached) if value})
+    
+    logger.info(f"Loaded exchange rate table for {len(rates)} currencies against {table.base_currency}")
+
+
+def refresh_exchange_rate_table() -> bool:
+    """
+    Reloads the process-wide exchange rate table from the latest rates.
+    
+    Returns:
+        True if the refresh was successful, False otherwise
+    """
+    try:
+        get_exchange_rate_table(force_refresh=True)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to refresh exchange rate table: {str(e)}")
+        return False
+
+
+def convert_amounts(amounts: Any, from_currencies: Any, to_currency: str, dates: Any = None) -> numpy.ndarray:
+    """
+    Converts a column of amounts to a target currency using the process-wide exchange rate table.
+    
+    Args:
+        amounts: Sequence of amounts to convert
+        from_currencies: A currency code or a sequence of currency codes aligned with amounts
+        to_currency: The target currency code
+        dates: None for the latest rates, a single day, or a sequence of days aligned with amounts
+        
+    Returns:
+        Array of converted amounts as floats
+    """
+    return get_exchange_rate_table().convert(amounts, from_currencies, to_currency, dates)
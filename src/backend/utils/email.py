@@ -4,17 +4,25 @@ Email utilities for the Justice Bid Rate Negotiation System.
 This module provides functionality for sending emails, including template rendering,
 SMTP configuration, and retry capabilities. It serves as the foundation for all 
 email communications in the application.
+
+SMTP sessions are pooled per worker process: a connection is opened, upgraded to TLS and
+authenticated once, then reused for later messages until it has been idle too long or has
+sent SMTP_POOL_MAX_MESSAGES messages.
 """
 
+import collections
+import functools
 import os
 import smtplib
 import ssl
+import threading
 import time
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any, Callable
 
 import jinja2
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -29,6 +37,12 @@ logger = get_logger(__name__)
 DEFAULT_SENDER = '"Justice Bid <no-reply@justicebid.com>"'
 DEFAULT_TEMPLATES_DIR = Path(__file__).parent.parent / "templates" / "email"
 
+# SMTP connection pool settings
+SMTP_POOL_MAX_SIZE = 4  # Idle connections kept per server and account
+SMTP_POOL_MAX_IDLE_SECONDS = 240  # Idle connections older than this are closed, not reused
+SMTP_POOL_CHECK_AFTER_SECONDS = 30  # Idle connections older than this are checked with NOOP
+SMTP_POOL_MAX_MESSAGES = 500  # Messages sent before a connection is recycled
+
 
 def init_email_config(config: Optional[Dict] = None) -> Dict:
     """
@@ -97,10 +111,11 @@ def send_email(
     cc: Optional[List[str]] = None,
     bcc: Optional[List[str]] = None,
     attachments: Optional[List[Dict]] = None,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    config: Optional[Dict] = None
 ) -> bool:
     """
-    Send an email with the specified parameters.
+    Send an email with the specified parameters over a pooled SMTP connection.
     
     Args:
         to_email: Recipient email address(es)
@@ -112,71 +127,26 @@ def send_email(
         bcc: Blind carbon copy recipients
         attachments: List of attachment dictionaries with 'content' and 'filename' keys
         headers: Additional email headers
+        config: Email configuration dictionary (defaults to the application configuration)
         
     Returns:
         bool: Success status of the email sending operation
     """
-    config = init_email_config()
+    config = config or init_email_config()
     
     # Ensure to_email is a list
     if isinstance(to_email, str):
         to_email = [to_email]
     
-    # Default values for optional parameters
-    from_email = from_email or config['default_sender']
     cc = cc or []
     bcc = bcc or []
-    attachments = attachments or []
-    headers = headers or {}
     
     try:
-        # Create message object
-        message = MIMEMultipart() if attachments or html else MIMEText(body, 'html' if html else 'plain')
-        
-        # Set headers
-        message['From'] = from_email
-        message['To'] = ', '.join(to_email)
-        message['Subject'] = subject
-        
-        if cc:
-            message['Cc'] = ', '.join(cc)
-        
-        # Add custom headers
-        for header_name, header_value in headers.items():
-            message[header_name] = header_value
-        
-        # Add body if using MIMEMultipart
-        if isinstance(message, MIMEMultipart):
-            content_type = 'html' if html else 'plain'
-            message.attach(MIMEText(body, content_type))
-        
-        # Add attachments
-        for attachment in attachments:
-            part = MIMEApplication(attachment['content'])
-            part.add_header('Content-Disposition', 'attachment', filename=attachment['filename'])
-            message.attach(part)
-        
-        # Determine all recipients
-        all_recipients = to_email + cc + bcc
-        
-        # Connect to SMTP server
-        context = ssl.create_default_context()
-        
-        if config['use_ssl']:
-            smtp = smtplib.SMTP_SSL(config['smtp_host'], config['smtp_port'], context=context)
-        else:
-            smtp = smtplib.SMTP(config['smtp_host'], config['smtp_port'])
-            
-            if config['use_tls']:
-                smtp.starttls(context=context)
-        
-        # Login if credentials provided
-        if config['smtp_username'] and config['smtp_password']:
-            smtp.login(config['smtp_username'], config['smtp_password'])
+        from_email, all_recipients, message = _build_message(
+            config, to_email, subject, body, from_email, html, cc, bcc, attachments, headers
+        )
         
-        # Send email
-        smtp.sendmail(from_email, all_recipients, message.as_string())
-        smtp.quit()
+        _deliver(get_smtp_pool(config), from_email, all_recipients, message)
         
         logger.info(f"Email sent successfully to {', '.join(to_email)}",
                    extra={"additional_data": {
@@ -198,6 +168,338 @@ def send_email(
         return False
 
 
+def send_emails(email_data_list: List[Dict], config: Optional[Dict] = None) -> Dict:
+    """
+    Send many emails over one pooled SMTP connection.
+    
+    A failure only affects its own message: a refused recipient or rejected message is recorded
+    and the next message is sent on the same connection, and a dropped connection is replaced
+    before the message is retried once.
+    
+    Args:
+        email_data_list: Email data dictionaries with 'recipient', 'subject' and 'body' keys and
+            optional 'is_html', 'cc', 'bcc', 'attachments', 'headers' and 'from_email' keys
+        config: Email configuration dictionary (defaults to the application configuration)
+        
+    Returns:
+        Dict: success_count, failure_count and total_count, plus a 'failures' list with the index,
+            recipient, error and whether the failure is worth retrying for each failed message
+    """
+    config = config or init_email_config()
+    pool = get_smtp_pool(config)
+    
+    success_count = 0
+    failures = []
+    
+    for index, email_data in enumerate(email_data_list):
+        recipient = email_data.get('recipient')
+        
+        try:
+            if not recipient or not email_data.get('subject') or not email_data.get('body'):
+                raise ValueError("Email data is missing a recipient, subject or body")
+            
+            from_email, all_recipients, message = _build_message(
+                config,
+                [recipient] if isinstance(recipient, str) else list(recipient),
+                email_data['subject'],
+                email_data['body'],
+                email_data.get('from_email'),
+                email_data.get('is_html', True),
+                email_data.get('cc') or [],
+                email_data.get('bcc') or [],
+                email_data.get('attachments'),
+                email_data.get('headers')
+            )
+            _deliver(pool, from_email, all_recipients, message)
+            success_count += 1
+        
+        except Exception as e:
+            failures.append({
+                'index': index,
+                'recipient': recipient,
+                'error': str(e),
+                # Connection problems and 4xx replies are transient; refused recipients and bad data are not
+                'retryable': _is_connection_error(e) or _is_transient_smtp_error(e)
+            })
+    
+    logger.info(f"Sent {success_count} of {len(email_data_list)} emails in batch",
+               extra={"additional_data": {
+                   "success": success_count,
+                   "failure": len(failures)
+               }})
+    
+    return {
+        'success_count': success_count,
+        'failure_count': len(failures),
+        'total_count': len(email_data_list),
+        'failures': failures
+    }
+
+
+def _build_message(
+    config: Dict,
+    to_email: List[str],
+    subject: str,
+    body: str,
+    from_email: Optional[str],
+    html: bool,
+    cc: List[str],
+    bcc: List[str],
+    attachments: Optional[List[Dict]],
+    headers: Optional[Dict[str, str]]
+) -> Tuple[str, List[str], str]:
+    """
+    Build a MIME message, returning the sender, all envelope recipients and the message text.
+    """
+    from_email = from_email or config['default_sender']
+    attachments = attachments or []
+    headers = headers or {}
+    
+    # Create message object
+    message = MIMEMultipart() if attachments or html else MIMEText(body, 'html' if html else 'plain')
+    
+    # Set headers
+    message['From'] = from_email
+    message['To'] = ', '.join(to_email)
+    message['Subject'] = subject
+    
+    if cc:
+        message['Cc'] = ', '.join(cc)
+    
+    # Add custom headers
+    for header_name, header_value in headers.items():
+        message[header_name] = header_value
+    
+    # Add body if using MIMEMultipart
+    if isinstance(message, MIMEMultipart):
+        content_type = 'html' if html else 'plain'
+        message.attach(MIMEText(body, content_type))
+    
+    # Add attachments
+    for attachment in attachments:
+        part = MIMEApplication(attachment['content'])
+        part.add_header('Content-Disposition', 'attachment', filename=attachment['filename'])
+        message.attach(part)
+    
+    # Determine all recipients
+    return from_email, to_email + cc + bcc, message.as_string()
+
+
+def _deliver(pool: 'SMTPConnectionPool', from_email: str, recipients: List[str], message: str) -> None:
+    """
+    Send a message over a pooled connection, retrying once on a fresh connection if the pooled
+    one turns out to have been dropped by the server.
+    """
+    for attempt in range(2):
+        try:
+            with pool.connection() as smtp:
+                smtp.sendmail(from_email, recipients, message)
+            return
+        except Exception as e:
+            if attempt or not _is_connection_error(e):
+                raise
+
+
+def _is_connection_error(exception: Exception) -> bool:
+    """
+    Whether an error means the SMTP connection can no longer be used.
+    
+    SMTP replies such as refused recipients are also OSErrors, but leave the session usable.
+    """
+    if isinstance(exception, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, smtplib.SMTPHeloError)):
+        return True
+    return isinstance(exception, OSError) and not isinstance(exception, smtplib.SMTPException)
+
+
+def _is_transient_smtp_error(exception: Exception) -> bool:
+    """
+    Whether an SMTP error carries a 4xx (temporary failure) reply code.
+    """
+    if isinstance(exception, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in exception.recipients.values()]
+    else:
+        codes = [getattr(exception, 'smtp_code', None)]
+    return bool(codes) and all(isinstance(code, int) and 400 <= code < 500 for code in codes)
+
+
+class _PooledConnection:
+    """
+    An open, authenticated SMTP connection and its usage counters.
+    """
+    
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+        self.message_count = 0
+
+
+class SMTPConnectionPool:
+    """
+    Pool of authenticated SMTP connections to one server and account.
+    
+    Connections are handed out one at a time and returned after use, so a connection is never
+    shared by two threads. Idle connections are reused most recently used first.
+    """
+    
+    def __init__(self, config: Dict, max_size: int = SMTP_POOL_MAX_SIZE,
+                 max_idle_seconds: float = SMTP_POOL_MAX_IDLE_SECONDS,
+                 max_messages: int = SMTP_POOL_MAX_MESSAGES):
+        """
+        Initialize the pool.
+        
+        Args:
+            config: Email configuration dictionary
+            max_size: Maximum number of idle connections kept open
+            max_idle_seconds: Idle time after which a connection is closed instead of reused
+            max_messages: Number of messages after which a connection is closed instead of reused
+        """
+        self.config = config
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.max_messages = max_messages
+        self._idle = collections.deque()
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open a connection, upgrading to TLS and logging in as configured.
+        """
+        context = ssl.create_default_context()
+        
+        if self.config['use_ssl']:
+            smtp = smtplib.SMTP_SSL(self.config['smtp_host'], self.config['smtp_port'], context=context)
+        else:
+            smtp = smtplib.SMTP(self.config['smtp_host'], self.config['smtp_port'])
+            
+            if self.config['use_tls']:
+                smtp.starttls(context=context)
+        
+        # Login if credentials provided
+        if self.config['smtp_username'] and self.config['smtp_password']:
+            smtp.login(self.config['smtp_username'], self.config['smtp_password'])
+        
+        return smtp
+    
+    def _is_usable(self, connection: _PooledConnection) -> bool:
+        """
+        Whether an idle connection can be reused, checking long-idle connections with NOOP.
+        """
+        idle_seconds = time.monotonic() - connection.last_used
+        if idle_seconds > self.max_idle_seconds:
+            return False
+        if idle_seconds > SMTP_POOL_CHECK_AFTER_SECONDS:
+            try:
+                return connection.smtp.noop()[0] == 250
+            except Exception:
+                return False
+        return True
+    
+    def acquire(self) -> _PooledConnection:
+        """
+        Take an idle connection from the pool, or open a new one if none is usable.
+        """
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return _PooledConnection(self._connect())
+            if self._is_usable(connection):
+                return connection
+            self._close(connection)
+    
+    def release(self, connection: _PooledConnection, reusable: bool = True) -> None:
+        """
+        Return a connection to the pool, closing it if it is broken, worn out or surplus.
+        """
+        connection.last_used = time.monotonic()
+        if reusable and connection.message_count < self.max_messages:
+            with self._lock:
+                if len(self._idle) < self.max_size:
+                    self._idle.append(connection)
+                    return
+        self._close(connection)
+    
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection for the duration of a with block.
+        
+        The connection is discarded if the block raises a connection error; other errors, such as
+        refused recipients, leave the session usable and it is returned to the pool.
+        """
+        connection = self.acquire()
+        try:
+            yield connection.smtp
+        except Exception as e:
+            connection.message_count += 1
+            self.release(connection, reusable=not _is_connection_error(e))
+            raise
+        connection.message_count += 1
+        self.release(connection)
+    
+    def close_all(self) -> None:
+        """
+        Close every idle connection in the pool.
+        """
+        with self._lock:
+            idle, self._idle = list(self._idle), collections.deque()
+        for connection in idle:
+            self._close(connection)
+    
+    @staticmethod
+    def _close(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+
+
+# Connection pools of this process, keyed by server and account
+_smtp_pools: Dict[Tuple, SMTPConnectionPool] = {}
+_smtp_pools_lock = threading.Lock()
+
+
+def get_smtp_pool(config: Dict) -> SMTPConnectionPool:
+    """
+    Get this process's connection pool for the server and account in an email configuration.
+    
+    Args:
+        config: Email configuration dictionary
+        
+    Returns:
+        SMTPConnectionPool: Connection pool for the configured server and account
+    """
+    key = (config['smtp_host'], config['smtp_port'], config['smtp_username'],
+           bool(config['use_ssl']), bool(config['use_tls']))
+    pool = _smtp_pools.get(key)
+    if pool is None:
+        with _smtp_pools_lock:
+            pool = _smtp_pools.setdefault(key, SMTPConnectionPool(config))
+    return pool
+
+
+def close_smtp_pools() -> None:
+    """
+    Close all pooled SMTP connections of this process.
+    """
+    with _smtp_pools_lock:
+        pools = list(_smtp_pools.values())
+        _smtp_pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+def _reset_smtp_pools_after_fork() -> None:
+    # A forked worker must not write to its parent's sockets, so it starts with empty pools
+    global _smtp_pools_lock
+    _smtp_pools.clear()
+    _smtp_pools_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_smtp_pools_after_fork)
+
+
 def send_template_email(
     to_email: Union[str, List[str]],
     subject: str,
@@ -228,8 +530,8 @@ def send_template_email(
     """
     config = init_email_config()
     
-    # Create template instance
-    email_template = EmailTemplate(config['templates_dir'])
+    # Shared template instance, so templates are compiled once per process
+    email_template = get_email_template_renderer(config['templates_dir'])
     
     try:
         # Render template with context
@@ -245,7 +547,8 @@ def send_template_email(
             cc=cc,
             bcc=bcc,
             attachments=attachments,
-            headers=headers
+            headers=headers,
+            config=config
         )
     
     except Exception as e:
@@ -272,10 +575,11 @@ class EmailTemplate:
         """
         self.templates_dir = templates_dir or DEFAULT_TEMPLATES_DIR
         
-        # Initialize template environment
+        # Initialize template environment; templates are not checked for changes on every lookup
         self._env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False
         )
         
         # Template cache
@@ -330,6 +634,29 @@ class EmailTemplate:
         template = self.get_template(template_name)
         return template.render(**context)
     
+    def precompile(self) -> int:
+        """
+        Compile every HTML template in the templates directory into the cache.
+        
+        Returns:
+            int: Number of templates compiled
+        """
+        try:
+            template_names = self._env.list_templates(extensions=['html'])
+        except OSError:
+            return 0
+        
+        compiled = 0
+        for template_name in template_names:
+            try:
+                self.get_template(template_name)
+                compiled += 1
+            except jinja2.TemplateError as e:
+                # Broken templates fail when they are rendered, not when others are loaded
+                logger.error(f"Failed to compile email template {template_name}: {str(e)}")
+        
+        return compiled
+    
     def clear_cache(self) -> None:
         """
         Clear the template cache.
@@ -337,6 +664,27 @@ class EmailTemplate:
         self._template_cache = {}
 
 
+@functools.lru_cache(maxsize=None)
+def _get_email_template_renderer(templates_dir: str) -> EmailTemplate:
+    email_template = EmailTemplate(Path(templates_dir))
+    email_template.precompile()
+    return email_template
+
+
+def get_email_template_renderer(templates_dir: Optional[Path] = None) -> EmailTemplate:
+    """
+    Get this process's shared template manager for a templates directory, with its templates
+    compiled on first use.
+    
+    Args:
+        templates_dir: Directory containing email templates
+        
+    Returns:
+        EmailTemplate: Shared template manager
+    """
+    return _get_email_template_renderer(str(templates_dir or DEFAULT_TEMPLATES_DIR))
+
+
 class EmailRetry:
     """
     Handles retries for email sending operations.
@@ -476,7 +824,8 @@ class SMTPEmailSender:
                 cc=cc,
                 bcc=bcc,
                 attachments=attachments,
-                headers=headers
+                headers=headers,
+                config=self.config
             )
         except Exception as e:
             logger.error(f"Failed to send email after retries: {str(e)}",
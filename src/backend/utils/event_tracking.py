@@ -5,11 +5,20 @@ interface for recording user actions, system events, and audit information.
 This module implements a flexible event tracking system that supports both logging and
 event-driven architecture patterns. It provides structured event recording with contextual
 enrichment, allowing for comprehensive audit trails and event sourcing.
+
+Events are enriched and logged on the caller's thread, then placed on a bounded in-process
+queue. A background thread drains the queue and hands the events to the registered handlers
+in batches, so storage writes such as the MongoDB insert stay off the request path.
 """
 
+import atexit
+import collections
 import logging
 import datetime
+import os
+import queue
 import threading
+import time
 import json
 import uuid
 from typing import Dict, Any, Optional, Callable, List
@@ -30,9 +39,26 @@ logger = logging.getLogger('event_tracking')
 # Thread-local storage for context information
 context_data = threading.local()
 
-# List of registered event handlers
+# List of registered event handlers, called once per event
 event_handlers = []
 
+# List of registered batch handlers, called once per batch with a list of events
+batch_handlers = []
+
+# Event dispatch defaults, used when settings do not override them
+DEFAULT_QUEUE_MAX_SIZE = 10000
+DEFAULT_FLUSH_INTERVAL = 1.0  # Seconds an event may wait in the queue before its batch is dispatched
+DEFAULT_FLUSH_BATCH_SIZE = 500
+DEFAULT_OVERFLOW_POLICY = 'drop_newest'
+
+# What happens to an event when the queue is full: it is dropped, the oldest queued event is
+# dropped to make room for it, or the caller waits up to BLOCK_TIMEOUT seconds for room
+OVERFLOW_POLICIES = ('drop_newest', 'drop_oldest', 'block')
+BLOCK_TIMEOUT = 0.05
+
+# A warning is logged for the first dropped event and then every DROP_WARNING_INTERVAL drops
+DROP_WARNING_INTERVAL = 1000
+
 
 def set_context(context: Dict[str, Any]) -> None:
     """
@@ -98,6 +124,35 @@ def unregister_handler(handler: Callable[[Dict[str, Any]], None]) -> bool:
     return False
 
 
+def register_batch_handler(handler: Callable[[List[Dict[str, Any]]], None]) -> None:
+    """
+    Registers a handler function that will be called with each batch of events.
+    
+    Args:
+        handler (Callable[[List[Dict[str, Any]]], None]): Function that accepts a list of event dictionaries
+    """
+    if handler not in batch_handlers:
+        batch_handlers.append(handler)
+        logger.debug(f"Registered batch event handler: {handler.__name__}")
+
+
+def unregister_batch_handler(handler: Callable[[List[Dict[str, Any]]], None]) -> bool:
+    """
+    Removes a previously registered batch handler function.
+    
+    Args:
+        handler (Callable[[List[Dict[str, Any]]], None]): Batch handler function to remove
+        
+    Returns:
+        bool: True if the handler was removed, False if it was not found
+    """
+    if handler in batch_handlers:
+        batch_handlers.remove(handler)
+        logger.debug(f"Unregistered batch event handler: {handler.__name__}")
+        return True
+    return False
+
+
 def _enrich_event(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     Adds standard contextual information to an event.
@@ -151,18 +206,308 @@ def _enrich_event(event: Dict[str, Any]) -> Dict[str, Any]:
     return event
 
 
-def _dispatch_event(event: Dict[str, Any]) -> None:
+def _dispatch_events(events: List[Dict[str, Any]]) -> int:
     """
-    Dispatches an event to all registered handlers.
+    Dispatches a batch of events to all registered batch handlers and event handlers.
     
     Args:
-        event (Dict[str, Any]): Event dictionary to dispatch
+        events (List[Dict[str, Any]]): Event dictionaries to dispatch
+        
+    Returns:
+        int: Number of handler calls that raised an error
     """
-    for handler in event_handlers:
+    errors = 0
+    
+    for handler in list(batch_handlers):
         try:
-            handler(event)
+            handler(events)
         except Exception as e:
-            logger.error(f"Error in event handler {handler.__name__}: {str(e)}")
+            errors += 1
+            logger.error(f"Error in batch event handler {handler.__name__}: {str(e)}")
+    
+    for handler in list(event_handlers):
+        for event in events:
+            try:
+                handler(event)
+            except Exception as e:
+                errors += 1
+                logger.error(f"Error in event handler {handler.__name__}: {str(e)}")
+    
+    return errors
+
+
+class EventDispatcher:
+    """
+    Bounded in-process event queue drained by a background thread, which dispatches the queued
+    events in batches of up to batch_size, at most flush_interval seconds after the first event
+    of a batch was queued.
+    
+    The thread is started on the first enqueue in each process.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = DEFAULT_QUEUE_MAX_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        overflow_policy: str = DEFAULT_OVERFLOW_POLICY
+    ):
+        """
+        Creates a dispatcher.
+        
+        Args:
+            max_size (int): Maximum number of queued events
+            flush_interval (float): Seconds the first event of a batch may wait before dispatch
+            batch_size (int): Maximum number of events per batch
+            overflow_policy (str): One of OVERFLOW_POLICIES, applied when the queue is full
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown event queue overflow policy: {overflow_policy}")
+        
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+        
+        self._queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._counters = collections.Counter()
+    
+    def enqueue(self, event: Dict[str, Any]) -> bool:
+        """
+        Queues an event for dispatch without waiting for its handlers.
+        
+        Args:
+            event (Dict[str, Any]): Event dictionary to queue
+            
+        Returns:
+            bool: True if the event was queued, False if it was dropped
+        """
+        self._ensure_started()
+        
+        try:
+            if self.overflow_policy == 'block':
+                self._queue.put(event, timeout=BLOCK_TIMEOUT)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            if self.overflow_policy != 'drop_oldest' or not self._replace_oldest(event):
+                self._record_drop(event)
+                return False
+        
+        self._count('enqueued')
+        return True
+    
+    def _replace_oldest(self, event: Dict[str, Any]) -> bool:
+        try:
+            self._record_drop(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            return False
+    
+    def _record_drop(self, event: Dict[str, Any]) -> None:
+        dropped = self._count('dropped')
+        if dropped == 1 or dropped % DROP_WARNING_INTERVAL == 0:
+            logger.warning(f"Event queue full, dropped {dropped} events so far "
+                           f"(latest: {event.get('event_type')})")
+    
+    def _count(self, counter: str, amount: int = 1) -> int:
+        with self._lock:
+            self._counters[counter] += amount
+            return self._counters[counter]
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name='event-dispatcher', daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._take_batch()
+            if batch:
+                self._dispatch(batch)
+    
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """
+        Waits for a first event, then collects events until the batch is full or flush_interval
+        has passed since the first one arrived.
+        """
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _dispatch(self, batch: List[Dict[str, Any]]) -> None:
+        errors = _dispatch_events(batch)
+        with self._lock:
+            self._counters['dispatched'] += len(batch)
+            self._counters['batches'] += 1
+            self._counters['handler_errors'] += errors
+    
+    def flush(self) -> int:
+        """
+        Dispatches every queued event on the calling thread.
+        
+        Returns:
+            int: Number of events dispatched
+        """
+        flushed = 0
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return flushed
+            self._dispatch(batch)
+            flushed += len(batch)
+    
+    def stop(self, timeout: float = 5.0) -> int:
+        """
+        Stops the background thread and dispatches the events still queued.
+        
+        Args:
+            timeout (float): Seconds to wait for a batch in progress to finish
+            
+        Returns:
+            int: Number of queued events dispatched while stopping
+        """
+        self._stopped.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout)
+        return self.flush()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the dispatcher's counters.
+        
+        Returns:
+            Dict[str, int]: Events enqueued, dispatched and dropped, batches dispatched, handler
+                errors and the current queue size
+        """
+        with self._lock:
+            counters = {name: self._counters[name]
+                        for name in ('enqueued', 'dispatched', 'dropped', 'batches', 'handler_errors')}
+        counters['queued'] = self._queue.qsize()
+        return counters
+
+
+# Event dispatcher of this process, created on first use from settings
+_dispatcher: Optional[EventDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_event_dispatcher() -> EventDispatcher:
+    """
+    Returns this process's event dispatcher, creating it from settings on first use.
+    
+    Returns:
+        EventDispatcher: The process's event dispatcher
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = EventDispatcher(
+                    max_size=getattr(settings, 'EVENT_QUEUE_MAX_SIZE', DEFAULT_QUEUE_MAX_SIZE),
+                    flush_interval=getattr(settings, 'EVENT_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL),
+                    batch_size=getattr(settings, 'EVENT_FLUSH_BATCH_SIZE', DEFAULT_FLUSH_BATCH_SIZE),
+                    overflow_policy=getattr(settings, 'EVENT_QUEUE_OVERFLOW_POLICY', DEFAULT_OVERFLOW_POLICY)
+                )
+    return _dispatcher
+
+
+def configure_event_dispatch(
+    max_size: Optional[int] = None,
+    flush_interval: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    overflow_policy: Optional[str] = None
+) -> EventDispatcher:
+    """
+    Replaces the process's event dispatcher with one using the given settings, dispatching the
+    events queued on the previous one first. Settings not given keep their current values.
+    
+    Args:
+        max_size (Optional[int]): Maximum number of queued events
+        flush_interval (Optional[float]): Seconds the first event of a batch may wait before dispatch
+        batch_size (Optional[int]): Maximum number of events per batch
+        overflow_policy (Optional[str]): One of OVERFLOW_POLICIES
+        
+    Returns:
+        EventDispatcher: The new event dispatcher
+    """
+    global _dispatcher
+    current = get_event_dispatcher()
+    dispatcher = EventDispatcher(
+        max_size=max_size if max_size is not None else current.max_size,
+        flush_interval=flush_interval if flush_interval is not None else current.flush_interval,
+        batch_size=batch_size if batch_size is not None else current.batch_size,
+        overflow_policy=overflow_policy or current.overflow_policy
+    )
+    with _dispatcher_lock:
+        _dispatcher = dispatcher
+    current.stop()
+    return dispatcher
+
+
+def flush_events() -> int:
+    """
+    Dispatches every queued event on the calling thread, e.g. before a worker exits.
+    
+    Returns:
+        int: Number of events dispatched
+    """
+    return _dispatcher.flush() if _dispatcher is not None else 0
+
+
+def get_event_dispatch_stats() -> Dict[str, int]:
+    """
+    Returns the counters of this process's event dispatcher, including dropped events.
+    
+    Returns:
+        Dict[str, int]: Dispatcher counters and current queue size
+    """
+    return get_event_dispatcher().stats()
+
+
+def _shutdown_dispatcher() -> None:
+    if _dispatcher is not None:
+        _dispatcher.stop()
+
+
+def _reset_dispatcher_after_fork() -> None:
+    # The child has no dispatcher thread and must not reuse its parent's queue or locks
+    global _dispatcher, _dispatcher_lock
+    _dispatcher = None
+    _dispatcher_lock = threading.Lock()
+
+
+atexit.register(_shutdown_dispatcher)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_dispatcher_after_fork)
 
 
 def track_event(
@@ -177,6 +522,9 @@ def track_event(
     """
     Records an event with the provided information.
     
+    The event is logged immediately and queued for the registered handlers, unless
+    settings.EVENT_DISPATCH_ASYNC is off, in which case the handlers run before this returns.
+    
     Args:
         event_type (str): Type of event being recorded
         data (Dict[str, Any]): Event data
@@ -223,8 +571,11 @@ def track_event(
         extra={'additional_data': event}
     )
     
-    # Dispatch the event to registered handlers
-    _dispatch_event(event)
+    # Queue the event for the registered handlers
+    if getattr(settings, 'EVENT_DISPATCH_ASYNC', True):
+        get_event_dispatcher().enqueue(event)
+    else:
+        _dispatch_events([event])
     
     return event
 
@@ -426,7 +777,7 @@ def track_api_event(
 
 def setup_mongodb_handler(collection_name: Optional[str] = None) -> Callable:
     """
-    Sets up an event handler that stores events in MongoDB.
+    Sets up a batch handler that stores events in MongoDB, one insert_many per batch.
     
     Args:
         collection_name (Optional[str]): Name of MongoDB collection to store events in.
@@ -438,25 +789,27 @@ def setup_mongodb_handler(collection_name: Optional[str] = None) -> Callable:
     if not collection_name:
         collection_name = 'events'
     
-    def mongodb_handler(event: Dict[str, Any]) -> None:
+    def mongodb_handler(events: List[Dict[str, Any]]) -> None:
         try:
             from src.backend.utils.mongodb_client import get_collection
             collection = get_collection(collection_name)
             
-            # Insert the event
-            collection.insert_one(event)
+            # Insert copies, so the events returned to callers do not gain MongoDB's _id field;
+            # unordered, so one rejected document does not stop the rest of the batch
+            collection.insert_many([dict(event) for event in events], ordered=False)
         except Exception as e:
-            logger.error(f"Failed to store event in MongoDB: {str(e)}")
+            logger.error(f"Failed to store {len(events)} events in MongoDB: {str(e)}")
     
     # Register the handler
-    register_handler(mongodb_handler)
+    register_batch_handler(mongodb_handler)
     
     return mongodb_handler
 
 
 def setup_datadog_handler() -> Callable:
     """
-    Sets up an event handler that sends events to Datadog.
+    Sets up a batch handler that sends events to Datadog: each batch is counted in a single
+    metric submission, and error and warning events are also posted as Datadog events.
     
     Returns:
         Callable: The registered handler function
@@ -485,59 +838,83 @@ def setup_datadog_handler() -> Callable:
                 app_key=datadog_app_key
             )
         
-        def datadog_handler(event: Dict[str, Any]) -> None:
+        def datadog_event_tags(event: Dict[str, Any]) -> List[str]:
+            tags = [
+                f"event_type:{event.get('event_type', 'unknown')}",
+                f"environment:{event.get('environment', 'unknown')}"
+            ]
+            
+            if 'category' in event:
+                tags.append(f"category:{event['category']}")
+            
+            if 'subcategory' in event:
+                tags.append(f"subcategory:{event['subcategory']}")
+            
+            return tags
+        
+        def datadog_alert_type(event: Dict[str, Any]) -> str:
+            if event.get('category') == 'error':
+                return 'error'
+            if event.get('category') == 'auth' and event.get('event_type') in ['login_failed', 'authentication_failed', 'unauthorized_access']:
+                return 'warning'
+            return 'info'
+        
+        def datadog_handler(events: List[Dict[str, Any]]) -> None:
             try:
-                # Create event title
-                event_type = event.get('event_type', 'unknown')
-                category = event.get('category', '')
-                
-                title = f"{category.upper()}: {event_type}" if category else event_type
-                
-                # Create event text with relevant information
-                text = f"Event ID: {event.get('event_id', 'N/A')}\n"
-                
-                if 'user_id' in event:
-                    text += f"User: {event['user_id']}\n"
-                
-                if 'organization_id' in event:
-                    text += f"Organization: {event['organization_id']}\n"
-                
-                if 'data' in event:
-                    text += f"Data: {json.dumps(event['data'], indent=2)}\n"
-                
-                # Prepare tags
-                tags = [
-                    f"event_type:{event_type}",
-                    f"environment:{event.get('environment', 'unknown')}"
-                ]
-                
-                if 'category' in event:
-                    tags.append(f"category:{event['category']}")
-                
-                if 'subcategory' in event:
-                    tags.append(f"subcategory:{event['subcategory']}")
-                
-                # Determine alert type
-                alert_type = 'info'
-                if event.get('category') == 'error':
-                    alert_type = 'error'
-                elif event.get('category') == 'auth' and event_type in ['login_failed', 'authentication_failed', 'unauthorized_access']:
-                    alert_type = 'warning'
-                
-                # Send event to Datadog
-                api.Event.create(
-                    title=title,
-                    text=text,
-                    tags=tags,
-                    alert_type=alert_type,
-                    source_type_name='justice_bid'
-                )
-                
+                # Count every event in one metric submission per batch, one series per tag set
+                counts = collections.Counter(tuple(datadog_event_tags(event)) for event in events)
+                now = time.time()
+                api.Metric.send(metrics=[
+                    {
+                        'metric': 'justice_bid.events',
+                        'points': [(now, count)],
+                        'type': 'count',
+                        'tags': list(tags)
+                    }
+                    for tags, count in counts.items()
+                ])
             except Exception as e:
-                logger.error(f"Failed to send event to Datadog: {str(e)}")
+                logger.error(f"Failed to send event metrics to Datadog: {str(e)}")
+            
+            # Errors and warnings are still posted as individual Datadog events
+            for event in events:
+                alert_type = datadog_alert_type(event)
+                if alert_type == 'info':
+                    continue
+                
+                try:
+                    # Create event title
+                    event_type = event.get('event_type', 'unknown')
+                    category = event.get('category', '')
+                    
+                    title = f"{category.upper()}: {event_type}" if category else event_type
+                    
+                    # Create event text with relevant information
+                    text = f"Event ID: {event.get('event_id', 'N/A')}\n"
+                    
+                    if 'user_id' in event:
+                        text += f"User: {event['user_id']}\n"
+                    
+                    if 'organization_id' in event:
+                        text += f"Organization: {event['organization_id']}\n"
+                    
+                    if 'data' in event:
+                        text += f"Data: {json.dumps(event['data'], indent=2)}\n"
+                    
+                    # Send event to Datadog
+                    api.Event.create(
+                        title=title,
+                        text=text,
+                        tags=datadog_event_tags(event),
+                        alert_type=alert_type,
+                        source_type_name='justice_bid'
+                    )
+                    
+                except Exception as e:
+                    logger.error(f"Failed to send event to Datadog: {str(e)}")
         
         # Register the handler
-        register_handler(datadog_handler)
+        register_batch_handler(datadog_handler)
         
         return datadog_handler
     
@@ -545,7 +922,7 @@ def setup_datadog_handler() -> Callable:
         logger.warning(f"Datadog event handler not configured: {str(e)}")
         
         # Return a dummy handler for consistency
-        def dummy_handler(event: Dict[str, Any]) -> None:
+        def dummy_handler(events: List[Dict[str, Any]]) -> None:
             pass
         
         return dummy_handler
@@ -9,7 +9,8 @@ import tempfile
 import csv
 import mimetypes
 import shutil
-from typing import List, Dict, Union, Optional, Any, BinaryIO, Tuple
+import json
+from typing import List, Dict, Union, Optional, Any, BinaryIO, Tuple, Iterable, Iterator
 
 import openpyxl  # version 3.1.0
 import pandas as pd  # version 2.0.0
@@ -25,6 +26,7 @@ logger = get_logger(__name__)
 # Global constants
 ALLOWED_EXTENSIONS = {'xlsx', 'xls', 'csv', 'pdf'}
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB in bytes
+STREAM_BLOCK_SIZE = 64 * 1024  # Block size when streaming generated files
 
 def get_file_extension(filename: str) -> str:
     """
@@ -269,6 +271,61 @@ def write_excel_file(file_path: str, data_frames: Dict[str, pd.DataFrame], optio
         logger.error(f"Error writing Excel file {file_path}: {str(e)}")
         raise ValueError(f"Failed to write Excel file: {str(e)}")
 
+def stream_tabular_export(chunks: Iterable[List[Dict]], file_format: str, fieldnames: List[str]) -> Iterator[bytes]:
+    """
+    Serializes chunks of rows to CSV, JSON lines or XLSX incrementally.
+    
+    Only one chunk of rows is held in memory at a time. CSV and JSON lines output is
+    yielded as each chunk is serialized; XLSX rows are written by a write-only workbook
+    into a temporary file which is then yielded in blocks.
+    
+    Args:
+        chunks (iterable): Iterable of lists of row dictionaries
+        file_format (str): Output format ('csv', 'jsonl' or 'xlsx'/'excel')
+        fieldnames (list): Columns to write, in order
+        
+    Returns:
+        iterator: Encoded blocks of the export file
+    """
+    file_format = file_format.lower()
+    
+    if file_format == 'csv':
+        # The header is written first, so an export without rows still names its columns
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=fieldnames).writeheader()
+        yield buffer.getvalue().encode('utf-8')
+        for rows in chunks:
+            buffer = io.StringIO()
+            csv_writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+            csv_writer.writerows(rows)
+            yield buffer.getvalue().encode('utf-8')
+    
+    elif file_format in ('jsonl', 'ndjson'):
+        for rows in chunks:
+            lines = [json.dumps({field: row.get(field) for field in fieldnames}, default=str) for row in rows]
+            if lines:
+                yield ('\n'.join(lines) + '\n').encode('utf-8')
+    
+    elif file_format in ('xlsx', 'excel'):
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Rates')
+        worksheet.append(fieldnames)
+        for rows in chunks:
+            for row in rows:
+                worksheet.append([row.get(field) for field in fieldnames])
+        
+        with tempfile.TemporaryFile() as xlsx_file:
+            workbook.save(xlsx_file)
+            xlsx_file.seek(0)
+            while True:
+                block = xlsx_file.read(STREAM_BLOCK_SIZE)
+                if not block:
+                    break
+                yield block
+    
+    else:
+        raise ValueError(f"Unsupported export format: {file_format}")
+
 def create_temp_file(content: bytes, suffix: str = None) -> str:
     """
     Creates a temporary file with the given content.
@@ -0,0 +1,85 @@
+"""
+In-process cache of entity ownership for the Justice Bid application.
+
+The entity ownership resolver stores the organizations owning each resolved entity here, keyed
+by entity type and ID, so that repeated access checks on the same rates, negotiations, messages,
+documents, OCGs and peer groups do not query the database. Repositories drop entries as soon as
+an entity's owners may have changed or the entity is deleted.
+
+The cache is per process; the TTL bounds how long another worker may serve owners after a
+change made elsewhere.
+"""
+
+import uuid
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Union
+
+from .cache import TTLCache
+
+# Ownership cache configuration
+OWNERSHIP_CACHE_ENABLED = True
+OWNERSHIP_CACHE_TTL = 60  # Seconds owners are served before the entity is resolved again
+OWNERSHIP_CACHE_MAX_ENTRIES = 16384  # Entities kept per process before least recently used are evicted
+
+_ownership_cache = TTLCache('entity owners', OWNERSHIP_CACHE_TTL, OWNERSHIP_CACHE_MAX_ENTRIES, OWNERSHIP_CACHE_ENABLED)
+
+
+def ownership_cache_key(entity_type: str, entity_id: Union[uuid.UUID, str]) -> str:
+    """
+    Build the cache key of an entity's owners.
+
+    Args:
+        entity_type: Type of the entity (e.g. "rate", "negotiation")
+        entity_id: ID of the entity
+
+    Returns:
+        Cache key string
+    """
+    return f"{entity_type}:{entity_id}"
+
+
+def get_cached_owners(entity_type: str, entity_ids: Iterable[Any]) -> Dict[Any, FrozenSet[uuid.UUID]]:
+    """
+    Get the cached owners of several entities of one type.
+
+    Args:
+        entity_type: Type of the entities
+        entity_ids: IDs of the entities
+
+    Returns:
+        Dictionary mapping the IDs found in the cache to their owning organization IDs
+    """
+    return _ownership_cache.get_many({entity_id: ownership_cache_key(entity_type, entity_id)
+                                      for entity_id in entity_ids})
+
+
+def cache_owners(entity_type: str, owners: Dict[Any, FrozenSet[uuid.UUID]],
+                 ttl: Optional[int] = None) -> None:
+    """
+    Cache the owners of several entities of one type.
+
+    Args:
+        entity_type: Type of the entities
+        owners: Dictionary mapping entity IDs to their owning organization IDs
+        ttl: Seconds the owners may be served, defaults to OWNERSHIP_CACHE_TTL
+    """
+    for entity_id, organization_ids in owners.items():
+        _ownership_cache.set(ownership_cache_key(entity_type, entity_id), organization_ids, ttl)
+
+
+def invalidate_owners(entity_type: str, *entity_ids: Union[uuid.UUID, str]) -> int:
+    """
+    Drop the cached owners of entities whose ownership changed or that were deleted.
+
+    Args:
+        entity_type: Type of the entities
+        entity_ids: IDs of the entities
+
+    Returns:
+        Number of entries dropped
+    """
+    return _ownership_cache.delete(*(ownership_cache_key(entity_type, entity_id) for entity_id in entity_ids))
+
+
+def clear_ownership_cache() -> None:
+    """Drop every cached entity owner."""
+    _ownership_cache.clear()
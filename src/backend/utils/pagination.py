@@ -4,10 +4,15 @@ across the Justice Bid Rate Negotiation System. Implements standardized paginati
 parameter handling, and response formatting.
 """
 
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Dict, List, Optional, Any, TypeVar, Generic, Tuple
 from flask import Request, url_for
-from sqlalchemy.orm import Query
-from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import func, select, tuple_
 
 from ..utils.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ..utils.validators import validate_integer
@@ -17,6 +22,9 @@ PAGINATION_DEFAULT_PAGE = 1
 PAGINATION_DEFAULT_PAGE_SIZE = DEFAULT_PAGE_SIZE
 PAGINATION_MAX_PAGE_SIZE = MAX_PAGE_SIZE
 
+# Ways of reporting the total count alongside a cursor page
+TOTAL_COUNT_MODES = ('none', 'approximate', 'exact')
+
 # Define generic type variable
 T = TypeVar('T')
 
@@ -183,49 +191,252 @@ def create_pagination_response(items: List[T], page: int, page_size: int,
     
     return response
 
-def apply_cursor_pagination(query: Query, cursor_column: str, cursor_value: Any, 
-                           limit: int, ascending: bool = True) -> Tuple[List[Any], Optional[Any]]:
+def get_cursor_pagination_params(request: Request,
+                                 default_limit: int = PAGINATION_DEFAULT_PAGE_SIZE,
+                                 max_limit: int = PAGINATION_MAX_PAGE_SIZE) -> Dict[str, Any]:
     """
-    Implements cursor-based pagination for improved performance with large datasets.
+    Extracts cursor pagination parameters from the request object with validation and defaults.
     
     Args:
-        query: SQLAlchemy query object
-        cursor_column: Column name to use for cursor
-        cursor_value: Current cursor value (value to start after)
-        limit: Maximum number of items to return
+        request: Flask request object
+        default_limit: Default number of items per page if not provided in request
+        max_limit: Maximum allowed number of items per page
+        
+    Returns:
+        Dictionary with cursor, limit and total (one of TOTAL_COUNT_MODES) parameters
+    """
+    try:
+        limit = int(request.args.get('limit', default_limit))
+    except (TypeError, ValueError):
+        limit = default_limit
+    
+    validate_integer(limit, 'limit', min_value=1, max_value=max_limit)
+    
+    total = request.args.get('total', 'none')
+    if total not in TOTAL_COUNT_MODES:
+        total = 'none'
+    
+    return {
+        'cursor': request.args.get('cursor') or None,
+        'limit': min(limit, max_limit),
+        'total': total
+    }
+
+def _encode_cursor_value(value: Any) -> Any:
+    """
+    Tags values JSON cannot represent so they round-trip through a cursor unchanged.
+    """
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {'u': str(value)}
+    if isinstance(value, Decimal):
+        return {'n': str(value)}
+    return value
+
+def _decode_cursor_value(value: Any) -> Any:
+    """
+    Restores a value tagged by _encode_cursor_value.
+    """
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        decoders = {'dt': datetime.fromisoformat, 'd': date.fromisoformat, 'u': uuid.UUID, 'n': Decimal}
+        if tag in decoders:
+            return decoders[tag](raw)
+    return value
+
+def encode_cursor(sort_key: str, values: List[Any]) -> str:
+    """
+    Encodes the keyset position of a row as an opaque, URL-safe cursor.
+    
+    Args:
+        sort_key: Name of the sort the cursor belongs to (a cursor is only valid for the same sort)
+        values: Sort column value followed by the row id
+        
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps({'k': sort_key, 'v': [_encode_cursor_value(value) for value in values]},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, sort_key: str) -> List[Any]:
+    """
+    Decodes a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Opaque cursor string
+        sort_key: Name of the sort the cursor is expected to belong to
+        
+    Returns:
+        Sort column value followed by the row id
+        
+    Raises:
+        ValueError: If the cursor is malformed or belongs to a different sort
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        values = [_decode_cursor_value(value) for value in payload['v']]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError('Invalid pagination cursor') from e
+    
+    if payload.get('k') != sort_key or len(values) != 2:
+        raise ValueError('Invalid pagination cursor')
+    return values
+
+def apply_keyset(query: Any, sort_column: Any, id_column: Any, cursor: Optional[str],
+                 limit: int, ascending: bool = True, sort_key: Optional[str] = None) -> Any:
+    """
+    Restricts a query to the page after a cursor using a keyset over (sort column, id).
+    
+    The predicate is a row-value comparison, so an index on (sort column, id) serves every
+    page at the same cost no matter how deep it is. One extra row is requested to detect
+    whether another page follows.
+    
+    Args:
+        query: SQLAlchemy Query or select() statement
+        sort_column: Column to sort by
+        id_column: Unique column used to break ties between equal sort values
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Maximum number of items per page
         ascending: Whether to sort in ascending or descending order
+        sort_key: Name of the sort encoded in cursors (defaults to the sort column name)
         
     Returns:
-        Tuple with results and next cursor value
+        Query or statement for one page plus one look-ahead row
     """
-    # Apply filter to query based on cursor_value if provided
-    if cursor_value is not None:
-        column = getattr(query.column_descriptions[0]['entity'], cursor_column)
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor, sort_key or sort_column.key)
+        position = tuple_(sort_column, id_column)
         if ascending:
-            query = query.filter(column > cursor_value)
+            query = query.filter(position > tuple_(sort_value, id_value))
         else:
-            query = query.filter(column < cursor_value)
+            query = query.filter(position < tuple_(sort_value, id_value))
     
-    # Order query by cursor_column in ascending or descending order
-    column = getattr(query.column_descriptions[0]['entity'], cursor_column)
     if ascending:
-        query = query.order_by(column.asc())
+        query = query.order_by(sort_column.asc(), id_column.asc())
     else:
-        query = query.order_by(column.desc())
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    
+    return query.limit(limit + 1)
+
+def finish_keyset_page(rows: List[Any], limit: int, sort_attribute: str, id_attribute: str = 'id',
+                       sort_key: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trims the look-ahead row of a keyset page and builds the cursor for the next page.
+    
+    Args:
+        rows: Rows returned by a query built with apply_keyset
+        limit: Maximum number of items per page
+        sort_attribute: Attribute of each row holding the sort value
+        id_attribute: Attribute of each row holding the id
+        sort_key: Name of the sort encoded in cursors (defaults to sort_attribute)
+        
+    Returns:
+        Tuple with the page items and the next cursor (None on the last page)
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor(sort_key or sort_attribute,
+                                [getattr(last, sort_attribute), getattr(last, id_attribute)])
+    return rows, next_cursor
+
+def count_query(session: Session, query: Any, approximate: bool = False) -> int:
+    """
+    Counts the rows matched by a query, optionally from planner statistics.
+    
+    An approximate count reads the row estimate of the query plan on PostgreSQL, which
+    costs the same regardless of table size. Other databases fall back to an exact count.
     
-    # Apply limit to query
-    query = query.limit(limit + 1)  # +1 to check if there are more results
+    Args:
+        session: SQLAlchemy session to run the count on
+        query: SQLAlchemy Query or select() statement, without limit or ordering
+        approximate: Whether a planner estimate is acceptable
+        
+    Returns:
+        Number of matching rows
+    """
+    statement = getattr(query, 'statement', query)
+    
+    if approximate and session.get_bind().dialect.name == 'postgresql':
+        compiled = statement.compile(dialect=session.get_bind().dialect)
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    
+    return session.execute(
+        select(func.count()).select_from(statement.order_by(None).subquery())
+    ).scalar() or 0
+
+def paginate_by_cursor(session: Session, query: Any, sort_column: Any, id_column: Any,
+                       cursor: Optional[str], limit: int, ascending: bool = True,
+                       total: str = 'none') -> 'CursorPaginatedResponse':
+    """
+    Fetches one keyset page of a query with an optional total count.
     
-    # Execute query to get results
-    results = query.all()
+    Args:
+        session: SQLAlchemy session used for select() statements and counts
+        query: SQLAlchemy Query or select() statement of ORM entities, without ordering
+        sort_column: Column to sort by
+        id_column: Unique column used to break ties between equal sort values
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Maximum number of items per page
+        ascending: Whether to sort in ascending or descending order
+        total: 'none', 'approximate' (planner estimate) or 'exact'
+        
+    Returns:
+        CursorPaginatedResponse with the page items and the next cursor
+    """
+    total_count = None
+    if total in ('approximate', 'exact'):
+        total_count = count_query(session, query, approximate=total == 'approximate')
     
-    # Extract next cursor value from last result if results exist
-    next_cursor = None
-    if len(results) > limit:
-        next_cursor = getattr(results[limit - 1], cursor_column)
-        results = results[:limit]  # Remove the extra item
+    page_query = apply_keyset(query, sort_column, id_column, cursor, limit, ascending)
+    if isinstance(page_query, Query):
+        rows = page_query.all()
+    else:
+        rows = session.execute(page_query).scalars().all()
+    items, next_cursor = finish_keyset_page(rows, limit, sort_column.key, id_column.key)
+    
+    return CursorPaginatedResponse(
+        items=items,
+        limit=limit,
+        next_cursor=next_cursor,
+        total_count=total_count,
+        total_is_approximate=total == 'approximate'
+    )
+
+def apply_cursor_pagination(query: Query, cursor_column: str, cursor_value: Optional[str], 
+                           limit: int, ascending: bool = True,
+                           id_column: str = 'id') -> Tuple[List[Any], Optional[str]]:
+    """
+    Implements cursor-based pagination for improved performance with large datasets.
     
-    return results, next_cursor
+    Args:
+        query: SQLAlchemy query object
+        cursor_column: Column name to use for cursor
+        cursor_value: Opaque cursor returned with the previous page, or None for the first page
+        limit: Maximum number of items to return
+        ascending: Whether to sort in ascending or descending order
+        id_column: Unique column name used to break ties between equal cursor column values
+        
+    Returns:
+        Tuple with results and next cursor value
+    """
+    entity = query.column_descriptions[0]['entity']
+    query = apply_keyset(query, getattr(entity, cursor_column), getattr(entity, id_column),
+                         cursor_value, limit, ascending)
+    return finish_keyset_page(query.all(), limit, cursor_column, id_column)
 
 class PaginatedResponse(Generic[T]):
     """
@@ -294,7 +505,8 @@ class CursorPaginatedResponse(Generic[T]):
     """
     
     def __init__(self, items: List[T], limit: int, next_cursor: Optional[Any], 
-                prev_cursor: Optional[Any] = None):
+                prev_cursor: Optional[Any] = None, total_count: Optional[int] = None,
+                total_is_approximate: bool = False):
         """
         Initializes a cursor-paginated response with items and pagination metadata.
         
@@ -303,6 +515,8 @@ class CursorPaginatedResponse(Generic[T]):
             limit: Maximum number of items per page
             next_cursor: Cursor value for the next page
             prev_cursor: Cursor value for the previous page
+            total_count: Optional total count of items across all pages
+            total_is_approximate: Whether total_count is a planner estimate
         """
         self.items = items
         
@@ -312,6 +526,11 @@ class CursorPaginatedResponse(Generic[T]):
             'next_cursor': next_cursor,
             'prev_cursor': prev_cursor
         }
+        
+        # Totals are only reported when requested, since an exact count scans every match
+        if total_count is not None:
+            self.pagination['total_count'] = total_count
+            self.pagination['total_is_approximate'] = total_is_approximate
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,103 @@
+"""
+In-process cache of authenticated principals for the Justice Bid application.
+
+require_auth stores the hydrated principal of each access token here, keyed by user ID and
+token ID (jti), so that repeat requests with the same token are authenticated without a
+database query. Entries live for a short TTL and are dropped as soon as the user, their
+roles or their permissions change, or the token is logged out.
+
+The cache is per process; the TTL bounds how long another worker may serve a principal
+after a change made elsewhere, while the token blacklist is still checked on every request.
+"""
+
+import uuid
+from typing import Any, Optional, Union
+
+from .cache import TTLCache
+
+# Principal cache configuration
+PRINCIPAL_CACHE_ENABLED = True
+PRINCIPAL_CACHE_TTL = 30  # Seconds a principal is served before the user is reloaded
+PRINCIPAL_CACHE_MAX_ENTRIES = 4096  # Tokens kept per process before least recently used are evicted
+
+_principal_cache = TTLCache('principals', PRINCIPAL_CACHE_TTL, PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_ENABLED)
+
+
+def principal_cache_key(user_id: Union[uuid.UUID, str], jti: Optional[str]) -> str:
+    """
+    Build the cache key of a principal.
+
+    Args:
+        user_id: ID of the authenticated user
+        jti: ID of the access token
+
+    Returns:
+        Cache key string
+    """
+    return f"{user_id}:{jti}"
+
+
+def get_cached_principal(user_id: Union[uuid.UUID, str], jti: Optional[str]) -> Any:
+    """
+    Get the cached principal of an access token.
+
+    Args:
+        user_id: ID of the authenticated user
+        jti: ID of the access token
+
+    Returns:
+        The cached principal or None if missing or expired
+    """
+    if not jti:
+        return None
+    return _principal_cache.get(principal_cache_key(user_id, jti))
+
+
+def cache_principal(user_id: Union[uuid.UUID, str], jti: Optional[str], principal: Any,
+                    ttl: Optional[int] = None) -> None:
+    """
+    Cache the principal of an access token.
+
+    Args:
+        user_id: ID of the authenticated user
+        jti: ID of the access token
+        principal: The principal to cache
+        ttl: Seconds the principal may be served, defaults to PRINCIPAL_CACHE_TTL
+    """
+    if not jti:
+        return
+    _principal_cache.set(principal_cache_key(user_id, jti), principal, ttl)
+
+
+def invalidate_principal(user_id: Union[uuid.UUID, str]) -> int:
+    """
+    Drop the cached principals of every token of a user.
+
+    Args:
+        user_id: ID of the user whose account, role or permissions changed
+
+    Returns:
+        Number of entries dropped
+    """
+    return _principal_cache.delete_pattern(principal_cache_key(user_id, '*'))
+
+
+def invalidate_principal_token(user_id: Union[uuid.UUID, str], jti: Optional[str]) -> bool:
+    """
+    Drop the cached principal of a single token.
+
+    Args:
+        user_id: ID of the authenticated user
+        jti: ID of the access token
+
+    Returns:
+        True if an entry was dropped, False otherwise
+    """
+    if not jti:
+        return False
+    return bool(_principal_cache.delete(principal_cache_key(user_id, jti)))
+
+
+def clear_principal_cache() -> None:
+    """Drop every cached principal, e.g. after role definitions change."""
+    _principal_cache.clear()
@@ -0,0 +1,211 @@
+"""
+Pure-Python full-text search for the Justice Bid application.
+
+Provides an in-memory inverted index with positional postings, used where the database has no
+full-text index (e.g. SQLite in tests). Queries use the same web-search syntax as PostgreSQL's
+websearch_to_tsquery: words are combined with AND, "quoted text" matches a phrase, "or" between
+two clauses matches either, and a leading "-" excludes a clause. Unlike PostgreSQL, words are
+not stemmed and stop words are not dropped.
+"""
+
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Set
+
+WORD_PATTERN = re.compile(r"\w+")
+QUERY_TOKEN_PATTERN = re.compile(r'(-?)"([^"]*)"?|(-?)(\S+)')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase words.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of words in order of appearance
+    """
+    return WORD_PATTERN.findall(text.lower()) if text else []
+
+
+@dataclass
+class SearchQuery:
+    """
+    Parsed full-text query.
+
+    Each clause is a phrase (a list of consecutive words; a single word is a one-word phrase).
+    A document matches when, for every group in required, it contains at least one of the group's
+    phrases, and it contains none of the excluded phrases.
+    """
+
+    required: List[List[List[str]]] = field(default_factory=list)  # AND of OR-groups of phrases
+    excluded: List[List[str]] = field(default_factory=list)  # Phrases that must not match
+
+    def __bool__(self) -> bool:
+        return bool(self.required)
+
+
+def parse_search_query(query: str) -> SearchQuery:
+    """
+    Parse a web-search style query.
+
+    Args:
+        query: Query text, e.g. 'rate "annual increase" -draft'
+
+    Returns:
+        SearchQuery with the required and excluded phrases
+    """
+    parsed = SearchQuery()
+    pending_or = False
+    for match in QUERY_TOKEN_PATTERN.finditer(query or ""):
+        quoted_negation, quoted, negation, word = match.groups()
+        if quoted is None and word.lower() == "or":
+            pending_or = bool(parsed.required)
+            continue
+
+        phrase = tokenize(quoted if quoted is not None else word)
+        if not phrase:
+            continue
+
+        if quoted_negation or negation:
+            parsed.excluded.append(phrase)
+        elif pending_or:
+            parsed.required[-1].append(phrase)
+        else:
+            parsed.required.append([phrase])
+        pending_or = False
+    return parsed
+
+
+class InvertedIndex:
+    """
+    Thread-safe in-memory inverted index with positional postings and tf-idf ranking.
+
+    Documents are added, replaced and removed one at a time, so the index is maintained
+    incrementally as the underlying records change.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[Hashable, List[int]]] = {}  # word -> document -> positions
+        self._documents: Dict[Hashable, int] = {}  # document -> number of words
+        self._document_words: Dict[Hashable, Set[str]] = {}  # document -> distinct words, for removal
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._documents
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """
+        Index a document, replacing any previous version of it.
+
+        Args:
+            doc_id: ID of the document
+            text: Text of the document
+        """
+        words = tokenize(text)
+        with self._lock:
+            self._remove(doc_id)
+            for position, word in enumerate(words):
+                self._postings.setdefault(word, {}).setdefault(doc_id, []).append(position)
+            self._documents[doc_id] = len(words)
+            self._document_words[doc_id] = set(words)
+
+    def remove(self, doc_id: Hashable) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: ID of the document
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        with self._lock:
+            return self._remove(doc_id)
+
+    def clear(self) -> None:
+        """Remove every document from the index."""
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            self._document_words.clear()
+
+    def search(self, query: Any) -> Dict[Hashable, float]:
+        """
+        Find the documents matching a query.
+
+        Args:
+            query: Query text or a SearchQuery from parse_search_query
+
+        Returns:
+            Dictionary mapping each matching document ID to its relevance score
+        """
+        if not isinstance(query, SearchQuery):
+            query = parse_search_query(query)
+        if not query:
+            return {}
+
+        with self._lock:
+            scores: Dict[Hashable, float] = {}
+            for index, group in enumerate(query.required):
+                group_scores: Dict[Hashable, float] = {}
+                for phrase in group:
+                    for doc_id, score in self._phrase_scores(phrase).items():
+                        group_scores[doc_id] = group_scores.get(doc_id, 0.0) + score
+                if index == 0:
+                    scores = group_scores
+                else:
+                    scores = {doc_id: score + group_scores[doc_id]
+                              for doc_id, score in scores.items() if doc_id in group_scores}
+                if not scores:
+                    return {}
+
+            for phrase in query.excluded:
+                for doc_id in self._phrase_scores(phrase):
+                    scores.pop(doc_id, None)
+            return scores
+
+    def _remove(self, doc_id: Hashable) -> bool:
+        if doc_id not in self._documents:
+            return False
+        del self._documents[doc_id]
+        for word in self._document_words.pop(doc_id):
+            documents = self._postings[word]
+            del documents[doc_id]
+            if not documents:
+                del self._postings[word]
+        return True
+
+    def _phrase_scores(self, phrase: List[str]) -> Dict[Hashable, float]:
+        """Score the documents containing a phrase by the tf-idf of its words."""
+        postings = [self._postings.get(word) for word in phrase]
+        if not all(postings):
+            return {}
+
+        candidates = set(postings[0])
+        for documents in postings[1:]:
+            candidates &= documents.keys()
+
+        total_documents = len(self._documents)
+        idf = [math.log(1 + total_documents / len(documents)) for documents in postings]
+        scores = {}
+        for doc_id in candidates:
+            if len(phrase) > 1:
+                starts = set(postings[0][doc_id])
+                for offset, documents in enumerate(postings[1:], start=1):
+                    starts &= {position - offset for position in documents[doc_id]}
+                if not starts:
+                    continue
+                frequencies = [len(starts)] * len(phrase)
+            else:
+                frequencies = [len(postings[0][doc_id])]
+            length_norm = 1 + math.log(1 + self._documents[doc_id])
+            scores[doc_id] = sum(tf * weight for tf, weight in zip(frequencies, idf)) / length_norm
+        return scores
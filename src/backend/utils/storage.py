@@ -4,6 +4,7 @@ import os
 import uuid
 import datetime
 import mimetypes
+import shutil
 import logging
 from typing import Dict, List, Union, Optional, BinaryIO, Any, Tuple
 
@@ -203,12 +204,21 @@ class S3StorageClient(StorageClient):
                 if metadata:
                     extra_args['Metadata'] = metadata
                 
-                self.s3_client.put_object(
-                    Body=file_data,
-                    Bucket=self.bucket_name,
-                    Key=destination_path,
-                    **extra_args
-                )
+                if hasattr(file_data, 'read'):
+                    # Stream file-like objects in multipart chunks instead of reading them whole
+                    self.s3_client.upload_fileobj(
+                        Fileobj=file_data,
+                        Bucket=self.bucket_name,
+                        Key=destination_path,
+                        ExtraArgs=extra_args
+                    )
+                else:
+                    self.s3_client.put_object(
+                        Body=file_data,
+                        Bucket=self.bucket_name,
+                        Key=destination_path,
+                        **extra_args
+                    )
             
             # Generate and return the S3 URL
             url = f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{destination_path}"
@@ -527,8 +537,8 @@ class LocalStorageClient(StorageClient):
                     
                 with open(full_path, mode) as f:
                     if hasattr(file_data, 'read'):
-                        # It's a file-like object
-                        f.write(file_data.read())
+                        # It's a file-like object, copy it in blocks
+                        shutil.copyfileobj(file_data, f)
                     else:
                         # It's bytes
                         f.write(file_data)
@@ -0,0 +1,284 @@
+"""
+Redis counters of unread messages for the Justice Bid application.
+
+Each user's unread messages are kept in a Redis hash mapping thread IDs to the number of
+unread messages in the thread, so that badge polling reads one small hash instead of querying
+the database. A hash only exists once it has been seeded from the read states in the database;
+message creation increments and read receipts update hashes that exist and leave absent ones
+alone, to be seeded on the next read.
+
+A seed is a snapshot of the database, so it must not race the writers. Next to each hash a
+sync hash counts the updates in flight for the user (registered before the writer commits) and
+a version bumped after every commit. A seed is only stored if no update is in flight and the
+version is the one read before the snapshot was taken; otherwise the snapshot may miss, or
+already include, a change and the next read seeds again.
+
+Counters expire after UNREAD_COUNTERS_TTL, which bounds how long a counter that missed an
+update (e.g. while Redis was unavailable) can drift from the database.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from utils.redis_client import get_redis_client
+from utils.logging import get_logger
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Unread counter configuration
+UNREAD_COUNTERS_ENABLED = True
+UNREAD_COUNTERS_PREFIX = "unread"
+UNREAD_COUNTERS_TTL = 3600  # Seconds before a user's counters are re-seeded from the database
+SEEDED_FIELD = "_"  # Marks a hash as seeded, so that users without unread messages keep one
+UNREAD_SYNC_TTL = 60  # Seconds before the in-flight updates of a writer that never finished are dropped
+
+# Register an update that is about to be committed
+BEGIN_SCRIPT = """
+redis.call('hincrby', KEYS[1], 'pending', 1)
+redis.call('expire', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Finish a committed update: bump the version and increment a thread's counter if the user's
+# counters have been seeded
+INCREMENT_SCRIPT = """
+if tonumber(redis.call('hget', KEYS[2], 'pending') or '0') > 0 then
+    redis.call('hincrby', KEYS[2], 'pending', -1)
+end
+redis.call('hincrby', KEYS[2], 'version', 1)
+redis.call('expire', KEYS[2], ARGV[3])
+if tonumber(ARGV[2]) ~= 0 and redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('hincrby', KEYS[1], ARGV[1], ARGV[2])
+end
+return nil
+"""
+
+# Set or clear a thread's counter only if the user's counters have been seeded; the version is
+# bumped so that a seed from a snapshot taken before the change is not stored
+SET_SCRIPT = """
+redis.call('hincrby', KEYS[2], 'version', 1)
+redis.call('expire', KEYS[2], ARGV[3])
+if redis.call('exists', KEYS[1]) == 0 then
+    return 0
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('hset', KEYS[1], ARGV[1], ARGV[2])
+else
+    redis.call('hdel', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+# Seed a user's counters unless a concurrent request already did, an update is in flight, or
+# the version changed since the snapshot was taken
+SEED_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return 0
+end
+local sync = redis.call('hmget', KEYS[2], 'pending', 'version')
+if tonumber(sync[1] or '0') > 0 or (sync[2] or '0') ~= ARGV[2] then
+    return 0
+end
+redis.call('hset', KEYS[1], unpack(ARGV, 3))
+redis.call('expire', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def unread_counters_key(user_id: Any) -> str:
+    """
+    Build the Redis key of a user's unread counters.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Redis key string
+    """
+    # The hash tag keeps a user's counters and sync hash in the same cluster slot
+    return f"{UNREAD_COUNTERS_PREFIX}:{{{user_id}}}"
+
+
+def unread_sync_key(user_id: Any) -> str:
+    """
+    Build the Redis key of the hash tracking updates to a user's unread counters.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Redis key string
+    """
+    return f"{unread_counters_key(user_id)}:sync"
+
+
+def get_unread_seed_version(user_id: Any) -> Optional[str]:
+    """
+    Get the version of a user's counters, read before taking the snapshot they are seeded from.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Version to pass to seed_unread_counts, or None if Redis is unavailable
+    """
+    if not UNREAD_COUNTERS_ENABLED:
+        return None
+
+    try:
+        version = get_redis_client().hget(unread_sync_key(user_id), 'version')
+    except Exception as e:
+        logger.error(f"Failed to read unread counter version for user {user_id}: {str(e)}")
+        return None
+    return str(int(version or 0))
+
+
+def get_unread_counts(user_id: Any) -> Optional[Dict[str, int]]:
+    """
+    Get a user's unread message counts by thread.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Dictionary mapping thread IDs to unread message counts, or None if the user's counters
+        have not been seeded or Redis is unavailable
+    """
+    if not UNREAD_COUNTERS_ENABLED:
+        return None
+
+    try:
+        counters = get_redis_client().hgetall(unread_counters_key(user_id))
+    except Exception as e:
+        logger.error(f"Failed to read unread counters for user {user_id}: {str(e)}")
+        return None
+
+    if not counters:
+        return None
+    return {
+        thread_id: int(count)
+        for thread_id, count in counters.items()
+        if thread_id != SEEDED_FIELD and int(count) > 0
+    }
+
+
+def seed_unread_counts(user_id: Any, counts: Dict[Any, int], version: Optional[str],
+                       ttl: int = UNREAD_COUNTERS_TTL) -> bool:
+    """
+    Seed a user's unread counters from the database.
+
+    Args:
+        user_id: ID of the user
+        counts: Dictionary mapping thread IDs to unread message counts
+        version: Version returned by get_unread_seed_version before the counts were read
+        ttl: Seconds before the counters are re-seeded
+
+    Returns:
+        True if the counters were seeded, False if they already existed, changed since the
+        counts were read, or Redis is unavailable
+    """
+    if not UNREAD_COUNTERS_ENABLED or version is None:
+        return False
+
+    fields = [SEEDED_FIELD, 0]
+    for thread_id, count in counts.items():
+        if count > 0:
+            fields.extend((str(thread_id), count))
+
+    try:
+        return bool(get_redis_client().eval(
+            SEED_SCRIPT, 2, unread_counters_key(user_id), unread_sync_key(user_id), ttl, version, *fields
+        ))
+    except Exception as e:
+        logger.error(f"Failed to seed unread counters for user {user_id}: {str(e)}")
+        return False
+
+
+def begin_unread_updates(user_ids: Iterable[Any]) -> None:
+    """
+    Register an update to users' unread counters before it is committed to the database.
+
+    Every call must be followed by increment_unread for the same users once the transaction
+    has been committed or rolled back; until then their counters are not seeded.
+
+    Args:
+        user_ids: IDs of the users
+    """
+    if not UNREAD_COUNTERS_ENABLED:
+        return
+
+    try:
+        # One script per key, so the pipeline also works when users hash to different cluster slots
+        pipeline = get_redis_client().pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.eval(BEGIN_SCRIPT, 1, unread_sync_key(user_id), UNREAD_SYNC_TTL)
+        pipeline.execute()
+    except Exception as e:
+        logger.error(f"Failed to register unread counter updates: {str(e)}")
+
+
+def increment_unread(user_ids: Iterable[Any], thread_id: Any, amount: int = 1) -> None:
+    """
+    Finish an update registered with begin_unread_updates, counting new messages in a thread as unread.
+
+    Args:
+        user_ids: IDs of the users
+        thread_id: ID of the thread
+        amount: Number of new messages, negative for deleted unread messages, 0 if nothing was committed
+    """
+    if not UNREAD_COUNTERS_ENABLED:
+        return
+
+    try:
+        pipeline = get_redis_client().pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.eval(INCREMENT_SCRIPT, 2, unread_counters_key(user_id), unread_sync_key(user_id),
+                          str(thread_id), amount, UNREAD_SYNC_TTL)
+        pipeline.execute()
+    except Exception as e:
+        logger.error(f"Failed to increment unread counters of thread {thread_id}: {str(e)}")
+
+
+def set_thread_unread(user_id: Any, thread_id: Any, count: int) -> None:
+    """
+    Set a user's unread message count in a thread after a read receipt.
+
+    Args:
+        user_id: ID of the user
+        thread_id: ID of the thread
+        count: Number of messages still unread in the thread
+    """
+    if not UNREAD_COUNTERS_ENABLED:
+        return
+
+    try:
+        get_redis_client().eval(SET_SCRIPT, 2, unread_counters_key(user_id), unread_sync_key(user_id),
+                                str(thread_id), count, UNREAD_SYNC_TTL)
+    except Exception as e:
+        logger.error(f"Failed to update unread counter of thread {thread_id} for user {user_id}: {str(e)}")
+
+
+def invalidate_unread_counts(*user_ids: Any) -> int:
+    """
+    Drop users' unread counters so they are re-seeded from the database on the next read.
+
+    Args:
+        user_ids: IDs of the users
+
+    Returns:
+        Number of counters dropped
+    """
+    if not UNREAD_COUNTERS_ENABLED or not user_ids:
+        return 0
+
+    try:
+        pipeline = get_redis_client().pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.delete(unread_counters_key(user_id))
+            # A seed from a snapshot taken before the invalidation is not stored
+            pipeline.hincrby(unread_sync_key(user_id), 'version', 1)
+            pipeline.expire(unread_sync_key(user_id), UNREAD_SYNC_TTL)
+        return sum(pipeline.execute()[::3])
+    except Exception as e:
+        logger.error(f"Failed to invalidate unread counters: {str(e)}")
+        return 0